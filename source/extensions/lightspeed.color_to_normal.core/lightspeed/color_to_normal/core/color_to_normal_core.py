@@ -15,7 +15,6 @@
 * limitations under the License.
 """
 
-import asyncio
 import contextlib
 import os
 import platform
@@ -30,6 +29,7 @@ import carb.tokens
 import numpy as np
 import omni.usd
 from lightspeed.common import constants
+from omni.flux.utils.common.conversion_scheduler import get_conversion_scheduler as _get_conversion_scheduler
 from PIL import Image
 
 
@@ -193,5 +193,4 @@ class ColorToNormalCore:
     @staticmethod
     @omni.usd.handle_exception
     async def async_perform_upscale(texture, output_texture):
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, ColorToNormalCore.perform_conversion, texture, output_texture)
+        await _get_conversion_scheduler().run(ColorToNormalCore.perform_conversion, texture, output_texture)
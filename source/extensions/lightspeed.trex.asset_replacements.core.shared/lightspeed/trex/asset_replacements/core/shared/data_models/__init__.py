@@ -27,7 +27,9 @@ __all__ = [
     "PrimTypes",
     "PrimsResponseModel",
     "ReferenceResponseModel",
+    "ReplaceReferenceItemModel",
     "ReplaceReferenceRequestModel",
+    "ReplaceReferencesRequestModel",
     "SetSelectionPathParamModel",
     "TexturesResponseModel",
 ]
@@ -43,7 +45,9 @@ from .models import (
     PrimTexturesPathParamModel,
     PrimTypes,
     ReferenceResponseModel,
+    ReplaceReferenceItemModel,
     ReplaceReferenceRequestModel,
+    ReplaceReferencesRequestModel,
     SetSelectionPathParamModel,
     TexturesResponseModel,
 )
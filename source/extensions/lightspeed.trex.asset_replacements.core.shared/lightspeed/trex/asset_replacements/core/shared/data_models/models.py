@@ -136,3 +136,30 @@ class ReplaceReferenceRequestModel(AppendReferenceRequestModel):
     existing_asset_layer_id: Path | None = None
 
     # Extra validation is done in the endpoint since it requires both the path parameter & the body
+
+
+class ReplaceReferenceItemModel(BaseServiceModel):
+    asset_path: str
+    asset_file_path: Path
+    # If the existing reference is not provided, the first reference found will be replaced
+    existing_asset_file_path: Path | None = None
+    existing_asset_layer_id: Path | None = None
+
+
+class ReplaceReferencesRequestModel(BaseServiceModel):
+    force: bool = False  # Ignore ingestion validation
+    references: list[ReplaceReferenceItemModel]
+
+    @root_validator(allow_reuse=True)
+    def root_validators(cls, values):  # noqa
+        errors = AssetReplacementsValidators.get_invalid_references(
+            [
+                (item.asset_path, item.asset_file_path, item.existing_asset_file_path, item.existing_asset_layer_id)
+                for item in values.get("references") or []
+            ],
+            values.get("force"),
+            values.get("context_name"),
+        )
+        if errors:
+            raise ValueError("\n".join(str(error) for error in errors.values()))
+        return values
@@ -101,6 +101,51 @@ class AssetReplacementsValidators:
 
         return asset_path
 
+    @classmethod
+    def get_invalid_references(
+        cls, references: list[tuple[str, Path, Path | None, Path | None]], force: bool, context_name: str
+    ) -> dict[int, ValueError]:
+        """
+        Validate many reference replacements at once. Every file is only validated once, even if it's used by many
+        replacements.
+
+        Args:
+            references: A list of tuples in the format (asset path, new file path, existing file path, existing layer)
+                        where the existing file path and layer are optional
+            force: Whether to accept the files that were not ingested
+            context_name: The USD context name
+
+        Returns:
+            The validation error of every invalid replacement, by index in the list of references
+        """
+        errors = {}
+        file_errors = {}
+        for index, (prim_path, asset_file_path, existing_asset_file_path, existing_asset_layer_id) in enumerate(
+            references
+        ):
+            try:
+                cls.is_valid_prim(prim_path, context_name)
+                if existing_asset_file_path or existing_asset_layer_id:
+                    cls.ref_exists_in_prim(existing_asset_file_path, existing_asset_layer_id, prim_path, context_name)
+                else:
+                    cls.has_at_least_one_ref(prim_path, context_name)
+            except ValueError as e:
+                errors[index] = e
+                continue
+
+            file_path = str(asset_file_path)
+            if file_path not in file_errors:
+                try:
+                    cls.is_valid_file_path(asset_file_path)
+                    if not force:
+                        cls.is_asset_ingested(asset_file_path)
+                    file_errors[file_path] = None
+                except ValueError as e:
+                    file_errors[file_path] = e
+            if file_errors[file_path] is not None:
+                errors[index] = file_errors[file_path]
+        return errors
+
     @classmethod
     def layer_is_in_project(cls, layer_id: Path | None, context_name: str):
         if layer_id is None:
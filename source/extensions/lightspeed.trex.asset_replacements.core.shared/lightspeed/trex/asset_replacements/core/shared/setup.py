@@ -35,7 +35,7 @@ from lightspeed.trex.utils.common.asset_utils import is_asset_ingested as _is_as
 from lightspeed.trex.utils.common.asset_utils import is_layer_from_capture as _is_layer_from_capture
 from lightspeed.trex.utils.common.asset_utils import is_mesh_from_capture as _is_mesh_from_capture
 from lightspeed.trex.utils.common.asset_utils import is_texture_from_capture as _is_texture_from_capture
-from lightspeed.trex.utils.common.prim_utils import filter_prims_paths as _filter_prims_paths
+from lightspeed.trex.utils.common.hash_index import get_stage_hash_index as _get_stage_hash_index
 from lightspeed.trex.utils.common.prim_utils import get_children_prims
 from lightspeed.trex.utils.common.prim_utils import get_extended_selection as _get_extended_selection
 from lightspeed.trex.utils.common.prim_utils import get_prim_paths as _get_prim_paths
@@ -64,6 +64,7 @@ from .data_models import (
     PrimTexturesPathParamModel,
     ReferenceResponseModel,
     ReplaceReferenceRequestModel,
+    ReplaceReferencesRequestModel,
     SetSelectionPathParamModel,
     TexturesResponseModel,
 )
@@ -136,41 +137,23 @@ class Setup:
         self, params: PrimReferencePathParamModel, body: ReplaceReferenceRequestModel
     ) -> ReferenceResponseModel:
         with omni.kit.undo.group():
-            stage = self._context.get_stage()
+            reference_path = self.replace_reference(
+                params.asset_path, body.asset_file_path, body.existing_asset_file_path, body.existing_asset_layer_id
+            )
 
-            edit_target_layer = stage.GetEditTarget().GetLayer()
+        return ReferenceResponseModel(reference_paths=[reference_path])
 
-            if body.existing_asset_layer_id and body.existing_asset_file_path:
-                current_layer = Sdf.Layer.FindOrOpen(str(body.existing_asset_layer_id))
-                current_ref = Sdf.Reference(
-                    assetPath=_OmniUrl(body.existing_asset_file_path).path, primPath=params.asset_path
+    def replace_references_with_data_model(self, body: ReplaceReferencesRequestModel) -> ReferenceResponseModel:
+        # The references are validated by the request model
+        with omni.kit.undo.group():
+            reference_paths = [
+                self.replace_reference(
+                    item.asset_path, item.asset_file_path, item.existing_asset_file_path, item.existing_asset_layer_id
                 )
-            else:
-                prim = stage.GetPrimAtPath(params.asset_path)
-                references = omni.usd.get_composed_references_from_prim(prim)
-                current_ref, current_layer = references[0]
-
-            # Remove the existing reference
-            self.remove_reference(stage, params.asset_path, current_ref, current_layer, remove_if_remix_ref=False)
-
-            # Get the new reference prim path
-            ref_prim_path = self.get_reference_prim_path_from_asset_path(
-                str(body.asset_file_path), current_layer, edit_target_layer, current_ref
-            )
-
-            # Add the new reference prim path
-            reference, child_prim_path = self.add_new_reference(
-                stage,
-                params.asset_path,
-                self.switch_ref_abs_to_rel_path(stage, str(body.asset_file_path)),
-                ref_prim_path,
-                edit_target_layer,
-                create_if_remix_ref=False,
-            )
+                for item in body.references
+            ]
 
-        return ReferenceResponseModel(
-            reference_paths=[(str(child_prim_path), (str(reference.assetPath), edit_target_layer.identifier))]
-        )
+        return ReferenceResponseModel(reference_paths=reference_paths)
 
     def append_reference_with_data_model(
         self, params: PrimReferencePathParamModel, body: AppendReferenceRequestModel
@@ -202,6 +185,56 @@ class Setup:
 
     # TRADITIONAL FUNCTIONS
 
+    def replace_reference(
+        self,
+        prim_path: str,
+        asset_file_path: str,
+        existing_asset_file_path: str | None = None,
+        existing_asset_layer_id: str | None = None,
+    ) -> tuple[str, tuple[str, str]]:
+        """
+        Replace a reference of a prim on the edit target
+
+        Args:
+            prim_path: The prim to replace the reference of
+            asset_file_path: The file to reference
+            existing_asset_file_path: The file of the reference to replace. If not set, the first reference is replaced
+            existing_asset_layer_id: The layer of the reference to replace
+
+        Returns:
+            The reference prim path, the reference file path and the edit target layer identifier
+        """
+        stage = self._context.get_stage()
+        edit_target_layer = stage.GetEditTarget().GetLayer()
+
+        if existing_asset_layer_id and existing_asset_file_path:
+            current_layer = Sdf.Layer.FindOrOpen(str(existing_asset_layer_id))
+            current_ref = Sdf.Reference(assetPath=_OmniUrl(existing_asset_file_path).path, primPath=prim_path)
+        else:
+            prim = stage.GetPrimAtPath(prim_path)
+            references = omni.usd.get_composed_references_from_prim(prim)
+            current_ref, current_layer = references[0]
+
+        # Remove the existing reference
+        self.remove_reference(stage, prim_path, current_ref, current_layer, remove_if_remix_ref=False)
+
+        # Get the new reference prim path
+        ref_prim_path = self.get_reference_prim_path_from_asset_path(
+            str(asset_file_path), current_layer, edit_target_layer, current_ref
+        )
+
+        # Add the new reference prim path
+        reference, child_prim_path = self.add_new_reference(
+            stage,
+            prim_path,
+            self.switch_ref_abs_to_rel_path(stage, str(asset_file_path)),
+            ref_prim_path,
+            edit_target_layer,
+            create_if_remix_ref=False,
+        )
+
+        return str(child_prim_path), (str(reference.assetPath), edit_target_layer.identifier)
+
     def get_children_from_prim(
         self,
         prim,
@@ -219,13 +252,13 @@ class Setup:
         )
 
     def get_instances_from_mesh_path(self, prim_path: str) -> set[str]:
-        instances = set()
-        instance_pattern = re.compile(constants.REGEX_INSTANCE_PATH)
-        for instance_path in _filter_prims_paths(lambda prim: bool(instance_pattern.match(str(prim.GetPath())))):
-            if Setup.get_prim_hash(instance_path) != Setup.get_prim_hash(prim_path):
-                continue
-            instances.add(constants.COMPILED_REGEX_MESH_TO_INSTANCE_SUB.sub(instance_path, prim_path))
-        return instances
+        index = _get_stage_hash_index(self._context.get_stage())
+        if index is None:
+            return set()
+        return {
+            constants.COMPILED_REGEX_MESH_TO_INSTANCE_SUB.sub(instance_path, prim_path)
+            for instance_path in index.get_instance_paths(Setup.get_prim_hash(prim_path))
+        }
 
     def get_textures_from_material_path(
         self, prim_path: str, texture_types: Optional[set[_TextureTypes]]
@@ -937,11 +970,12 @@ class Setup:
 
     @staticmethod
     def get_instance_from_mesh(mesh_paths: list[str], instance_paths: list[str]) -> list[str]:
+        instance_paths_by_hash = {}
+        for instance_path in instance_paths:
+            instance_paths_by_hash.setdefault(Setup.get_prim_hash(instance_path), []).append(instance_path)
         instances = set()
         for mesh_path in mesh_paths:
-            for instance_path in instance_paths:
-                if Setup.get_prim_hash(instance_path) != Setup.get_prim_hash(mesh_path):
-                    continue
+            for instance_path in instance_paths_by_hash.get(Setup.get_prim_hash(mesh_path), []):
                 instances.add(constants.COMPILED_REGEX_MESH_TO_INSTANCE_SUB.sub(instance_path, mesh_path))
         return list(instances)
 
@@ -23,6 +23,8 @@ import omni.kit.commands
 import omni.usd
 from lightspeed.trex.asset_replacements.core.shared import Setup as _AssetReplacementsCore
 from lightspeed.trex.asset_replacements.core.shared import usd_copier as _usd_copier
+from lightspeed.trex.utils.common import prim_utils as _prim_utils
+from lightspeed.trex.utils.common.hash_index import get_stage_hash_index as _get_stage_hash_index
 from omni.flux.utils.widget.resources import get_test_data as _get_test_data
 from omni.kit.test.async_unittest import AsyncTestCase
 from omni.kit.test_suite.helpers import open_stage, wait_stage_loading
@@ -146,6 +148,73 @@ class TestAssetReplacementsCore(AsyncTestCase):
             [],
         )
 
+    async def test_get_instances_from_mesh_path_should_follow_stage_changes(self):
+        # Arrange
+        core = _AssetReplacementsCore("")
+        stage = self.context.get_stage()
+        mesh_path = "/RootNode/meshes/mesh_BAC90CAA733B0859"
+        instance_paths = {f"/RootNode/instances/inst_BAC90CAA733B0859_{index}" for index in range(3)}
+
+        # Act
+        value = core.get_instances_from_mesh_path(mesh_path)
+
+        # Assert
+        self.assertEqual(instance_paths, value)
+
+        # Act
+        stage.DefinePrim("/RootNode/instances/inst_BAC90CAA733B0859_3", "Xform")
+        stage.DefinePrim("/RootNode/instances/inst_BAC90CAA733B0859_3/Child", "Xform")
+        value = core.get_instances_from_mesh_path(f"{mesh_path}/Child")
+
+        # Assert
+        self.assertEqual(
+            {f"{path}/Child" for path in instance_paths | {"/RootNode/instances/inst_BAC90CAA733B0859_3"}}, value
+        )
+        self.assertEqual([], _get_stage_hash_index(stage).get_inconsistencies())
+
+        # Act
+        stage.RemovePrim("/RootNode/instances/inst_BAC90CAA733B0859_3")
+        value = core.get_instances_from_mesh_path(mesh_path)
+
+        # Assert
+        self.assertEqual(instance_paths, value)
+        self.assertEqual([], _get_stage_hash_index(stage).get_inconsistencies())
+
+    async def test_get_prim_paths_with_hashes_should_match_full_traversal(self):
+        # Arrange
+        stage = self.context.get_stage()
+        stage.DefinePrim("/RootNode/meshes/mesh_BAC90CAA733B0859/NewMesh", "Mesh")
+        asset_hashes = {"BAC90CAA733B0859", "9907D0B07D040077", "BC868CE5A075ABB1"}
+
+        type_predicates = {
+            None: lambda prim: (
+                _prim_utils.is_light(prim) or _prim_utils.is_material(prim) or _prim_utils.is_model(prim)
+            ),
+            _prim_utils.PrimTypes.LIGHTS: _prim_utils.is_light,
+            _prim_utils.PrimTypes.MATERIALS: _prim_utils.is_material,
+            _prim_utils.PrimTypes.MODELS: _prim_utils.is_model,
+        }
+
+        for prim_type, type_predicate in type_predicates.items():
+            with self.subTest(prim_type=prim_type):
+                # Act
+                value = _prim_utils.get_prim_paths(asset_hashes=asset_hashes, prim_type=prim_type)
+
+                # Assert
+                expected = _prim_utils.filter_prims_paths(
+                    lambda prim, _predicate=type_predicate: _predicate(prim)
+                    and _prim_utils.includes_hash(prim, asset_hashes),
+                    filter_session_prims=True,
+                )
+                self.assertTrue(value)
+                self.assertEqual(expected, value)
+
+        self.assertIn(
+            "/RootNode/meshes/mesh_BAC90CAA733B0859/NewMesh",
+            _prim_utils.get_prim_paths(asset_hashes=asset_hashes, prim_type=_prim_utils.PrimTypes.MODELS),
+        )
+        self.assertEqual([], _get_stage_hash_index(stage).get_inconsistencies())
+
     async def test_asset_is_in_proj_dir(self):
         # Arrange
         core = _AssetReplacementsCore("")
@@ -15,12 +15,16 @@
 * limitations under the License.
 """
 
+import tempfile
 from contextlib import nullcontext
+from pathlib import Path
+from unittest.mock import patch
 
 import omni.usd
 from lightspeed.trex.asset_replacements.core.shared.data_models import AssetReplacementsValidators
 from omni.kit.test.async_unittest import AsyncTestCase
 from omni.kit.test_suite.helpers import wait_stage_loading
+from pxr import Sdf
 
 
 class TestAssetReplacementsValidators(AsyncTestCase):
@@ -61,3 +65,35 @@ class TestAssetReplacementsValidators(AsyncTestCase):
                     self.assertEqual(value, prim_path)
                 else:
                     self.assertEqual(str(cm.exception), f"{message}: {prim_path}")
+
+    async def test_get_invalid_references_validates_each_file_once(self):
+        # Arrange
+        stage = self.context.get_stage()
+        temp_dir = tempfile.TemporaryDirectory()
+        asset_file = Path(temp_dir.name) / "asset.usda"
+        Sdf.Layer.CreateNew(str(asset_file)).Save()
+
+        references = []
+        for index in range(10):
+            prim = stage.DefinePrim(f"/test/mesh_{index}", "Xform")
+            prim.GetReferences().AddReference(str(asset_file))
+            references.append((f"/test/mesh_{index}", asset_file, None, None))
+        stage.DefinePrim("/test/no_reference", "Xform")
+        references.append(("/test/no_reference", asset_file, None, None))
+        references.append(("/test/non_existent", asset_file, None, None))
+
+        with patch(
+            "lightspeed.trex.asset_replacements.core.shared.data_models.validators.is_asset_ingested"
+        ) as was_ingested_mock:
+            was_ingested_mock.return_value = True
+
+            # Act
+            errors = AssetReplacementsValidators.get_invalid_references(references, False, "")
+
+        # Assert
+        self.assertEqual(1, was_ingested_mock.call_count)
+        self.assertEqual([10, 11], list(errors))
+        self.assertEqual("The selected prim has no references", str(errors[10]))
+        self.assertEqual("The prim path does not exist in the current stage: /test/non_existent", str(errors[11]))
+
+        temp_dir.cleanup()
@@ -26,6 +26,7 @@ import omni.usd
 from lightspeed.common import constants
 from lightspeed.trex.asset_replacements.core.shared import Setup as _AssetReplacementsCore
 from omni.flux.utils.common import path_utils as _path_utils
+from omni.flux.utils.common.metadata_store import is_metadata_store_enabled as _is_metadata_store_enabled
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
 from omni.flux.validator.factory import BASE_HASH_KEY, VALIDATION_PASSED
 from omni.kit.usd.collect import Collector
@@ -117,10 +118,14 @@ def _copy_metadata(asset_path: str, dest_path: str):
     dest_path_url = _OmniUrl(_OmniUrl(dest_path).path)
     dest_metadata_path = str(dest_path_url / asset_path_basename) + ".meta"
     new_asset_path = f"{dest_path}/{asset_path_basename}"
-    try:
-        omni.client.copy(f"{asset_path}.meta", dest_metadata_path, omni.client.CopyBehavior.OVERWRITE)
-    except OSError:
-        carb.log_error(f"The metadata file could not be copied from {asset_path}.meta to {dest_path}.")
+    if _is_metadata_store_enabled():
+        # The metadata is stored in the metadata store of the directories, not in sidecar files
+        _path_utils.copy_metadata(asset_path, new_asset_path)
+    else:
+        try:
+            omni.client.copy(f"{asset_path}.meta", dest_metadata_path, omni.client.CopyBehavior.OVERWRITE)
+        except OSError:
+            carb.log_error(f"The metadata file could not be copied from {asset_path}.meta to {dest_path}.")
 
     # Update metadata if there is no hash or if the current hash does not match
     if not _path_utils.read_metadata(file_path=asset_path, key=BASE_HASH_KEY) or not _path_utils.hash_match_metadata(
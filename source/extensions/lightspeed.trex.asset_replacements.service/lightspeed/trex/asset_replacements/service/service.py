@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+from fastapi import Request, Response
 from lightspeed.trex.asset_replacements.core.shared import Setup as AssetReplacementsCore
 from lightspeed.trex.asset_replacements.core.shared.data_models import (
     AssetReplacementsValidators,
@@ -32,6 +33,7 @@ from lightspeed.trex.asset_replacements.core.shared.data_models.models import (
     PrimTexturesPathParamModel,
     ReferenceResponseModel,
     ReplaceReferenceRequestModel,
+    ReplaceReferencesRequestModel,
     TexturesResponseModel,
 )
 from omni.flux.asset_importer.core.data_models import TextureTypeNames
@@ -52,6 +54,8 @@ class AssetReplacementsService(ServiceBase):
 
         super().__init__()
 
+        self.watch_stage(context_name)
+
     @classmethod
     @property
     def prefix(cls) -> str:
@@ -60,6 +64,8 @@ class AssetReplacementsService(ServiceBase):
     def register_endpoints(self):
         context_name = self.__context_name
         asset_path_description = "The asset path to the asset that will be inspected for {0}"
+        cursor_description = "The cursor of the page to get, given by the `X-Next-Cursor` header of the previous page"
+        limit_description = "The maximum number of items to return. Return all the items if not set"
 
         @self.router.get(
             path="/",
@@ -67,6 +73,8 @@ class AssetReplacementsService(ServiceBase):
             response_model=PrimsResponseModel,
         )
         async def get_assets(
+            request: Request,
+            response: Response,
             asset_hashes: set[str] | None = ServiceBase.describe_query_param(  # noqa B008
                 None, "Filter assets to keep specific hashes"
             ),
@@ -90,18 +98,29 @@ class AssetReplacementsService(ServiceBase):
                 "Filter an asset if it exists or not on a given layer. Use in conjunction with `layer_identifier` "
                 "to filter on a given layer, otherwise this parameter will be ignored.",
             ),
+            cursor: str | None = ServiceBase.describe_query_param(None, cursor_description),  # noqa B008
+            limit: int | None = ServiceBase.describe_query_param(None, limit_description),  # noqa B008
         ) -> PrimsResponseModel:
             try:
-                return self.__asset_core.get_prim_paths_with_data_model(
-                    GetPrimsQueryModel(
-                        asset_hashes=asset_hashes,
-                        asset_types=asset_types,
-                        return_selection=selection,
-                        filter_session_prims=filter_session_assets,
-                        layer_identifier=layer_identifier,
-                        exists=exists,
-                        context_name=context_name,
-                    )
+                return await self.get_cached_response(
+                    request,
+                    response,
+                    lambda: self.__asset_core.get_prim_paths_with_data_model(
+                        GetPrimsQueryModel(
+                            asset_hashes=asset_hashes,
+                            asset_types=asset_types,
+                            return_selection=selection,
+                            filter_session_prims=filter_session_assets,
+                            layer_identifier=layer_identifier,
+                            exists=exists,
+                            context_name=context_name,
+                        )
+                    ),
+                    items_field="asset_paths",
+                    cursor=cursor,
+                    limit=limit,
+                    # The selection changes don't bump the revision
+                    use_cache=not selection,
                 )
             except ValueError as e:
                 ServiceBase.raise_error(422, e)
@@ -112,13 +131,24 @@ class AssetReplacementsService(ServiceBase):
             response_model=PrimsResponseModel,
         )
         async def get_model_instances(
+            request: Request,
+            response: Response,
             asset_path: str = ServiceBase.validate_path_param(  # noqa B008
                 PrimInstancesPathParamModel,
                 description=asset_path_description.format("instances"),  # noqa B008
                 context_name=context_name,
             ),
+            cursor: str | None = ServiceBase.describe_query_param(None, cursor_description),  # noqa B008
+            limit: int | None = ServiceBase.describe_query_param(None, limit_description),  # noqa B008
         ) -> PrimsResponseModel:
-            return self.__asset_core.get_instances_with_data_model(asset_path)
+            return await self.get_cached_response(
+                request,
+                response,
+                lambda: self.__asset_core.get_instances_with_data_model(asset_path),
+                items_field="asset_paths",
+                cursor=cursor,
+                limit=limit,
+            )
 
         @self.router.get(
             path="/{asset_path:path}/textures",
@@ -126,6 +156,8 @@ class AssetReplacementsService(ServiceBase):
             response_model=TexturesResponseModel,
         )
         async def get_material_textures(
+            request: Request,
+            response: Response,
             asset_path: str = ServiceBase.validate_path_param(  # noqa B008
                 PrimTexturesPathParamModel,
                 description=asset_path_description.format("textures"),  # noqa B008
@@ -134,9 +166,18 @@ class AssetReplacementsService(ServiceBase):
             texture_types: set[TextureTypeNames] | None = ServiceBase.describe_query_param(  # noqa B008
                 None, "The type of textures to look for in the given material."
             ),
+            cursor: str | None = ServiceBase.describe_query_param(None, cursor_description),  # noqa B008
+            limit: int | None = ServiceBase.describe_query_param(None, limit_description),  # noqa B008
         ) -> TexturesResponseModel:
-            return self.__asset_core.get_textures_with_data_model(
-                asset_path, GetTexturesQueryModel(texture_types=texture_types)
+            return await self.get_cached_response(
+                request,
+                response,
+                lambda: self.__asset_core.get_textures_with_data_model(
+                    asset_path, GetTexturesQueryModel(texture_types=texture_types)
+                ),
+                items_field="textures",
+                cursor=cursor,
+                limit=limit,
             )
 
         @self.router.get(
@@ -145,13 +186,17 @@ class AssetReplacementsService(ServiceBase):
             response_model=ReferenceResponseModel,
         )
         async def get_asset_file_paths(
+            request: Request,
+            response: Response,
             asset_path: str = ServiceBase.validate_path_param(  # noqa B008
                 PrimReferencePathParamModel,
                 description=asset_path_description.format("file paths"),  # noqa B008
                 context_name=context_name,
             ),
         ) -> ReferenceResponseModel:
-            return self.__asset_core.get_reference_with_data_model(asset_path)
+            return await self.get_cached_response(
+                request, response, lambda: self.__asset_core.get_reference_with_data_model(asset_path)
+            )
 
         @self.router.post(
             path="/{asset_path:path}/file-paths",
@@ -201,6 +246,19 @@ class AssetReplacementsService(ServiceBase):
 
             return self.__asset_core.replace_reference_with_data_model(asset_path, body)
 
+        @self.router.put(
+            path="/file-paths",
+            description=(
+                "Replace the file paths of many assets in a single undo step. "
+                "All the replacements are validated before any file path is replaced."
+            ),
+            response_model=ReferenceResponseModel,
+        )
+        async def replace_asset_file_paths(
+            body: ServiceBase.inject_hidden_fields(ReplaceReferencesRequestModel, context_name=context_name),
+        ) -> ReferenceResponseModel:
+            return self.__asset_core.replace_references_with_data_model(body)
+
         @self.router.put(path="/selection/{asset_paths:path}", description="Set the selection in the current stage.")
         async def set_selection(
             asset_paths: str = ServiceBase.validate_path_param(  # noqa B008
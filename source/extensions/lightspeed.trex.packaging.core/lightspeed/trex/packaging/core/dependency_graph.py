@@ -0,0 +1,169 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Set
+
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from pxr import Sdf, UsdUtils
+
+
+@dataclass
+class LayerDependencies:
+    """
+    The external dependencies authored in a single layer, as written in the layer.
+    """
+
+    sublayers: List[str] = field(default_factory=list)
+    references: List[str] = field(default_factory=list)
+    payloads: List[str] = field(default_factory=list)
+    asset_paths: List[str] = field(default_factory=list)
+
+    @property
+    def paths(self) -> List[str]:
+        """
+        Get every distinct path authored in the layer, in the order they are listed by type
+        """
+        return list(dict.fromkeys([*self.sublayers, *self.references, *self.payloads, *self.asset_paths]))
+
+
+class DependencyGraph:
+    """
+    The resolved dependencies of a layer stack, computed once and shared by every packaging stage.
+    """
+
+    def __init__(self, root_layer: Sdf.Layer):
+        """
+        Args:
+            root_layer: The root layer to compute the dependencies for
+        """
+        self._root_layer_identifier = root_layer.identifier
+
+        layers, assets, unresolved_paths = UsdUtils.ComputeAllDependencies(self._root_layer_identifier)
+
+        self._layers: List[Sdf.Layer] = list(layers)
+        self._assets: List[str] = list(assets)
+        self._unresolved_paths: List[str] = list(unresolved_paths)
+
+        self._resolved_paths: Set[str] = {
+            *[_OmniUrl(layer.identifier).path for layer in self._layers],
+            *[_OmniUrl(asset).path for asset in self._assets],
+        }
+        self._layer_dependencies: Dict[str, LayerDependencies] = {}
+
+    @property
+    def root_layer_identifier(self) -> str:
+        """
+        Get the identifier of the layer the graph was computed for
+        """
+        return self._root_layer_identifier
+
+    @property
+    def layers(self) -> List[Sdf.Layer]:
+        """
+        Get every layer in the graph, including the root layer
+        """
+        return self._layers
+
+    @property
+    def assets(self) -> List[str]:
+        """
+        Get every non-layer asset resolved in the graph
+        """
+        return self._assets
+
+    @property
+    def unresolved_paths(self) -> List[str]:
+        """
+        Get every asset path that could not be resolved
+        """
+        return self._unresolved_paths
+
+    @property
+    def dependencies(self) -> List[str]:
+        """
+        Get the identifiers of every layer followed by every asset in the graph
+        """
+        return [*[layer.identifier for layer in self._layers], *self._assets]
+
+    def is_resolved(self, path: str) -> bool:
+        """
+        Check if a path was resolved in the graph without accessing the file system.
+
+        Args:
+            path: An absolute POSIX path
+
+        Returns:
+            True if the path is a resolved layer or asset, False otherwise
+        """
+        return path in self._resolved_paths
+
+    def get_layer_dependencies(self, layer: Sdf.Layer) -> LayerDependencies:
+        """
+        Get the sublayers, references, payloads and asset paths authored in a given layer.
+
+        The result is computed the first time a layer is queried and cached for the lifetime of the graph.
+
+        Args:
+            layer: A layer of the graph
+
+        Returns:
+            The dependencies authored in the layer
+        """
+        dependencies = self._layer_dependencies.get(layer.identifier)
+        if dependencies is None:
+            dependencies = self._extract_layer_dependencies(layer)
+            self._layer_dependencies[layer.identifier] = dependencies
+        return dependencies
+
+    def _extract_layer_dependencies(self, layer: Sdf.Layer) -> LayerDependencies:
+        dependencies = LayerDependencies(sublayers=list(layer.subLayerPaths))
+
+        def add_asset_values(value):
+            if isinstance(value, Sdf.AssetPath):
+                if value.path:
+                    dependencies.asset_paths.append(value.path)
+            elif value is not None and not isinstance(value, str):
+                for item in value:
+                    add_asset_values(item)
+
+        def visit(path: Sdf.Path):
+            if path.IsPrimOrPrimVariantSelectionPath():
+                prim_spec = layer.GetPrimAtPath(path)
+                if not prim_spec:
+                    return
+                dependencies.references.extend(
+                    r.assetPath for r in prim_spec.referenceList.GetAddedOrExplicitItems() if r.assetPath
+                )
+                dependencies.payloads.extend(
+                    p.assetPath for p in prim_spec.payloadList.GetAddedOrExplicitItems() if p.assetPath
+                )
+            elif path.IsPropertyPath():
+                attribute_spec = layer.GetAttributeAtPath(path)
+                if not attribute_spec or attribute_spec.typeName not in [
+                    Sdf.ValueTypeNames.Asset,
+                    Sdf.ValueTypeNames.AssetArray,
+                ]:
+                    return
+                if attribute_spec.HasDefaultValue():
+                    add_asset_values(attribute_spec.default)
+                for time in layer.ListTimeSamplesForPath(path):
+                    add_asset_values(layer.QueryTimeSample(path, time))
+
+        layer.Traverse(Sdf.Path.absoluteRootPath, visit)
+
+        return dependencies
@@ -19,6 +19,7 @@ import re
 from pathlib import Path
 from typing import List, Optional
 
+from lightspeed.trex.packaging.core.transfer import DEFAULT_MAX_TRANSFER_WORKERS as _DEFAULT_MAX_TRANSFER_WORKERS
 from lightspeed.trex.replacement.core.shared import Setup as _ReplacementCore
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
 from pydantic import BaseModel, Field, validator
@@ -52,6 +53,18 @@ class ModPackagingSchema(BaseModel):
         "- Copying will make sure the mod is completely standalone so no other mods need to be installed for this mod "
         "to be loaded successfully.",
     )
+    incremental: Optional[bool] = Field(
+        False,
+        description="Whether the existing package found in the output directory should be updated instead of being "
+        "re-packaged from scratch.\n\n"
+        "- When enabled, a manifest of the packaged content is stored in the project directory and only the assets & "
+        "layers that changed since the last run will be written. Outputs no longer referenced will be deleted.\n"
+        "- When disabled, or if no valid manifest is found, the output directory will be emptied.",
+    )
+    max_transfer_workers: Optional[int] = Field(
+        _DEFAULT_MAX_TRANSFER_WORKERS,
+        description="The maximum number of files that can be copied to the output directory at the same time.",
+    )
     mod_name: str = Field(..., description="The display name used for the mod in the RTX Remix Runtime.")
     mod_version: str = Field(..., description="The mod version. Used when building dependency lists.")
     mod_details: Optional[str] = Field(None, description="Optional text used to describe the mod in more details.")
@@ -85,6 +98,13 @@ class ModPackagingSchema(BaseModel):
             raise ValueError("The value cannot be empty")
         return v
 
+    @validator("max_transfer_workers", allow_reuse=True)
+    def is_positive(cls, v):  # noqa
+        """Check that at least 1 transfer worker is used"""
+        if v < 1:
+            raise ValueError("The value must be greater than 0")
+        return v
+
     @validator("mod_version", allow_reuse=True)
     def is_valid_version(cls, v):  # noqa
         """Check that the mod version has a valid format"""
@@ -0,0 +1,200 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import hashlib
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Union
+
+import carb
+import omni.client
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from omni.flux.utils.common.path_utils import hash_file as _hash_file
+from omni.flux.utils.common.path_utils import read_json_file as _read_json_file
+from omni.flux.utils.common.path_utils import write_json_file as _write_json_file
+
+
+class PackagingManifest:
+    """
+    Keep track of the content of a packaged mod to allow re-packaging only the outputs that changed since the last run.
+
+    Every output is stored using its path relative to the output directory, alongside the source it was generated from,
+    the source content hash and, for copied assets, the source size & modification time.
+
+    The manifest is stored in the project directory, or next to the output directory without a project, so it doesn't
+    ship with the package. Sources & output directories found in the project directory are stored relative to it, so
+    the manifest stays valid when the project is moved.
+    """
+
+    MANIFEST_DIRECTORY_NAME = ".packaging_manifests"
+    MANIFEST_VERSION = 1
+
+    def __init__(self, output_directory: Union[Path, str], project_directory: Optional[Union[Path, str]] = None):
+        """
+        Args:
+            output_directory: The directory of the package
+            project_directory: The directory of the packaged project, where the manifest is stored. Sources outside
+                               of it are stored as-is
+        """
+        self._output_directory = _OmniUrl(output_directory)
+        self._project_directory = _OmniUrl(project_directory) if project_directory else None
+        self._previous_entries: Dict[str, Dict] = {}
+        self._entries: Dict[str, Dict] = {}
+
+    @property
+    def url(self) -> _OmniUrl:
+        """
+        Get the URL of the manifest file. Every output directory has its own manifest.
+        """
+        manifest_directory = self._project_directory or _OmniUrl(self._output_directory.parent_url)
+        output_key = hashlib.md5(self._get_stored_path(self._output_directory.path).encode("utf-8")).hexdigest()
+        return manifest_directory / self.MANIFEST_DIRECTORY_NAME / f"{output_key}.json"
+
+    def load(self) -> bool:
+        """
+        Load the manifest of a previous packaging run in the output directory.
+
+        Returns:
+            True if a valid manifest was found, False otherwise.
+        """
+        self._previous_entries.clear()
+        self._entries.clear()
+
+        if not self.url.exists:
+            return False
+
+        try:
+            data = _read_json_file(str(self.url))
+        except (IOError, ValueError):
+            carb.log_warn(f"Unable to read the packaging manifest: {self.url}")
+            return False
+
+        if data.get("version") != self.MANIFEST_VERSION:
+            carb.log_warn(f"Unsupported packaging manifest version found: {self.url}")
+            return False
+
+        self._previous_entries = data.get("entries", {})
+        return True
+
+    def save(self):
+        """
+        Write the manifest of the current packaging run.
+        """
+        _write_json_file(
+            str(self.url),
+            {
+                "version": self.MANIFEST_VERSION,
+                "output_directory": self._get_stored_path(self._output_directory.path),
+                "entries": self._entries,
+            },
+        )
+
+    def register_asset(self, output_path: Union[_OmniUrl, str], source_path: str) -> bool:
+        """
+        Register an asset that will be copied to the output directory.
+
+        The source content is only hashed when its size or modification time changed since the last run.
+
+        Args:
+            output_path: The absolute output path of the asset
+            source_path: The absolute path of the asset to copy
+
+        Returns:
+            True if the output must be written, False if it is already up-to-date.
+        """
+        key = self._get_relative_output_path(output_path)
+        previous_entry = self._previous_entries.get(key)
+        source = self._get_stored_path(source_path)
+
+        result, entry = omni.client.stat(source_path)
+        if result != omni.client.Result.OK:
+            self._entries[key] = {"source": source}
+            return True
+
+        size = entry.size
+        modified_time = entry.modified_time.timestamp()
+
+        if (
+            previous_entry
+            and previous_entry.get("source") == source
+            and previous_entry.get("size") == size
+            and previous_entry.get("mtime") == modified_time
+        ):
+            self._entries[key] = previous_entry
+            return not _OmniUrl(output_path).exists
+
+        content_hash = _hash_file(source_path)
+        self._entries[key] = {"source": source, "hash": content_hash, "size": size, "mtime": modified_time}
+
+        return self._is_modified(previous_entry, source, content_hash, output_path)
+
+    def register_layer(self, output_path: Union[_OmniUrl, str], source_path: str, content: str) -> bool:
+        """
+        Register a layer that will be exported to the output directory.
+
+        Layers are always compared using their content since packaging modifies the asset paths before exporting them.
+
+        Args:
+            output_path: The absolute output path of the layer
+            source_path: The absolute path of the original layer
+            content: The serialized content of the layer to export
+
+        Returns:
+            True if the output must be written, False if it is already up-to-date.
+        """
+        key = self._get_relative_output_path(output_path)
+        previous_entry = self._previous_entries.get(key)
+
+        source = self._get_stored_path(source_path)
+
+        content_hash = hashlib.md5(content.encode("utf-8")).hexdigest()
+        self._entries[key] = {"source": source, "hash": content_hash}
+
+        return self._is_modified(previous_entry, source, content_hash, output_path)
+
+    def get_stale_outputs(self) -> List[_OmniUrl]:
+        """
+        Get the outputs written by the previous packaging run that are no longer referenced by the current one.
+
+        Returns:
+            A list of absolute output URLs
+        """
+        return [self._output_directory / key for key in self._previous_entries if key not in self._entries]
+
+    def _is_modified(
+        self,
+        previous_entry: Optional[Dict],
+        source: str,
+        content_hash: Optional[str],
+        output_path: Union[_OmniUrl, str],
+    ) -> bool:
+        if not previous_entry or content_hash is None:
+            return True
+        if previous_entry.get("source") != source or previous_entry.get("hash") != content_hash:
+            return True
+        # The output might have been deleted manually since the last run
+        return not _OmniUrl(output_path).exists
+
+    def _get_relative_output_path(self, output_path: Union[_OmniUrl, str]) -> str:
+        return PurePosixPath(_OmniUrl(output_path).path).relative_to(self._output_directory.path).as_posix()
+
+    def _get_stored_path(self, source_path: str) -> str:
+        if self._project_directory is None:
+            return source_path
+        try:
+            return PurePosixPath(_OmniUrl(source_path).path).relative_to(self._project_directory.path).as_posix()
+        except ValueError:
+            return source_path
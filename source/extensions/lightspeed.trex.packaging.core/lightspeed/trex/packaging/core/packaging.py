@@ -35,11 +35,16 @@ from lightspeed.layer_manager.core import LSS_LAYER_MOD_DEPENDENCIES as _LSS_LAY
 from lightspeed.layer_manager.core import LSS_LAYER_MOD_NAME as _LSS_LAYER_MOD_NAME
 from lightspeed.layer_manager.core import LSS_LAYER_MOD_NOTES as _LSS_LAYER_MOD_NOTES
 from lightspeed.layer_manager.core import LSS_LAYER_MOD_VERSION as _LSS_LAYER_MOD_VERSION
+from lightspeed.trex.packaging.core.dependency_graph import DependencyGraph as _DependencyGraph
 from lightspeed.trex.packaging.core.items import ModPackagingSchema as _ModPackagingSchema
+from lightspeed.trex.packaging.core.manifest import PackagingManifest as _PackagingManifest
+from lightspeed.trex.packaging.core.transfer import DEFAULT_MAX_TRANSFER_WORKERS as _DEFAULT_MAX_TRANSFER_WORKERS
+from lightspeed.trex.packaging.core.transfer import FileTransferEngine as _FileTransferEngine
 from omni.flux.utils.common import Event as _Event
 from omni.flux.utils.common import EventSubscription as _EventSubscription
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from omni.flux.utils.common.omni_url import exists_urls_async as _exists_urls_async
 from omni.flux.utils.material_converter.utils import MaterialConverterUtils as _MaterialConverterUtils
 from omni.kit.usd.collect.omni_client_wrapper import OmniClientWrapper as _OmniClientWrapper
 from omni.kit.usd.layers import LayerUtils as _LayerUtils
@@ -56,6 +61,7 @@ class PackagingCore:
             "_current_count": None,
             "_total_count": None,
             "_temp_files": None,
+            "_transfer_engine": None,
         }
         for attr, value in self.default_attr.items():
             setattr(self, attr, value)
@@ -65,6 +71,7 @@ class PackagingCore:
         self._total_count = 0
         self._status = "(0/7) Initializing"
         self._temp_files = {}
+        self._transfer_engine = None
 
         self.__packaging_progress = _Event()
         self.__packaging_completed = _Event()
@@ -133,10 +140,13 @@ class PackagingCore:
             )
             self.current_count += 1
 
+            # Resolve the dependencies of the filtered layer stack once and share them with every following stage
+            dependency_graph = _DependencyGraph(temp_root_mod_layer)
+
             # Get the updated external mods dependencies pointing to the installed external mods
             if model.redirect_external_dependencies:
                 mod_dependencies, redirected_dependencies = self._get_redirected_dependencies(
-                    temp_root_mod_layer, [m for m in model.mod_layer_paths if m not in model.selected_layer_paths]
+                    dependency_graph, [m for m in model.mod_layer_paths if m not in model.selected_layer_paths]
                 )
             # No dependencies will be redirected
             else:
@@ -145,7 +155,15 @@ class PackagingCore:
 
             # Don't use the omni collector because it's not flexible enough
             errors.extend(
-                await self._collect(temp_root_mod_layer, temp_layers, model.output_directory, redirected_dependencies)
+                await self._collect(
+                    dependency_graph,
+                    temp_layers,
+                    model.output_directory,
+                    redirected_dependencies,
+                    incremental=model.incremental,
+                    project_directory=_OmniUrl(model.mod_layer_paths[0]).parent_url,
+                    max_transfer_workers=model.max_transfer_workers,
+                )
             )
 
             exported_mod_layer = Sdf.Layer.FindOrOpen(
@@ -174,6 +192,8 @@ class PackagingCore:
         Cancel the packaging process.
         """
         self._cancel_token = True
+        if self._transfer_engine:
+            self._transfer_engine.cancel()
 
     @property
     def current_count(self) -> int:
@@ -299,13 +319,12 @@ class PackagingCore:
         return temp_layers
 
     def _get_redirected_dependencies(
-        self, temp_root_layer: Sdf.Layer, external_mod_paths: List[Path]
+        self, dependency_graph: _DependencyGraph, external_mod_paths: List[Path]
     ) -> Tuple[Set[str], Set[str]]:
         mod_dependencies = set()
         redirected_dependencies = set()
 
-        all_layers, all_assets, _ = UsdUtils.ComputeAllDependencies(temp_root_layer.identifier)
-        all_dependencies = [*[layer.identifier for layer in all_layers], *all_assets]
+        all_dependencies = dependency_graph.dependencies
 
         self._packaging_new_stage("(2/7) Redirecting dependencies...", len(all_dependencies))
 
@@ -339,30 +358,33 @@ class PackagingCore:
     @omni.usd.handle_exception
     async def _collect(
         self,
-        temp_root_layer: Sdf.Layer,
+        dependency_graph: _DependencyGraph,
         existing_temp_layers: List[str],
         output_directory: Union[Path, str],
         redirected_dependencies: Set[str],
+        incremental: bool = False,
+        max_transfer_workers: int = _DEFAULT_MAX_TRANSFER_WORKERS,
+        project_directory: Optional[Union[Path, str]] = None,
     ) -> List[str]:
         errors = []
 
         if self._cancel_token:
             return errors
 
-        all_layers, all_assets, unresolved_paths = UsdUtils.ComputeAllDependencies(temp_root_layer.identifier)
-
-        self._packaging_new_stage("(3/7) Creating temporary layers...", len(all_layers))
+        self._packaging_new_stage("(3/7) Creating temporary layers...", len(dependency_graph.layers))
 
         temp_layers_map = {self._get_original_path(temp_layer): temp_layer for temp_layer in existing_temp_layers}
         temp_layers = []
-        for layer in all_layers:
+        # The temporary layers are copies of the graph layers, their authored paths are read from the graph
+        graph_layers = {}
+        for layer in dependency_graph.layers:
             if self._cancel_token:
                 return errors
 
             self.current_count += 1
 
             # The root layer is already a temporary layer
-            if layer.identifier == temp_root_layer.identifier:
+            if layer.identifier == dependency_graph.root_layer_identifier:
                 temp_layer_path = layer.identifier
             # For every other layer, make sure a temporary layer was not already created before creating one
             else:
@@ -374,15 +396,16 @@ class PackagingCore:
                 errors.append(f"Unable to open temporary file: {temp_layer_path}")
             else:
                 temp_layers.append(temp_layer)
+                graph_layers[temp_layer.identifier] = layer
 
-        for unresolved_path in unresolved_paths:
+        for unresolved_path in dependency_graph.unresolved_paths:
             errors.append(f"Unresolved asset found when collecting dependencies: {unresolved_path}")
 
         if errors or self._cancel_token:
             return errors
 
         temp_layer_paths = {_OmniUrl(temp_layer.identifier).path: temp_layer for temp_layer in temp_layers}
-        all_dependencies = [*temp_layer_paths.keys(), *all_assets]
+        all_dependencies = [*temp_layer_paths.keys(), *dependency_graph.assets]
 
         self._packaging_new_stage("(4/7) Listing assets to collect...", len(all_dependencies))
 
@@ -427,20 +450,33 @@ class PackagingCore:
             if self._cancel_token:
                 return errors
             self.current_count += 1
-            UsdUtils.ModifyAssetPaths(temp_layer, partial(self._modify_asset_paths, temp_layer, updated_dependencies))
+            self._modify_layer_asset_paths(
+                dependency_graph, graph_layers[temp_layer.identifier], temp_layer, updated_dependencies
+            )
 
         # Wrap in a try for when Export fails to write the file
         try:
             if self._cancel_token:
                 return errors
 
-            # Make sure to create a clean packaging directory
-            if _OmniUrl(output_directory).exists:
+            # When packaging incrementally, only the outputs that changed since the last run will be written
+            manifest = None
+            update_existing_package = False
+            if incremental:
+                manifest = _PackagingManifest(output_directory, project_directory=project_directory)
+                update_existing_package = manifest.load()
+
+            # Make sure to create a clean packaging directory unless an existing package can be updated
+            if not update_existing_package and _OmniUrl(output_directory).exists:
                 await _OmniClientWrapper.delete(str(output_directory))
 
             self._packaging_new_stage("(6/7) Collecting assets...", len(self._collected_dependencies))
 
-            # Copy all collected assets to the output directory
+            output_folders = set()
+            layer_exports = []
+            asset_copies = []
+
+            # List all the collected assets to write in the output directory
             for temp_input_path, relative_output_path in self._collected_dependencies.items():
                 if self._cancel_token:
                     return errors
@@ -450,32 +486,61 @@ class PackagingCore:
                 if input_path:
                     output_path = output_path.with_name(_OmniUrl(input_path).name)
 
-                # Create all the missing folders in the tree
-                cumulative_url = None
-                for part in Path(output_path.parent_url).parts:
-                    if not cumulative_url:
-                        cumulative_url = _OmniUrl(part)
+                input_layer = temp_layer_paths.get(temp_input_path)
+
+                # Skip the outputs that are already up-to-date
+                if manifest:
+                    if input_layer:
+                        is_modified = manifest.register_layer(
+                            output_path, input_path or temp_input_path, input_layer.ExportToString()
+                        )
                     else:
-                        cumulative_url /= part
-                    if not str(cumulative_url).startswith(str(output_directory)) or cumulative_url.exists:
+                        is_modified = manifest.register_asset(output_path, temp_input_path)
+                    if not is_modified:
+                        self.current_count += 1
                         continue
-                    await _OmniClientWrapper.create_folder(str(cumulative_url))
+
+                output_folders.add(output_path.parent_url)
 
                 # If the dependency is a layer, export it to the output directory to keep references changes applied
-                input_layer = temp_layer_paths.get(temp_input_path)
                 if input_layer:
-                    input_layer.Export(str(output_path))
+                    layer_exports.append((input_layer, str(output_path)))
                 # Otherwise simply copy the dependency to the output directory
                 else:
-                    await _OmniClientWrapper.copy(temp_input_path, str(output_path))
+                    asset_copies.append((temp_input_path, str(output_path)))
+
+            self._transfer_engine = _FileTransferEngine(max_workers=max_transfer_workers)
 
+            # Create all the missing folders in the tree. A freshly emptied output directory has no existing folders.
+            await self._transfer_engine.create_folders(
+                output_folders, output_directory, check_exists=update_existing_package
+            )
+
+            for input_layer, output_path in layer_exports:
+                if self._cancel_token:
+                    return errors
+                input_layer.Export(output_path)
                 self.current_count += 1
+
+            await self._transfer_engine.copy(asset_copies, self._on_transfer_progress)
+
+            if self._cancel_token:
+                return errors
+
+            if manifest:
+                # Delete the outputs that are no longer referenced by the package
+                stale_outputs = await _exists_urls_async(manifest.get_stale_outputs())
+                for stale_output, exists in stale_outputs.items():
+                    if exists:
+                        await _OmniClientWrapper.delete(stale_output)
+                manifest.save()
         # Make sure to bubble up failures
         except Exception as e:  # noqa PLW0706
             errors.append(e)
 
         # Clear assets marked for collection now that they were copied
         self._collected_dependencies.clear()
+        self._transfer_engine = None
 
         return errors
 
@@ -572,8 +637,43 @@ class PackagingCore:
 
         return fixed_relative_path
 
+    def _modify_layer_asset_paths(
+        self,
+        dependency_graph: _DependencyGraph,
+        layer: Sdf.Layer,
+        temp_layer: Sdf.Layer,
+        dependency_updates: Dict[str, Callable[[Sdf.Layer, str], str]],
+    ):
+        """
+        Update the asset paths of a temporary layer.
+
+        The paths authored in the layer are read from the dependency graph so every distinct path is only updated once.
+
+        Args:
+            dependency_graph: The dependency graph of the packaged layer stack
+            layer: The layer of the graph the temporary layer was copied from
+            temp_layer: The temporary layer to update
+            dependency_updates: The update method of every dependency to update, keyed by absolute path
+        """
+        modify_asset_path = partial(self._modify_asset_paths, dependency_graph, temp_layer, dependency_updates)
+        modified_paths = {
+            path: modify_asset_path(path) for path in dependency_graph.get_layer_dependencies(layer).paths
+        }
+
+        def get_modified_path(path: str) -> str:
+            # Paths the graph doesn't list, like asset-valued metadata, are updated when they are found
+            if path not in modified_paths:
+                modified_paths[path] = modify_asset_path(path)
+            return modified_paths[path]
+
+        UsdUtils.ModifyAssetPaths(temp_layer, get_modified_path)
+
     def _modify_asset_paths(
-        self, temp_layer: Sdf.Layer, dependency_updates: Dict[str, Callable[[Sdf.Layer, str], str]], relative_path: str
+        self,
+        dependency_graph: _DependencyGraph,
+        temp_layer: Sdf.Layer,
+        dependency_updates: Dict[str, Callable[[Sdf.Layer, str], str]],
+        relative_path: str,
     ) -> str:
         if self._cancel_token:
             return relative_path
@@ -588,8 +688,9 @@ class PackagingCore:
             absolute_url = _OmniUrl(_OmniUrl(temp_layer.identifier).parent_url) / relative_path
         absolute_path = self._simplify_relative_path(absolute_url.path)
 
-        # If we found an existing resolved asset, and it should be updated, update the reference
-        if absolute_url.exists and absolute_path in dependency_updates:
+        # If we found an existing resolved asset, and it should be updated, update the reference.
+        # The dependency graph already resolved every asset so the file system is not accessed.
+        if absolute_path in dependency_updates and dependency_graph.is_resolved(absolute_path):
             fixed_relative_path = dependency_updates[absolute_path](temp_layer, relative_path)
 
         return fixed_relative_path
@@ -622,6 +723,14 @@ class PackagingCore:
 
         return simplified_path
 
+    def _on_transfer_progress(self, copied_files: int, _total_files: int, copied_bytes: int, elapsed_time: float):
+        if elapsed_time > 0:
+            self._status = (
+                f"(6/7) Collecting assets... ({copied_files / elapsed_time:.1f} files/s, "
+                f"{copied_bytes / elapsed_time / 1024 ** 2:.1f} MB/s)"
+            )
+        self.current_count += 1
+
     def _packaging_new_stage(self, status: str, total_count: int):
         self._status = status
         self._current_count = 0
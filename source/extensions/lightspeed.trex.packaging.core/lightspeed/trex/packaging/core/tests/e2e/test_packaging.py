@@ -92,7 +92,9 @@ class TestPackagingCoreE2E(omni.kit.test.AsyncTestCase):
         self.assertEqual(call(0, 10, "(5/7) Updating asset paths..."), progress_mock.call_args_list[47])
         self.assertEqual(call(10, 10, "(5/7) Updating asset paths..."), progress_mock.call_args_list[57])
         self.assertEqual(call(0, 9, "(6/7) Collecting assets..."), progress_mock.call_args_list[58])
-        self.assertEqual(call(9, 9, "(6/7) Collecting assets..."), progress_mock.call_args_list[67])
+        # The transfer rates are appended to the status while collecting assets
+        self.assertEqual((9, 9), progress_mock.call_args_list[67][0][:2])
+        self.assertTrue(progress_mock.call_args_list[67][0][2].startswith("(6/7) Collecting assets..."))
         self.assertEqual(call(0, 10, "(7/7) Cleaning up temporary layers..."), progress_mock.call_args_list[68])
         self.assertEqual(call(10, 10, "(7/7) Cleaning up temporary layers..."), progress_mock.call_args_list[78])
 
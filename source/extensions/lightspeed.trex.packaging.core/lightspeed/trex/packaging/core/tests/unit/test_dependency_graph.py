@@ -0,0 +1,147 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import omni.kit.test
+from lightspeed.trex.packaging.core.dependency_graph import DependencyGraph
+from omni.flux.utils.common.omni_url import OmniUrl
+from pxr import Sdf, UsdUtils
+
+
+class TestDependencyGraph(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root_dir = Path(self.temp_dir.name)
+
+        (root_dir / "textures").mkdir()
+        (root_dir / "textures" / "albedo.dds").write_bytes(b"")
+
+        self.reference_layer = Sdf.Layer.CreateNew(str(root_dir / "reference.usda"))
+        Sdf.CreatePrimInLayer(self.reference_layer, "/Reference")
+        self.reference_layer.Save()
+
+        self.payload_layer = Sdf.Layer.CreateNew(str(root_dir / "payload.usda"))
+        Sdf.CreatePrimInLayer(self.payload_layer, "/Payload")
+        self.payload_layer.Save()
+
+        self.sublayer = Sdf.Layer.CreateNew(str(root_dir / "sublayer.usda"))
+        prim_spec = Sdf.CreatePrimInLayer(self.sublayer, "/World/Mesh")
+        prim_spec.referenceList.Prepend(Sdf.Reference("./reference.usda"))
+        prim_spec.payloadList.Prepend(Sdf.Payload("./payload.usda"))
+        albedo_spec = Sdf.AttributeSpec(prim_spec, "albedo", Sdf.ValueTypeNames.Asset)
+        albedo_spec.default = Sdf.AssetPath("./textures/albedo.dds")
+        missing_spec = Sdf.AttributeSpec(prim_spec, "missing", Sdf.ValueTypeNames.Asset)
+        missing_spec.default = Sdf.AssetPath("./textures/missing.dds")
+        self.sublayer.Save()
+
+        self.root_layer = Sdf.Layer.CreateNew(str(root_dir / "mod.usda"))
+        self.root_layer.subLayerPaths.append("./sublayer.usda")
+        self.root_layer.Save()
+
+    # After running each test
+    async def tearDown(self):
+        self.root_layer = None
+        self.sublayer = None
+        self.reference_layer = None
+        self.payload_layer = None
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    async def test_init_should_compute_dependencies_once(self):
+        # Arrange
+        with patch.object(UsdUtils, "ComputeAllDependencies", wraps=UsdUtils.ComputeAllDependencies) as compute_mock:
+            # Act
+            graph = DependencyGraph(self.root_layer)
+            _ = graph.layers
+            _ = graph.assets
+            _ = graph.dependencies
+
+        # Assert
+        self.assertEqual(1, compute_mock.call_count)
+
+    async def test_dependencies_should_list_resolved_layers_and_assets(self):
+        # Arrange
+        graph = DependencyGraph(self.root_layer)
+
+        # Act
+        layer_paths = {OmniUrl(layer.identifier).path for layer in graph.layers}
+        asset_names = [OmniUrl(asset).name for asset in graph.assets]
+
+        # Assert
+        self.assertEqual(self.root_layer.identifier, graph.root_layer_identifier)
+        self.assertSetEqual(
+            {
+                OmniUrl(layer.identifier).path
+                for layer in [self.root_layer, self.sublayer, self.reference_layer, self.payload_layer]
+            },
+            layer_paths,
+        )
+        self.assertListEqual(["albedo.dds"], asset_names)
+        self.assertEqual(1, len(graph.unresolved_paths))
+        self.assertEqual(len(graph.layers) + len(graph.assets), len(graph.dependencies))
+
+    async def test_is_resolved_should_return_true_for_resolved_paths_only(self):
+        # Arrange
+        graph = DependencyGraph(self.root_layer)
+
+        # Act
+        resolved = graph.is_resolved(OmniUrl(self.sublayer.identifier).path)
+        unresolved = graph.is_resolved(OmniUrl(self.sublayer.identifier).with_name("missing.dds").path)
+
+        # Assert
+        self.assertTrue(resolved)
+        self.assertFalse(unresolved)
+
+    async def test_get_layer_dependencies_should_sort_dependencies_by_type(self):
+        # Arrange
+        graph = DependencyGraph(self.root_layer)
+
+        # Act
+        root_dependencies = graph.get_layer_dependencies(self.root_layer)
+        sublayer_dependencies = graph.get_layer_dependencies(self.sublayer)
+
+        # Assert
+        self.assertListEqual(["./sublayer.usda"], root_dependencies.sublayers)
+        self.assertListEqual([], root_dependencies.references)
+
+        self.assertListEqual([], sublayer_dependencies.sublayers)
+        self.assertListEqual(["./reference.usda"], sublayer_dependencies.references)
+        self.assertListEqual(["./payload.usda"], sublayer_dependencies.payloads)
+        self.assertListEqual(
+            ["./textures/albedo.dds", "./textures/missing.dds"], sorted(sublayer_dependencies.asset_paths)
+        )
+        self.assertIs(sublayer_dependencies, graph.get_layer_dependencies(self.sublayer))
+
+    async def test_layer_dependencies_paths_should_list_distinct_paths(self):
+        # Arrange
+        graph = DependencyGraph(self.root_layer)
+        prim_spec = self.sublayer.GetPrimAtPath("/World/Mesh")
+        duplicate_spec = Sdf.AttributeSpec(prim_spec, "duplicate", Sdf.ValueTypeNames.Asset)
+        duplicate_spec.default = Sdf.AssetPath("./textures/albedo.dds")
+
+        # Act
+        paths = graph.get_layer_dependencies(self.sublayer).paths
+
+        # Assert
+        self.assertListEqual(
+            ["./reference.usda", "./payload.usda", "./textures/albedo.dds", "./textures/missing.dds"],
+            paths[:2] + sorted(paths[2:]),
+        )
@@ -147,3 +147,22 @@ class TestModPackagingSchema(omni.kit.test.AsyncTestCase):
         # Assert
         self.assertEqual(expected_1, val_1)
         self.assertEqual(expected_2, val_2)
+
+    async def test_is_positive_invalid_should_raise_value_error(self):
+        # Arrange
+        with self.assertRaises(ValueError) as cm:
+            # Act
+            ModPackagingSchema.is_positive(0)
+
+        # Assert
+        self.assertEqual("The value must be greater than 0", str(cm.exception))
+
+    async def test_is_positive_valid_should_return_value(self):
+        # Arrange
+        expected = 16
+
+        # Act
+        val = ModPackagingSchema.is_positive(expected)
+
+        # Assert
+        self.assertEqual(expected, val)
@@ -0,0 +1,236 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import omni.kit.test
+from lightspeed.trex.packaging.core.manifest import PackagingManifest
+
+
+class TestPackagingManifest(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source_dir = Path(self.temp_dir.name) / "source"
+        self.output_dir = Path(self.temp_dir.name) / "package"
+        self.source_dir.mkdir()
+        self.output_dir.mkdir()
+
+    # After running each test
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    async def test_load_no_manifest_should_return_false(self):
+        # Arrange
+        manifest = PackagingManifest(self.output_dir)
+
+        # Act
+        val = manifest.load()
+
+        # Assert
+        self.assertFalse(val)
+
+    async def test_load_saved_manifest_should_return_true(self):
+        # Arrange
+        PackagingManifest(self.output_dir).save()
+        manifest = PackagingManifest(self.output_dir)
+
+        # Act
+        val = manifest.load()
+
+        # Assert
+        self.assertTrue(val)
+        self.assertTrue(Path(manifest.url.path).exists())
+        self.assertEqual(Path(self.temp_dir.name).as_posix(), Path(manifest.url.path).parent.parent.as_posix())
+        self.assertListEqual([], list(self.output_dir.iterdir()))
+
+    async def test_save_with_project_should_store_manifest_in_project(self):
+        # Arrange
+        manifest = PackagingManifest(self.output_dir, project_directory=self.source_dir)
+        other_manifest = PackagingManifest(
+            Path(self.temp_dir.name) / "other_package", project_directory=self.source_dir
+        )
+
+        # Act
+        manifest.save()
+
+        # Assert
+        self.assertEqual(
+            (self.source_dir / PackagingManifest.MANIFEST_DIRECTORY_NAME).as_posix(),
+            Path(manifest.url.path).parent.as_posix(),
+        )
+        self.assertTrue(Path(manifest.url.path).exists())
+        self.assertNotEqual(manifest.url.path, other_manifest.url.path)
+        self.assertFalse(other_manifest.load())
+        self.assertListEqual([], list(self.output_dir.iterdir()))
+
+    async def test_register_asset_unchanged_should_return_false(self):
+        # Arrange
+        source_path, output_path = self.__create_asset("textures/albedo.dds", b"content")
+        self.__package_assets([(output_path, source_path)])
+
+        manifest = PackagingManifest(self.output_dir)
+        manifest.load()
+
+        # Act
+        val = manifest.register_asset(str(output_path), str(source_path))
+
+        # Assert
+        self.assertFalse(val)
+
+    async def test_register_asset_touched_but_identical_should_return_false(self):
+        # Arrange
+        source_path, output_path = self.__create_asset("textures/albedo.dds", b"content")
+        self.__package_assets([(output_path, source_path)])
+
+        stat = source_path.stat()
+        os.utime(source_path, (stat.st_atime + 10, stat.st_mtime + 10))
+
+        manifest = PackagingManifest(self.output_dir)
+        manifest.load()
+
+        # Act
+        val = manifest.register_asset(str(output_path), str(source_path))
+
+        # Assert
+        self.assertFalse(val)
+
+    async def test_register_asset_modified_should_return_true(self):
+        # Arrange
+        source_path, output_path = self.__create_asset("textures/albedo.dds", b"content")
+        self.__package_assets([(output_path, source_path)])
+
+        source_path.write_bytes(b"modified content")
+
+        manifest = PackagingManifest(self.output_dir)
+        manifest.load()
+
+        # Act
+        val = manifest.register_asset(str(output_path), str(source_path))
+
+        # Assert
+        self.assertTrue(val)
+
+    async def test_register_asset_deleted_output_should_return_true(self):
+        # Arrange
+        source_path, output_path = self.__create_asset("textures/albedo.dds", b"content")
+        self.__package_assets([(output_path, source_path)])
+
+        output_path.unlink()
+
+        manifest = PackagingManifest(self.output_dir)
+        manifest.load()
+
+        # Act
+        val = manifest.register_asset(str(output_path), str(source_path))
+
+        # Assert
+        self.assertTrue(val)
+
+    async def test_register_layer_should_compare_layer_content(self):
+        # Arrange
+        output_path = self.output_dir / "mod.usda"
+        output_path.write_text("#usda 1.0")
+
+        manifest = PackagingManifest(self.output_dir)
+        manifest.register_layer(str(output_path), "C:/project/mod.usda", "#usda 1.0")
+        manifest.save()
+
+        manifest = PackagingManifest(self.output_dir)
+        manifest.load()
+
+        # Act
+        unchanged_val = manifest.register_layer(str(output_path), "C:/project/mod.usda", "#usda 1.0")
+        changed_val = manifest.register_layer(str(output_path), "C:/project/mod.usda", "#usda 1.0\n(doc = 'Test')")
+
+        # Assert
+        self.assertFalse(unchanged_val)
+        self.assertTrue(changed_val)
+
+    async def test_get_stale_outputs_should_return_unregistered_previous_outputs(self):
+        # Arrange
+        source_0_path, output_0_path = self.__create_asset("textures/albedo.dds", b"albedo")
+        source_1_path, output_1_path = self.__create_asset("textures/normal.dds", b"normal")
+        self.__package_assets([(output_0_path, source_0_path), (output_1_path, source_1_path)])
+
+        manifest = PackagingManifest(self.output_dir)
+        manifest.load()
+        manifest.register_asset(str(output_0_path), str(source_0_path))
+
+        # Act
+        val = manifest.get_stale_outputs()
+
+        # Assert
+        self.assertListEqual([output_1_path.as_posix()], [url.path for url in val])
+
+    async def test_save_should_store_project_sources_relative_to_project(self):
+        # Arrange
+        source_path, output_path = self.__create_asset("textures/albedo.dds", b"content")
+        external_path = Path(self.temp_dir.name) / "external.dds"
+        external_path.write_bytes(b"external")
+        output_path.parent.mkdir(parents=True)
+
+        manifest = PackagingManifest(self.output_dir, project_directory=self.source_dir)
+        manifest.register_asset(str(output_path), str(source_path))
+        manifest.register_asset(str(self.output_dir / "external.dds"), str(external_path))
+
+        # Act
+        manifest.save()
+
+        # Assert
+        entries = json.loads(Path(manifest.url.path).read_text())["entries"]
+        self.assertEqual("textures/albedo.dds", entries["textures/albedo.dds"]["source"])
+        self.assertEqual(str(external_path), entries["external.dds"]["source"])
+
+    async def test_register_asset_moved_project_should_return_false(self):
+        # Arrange
+        source_path, output_path = self.__create_asset("textures/albedo.dds", b"content")
+        output_path.parent.mkdir(parents=True)
+        output_path.write_bytes(b"content")
+        manifest = PackagingManifest(self.output_dir, project_directory=self.source_dir)
+        manifest.register_asset(str(output_path), str(source_path))
+        manifest.save()
+
+        moved_dir = Path(self.temp_dir.name) / "moved"
+        self.source_dir.rename(moved_dir)
+
+        manifest = PackagingManifest(self.output_dir, project_directory=moved_dir)
+        manifest.load()
+
+        # Act
+        val = manifest.register_asset(str(output_path), str(moved_dir / "textures/albedo.dds"))
+
+        # Assert
+        self.assertFalse(val)
+
+    def __create_asset(self, relative_path: str, content: bytes):
+        source_path = self.source_dir / relative_path
+        source_path.parent.mkdir(parents=True, exist_ok=True)
+        source_path.write_bytes(content)
+        return source_path, self.output_dir / relative_path
+
+    def __package_assets(self, assets):
+        manifest = PackagingManifest(self.output_dir)
+        for output_path, source_path in assets:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(source_path.read_bytes())
+            manifest.register_asset(str(output_path), str(source_path))
+        manifest.save()
@@ -30,6 +30,7 @@ from lightspeed.layer_manager.core import (
     LSS_LAYER_MOD_VERSION,
 )
 from lightspeed.trex.packaging.core import PackagingCore
+from lightspeed.trex.packaging.core.dependency_graph import DependencyGraph, LayerDependencies
 from omni.flux.utils.common.omni_url import OmniUrl
 from omni.flux.utils.material_converter.utils import MaterialConverterUtils
 from omni.kit.usd.collect.omni_client_wrapper import OmniClientWrapper
@@ -165,6 +166,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             patch("lightspeed.trex.packaging.core.packaging._ModPackagingSchema") as model_mock,
             patch.object(PackagingCore, "_initialize_usd_stage") as init_usd_mock,
             patch.object(PackagingCore, "_filter_sublayers") as filter_mock,
+            patch("lightspeed.trex.packaging.core.packaging._DependencyGraph"),
             patch.object(PackagingCore, "_get_redirected_dependencies") as redirect_mock,
             patch.object(PackagingCore, "_make_temp_layer") as make_temp_mock,
             patch.object(PackagingCore, "_collect") as collect_mock,
@@ -216,6 +218,8 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
         root_mod_mock = Mock()
         context_name_mock = Mock()
         output_directory_mock = Mock()
+        incremental_mock = Mock()
+        max_transfer_workers_mock = Mock()
 
         temp_layers_mock = [Mock()]
 
@@ -234,6 +238,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             patch("lightspeed.trex.packaging.core.packaging._ModPackagingSchema") as model_mock,
             patch.object(PackagingCore, "_initialize_usd_stage") as init_usd_mock,
             patch.object(PackagingCore, "_filter_sublayers") as filter_mock,
+            patch("lightspeed.trex.packaging.core.packaging._DependencyGraph") as graph_mock,
             patch.object(PackagingCore, "_get_redirected_dependencies") as redirect_mock,
             patch.object(PackagingCore, "_collect") as collect_mock,
             patch.object(PackagingCore, "_packaging_completed") as completed_mock,
@@ -245,6 +250,8 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             model_mock.return_value.selected_layer_paths = [root_mod_mock]
             model_mock.return_value.context_name = context_name_mock
             model_mock.return_value.output_directory = output_directory_mock
+            model_mock.return_value.incremental = incremental_mock
+            model_mock.return_value.max_transfer_workers = max_transfer_workers_mock
 
             if sys.version_info.minor > 7:
                 init_usd_mock.return_value = Mock()
@@ -276,6 +283,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
 
         self.assertEqual(1, init_usd_mock.call_count)
         self.assertEqual(1, filter_mock.call_count)
+        self.assertEqual(1, graph_mock.call_count)
         self.assertEqual(1, redirect_mock.call_count)
         self.assertEqual(1, collect_mock.call_count)
         self.assertEqual(2, update_metadata_mock.call_count)
@@ -285,9 +293,18 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             call(context_name_mock, None, temp_mod_layer_mock, [OmniUrl(root_mod_mock).path.lower()]),
             filter_mock.call_args,
         )
-        self.assertEqual(call(temp_mod_layer_mock, []), redirect_mock.call_args)
+        self.assertEqual(call(temp_mod_layer_mock), graph_mock.call_args)
+        self.assertEqual(call(graph_mock.return_value, []), redirect_mock.call_args)
         self.assertEqual(
-            call(temp_mod_layer_mock, temp_layers_mock, output_directory_mock, redirected_mock), collect_mock.call_args
+            call(
+                graph_mock.return_value,
+                temp_layers_mock,
+                output_directory_mock,
+                redirected_mock,
+                incremental=incremental_mock,
+                max_transfer_workers=max_transfer_workers_mock,
+            ),
+            collect_mock.call_args,
         )
         self.assertEqual(
             call(model_mock(), exported_mod_layer_mock, dependencies_mock, True), update_metadata_mock.call_args_list[0]
@@ -615,6 +632,44 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
     ):
         await self.__run_redirect_inside_package_directory(False, False)
 
+    async def test_modify_layer_asset_paths_should_update_every_distinct_path_once(self):
+        # Arrange
+        packaging_core = PackagingCore()
+
+        layer = Sdf.Layer.CreateAnonymous()
+        prim_spec = Sdf.CreatePrimInLayer(layer, "/World/Mesh")
+        prim_spec.referenceList.Prepend(Sdf.Reference("./assets/mesh.usda"))
+        for name in ["albedo", "normal"]:
+            attribute_spec = Sdf.AttributeSpec(prim_spec, name, Sdf.ValueTypeNames.Asset)
+            attribute_spec.default = Sdf.AssetPath("./textures/shared.dds")
+
+        dependency_graph_mock = Mock()
+        dependency_graph_mock.get_layer_dependencies.return_value = LayerDependencies(
+            references=["./assets/mesh.usda"], asset_paths=["./textures/shared.dds", "./textures/shared.dds"]
+        )
+        dependency_updates_mock = Mock()
+
+        with patch.object(PackagingCore, "_modify_asset_paths") as modify_asset_paths_mock:
+            modify_asset_paths_mock.side_effect = lambda *args: f"./package/{args[-1][2:]}"
+
+            # Act
+            packaging_core._modify_layer_asset_paths(  # noqa PLW0212
+                dependency_graph_mock, layer, layer, dependency_updates_mock
+            )
+
+        # Assert
+        self.assertEqual(call(layer), dependency_graph_mock.get_layer_dependencies.call_args)
+        self.assertListEqual(
+            [
+                call(dependency_graph_mock, layer, dependency_updates_mock, "./assets/mesh.usda"),
+                call(dependency_graph_mock, layer, dependency_updates_mock, "./textures/shared.dds"),
+            ],
+            modify_asset_paths_mock.call_args_list,
+        )
+        self.assertEqual("./package/assets/mesh.usda", prim_spec.referenceList.prependedItems[0].assetPath)
+        self.assertEqual("./package/textures/shared.dds", prim_spec.attributes["albedo"].default.path)
+        self.assertEqual("./package/textures/shared.dds", prim_spec.attributes["normal"].default.path)
+
     async def test_modify_asset_paths_does_not_exist_should_return_original_path(self):
         await self.__run_modify_asset_paths(False, True, False)
         await self.__run_modify_asset_paths(False, False, False)
@@ -787,11 +842,13 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
         relative_path = absolute_path if is_absolute else "./assets/test.usd"
         modified_path = "C:/modified_path"
 
-        with patch.object(OmniUrl, "exists", new_callable=PropertyMock) as exists_mock:
-            exists_mock.return_value = dependency_exists
+        dependency_graph_mock = Mock()
+        dependency_graph_mock.is_resolved.return_value = dependency_exists
 
+        with patch.object(OmniUrl, "exists", new_callable=PropertyMock) as exists_mock:
             # Act
             val = packaging_core._modify_asset_paths(  # noqa PLW0212
+                dependency_graph_mock,
                 layer_mock,
                 {absolute_path if dependency_update else "C:/absolute_path": lambda *_: modified_path},
                 relative_path,
@@ -799,6 +856,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
 
         # Assert
         self.assertEqual(modified_path if dependency_exists and dependency_update else relative_path, val)
+        self.assertEqual(0, exists_mock.call_count)
 
     async def __run_get_redirected_dependencies(self, should_cancel: bool):
         # Arrange
@@ -826,9 +884,11 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
         with patch.object(UsdUtils, "ComputeAllDependencies") as compute_dependencies_mock:
             compute_dependencies_mock.return_value = layer_mocks, asset_mocks, []
 
+            dependency_graph = DependencyGraph(root_layer_mock)
+
             # Act
             mod_dependencies, redirected_dependencies = packaging_core._get_redirected_dependencies(  # noqa PLW0212
-                root_layer_mock, external_mod_paths
+                dependency_graph, external_mod_paths
             )
 
         # Assert
@@ -882,6 +942,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             patch.object(Sdf.Layer, "FindOrOpen") as find_open_mock,
             patch.object(UsdUtils, "ComputeAllDependencies") as compute_dependencies_mock,
             patch.object(UsdUtils, "ModifyAssetPaths") as modify_assets_mock,
+            patch.object(DependencyGraph, "get_layer_dependencies") as get_layer_dependencies_mock,
             patch.object(MaterialConverterUtils, "get_material_library_shader_urls") as get_shaders_mock,
             patch.object(OmniClientWrapper, "create_folder") as create_folder_mock,
             patch.object(OmniClientWrapper, "delete") as delete_folder_mock,
@@ -890,6 +951,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
         ):
             compute_dependencies_mock.return_value = (layers_mock, assets_mock, unresolved_mock)
             get_shaders_mock.return_value = [OmniUrl(asset_2_mock)]
+            get_layer_dependencies_mock.return_value = LayerDependencies()
 
             modify_assets_mock.side_effect = lambda *_: packaging_core._collected_dependencies.update(  # noqa PLW0212
                 {
@@ -910,7 +972,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             ]
 
             find_open_mock.side_effect = [layer_0_temp_mock, layer_1_temp_mock]
-            exists_mock.side_effect = [True, False, True, True, False]
+            exists_mock.side_effect = [True]
 
             if sys.version_info.minor > 7:
                 make_temp_mock.side_effect = layer_1_temp_path_mock
@@ -928,9 +990,11 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
                 create_folder_mock.return_value = none_future
                 copy_mock.return_value = none_future
 
+            dependency_graph = DependencyGraph(root_layer_mock)
+
             # Act
             errors = await packaging_core._collect(  # noqa PLW0212
-                root_layer_mock, existing_temps_mock, output_directory_mock, redirected_dependencies_mock
+                dependency_graph, existing_temps_mock, output_directory_mock, redirected_dependencies_mock
             )
 
         # Assert
@@ -943,9 +1007,8 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             errors,
         )
 
-        self.assertEqual(0 if should_cancel else 1, compute_dependencies_mock.call_count)
-        if not should_cancel:
-            self.assertEqual(call(root_layer_mock.identifier), compute_dependencies_mock.call_args)
+        self.assertEqual(1, compute_dependencies_mock.call_count)
+        self.assertEqual(call(root_layer_mock.identifier), compute_dependencies_mock.call_args)
 
         if should_cancel or has_unresolved_assets:
             self.assertEqual(0, get_shaders_mock.call_count)
@@ -971,8 +1034,11 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             self.assertEqual(
                 call(asset_0_mock, str(OmniUrl(output_directory_mock) / asset_0_output_mock)), copy_mock.call_args
             )
+            self.assertEqual(
+                [call(layer_mock) for layer_mock in layers_mock], get_layer_dependencies_mock.call_args_list
+            )
             for index, layer_mock in enumerate(temp_layers_mock):
-                # Only compare the first arg since the partial function is built on the fly
+                # Only compare the first arg since the update function is built on the fly
                 self.assertEqual(layer_mock, modify_assets_mock.call_args_list[index][0][0])
                 self.assertEqual(
                     call(str(OmniUrl(output_directory_mock) / OmniUrl(layers_mock[index].identifier).name)),
@@ -0,0 +1,114 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import omni.kit.test
+from lightspeed.trex.packaging.core.transfer import FileTransferEngine
+from omni.kit.usd.collect.omni_client_wrapper import OmniClientWrapper
+
+
+class TestFileTransferEngine(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root_dir = Path(self.temp_dir.name)
+
+    # After running each test
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    async def test_create_folders_should_create_each_folder_and_parents_once(self):
+        # Arrange
+        engine = FileTransferEngine(max_workers=4)
+        output_dir = self.root_dir / "package"
+
+        folders = [
+            (output_dir / "textures").as_posix(),
+            (output_dir / "textures").as_posix(),
+            (output_dir / "meshes" / "props").as_posix(),
+        ]
+
+        with patch.object(OmniClientWrapper, "create_folder", wraps=OmniClientWrapper.create_folder) as create_mock:
+            # Act
+            created = await engine.create_folders(folders, output_dir, check_exists=False)
+
+        # Assert
+        self.assertEqual(4, create_mock.call_count)
+        self.assertEqual(4, len(created))
+        self.assertTrue((output_dir / "textures").is_dir())
+        self.assertTrue((output_dir / "meshes" / "props").is_dir())
+
+    async def test_create_folders_check_exists_should_skip_existing_folders(self):
+        # Arrange
+        engine = FileTransferEngine()
+        output_dir = self.root_dir / "package"
+        (output_dir / "textures").mkdir(parents=True)
+
+        # Act
+        created = await engine.create_folders(
+            [(output_dir / "textures").as_posix(), (output_dir / "meshes").as_posix()], output_dir
+        )
+
+        # Assert
+        self.assertListEqual([(output_dir / "meshes").as_posix()], created)
+        self.assertTrue((output_dir / "meshes").is_dir())
+
+    async def test_copy_should_copy_all_files_and_report_progress(self):
+        # Arrange
+        engine = FileTransferEngine(max_workers=3)
+        progress_mock = Mock()
+
+        transfers = []
+        for index in range(10):
+            source = self.root_dir / f"texture_{index}.dds"
+            source.write_bytes(b"0" * 16)
+            transfers.append((source.as_posix(), (self.root_dir / f"copy_{index}.dds").as_posix()))
+
+        # Act
+        copied = await engine.copy(transfers, progress_mock)
+
+        # Assert
+        self.assertSetEqual({destination for _, destination in transfers}, copied)
+        for _, destination in transfers:
+            self.assertTrue(Path(destination).exists())
+
+        self.assertEqual(10, progress_mock.call_count)
+        copied_files, total_files, copied_bytes, _ = progress_mock.call_args[0]
+        self.assertEqual(10, copied_files)
+        self.assertEqual(10, total_files)
+        self.assertEqual(160, copied_bytes)
+
+    async def test_copy_cancelled_should_not_copy_pending_files(self):
+        # Arrange
+        engine = FileTransferEngine(max_workers=1)
+
+        transfers = []
+        for index in range(5):
+            source = self.root_dir / f"texture_{index}.dds"
+            source.write_bytes(b"0")
+            transfers.append((source.as_posix(), (self.root_dir / f"copy_{index}.dds").as_posix()))
+
+        # Act
+        copied = await engine.copy(transfers, lambda *_: engine.cancel())
+
+        # Assert
+        self.assertTrue(engine.is_cancelled)
+        self.assertEqual(1, len(copied))
@@ -0,0 +1,160 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import asyncio
+import time
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import omni.client
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from omni.kit.usd.collect.omni_client_wrapper import OmniClientWrapper as _OmniClientWrapper
+
+DEFAULT_MAX_TRANSFER_WORKERS = 8
+
+
+class FileTransferEngine:
+    """
+    Copy files and create folders concurrently, using a bounded number of workers.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_TRANSFER_WORKERS):
+        """
+        Args:
+            max_workers: The maximum number of transfers that can run at the same time
+        """
+        self._max_workers = max(1, max_workers)
+        self._cancel_token = False
+
+    @property
+    def is_cancelled(self) -> bool:
+        """
+        Whether the transfers were cancelled
+        """
+        return self._cancel_token
+
+    def cancel(self):
+        """
+        Cancel the pending transfers. Transfers already in progress will be allowed to finish.
+        """
+        self._cancel_token = True
+
+    async def create_folders(
+        self, folder_urls: Iterable[str], root_url: Union[Path, str], check_exists: bool = True
+    ) -> List[str]:
+        """
+        Create every folder in the given list, including the missing parent folders located inside the root folder.
+
+        Every folder will be created only once and folders of the same depth will be created concurrently.
+
+        Args:
+            folder_urls: The folders to create
+            root_url: The top-most folder that should be created if missing
+            check_exists: Whether the folders existence should be checked before creating them. Can be disabled when
+                          the root folder is known to be empty.
+
+        Returns:
+            The list of created folders
+        """
+        root_path = _OmniUrl(root_url).path
+
+        # Make sure parents are listed and only keep unique folders inside the root
+        folders: Dict[str, str] = {}
+        for folder_url in folder_urls:
+            url = _OmniUrl(folder_url)
+            while url.path.startswith(root_path) and url.path not in folders:
+                folders[url.path] = str(url)
+                parent_url = _OmniUrl(url.parent_url)
+                if parent_url.path == url.path:
+                    break
+                url = parent_url
+
+        # Group the folders by depth so parents are always created before their children
+        folders_by_depth: Dict[int, List[str]] = {}
+        for folder_path, folder_url in folders.items():
+            folders_by_depth.setdefault(len(PurePosixPath(folder_path).parts), []).append(folder_url)
+
+        created_folders = []
+        semaphore = asyncio.Semaphore(self._max_workers)
+
+        async def create_folder(folder_url: str):
+            async with semaphore:
+                if self._cancel_token:
+                    return
+                if check_exists and _OmniUrl(folder_url).exists:
+                    return
+                await _OmniClientWrapper.create_folder(folder_url)
+                created_folders.append(folder_url)
+
+        for depth in sorted(folders_by_depth):
+            if self._cancel_token:
+                break
+            await asyncio.gather(*[create_folder(url) for url in sorted(folders_by_depth[depth])])
+
+        return created_folders
+
+    async def copy(
+        self,
+        transfers: List[Tuple[str, str]],
+        progress_callback: Optional[Callable[[int, int, int, float], None]] = None,
+    ) -> Set[str]:
+        """
+        Copy every source file to its destination concurrently.
+
+        Args:
+            transfers: A list of (source, destination) tuples. Destination folders must already exist.
+            progress_callback: Called after every copied file with the copied files count, the total files count, the
+                               copied bytes and the elapsed time in seconds.
+
+        Returns:
+            The set of destination files that were copied
+        """
+        queue = asyncio.Queue()
+        for transfer in transfers:
+            queue.put_nowait(transfer)
+
+        copied_files = set()
+        copied_bytes = 0
+        failed = False
+        start_time = time.perf_counter()
+
+        async def worker():
+            nonlocal copied_bytes, failed
+            while not self._cancel_token and not failed:
+                try:
+                    source, destination = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    result, entry = await omni.client.stat_async(source)
+                    await _OmniClientWrapper.copy(source, destination)
+                except Exception:  # noqa PLW0718
+                    # Stop the other workers and bubble up the failure
+                    failed = True
+                    raise
+
+                copied_files.add(destination)
+                if result == omni.client.Result.OK:
+                    copied_bytes += entry.size
+
+                if progress_callback:
+                    progress_callback(len(copied_files), len(transfers), copied_bytes, time.perf_counter() - start_time)
+
+        await asyncio.gather(*[worker() for _ in range(min(self._max_workers, len(transfers)))])
+
+        return copied_files
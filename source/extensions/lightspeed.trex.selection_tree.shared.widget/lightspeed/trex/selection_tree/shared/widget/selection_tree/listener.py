@@ -53,6 +53,10 @@ class USDListener:
             if stage != model.stage:
                 continue
 
+            model.invalidate_reference_paths(
+                [path for path in notice.GetResyncedPaths() if path.IsPrimPath() or path.IsAbsoluteRootPath()]
+            )
+
             should_refresh = False
             for resynced_path in notice.GetResyncedPaths():
                 if "." in str(resynced_path):  # an attribute
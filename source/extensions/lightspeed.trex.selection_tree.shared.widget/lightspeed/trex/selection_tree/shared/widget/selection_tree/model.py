@@ -15,11 +15,7 @@
 * limitations under the License.
 """
 
-import concurrent.futures
-import math
-import multiprocessing
 import re
-import typing
 from contextlib import contextmanager
 from typing import Dict, List, Optional, Tuple, Type, Union
 
@@ -29,15 +25,17 @@ import omni.ui as ui
 import omni.usd
 from lightspeed.common import constants
 from lightspeed.trex.asset_replacements.core.shared import Setup as _AssetReplacementsCore
+from lightspeed.trex.utils.common.hash_index import get_stage_hash_index as _get_stage_hash_index
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.flux.utils.common.decorators import ignore_function_decorator as _ignore_function_decorator
 from omni.kit.usd.layers import LayerEventType, get_layer_event_payload, get_layers
-from pxr import Usd, UsdGeom, UsdLux
+from pxr import Sdf, Usd, UsdGeom, UsdLux
 
 from .listener import USDListener as _USDListener
 
-if typing.TYPE_CHECKING:
-    from pxr import Sdf
+_REGEX_LIGHT_PATH = re.compile(constants.REGEX_LIGHT_PATH)
+# Above this number of resynced paths, forgetting all the cached references is faster than pruning them
+_MAX_INVALIDATED_PATHS = 1000
 
 HEADER_DICT = {0: "Path"}
 
@@ -467,6 +465,9 @@ class ListModel(ui.AbstractItemModel):
         self._stage_event = None
         self._layer_event = None
         self._usd_listener = _USDListener()
+        # Prim path -> referenced prim paths. Only used while the listeners keep it up to date
+        self.__reference_paths_cache: Dict["Sdf.Path", List["Sdf.Path"]] = {}
+        self.__reference_paths_cache_enabled = False
 
     def set_ignore_refresh(self, value):
         self._ignore_refresh = value
@@ -502,6 +503,8 @@ class ListModel(ui.AbstractItemModel):
         return self._context.get_stage()
 
     def enable_listeners(self, value):
+        self.__reference_paths_cache.clear()
+        self.__reference_paths_cache_enabled = value
         if value:
             self._usd_listener.add_model(self)
             self._stage_event = self._context.get_stage_event_stream().create_subscription_to_pop(
@@ -513,6 +516,24 @@ class ListModel(ui.AbstractItemModel):
             self._usd_listener.remove_model(self)
             self._stage_event = None
 
+    def invalidate_reference_paths(self, paths: List["Sdf.Path"]):
+        """
+        Forget the cached references of the resynced prims and their children
+
+        Args:
+            paths: the resynced prim paths
+        """
+        if not self.__reference_paths_cache:
+            return
+        resynced_paths = set(paths)
+        if len(resynced_paths) > _MAX_INVALIDATED_PATHS or Sdf.Path.absoluteRootPath in resynced_paths:
+            self.__reference_paths_cache.clear()
+            return
+        # Look for the resynced paths in the prefixes of every cached path instead of comparing every pair of paths
+        for cached_path in list(self.__reference_paths_cache):
+            if not resynced_paths.isdisjoint(cached_path.GetPrefixes()):
+                del self.__reference_paths_cache[cached_path]
+
     def _on_layer_event(self, event: carb.events.IEvent):
         temp = get_layer_event_payload(event)
         if temp.event_type in [
@@ -520,11 +541,14 @@ class ListModel(ui.AbstractItemModel):
             LayerEventType.MUTENESS_STATE_CHANGED,
             LayerEventType.MUTENESS_SCOPE_CHANGED,
         ]:
+            self.__reference_paths_cache.clear()
             self.refresh()
             if self._ignore_refresh:
                 self._ignore_refresh = False
 
     def _on_stage_event(self, event):
+        if event.type in [int(omni.usd.StageEventType.OPENED), int(omni.usd.StageEventType.CLOSED)]:
+            self.__reference_paths_cache.clear()
         if event.type == int(omni.usd.StageEventType.SELECTION_CHANGED):
             self.refresh()
             if self._ignore_refresh:
@@ -544,25 +568,23 @@ class ListModel(ui.AbstractItemModel):
             return None
         return str(children[0].path)
 
-    @staticmethod
-    def __get_reference_prims(prims) -> Dict["Usd.Prim", List["Sdf.Path"]]:
-        prim_paths = {}
-        regex_pattern = re.compile(constants.REGEX_LIGHT_PATH)
-        for prim in prims:
-            if regex_pattern.match(str(prim.GetPath())):
-                prim_paths[prim] = [prim.GetPath()]
-            else:
-                for prim_spec in prim.GetPrimStack():
-                    items = prim_spec.referenceList.prependedItems
-                    for item in items:
-                        if not item.primPath:
-                            continue
-                        if prim in prim_paths:
-                            prim_paths[prim].append(item.primPath)
-                        else:
-                            prim_paths[prim] = [item.primPath]
-
-        return prim_paths
+    def __get_reference_paths(self, prim: "Usd.Prim") -> List["Sdf.Path"]:
+        """Get the prim paths referenced by a prim (or the path of the prim for lights)"""
+        path = prim.GetPath()
+        reference_paths = self.__reference_paths_cache.get(path)
+        if reference_paths is not None:
+            return reference_paths
+        if _REGEX_LIGHT_PATH.match(str(path)):
+            reference_paths = [path]
+        else:
+            reference_paths = []
+            for prim_spec in prim.GetPrimStack():
+                for item in prim_spec.referenceList.prependedItems:
+                    if item.primPath:
+                        reference_paths.append(item.primPath)
+        if self.__reference_paths_cache_enabled:
+            self.__reference_paths_cache[path] = reference_paths
+        return reference_paths
 
     def __get_model_from_prototype_path(self, path):
         if not path.startswith(constants.MESH_PATH) and not path.startswith(constants.LIGHT_PATH):
@@ -583,54 +605,38 @@ class ListModel(ui.AbstractItemModel):
         return self.__get_model_from_prototype_path(str(parent.GetPath()))
 
     def __get_instances_by_mesh(self, paths: List[str]) -> Dict["Sdf.Path", List["Usd.Prim"]]:
-        if not self.stage:
+        stage = self.stage
+        if not stage:
             return {}
 
-        iterator = list(iter(Usd.PrimRange.Stage(self.stage, Usd.PrimIsActive & Usd.PrimIsDefined & Usd.PrimIsLoaded)))
-
         # extract hashes from paths
         hashes = set()
-        regex_inst_pattern = re.compile(constants.REGEX_HASH)
         for path in paths:
-            match = regex_inst_pattern.match(path)
+            match = constants.COMPILED_REGEX_HASH.match(path)
             if not match:
                 continue
             hashes.add(match.groups()[2])
+        if not hashes:
+            return {}
 
+        # Only the prims with the selected hashes in their path are looked at, not the whole stage
         result = {}
-        futures = []
-        cpu_count = multiprocessing.cpu_count()
-        # we can use threadpool here because we are just reading the stage
-        # Use exact number of cpu count as max worker: this is faster that letting Python doing it
-        # Divide the iter by group that fit the  max worker
-        with concurrent.futures.ThreadPoolExecutor(max_workers=cpu_count) as executor:
-            to_send = []
-            size_iter = len(iterator)
-            group_size = math.ceil(size_iter / cpu_count)
-            for i, prim in enumerate(iterator):
-                match = regex_inst_pattern.match(prim.GetName())
-                if not match or match.groups()[2] not in hashes:
-                    if i == size_iter - 1 and to_send:
-                        futures.append(executor.submit(self.__get_reference_prims, to_send))
-                    continue
-                if i == size_iter - 1 and to_send:
-                    futures.append(executor.submit(self.__get_reference_prims, to_send))
-                    continue
-                to_send.append(prim)
-                if len(to_send) == group_size:
-                    futures.append(executor.submit(self.__get_reference_prims, to_send))
-                    to_send = []
-
-            regex_pattern = re.compile(constants.REGEX_LIGHT_PATH)
-            for future in concurrent.futures.as_completed(futures):
-                refs = future.result()
-                for prim, ref in refs.items():
-                    if ref and ref[0] == prim.GetPath() and not regex_pattern.match(str(prim.GetPath())):
-                        continue
-                    if ref and ref[0] in result and prim not in result[ref[0]]:
-                        result[ref[0]].append(prim)
-                    elif ref and ref[0] not in result:
-                        result[ref[0]] = [prim]
+        for path in _get_stage_hash_index(stage).get_prim_paths(hashes):
+            match = constants.COMPILED_REGEX_HASH.match(path.rsplit("/", 1)[-1])
+            if not match or match.groups()[2] not in hashes:
+                continue
+            prim = stage.GetPrimAtPath(path)
+            # Same prims as a traversal with `Usd.PrimIsActive & Usd.PrimIsDefined & Usd.PrimIsLoaded`
+            if not prim.IsActive() or not prim.IsDefined() or not prim.IsLoaded():
+                continue
+            refs = self.__get_reference_paths(prim)
+            if not refs:
+                continue
+            if refs[0] == prim.GetPath() and not _REGEX_LIGHT_PATH.match(path):
+                continue
+            instances = result.setdefault(refs[0], [])
+            if prim not in instances:
+                instances.append(prim)
         return result
 
     def select_prim_paths(self, paths: List[Union[str]]):
@@ -0,0 +1,102 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+import omni.usd
+from lightspeed.trex.selection_tree.shared.widget.selection_tree.model import ListModel as _ListModel
+from omni.flux.utils.widget.resources import get_test_data as _get_test_data
+from omni.kit.test.async_unittest import AsyncTestCase
+from omni.kit.test_suite.helpers import open_stage, wait_stage_loading
+from pxr import Sdf
+
+
+class TestSelectionTreeModel(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        await open_stage(_get_test_data("usd/project_example/combined.usda"))
+        self.context = omni.usd.get_context()
+        self.model = _ListModel("")
+        self.model.enable_listeners(True)
+
+    # After running each test
+    async def tearDown(self):
+        self.model.enable_listeners(False)
+        self.model.destroy()
+        self.model = None
+        await wait_stage_loading()
+
+    def _get_instance_paths(self, selection):
+        self.context.get_selection().set_selected_prim_paths(selection, True)
+        self.model.refresh()
+        return [
+            [instance.path for instance in item.instance_group_item.instances]
+            for item in self.model.get_item_children(None)
+        ]
+
+    async def test_refresh_should_list_instances_of_selected_meshes(self):
+        # Act
+        value = self._get_instance_paths(
+            ["/RootNode/meshes/mesh_BAC90CAA733B0859", "/RootNode/instances/inst_CED45075A077A49A_0"]
+        )
+
+        # Assert
+        self.assertEqual(
+            [
+                [f"/RootNode/instances/inst_BAC90CAA733B0859_{index}" for index in range(3)],
+                ["/RootNode/instances/inst_CED45075A077A49A_0"],
+            ],
+            value,
+        )
+
+    async def test_refresh_should_follow_new_and_removed_instances(self):
+        # Arrange
+        stage = self.context.get_stage()
+        mesh_path = "/RootNode/meshes/mesh_BAC90CAA733B0859"
+        new_instance_path = "/RootNode/instances/inst_BAC90CAA733B0859_3"
+        self._get_instance_paths([mesh_path])
+
+        # Act
+        stage.DefinePrim(new_instance_path, "Xform").GetReferences().AddInternalReference(Sdf.Path(mesh_path))
+        value = self._get_instance_paths([mesh_path])
+
+        # Assert
+        self.assertEqual([[f"/RootNode/instances/inst_BAC90CAA733B0859_{index}" for index in range(4)]], value)
+
+        # Act
+        stage.RemovePrim(new_instance_path)
+        value = self._get_instance_paths([mesh_path])
+
+        # Assert
+        self.assertEqual([[f"/RootNode/instances/inst_BAC90CAA733B0859_{index}" for index in range(3)]], value)
+
+    async def test_invalidate_reference_paths_should_forget_resynced_prims_and_children(self):
+        # Arrange
+        self._get_instance_paths(["/RootNode/meshes/mesh_BAC90CAA733B0859", "/RootNode/meshes/mesh_CED45075A077A49A"])
+        cache = self.model._ListModel__reference_paths_cache  # noqa PLW0212
+        cached_paths = set(cache)
+        instance_paths = {path for path in cached_paths if path.HasPrefix(Sdf.Path("/RootNode/instances"))}
+
+        # Act
+        self.model.invalidate_reference_paths([Sdf.Path("/RootNode/instances"), Sdf.Path("/RootNode/unknown")])
+
+        # Assert
+        self.assertTrue(instance_paths)
+        self.assertEqual(cached_paths - instance_paths, set(cache))
+
+        # Act
+        self.model.invalidate_reference_paths([Sdf.Path.absoluteRootPath])
+
+        # Assert
+        self.assertEqual({}, cache)
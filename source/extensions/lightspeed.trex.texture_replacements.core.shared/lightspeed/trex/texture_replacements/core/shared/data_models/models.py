@@ -89,7 +89,9 @@ class ReplaceTexturesRequestModel(BaseServiceModel):
 
     @root_validator(allow_reuse=True)
     def root_validators(cls, values):  # noqa
-        for texture_entry in values.get("textures"):
-            TextureReplacementsValidators.is_valid_texture_prim(texture_entry, values.get("context_name"))
-            TextureReplacementsValidators.is_valid_texture_asset(texture_entry, values.get("force"))
+        errors = TextureReplacementsValidators.get_invalid_textures(
+            values.get("textures"), values.get("force"), values.get("context_name")
+        )
+        if errors:
+            raise ValueError("\n".join(str(error) for error in errors.values()))
         return values
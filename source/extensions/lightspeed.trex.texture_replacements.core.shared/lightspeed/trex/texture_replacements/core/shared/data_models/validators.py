@@ -68,6 +68,41 @@ class TextureReplacementsValidators:
 
         return texture_tuple
 
+    @classmethod
+    def get_invalid_textures(
+        cls, textures: list[tuple[str, Path]], force: bool, context_name: str
+    ) -> dict[int, ValueError]:
+        """
+        Validate many textures at once. Every asset is only validated once, even if it's used by many textures.
+
+        Args:
+            textures: A list of tuples in the format (texture property, asset path)
+            force: Whether to accept the assets that were not ingested
+            context_name: The USD context name
+
+        Returns:
+            The validation error of every invalid texture, by index in the list of textures
+        """
+        errors = {}
+        asset_errors = {}
+        for index, texture_tuple in enumerate(textures):
+            try:
+                cls.is_valid_texture_prim(texture_tuple, context_name)
+            except ValueError as e:
+                errors[index] = e
+                continue
+
+            asset_path = str(texture_tuple[1])
+            if asset_path not in asset_errors:
+                try:
+                    cls.is_valid_texture_asset(texture_tuple, force)
+                    asset_errors[asset_path] = None
+                except ValueError as e:
+                    asset_errors[asset_path] = e
+            if asset_errors[asset_path] is not None:
+                errors[index] = asset_errors[asset_path]
+        return errors
+
     @classmethod
     def layer_is_in_project(cls, layer_id: Path | None, context_name: str):
         if layer_id is None:
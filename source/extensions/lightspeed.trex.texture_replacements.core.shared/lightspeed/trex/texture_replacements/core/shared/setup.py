@@ -21,11 +21,13 @@ import omni.usd
 from lightspeed.trex.utils.common.asset_utils import TEXTURE_TYPE_INPUT_MAP as _TEXTURE_TYPE_INPUT_MAP
 from lightspeed.trex.utils.common.asset_utils import get_ingested_texture_type as _get_ingested_texture_type
 from lightspeed.trex.utils.common.asset_utils import get_texture_type_input_name as _get_texture_type_input_name
-from lightspeed.trex.utils.common.prim_utils import PrimTypes as _PrimTypes
+from lightspeed.trex.utils.common.hash_index import get_stage_hash_index as _get_stage_hash_index
+from lightspeed.trex.utils.common.hash_index import is_indexable_hash as _is_indexable_hash
+from lightspeed.trex.utils.common.material_index import get_stage_material_index as _get_stage_material_index
 from lightspeed.trex.utils.common.prim_utils import filter_prims_paths as _filter_prims_paths
 from lightspeed.trex.utils.common.prim_utils import get_extended_selection as _get_extended_selection
-from lightspeed.trex.utils.common.prim_utils import get_prim_paths as _get_prim_paths
 from lightspeed.trex.utils.common.prim_utils import includes_hash as _includes_hash
+from lightspeed.trex.utils.common.prim_utils import is_material as _is_material
 from lightspeed.trex.utils.common.prim_utils import is_shader as _is_shader
 from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS
 from omni.flux.asset_importer.core.data_models import TextureTypeNames as _TextureTypeNames
@@ -72,7 +74,8 @@ class TextureReplacementsCore:
         )
 
     def replace_texture_with_data_models(self, body: ReplaceTexturesRequestModel):
-        self.replace_textures(body.textures)
+        # The textures are validated by the request model
+        self.replace_textures(body.textures, force=body.force, validate=False)
 
     def get_texture_material_with_data_models(self, params: TextureMaterialPathParamModel) -> PrimsResponseModel:
         material_asset_path = self.get_texture_material(params.texture_asset_path)
@@ -131,76 +134,93 @@ class TextureReplacementsCore:
             a shader input and the asset path will be the absolute path to the texture asset
         """
         stage = self._context.get_stage()
+        material_index = _get_stage_material_index(stage)
         textures = []
 
-        selection = None
         if return_selection:
-            selection = _get_extended_selection(self._context_name)
+            shader_paths = [
+                path for path in _get_extended_selection(self._context_name) if material_index.is_shader(path)
+            ]
+        elif asset_hashes is not None and all(_is_indexable_hash(asset_hash) for asset_hash in asset_hashes):
+            # Only look at the prims that have one of the hashes in their path
+            shader_paths = [
+                path
+                for path in _get_stage_hash_index(stage).get_prim_paths(asset_hashes)
+                if material_index.is_shader(path)
+            ]
+        else:
+            shader_paths = material_index.get_shader_paths()
 
-        # Get every asset-type input for every shader and validate that the asset path has a supported texture extension
-        for shader_path in _filter_prims_paths(
+        texture_type_names = None
+        if texture_types is not None:
+            texture_type_names = {
+                _get_texture_type_input_name(_TextureTypes[texture_type.value]) for texture_type in texture_types
+            }
+
+        shader_paths = _filter_prims_paths(
             lambda prim: bool(_is_shader(prim) and _includes_hash(prim, asset_hashes)),
-            prim_paths=selection,
+            prim_paths=shader_paths,
             filter_session_prims=filter_session_prims,
             layer_id=layer_id,
             exists=exists,
             context_name=self._context_name,
-        ):
-            shader = UsdShade.Shader(stage.GetPrimAtPath(shader_path))
-            for shader_input in shader.GetInputs():
+        )
+
+        # Get every asset-type input for every shader and validate that the asset path has a supported texture extension
+        for shader_path, input_names in material_index.get_asset_inputs(shader_paths).items():
+            shader_prim = stage.GetPrimAtPath(shader_path)
+            for input_name in input_names:
                 # Make sure the input matches the filter if set
-                if texture_types is not None:
-                    texture_type_names = [
-                        _get_texture_type_input_name(_TextureTypes[texture_type.value])
-                        for texture_type in texture_types
-                    ]
-                    if shader_input.GetFullName() not in texture_type_names:
-                        continue
-                # Make sure the input expects an asset
-                if shader_input.GetTypeName() != Sdf.ValueTypeNames.Asset:
+                if texture_type_names is not None and input_name not in texture_type_names:
+                    continue
+                # Resolve the asset again so textures written since the shader was indexed are found
+                value = shader_prim.GetAttribute(input_name).Get()
+                if not value:
                     continue
                 # Make sure the asset is a supported texture
-                texture_asset_path = shader_input.Get().resolvedPath
+                texture_asset_path = value.resolvedPath
                 if OmniUrl(texture_asset_path).suffix.lower() not in _SUPPORTED_TEXTURE_EXTENSIONS:
                     continue
                 # Build the full property path
-                texture_input_path = Sdf.Path(shader_path).AppendProperty(shader_input.GetFullName())
+                texture_input_path = Sdf.Path(shader_path).AppendProperty(input_name)
                 # Store the texture property and the asset path
                 textures.append((str(texture_input_path), str(texture_asset_path)))
 
         return textures
 
-    def replace_textures(self, textures: list[tuple[str, str]], force: bool = False):
+    def replace_textures(self, textures: list[tuple[str, str]], force: bool = False, validate: bool = True):
         """
-        Replace a list of textures
+        Replace a list of textures. All the textures are validated first and the valid textures are replaced in a
+        single change block & undo step.
 
         Args:
             textures: A list of tuples in the format (texture property, asset path) where the texture property should be
                       a shader input and the asset path should be the absolute path to the texture asset
             force: Whether to force replace the texture or validate it was ingested correctly
+            validate: Whether to validate the textures or not. Invalid textures are skipped.
         """
-        with undo.group():
-            for texture_attr_path, texture_asset_path in textures:
-                try:
-                    TextureReplacementsValidators.is_valid_texture_prim(
-                        (texture_attr_path, texture_asset_path), self._context_name
-                    )
-                    TextureReplacementsValidators.is_valid_texture_asset((texture_attr_path, texture_asset_path), force)
-                except ValueError:
-                    continue
-
-                commands.execute(
-                    "ChangeProperty",
-                    prop_path=texture_attr_path,
-                    value=Sdf.AssetPath(
-                        omni.usd.make_path_relative_to_current_edit_target(
-                            str(texture_asset_path), stage=self._context.get_stage()
-                        )
+        stage = self._context.get_stage()
+        errors = {}
+        if validate:
+            errors = TextureReplacementsValidators.get_invalid_textures(textures, force, self._context_name)
+
+        values = []
+        for index, (texture_attr_path, texture_asset_path) in enumerate(textures):
+            if index in errors:
+                continue
+            values.append(
+                (
+                    texture_attr_path,
+                    Sdf.AssetPath(
+                        omni.usd.make_path_relative_to_current_edit_target(str(texture_asset_path), stage=stage)
                     ),
-                    prev=None,
-                    usd_context_name=self._context_name,
-                    target_layer=self._context.get_stage().GetEditTarget().GetLayer(),
                 )
+            )
+        if not values:
+            return
+
+        with undo.group():
+            commands.execute("SetAttributeValues", values=values, stage=stage)
 
     def get_texture_material(self, texture_prim_path: str) -> str | None:
         """
@@ -212,24 +232,36 @@ class TextureReplacementsCore:
         Returns:
             the prim path to the associated material or None if no material is found
         """
-        stage = self._context.get_stage()
+        return self.get_texture_materials([texture_prim_path])[texture_prim_path]
 
-        # Get the prim path for the shader input
-        shader_path = Sdf.Path(texture_prim_path).GetPrimPath()
-        # Get all materials in the stage. Materials are linked to their shader via their output
-        material_paths = _get_prim_paths(prim_type=_PrimTypes.MATERIALS)
-
-        for material_path in material_paths:
-            # Get the outputs for the material
-            for output in UsdShade.Material(stage.GetPrimAtPath(material_path)).GetOutputs():
-                # Get the connection of the output
-                for connection_path in output.GetRawConnectedSourcePaths():
-                    # Make sure the output connection points to our shader
-                    if Sdf.Path(connection_path).GetPrimPath() == shader_path:
-                        return material_path
-
-        # No material is connected to our shader
-        return None
+    def get_texture_materials(self, texture_prim_paths: list[str]) -> dict[str, str | None]:
+        """
+        Get the material prim paths of many texture prim attributes
+
+        Args:
+            texture_prim_paths: The prim paths to shader input attributes
+
+        Returns:
+            The prim path to the associated material of every texture attribute or None if no material is found
+        """
+        material_index = _get_stage_material_index(self._context.get_stage())
+
+        # Materials are linked to their shader via their output
+        shader_paths = {path: str(Sdf.Path(path).GetPrimPath()) for path in texture_prim_paths}
+        materials_by_shader = material_index.get_materials(set(shader_paths.values()))
+        valid_materials = set(
+            _filter_prims_paths(
+                _is_material,
+                prim_paths=list({path for paths in materials_by_shader.values() for path in paths}),
+                filter_session_prims=True,
+                context_name=self._context_name,
+            )
+        )
+
+        return {
+            path: next((m for m in materials_by_shader[shader_paths[path]] if m in valid_materials), None)
+            for path in texture_prim_paths
+        }
 
     async def get_expected_texture_material_inputs(
         self,
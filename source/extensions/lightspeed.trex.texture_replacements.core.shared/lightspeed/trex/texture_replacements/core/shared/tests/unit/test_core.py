@@ -15,20 +15,163 @@
 * limitations under the License.
 """
 
+import os
+import tempfile
+from pathlib import Path
+
+import omni.kit.undo
+import omni.usd
+from lightspeed.trex.texture_replacements.core.shared import TextureReplacementsCore
+from lightspeed.trex.utils.common.material_index import get_stage_material_index as _get_stage_material_index
 from omni.kit.test.async_unittest import AsyncTestCase
+from omni.kit.test_suite.helpers import wait_stage_loading
+from pxr import Sdf, UsdShade
 
 
 class TestTextureReplacementsCore(AsyncTestCase):
     # Before running each test
     async def setUp(self):
-        pass
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.core = TextureReplacementsCore()
 
     # After running each test
     async def tearDown(self):
-        pass
+        self.core.destroy()
+        self.temp_dir.cleanup()
+        await wait_stage_loading()
+        if self.context.can_close_stage():
+            await self.context.close_stage_async()
+        self.context = None
+
+    def _create_material(self, material_hash: str, texture_name: str) -> str:
+        stage = self.context.get_stage()
+        texture_path = Path(self.temp_dir.name) / texture_name
+        texture_path.write_bytes(b"")
+
+        material = UsdShade.Material.Define(stage, f"/RootNode/Looks/mat_{material_hash}")
+        shader = UsdShade.Shader.Define(stage, f"/RootNode/Looks/mat_{material_hash}/Shader")
+        shader.CreateInput("diffuse_texture", Sdf.ValueTypeNames.Asset).Set(Sdf.AssetPath(str(texture_path)))
+        shader.CreateInput("roughness_constant", Sdf.ValueTypeNames.Float).Set(0.5)
+        material.CreateSurfaceOutput().ConnectToSource(shader.ConnectableAPI(), "out")
+        return str(shader.GetPath())
 
     async def test_something(self):
         # Arrange
         # Act
         # Assert
         pass
+
+    async def test_get_texture_prims_assets_should_follow_stage_changes(self):
+        # Arrange
+        shader_path = self._create_material("0123456789ABCDEF", "a.dds")
+        other_shader_path = self._create_material("FEDCBA9876543210", "b.dds")
+
+        # Act
+        all_textures = self.core.get_texture_prims_assets(None, None, filter_session_prims=False)
+        hash_textures = self.core.get_texture_prims_assets({"FEDCBA9876543210"}, None, filter_session_prims=False)
+
+        # Assert
+        self.assertEqual(
+            [f"{shader_path}.inputs:diffuse_texture", f"{other_shader_path}.inputs:diffuse_texture"],
+            [texture_path for texture_path, _ in all_textures],
+        )
+        self.assertEqual([f"{other_shader_path}.inputs:diffuse_texture"], [path for path, _ in hash_textures])
+
+        # Act
+        self.context.get_stage().RemovePrim("/RootNode/Looks/mat_0123456789ABCDEF")
+        textures = self.core.get_texture_prims_assets(None, None, filter_session_prims=False)
+
+        # Assert
+        self.assertEqual([f"{other_shader_path}.inputs:diffuse_texture"], [path for path, _ in textures])
+
+    async def test_get_texture_materials_should_return_connected_materials(self):
+        # Arrange
+        shader_path = self._create_material("0123456789ABCDEF", "a.dds")
+        stage = self.context.get_stage()
+        orphan_shader = UsdShade.Shader.Define(stage, "/RootNode/Looks/Orphan")
+        orphan_shader.CreateInput("diffuse_texture", Sdf.ValueTypeNames.Asset)
+        texture_paths = [f"{shader_path}.inputs:diffuse_texture", "/RootNode/Looks/Orphan.inputs:diffuse_texture"]
+
+        # Act
+        materials = self.core.get_texture_materials(texture_paths)
+
+        # Assert
+        self.assertEqual({texture_paths[0]: "/RootNode/Looks/mat_0123456789ABCDEF", texture_paths[1]: None}, materials)
+
+        # Act
+        material = UsdShade.Material(stage.GetPrimAtPath("/RootNode/Looks/mat_0123456789ABCDEF"))
+        material.GetSurfaceOutput().DisconnectSource()
+
+        # Assert
+        self.assertIsNone(self.core.get_texture_material(texture_paths[0]))
+
+    async def test_material_index_should_follow_input_changes(self):
+        # Arrange
+        shader_path = self._create_material("0123456789ABCDEF", "a.dds")
+        stage = self.context.get_stage()
+        index = _get_stage_material_index(stage)
+        texture_path = str(Path(self.temp_dir.name) / "a.dds")
+        index.update()
+
+        # Act
+        shader = UsdShade.Shader(stage.GetPrimAtPath(shader_path))
+        shader.CreateInput("normalmap_texture", Sdf.ValueTypeNames.Asset)
+        shader.GetInput("diffuse_texture").Set(Sdf.AssetPath(""))
+        self._create_material("FEDCBA9876543210", "a.dds")
+
+        # Assert
+        new_shader_path = "/RootNode/Looks/mat_FEDCBA9876543210/Shader"
+        self.assertEqual(
+            {
+                shader_path: ["inputs:diffuse_texture", "inputs:normalmap_texture"],
+                new_shader_path: ["inputs:diffuse_texture"],
+            },
+            index.get_asset_inputs([shader_path, new_shader_path]),
+        )
+        self.assertEqual(
+            {new_shader_path: ["/RootNode/Looks/mat_FEDCBA9876543210"]}, index.get_materials([new_shader_path])
+        )
+        self.assertEqual(
+            {
+                "/RootNode/Looks/mat_0123456789ABCDEF": [
+                    f"{shader_path}.inputs:diffuse_texture",
+                    f"{shader_path}.inputs:normalmap_texture",
+                ]
+            },
+            index.get_material_texture_inputs(["/RootNode/Looks/mat_0123456789ABCDEF"]),
+        )
+        self.assertEqual(
+            {texture_path: [f"{new_shader_path}.inputs:diffuse_texture"]}, index.get_asset_input_paths([texture_path])
+        )
+        self.assertEqual(
+            [(f"{new_shader_path}.inputs:diffuse_texture", texture_path)],
+            self.core.get_texture_prims_assets({"FEDCBA9876543210"}, None, filter_session_prims=False),
+        )
+
+    async def test_replace_textures_should_replace_valid_textures_in_one_undo_step(self):
+        # Arrange
+        stage = self.context.get_stage()
+        shader_paths = [self._create_material(f"{index:016X}", f"{index}.dds") for index in range(50)]
+        new_texture = Path(self.temp_dir.name) / "new.dds"
+        new_texture.write_bytes(b"")
+        textures = [(f"{path}.inputs:diffuse_texture", str(new_texture)) for path in shader_paths]
+        textures.append((f"{shader_paths[0]}.inputs:roughness_texture", str(new_texture)))
+
+        # Act
+        self.core.replace_textures(textures, force=True)
+
+        # Assert
+        for shader_path in shader_paths:
+            value = stage.GetAttributeAtPath(f"{shader_path}.inputs:diffuse_texture").Get()
+            self.assertEqual(os.path.normpath(str(new_texture)), os.path.normpath(value.resolvedPath))
+        self.assertFalse(stage.GetAttributeAtPath(f"{shader_paths[0]}.inputs:roughness_texture"))
+
+        # Act
+        omni.kit.undo.undo()
+
+        # Assert
+        for index, shader_path in enumerate(shader_paths):
+            value = stage.GetAttributeAtPath(f"{shader_path}.inputs:diffuse_texture").Get()
+            self.assertEqual(f"{index}.dds", Path(value.path).name)
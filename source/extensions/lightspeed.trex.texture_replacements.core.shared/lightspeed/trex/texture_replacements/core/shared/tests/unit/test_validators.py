@@ -125,3 +125,30 @@ class TestTextureReplacementsValidators(AsyncTestCase):
                     self.assertEqual(value, input_val)
                 else:
                     self.assertEqual(str(cm.exception), f"{message}: {asset_path}")
+
+    async def test_get_invalid_textures_validates_each_asset_once(self):
+        # Arrange
+        stage = self.context.get_stage()
+        valid_asset_path = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
+        textures = []
+        for index in range(10):
+            shader = UsdShade.Shader.Define(stage, f"/test/Shader_{index}")
+            shader.CreateInput("diffuse_texture", Sdf.ValueTypeNames.Asset)
+            textures.append((f"/test/Shader_{index}.inputs:diffuse_texture", valid_asset_path.name))
+        textures.append(("/test/Shader_0.inputs:diffuse_texture", "Z:/Test/non_existent.png"))
+        textures.append(("/test/non/existent.inputs:diffuse_texture", valid_asset_path.name))
+
+        with patch(
+            "lightspeed.trex.texture_replacements.core.shared.data_models.validators.is_asset_ingested"
+        ) as was_ingested_mock:
+            was_ingested_mock.return_value = True
+
+            # Act
+            errors = TextureReplacementsValidators.get_invalid_textures(textures, False, "")
+
+        # Assert
+        self.assertEqual(1, was_ingested_mock.call_count)
+        self.assertEqual([10, 11], list(errors))
+        self.assertEqual(
+            "The asset path does not point to an existing file: Z:/Test/non_existent.png", str(errors[10])
+        )
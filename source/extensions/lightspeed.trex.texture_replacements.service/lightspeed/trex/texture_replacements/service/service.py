@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+from fastapi import Request, Response
 from lightspeed.trex.texture_replacements.core.shared import TextureReplacementsCore
 from lightspeed.trex.texture_replacements.core.shared.data_models import (
     GetTexturesQueryModel,
@@ -42,6 +43,8 @@ class TextureReplacementsService(ServiceBase):
 
         super().__init__()
 
+        self.watch_stage(context_name)
+
     @classmethod
     @property
     def prefix(cls) -> str:
@@ -56,6 +59,8 @@ class TextureReplacementsService(ServiceBase):
             response_model=TexturesResponseModel,
         )
         async def get_textures(
+            request: Request,
+            response: Response,
             asset_hashes: set[str] | None = ServiceBase.describe_query_param(  # noqa B008
                 None, "Filter textures to keep textures from specific material hashes"
             ),
@@ -79,18 +84,33 @@ class TextureReplacementsService(ServiceBase):
                 "Filter an texture if it exists or not on a given layer. Use in conjunction with `layer_identifier` "
                 "to filter on a given layer, otherwise this parameter will be ignored.",
             ),
+            cursor: str | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The cursor of the page to get, given by the `X-Next-Cursor` header of the previous page"
+            ),
+            limit: int | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The maximum number of textures to return. Return all the textures if not set"
+            ),
         ) -> TexturesResponseModel:
             try:
-                return self.__texture_core.get_texture_prims_assets_with_data_models(
-                    GetTexturesQueryModel(
-                        asset_hashes=asset_hashes,
-                        texture_types=texture_types,
-                        return_selection=selection,
-                        filter_session_prims=filter_session_prims,
-                        layer_identifier=layer_identifier,
-                        exists=exists,
-                        context_name=context_name,
-                    )
+                return await self.get_cached_response(
+                    request,
+                    response,
+                    lambda: self.__texture_core.get_texture_prims_assets_with_data_models(
+                        GetTexturesQueryModel(
+                            asset_hashes=asset_hashes,
+                            texture_types=texture_types,
+                            return_selection=selection,
+                            filter_session_prims=filter_session_prims,
+                            layer_identifier=layer_identifier,
+                            exists=exists,
+                            context_name=context_name,
+                        )
+                    ),
+                    items_field="textures",
+                    cursor=cursor,
+                    limit=limit,
+                    # The selection changes don't bump the revision
+                    use_cache=not selection,
                 )
             except ValueError as e:
                 ServiceBase.raise_error(422, e)
@@ -118,6 +138,8 @@ class TextureReplacementsService(ServiceBase):
             response_model=PrimsResponseModel,
         )
         async def get_texture_material(
+            request: Request,
+            response: Response,
             texture_asset_path: str = ServiceBase.validate_path_param(  # noqa B008
                 TextureMaterialPathParamModel,
                 description="The asset path of a given texture",
@@ -125,7 +147,11 @@ class TextureReplacementsService(ServiceBase):
             )
         ) -> PrimsResponseModel:
             try:
-                return self.__texture_core.get_texture_material_with_data_models(texture_asset_path)
+                return await self.get_cached_response(
+                    request,
+                    response,
+                    lambda: self.__texture_core.get_texture_material_with_data_models(texture_asset_path),
+                )
             except ValueError as e:
                 ServiceBase.raise_error(404, e)
 
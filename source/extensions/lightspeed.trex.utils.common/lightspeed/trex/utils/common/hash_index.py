@@ -0,0 +1,267 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "StageHashIndex",
+    "get_stage_hash_index",
+    "is_indexable_hash",
+    "sort_in_traversal_order",
+]
+
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+from lightspeed.common import constants
+from omni.flux.utils.common.stage_index import StageIndex as _StageIndex
+from omni.flux.utils.common.stage_index import StageIndexRegistry as _StageIndexRegistry
+from pxr import Sdf, Tf, Usd
+
+# Any 16 characters hash found in a path. Longer runs give all their 16 characters windows so a hash found in a path
+# with `asset_hash in path` is always indexed
+_HASH_RUN = re.compile(r"[A-Z0-9]{16,}")
+_HASH = re.compile(r"^[A-Z0-9]{16}$")
+_INSTANCE_PATH = re.compile(constants.REGEX_INSTANCE_PATH)
+
+# Above this number of resynced paths, rebuilding the index is faster than updating it
+_MAX_PENDING_PATHS = 10000
+
+
+def is_indexable_hash(asset_hash: str) -> bool:
+    """
+    Returns:
+        Whether prims containing the hash in their path can be found with a `StageHashIndex`
+    """
+    return bool(_HASH.match(asset_hash))
+
+
+def _get_hashes(path: str) -> Set[str]:
+    hashes = set()
+    for match in _HASH_RUN.finditer(path):
+        run = match.group(0)
+        for index in range(len(run) - 15):
+            hashes.add(run[index : index + 16])  # noqa E203
+    return hashes
+
+
+def sort_in_traversal_order(stage: Usd.Stage, paths: Iterable[str]) -> List[str]:
+    """
+    Sort prim paths in the order a traversal of the stage would find them, without traversing the stage
+
+    Args:
+        stage: the stage of the prims
+        paths: the prim paths to sort
+
+    Returns:
+        The sorted prim paths
+    """
+    children_order = {}
+
+    def get_key(path: str) -> List[int]:
+        key = []
+        for prefix in Sdf.Path(path).GetPrefixes():
+            parent_path = prefix.GetParentPath()
+            order = children_order.get(parent_path)
+            if order is None:
+                parent = stage.GetPrimAtPath(parent_path)
+                names = parent.GetAllChildrenNames() if parent.IsValid() else []
+                order = {name: index for index, name in enumerate(names)}
+                children_order[parent_path] = order
+            key.append(order.get(prefix.name, -1))
+        return key
+
+    return sorted(paths, key=get_key)
+
+
+class StageHashIndex(_StageIndex):
+    def __init__(self, stage: Usd.Stage):
+        """
+        Index of the prims of a stage by the capture hashes found in their paths (meshes, materials, lights and their
+        instances and children).
+
+        The index is built on the first query and then updated from the resynced paths of the stage
+        `ObjectsChanged` notices, so queries don't traverse the stage.
+
+        Args:
+            stage: the stage to index
+        """
+        super().__init__(stage)
+        self._built = False
+        self._pending: Set[Sdf.Path] = set()
+        self._paths: Dict[str, Set[str]] = {}  # prim path -> hashes
+        self._children: Dict[str, Set[str]] = {}  # prim path -> indexed children paths
+        self._prims_by_hash: Dict[str, Set[str]] = {}
+        self._instances_by_hash: Dict[str, Set[str]] = {}
+
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    def _on_objects_changed(self, notice, sender):
+        if not self._built or sender != self.stage:
+            return
+        for path in notice.GetResyncedPaths():
+            if path.IsPrimPath() or path == Sdf.Path.absoluteRootPath:
+                self._pending.add(path)
+
+    def _add(self, path: str):
+        hashes = _get_hashes(path)
+        self._paths[path] = hashes
+        self._children.setdefault(str(Sdf.Path(path).GetParentPath()), set()).add(path)
+        if not hashes:
+            return
+        if _INSTANCE_PATH.match(path):
+            instance_hash = constants.COMPILED_REGEX_HASH.match(path).group(3)
+            self._instances_by_hash.setdefault(instance_hash, set()).add(path)
+        for asset_hash in hashes:
+            self._prims_by_hash.setdefault(asset_hash, set()).add(path)
+
+    def _remove(self, path: str):
+        for child_path in self._children.pop(path, ()):
+            self._remove(child_path)
+        hashes = self._paths.pop(path, None)
+        if hashes is None:
+            return
+        parent_children = self._children.get(str(Sdf.Path(path).GetParentPath()))
+        if parent_children is not None:
+            parent_children.discard(path)
+        for asset_hash in hashes:
+            self._discard(self._prims_by_hash, asset_hash, path)
+            self._discard(self._instances_by_hash, asset_hash, path)
+
+    @staticmethod
+    def _discard(paths_by_hash: Dict[str, Set[str]], asset_hash: str, path: str):
+        paths = paths_by_hash.get(asset_hash)
+        if paths is None:
+            return
+        paths.discard(path)
+        if not paths:
+            del paths_by_hash[asset_hash]
+
+    def _add_subtree(self, prim: Usd.Prim):
+        for child_prim in Usd.PrimRange(prim, Usd.PrimAllPrimsPredicate):
+            self._add(str(child_prim.GetPath()))
+
+    def rebuild(self):
+        """Index all the prims of the stage again"""
+        self._pending.clear()
+        self._paths.clear()
+        self._children.clear()
+        self._prims_by_hash.clear()
+        self._instances_by_hash.clear()
+        for prim in self.stage.TraverseAll():
+            self._add(str(prim.GetPath()))
+        self._built = True
+
+    def update(self):
+        """Apply the changes of the stage since the last query. Called by every query."""
+        if not self._built or len(self._pending) > _MAX_PENDING_PATHS:
+            self.rebuild()
+            return
+        if not self._pending:
+            return
+        pending = sorted(self._pending)
+        self._pending.clear()
+        if pending[0] == Sdf.Path.absoluteRootPath:
+            self.rebuild()
+            return
+        stage = self.stage
+        previous = None
+        for path in pending:
+            # Sorted paths list a prim before its descendants: the descendants are updated with the prim
+            if previous is not None and path.HasPrefix(previous):
+                continue
+            previous = path
+            self._remove(str(path))
+            prim = stage.GetPrimAtPath(path)
+            if prim.IsValid():
+                self._add_subtree(prim)
+
+    def get_prim_paths(self, asset_hashes: Iterable[str]) -> List[str]:
+        """
+        Get the prims that contain any of the hashes in their path, like the mesh, material & light prims of the hashes
+        and their children & instances.
+
+        Args:
+            asset_hashes: the hashes to look for. See `is_indexable_hash`
+
+        Returns:
+            The prim paths, in the stage traversal order
+        """
+        self.update()
+        paths = set()
+        for asset_hash in asset_hashes:
+            paths.update(self._prims_by_hash.get(asset_hash, ()))
+        return sort_in_traversal_order(self.stage, paths)
+
+    def get_instance_paths(self, asset_hash: str) -> Set[str]:
+        """
+        Get the instance prims (`inst_<HASH>`) of a hash
+
+        Args:
+            asset_hash: the hash of the mesh or light
+
+        Returns:
+            The instance prim paths
+        """
+        self.update()
+        return set(self._instances_by_hash.get(asset_hash, ()))
+
+    def get_inconsistencies(self) -> List[str]:
+        """
+        Compare the index with a full traversal of the stage. Used to validate the incremental updates.
+
+        Returns:
+            The differences between the index & the stage. Empty if the index is consistent
+        """
+        self.update()
+        expected = StageHashIndex(self.stage)
+        expected.rebuild()
+
+        inconsistencies = []
+        for name in ("_paths", "_prims_by_hash", "_instances_by_hash"):
+            value = getattr(self, name)
+            expected_value = getattr(expected, name)
+            for key in sorted(set(value) | set(expected_value)):
+                if value.get(key) != expected_value.get(key):
+                    inconsistencies.append(
+                        f"{name}[{key}]: indexed {value.get(key)}, expected {expected_value.get(key)}"
+                    )
+        expected.destroy()
+        return inconsistencies
+
+    def destroy(self):
+        if self._listener:
+            self._listener.Revoke()
+        self._listener = None
+        self._paths.clear()
+        self._children.clear()
+        self._prims_by_hash.clear()
+        self._instances_by_hash.clear()
+
+
+def get_stage_hash_index(stage: Usd.Stage) -> Optional[StageHashIndex]:
+    """
+    Get the hash index of a stage. The index is created once per stage and kept up to date with the stage changes.
+
+    Args:
+        stage: the stage to index
+
+    Returns:
+        The hash index of the stage or None if the stage is not valid
+    """
+    return _INDEXES.get(stage)
+
+
+_INDEXES = _StageIndexRegistry(StageHashIndex)
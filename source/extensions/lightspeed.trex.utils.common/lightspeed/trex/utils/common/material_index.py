@@ -0,0 +1,330 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "StageMaterialIndex",
+    "get_stage_material_index",
+]
+
+import os
+from typing import Dict, Iterable, List, Optional, Set
+
+from omni.flux.utils.common.stage_index import StageIndex as _StageIndex
+from omni.flux.utils.common.stage_index import StageIndexRegistry as _StageIndexRegistry
+from pxr import Sdf, Tf, Usd, UsdShade
+
+from .hash_index import sort_in_traversal_order as _sort_in_traversal_order
+from .prim_utils import is_material as _is_material
+from .prim_utils import is_shader as _is_shader
+
+# Above this number of changed paths, rebuilding the index is faster than updating it
+_MAX_PENDING_PATHS = 10000
+
+
+def _get_asset_name(asset_path: str) -> str:
+    return os.path.normcase(asset_path.replace("\\", "/").rsplit("/", 1)[-1])
+
+
+def _normalize_path(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path)) if path else ""
+
+
+class StageMaterialIndex(_StageIndex):
+    def __init__(self, stage: Usd.Stage):
+        """
+        Index of the material graphs of a stage: the materials connected to every shader, the asset inputs of every
+        shader and the shader inputs using every asset.
+
+        The index is built on the first query and then updated from the stage `ObjectsChanged` notices: resynced prims
+        are indexed again with their children and prims with changed properties are indexed again alone.
+
+        Asset inputs are indexed by their authored asset path. Asset paths are only resolved at query time, so they are
+        always resolved against the current state of the stage & the file system.
+
+        Args:
+            stage: the stage to index
+        """
+        super().__init__(stage)
+        self._built = False
+        self._pending_resyncs: Set[Sdf.Path] = set()
+        self._pending_changes: Set[Sdf.Path] = set()
+
+        self._shaders: Set[str] = set()
+        self._sorted_shaders: Optional[List[str]] = None
+        self._materials: Set[str] = set()
+        self._shaders_by_material: Dict[str, Set[str]] = {}
+        self._materials_by_shader: Dict[str, Set[str]] = {}
+        self._asset_inputs_by_shader: Dict[str, Dict[str, str]] = {}  # shader path -> {input name: authored path}
+        self._inputs_by_asset: Dict[str, Set[str]] = {}  # authored asset path -> input property paths
+        self._assets_by_name: Dict[str, Set[str]] = {}  # asset file name -> authored asset paths
+
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    def _on_objects_changed(self, notice, sender):
+        if not self._built or sender != self.stage:
+            return
+        for path in notice.GetResyncedPaths():
+            self._pending_resyncs.add(path.GetPrimPath() if path.IsPropertyPath() else path)
+        for path in notice.GetChangedInfoOnlyPaths():
+            self._pending_changes.add(path.GetPrimPath())
+
+    def _add(self, prim: Usd.Prim):
+        path = str(prim.GetPath())
+        if _is_shader(prim):
+            self._add_shader(path, UsdShade.Shader(prim))
+        elif _is_material(prim):
+            self._add_material(path, UsdShade.Material(prim))
+
+    def _add_shader(self, path: str, shader: UsdShade.Shader):
+        self._shaders.add(path)
+        self._sorted_shaders = None
+        asset_inputs = {}
+        for shader_input in shader.GetInputs():
+            if shader_input.GetTypeName() != Sdf.ValueTypeNames.Asset:
+                continue
+            input_name = shader_input.GetFullName()
+            value = shader_input.Get()
+            asset_path = value.path if value else ""
+            asset_inputs[input_name] = asset_path
+            if not asset_path:
+                continue
+            input_paths = self._inputs_by_asset.setdefault(asset_path, set())
+            if not input_paths:
+                self._assets_by_name.setdefault(_get_asset_name(asset_path), set()).add(asset_path)
+            input_paths.add(f"{path}.{input_name}")
+        self._asset_inputs_by_shader[path] = asset_inputs
+
+    def _add_material(self, path: str, material: UsdShade.Material):
+        self._materials.add(path)
+        shader_paths = set()
+        for output in material.GetOutputs():
+            for connection_path in output.GetRawConnectedSourcePaths():
+                shader_paths.add(str(Sdf.Path(connection_path).GetPrimPath()))
+        self._shaders_by_material[path] = shader_paths
+        for shader_path in shader_paths:
+            self._materials_by_shader.setdefault(shader_path, set()).add(path)
+
+    def _remove(self, path: str):
+        if path in self._shaders:
+            self._shaders.discard(path)
+            self._sorted_shaders = None
+            for input_name, asset_path in self._asset_inputs_by_shader.pop(path, {}).items():
+                input_paths = self._inputs_by_asset.get(asset_path)
+                if input_paths is None:
+                    continue
+                input_paths.discard(f"{path}.{input_name}")
+                if input_paths:
+                    continue
+                del self._inputs_by_asset[asset_path]
+                asset_paths = self._assets_by_name[_get_asset_name(asset_path)]
+                asset_paths.discard(asset_path)
+                if not asset_paths:
+                    del self._assets_by_name[_get_asset_name(asset_path)]
+        if path in self._materials:
+            self._materials.discard(path)
+            for shader_path in self._shaders_by_material.pop(path, ()):
+                material_paths = self._materials_by_shader.get(shader_path)
+                if material_paths is None:
+                    continue
+                material_paths.discard(path)
+                if not material_paths:
+                    del self._materials_by_shader[shader_path]
+
+    def rebuild(self):
+        """Index all the material graphs of the stage again"""
+        self._pending_resyncs.clear()
+        self._pending_changes.clear()
+        self._shaders.clear()
+        self._sorted_shaders = None
+        self._materials.clear()
+        self._shaders_by_material.clear()
+        self._materials_by_shader.clear()
+        self._asset_inputs_by_shader.clear()
+        self._inputs_by_asset.clear()
+        self._assets_by_name.clear()
+        for prim in self.stage.TraverseAll():
+            self._add(prim)
+        self._built = True
+
+    def update(self):
+        """Apply the changes of the stage since the last query. Called by every query."""
+        if not self._built or len(self._pending_resyncs) + len(self._pending_changes) > _MAX_PENDING_PATHS:
+            self.rebuild()
+            return
+        if not self._pending_resyncs and not self._pending_changes:
+            return
+        resyncs = sorted(self._pending_resyncs)
+        changes = self._pending_changes - self._pending_resyncs
+        self._pending_resyncs.clear()
+        self._pending_changes.clear()
+        if resyncs and resyncs[0] == Sdf.Path.absoluteRootPath:
+            self.rebuild()
+            return
+
+        stage = self.stage
+
+        # Sorted paths list a prim before its descendants: the descendants are updated with the prim
+        roots = []
+        for path in resyncs:
+            if not roots or not path.HasPrefix(roots[-1]):
+                roots.append(path)
+        if roots:
+            root_paths = {str(path) for path in roots}
+            prefixes = tuple(f"{path}/" for path in root_paths)
+            for path in self._shaders | self._materials:
+                if path in root_paths or path.startswith(prefixes):
+                    self._remove(path)
+            for path in roots:
+                prim = stage.GetPrimAtPath(path)
+                if prim.IsValid():
+                    for child_prim in Usd.PrimRange(prim, Usd.PrimAllPrimsPredicate):
+                        self._add(child_prim)
+
+        for path in changes:
+            if any(path.HasPrefix(root) for root in roots):
+                continue
+            self._remove(str(path))
+            prim = stage.GetPrimAtPath(path)
+            if prim.IsValid():
+                self._add(prim)
+
+    def get_shader_paths(self) -> List[str]:
+        """
+        Returns:
+            The shader prim paths, in the stage traversal order
+        """
+        self.update()
+        if self._sorted_shaders is None:
+            self._sorted_shaders = _sort_in_traversal_order(self.stage, self._shaders)
+        return list(self._sorted_shaders)
+
+    def is_shader(self, path: str) -> bool:
+        """
+        Returns:
+            Whether the prim is an indexed shader or not
+        """
+        self.update()
+        return str(path) in self._shaders
+
+    def get_materials(self, shader_paths: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Get the materials connected to shaders through their outputs
+
+        Args:
+            shader_paths: the shader prim paths
+
+        Returns:
+            The material prim paths of every shader, in the stage traversal order
+        """
+        self.update()
+        return {
+            str(path): _sort_in_traversal_order(self.stage, self._materials_by_shader.get(str(path), ()))
+            for path in shader_paths
+        }
+
+    def get_asset_inputs(self, shader_paths: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Get the asset input names of shaders
+
+        Args:
+            shader_paths: the shader prim paths
+
+        Returns:
+            The full names of the asset inputs of every shader, in the shader inputs order
+        """
+        self.update()
+        return {str(path): list(self._asset_inputs_by_shader.get(str(path), {})) for path in shader_paths}
+
+    def get_material_texture_inputs(self, material_paths: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Get the asset input properties of the shaders connected to materials
+
+        Args:
+            material_paths: the material prim paths
+
+        Returns:
+            The asset input property paths of every material, in the stage traversal order of the shaders
+        """
+        self.update()
+        result = {}
+        for material_path in material_paths:
+            input_paths = []
+            shader_paths = _sort_in_traversal_order(self.stage, self._shaders_by_material.get(str(material_path), ()))
+            for shader_path in shader_paths:
+                input_paths.extend(
+                    f"{shader_path}.{input_name}" for input_name in self._asset_inputs_by_shader.get(shader_path, {})
+                )
+            result[str(material_path)] = input_paths
+        return result
+
+    def get_asset_input_paths(self, asset_paths: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Get the shader input properties using assets.
+
+        Only the inputs authoring an asset path with the same file name are resolved, once for all the queried assets.
+
+        Args:
+            asset_paths: the resolved asset paths
+
+        Returns:
+            The sorted input property paths using every asset
+        """
+        self.update()
+        stage = self.stage
+        resolved_paths = {}  # input property path -> normalized resolved asset path
+        result = {}
+        for asset_path in asset_paths:
+            normalized_path = _normalize_path(str(asset_path))
+            input_paths = []
+            for authored_path in self._assets_by_name.get(_get_asset_name(str(asset_path)), ()):
+                for input_path in self._inputs_by_asset[authored_path]:
+                    if input_path not in resolved_paths:
+                        value = stage.GetAttributeAtPath(input_path).Get()
+                        resolved_paths[input_path] = _normalize_path(value.resolvedPath) if value else ""
+                    if resolved_paths[input_path] == normalized_path:
+                        input_paths.append(input_path)
+            result[str(asset_path)] = sorted(input_paths)
+        return result
+
+    def destroy(self):
+        if self._listener:
+            self._listener.Revoke()
+        self._listener = None
+        self._shaders.clear()
+        self._sorted_shaders = None
+        self._materials.clear()
+        self._shaders_by_material.clear()
+        self._materials_by_shader.clear()
+        self._asset_inputs_by_shader.clear()
+        self._inputs_by_asset.clear()
+        self._assets_by_name.clear()
+
+
+def get_stage_material_index(stage: Usd.Stage) -> Optional[StageMaterialIndex]:
+    """
+    Get the material index of a stage. The index is created once per stage and kept up to date with the stage changes.
+
+    Args:
+        stage: the stage to index
+
+    Returns:
+        The material index of the stage or None if the stage is not valid
+    """
+    return _INDEXES.get(stage)
+
+
+_INDEXES = _StageIndexRegistry(StageMaterialIndex)
@@ -36,6 +36,9 @@ import omni.usd
 from lightspeed.common import constants
 from pxr import Sdf, Usd, UsdGeom, UsdLux, UsdShade
 
+from .hash_index import get_stage_hash_index as _get_stage_hash_index
+from .hash_index import is_indexable_hash as _is_indexable_hash
+
 
 class PrimTypes(Enum):
     LIGHTS = "lights"
@@ -69,6 +72,12 @@ def get_prim_paths(
     Returns:
         A list of prims paths
     """
+    if selection is None and asset_hashes is not None and all(_is_indexable_hash(h) for h in asset_hashes):
+        # Only look at the prims that have one of the hashes in their path instead of traversing the stage
+        index = _get_stage_hash_index(omni.usd.get_context(context_name).get_stage())
+        if index is not None:
+            selection = index.get_prim_paths(asset_hashes)
+
     if prim_type is not None:
         match prim_type:
             case PrimTypes.LIGHTS:
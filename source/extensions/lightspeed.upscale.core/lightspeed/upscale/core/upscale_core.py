@@ -15,7 +15,6 @@
 * limitations under the License.
 """
 
-import asyncio
 import contextlib
 import os
 import subprocess
@@ -26,6 +25,7 @@ from typing import TYPE_CHECKING, Callable, Union
 import carb
 import omni.usd
 from lightspeed.common import constants
+from omni.flux.utils.common.conversion_scheduler import get_conversion_scheduler as _get_conversion_scheduler
 from PIL import Image
 
 if TYPE_CHECKING:
@@ -177,7 +177,6 @@ class UpscalerCore:
         keep_png: bool = False,
         overwrite: bool = False,
     ):
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None, UpscalerCore.perform_upscale, upscale_model, input_texture, output_texture, keep_png, overwrite
+        await _get_conversion_scheduler().run(
+            UpscalerCore.perform_upscale, upscale_model, input_texture, output_texture, keep_png, overwrite
         )
@@ -25,6 +25,7 @@ from omni.flux.asset_importer.core.data_models.constants import (
     SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS,
 )
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
+from omni.flux.utils.common.path_utils import is_metadata_file as _is_metadata_file
 from omni.flux.utils.widget.file_pickers import open_file_picker as _open_file_picker
 from omni.flux.utils.widget.hover import hover_helper as _hover_helper
 
@@ -90,7 +91,7 @@ class ScanFolderWidget:
         for file in input_folder.iterdir():
             if not file.is_file():
                 continue
-            if file.suffix == ".meta":
+            if _is_metadata_file(file):
                 continue
             match = search_exp.search(str(file.name))
             if not match:
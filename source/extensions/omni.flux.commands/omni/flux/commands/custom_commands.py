@@ -297,4 +297,62 @@ class RemoveOverrideCommand(omni.kit.commands.Command):
                 self._edit_target_undo.undo()
 
 
+class SetAttributeValuesCommand(omni.kit.commands.Command):
+    """
+    Set the default value of many attributes in a single change block undoable **Command**.
+
+    The attribute specs are created on the edit target layer when they don't exist. Invalid attributes are skipped.
+
+    Args:
+        values (list[tuple[str, Any]]): The attribute paths and the values to set.
+        context_name (str): Usd context name to run the command on.
+        stage (Usd.Stage): Stage to operate. Optional.
+    """
+
+    def __init__(self, values: list[tuple[str, Any]], context_name: str = "", stage: Usd.Stage = None):
+        self._values = [(Sdf.Path(str(path)), value) for path, value in values]
+        self._stage = stage or omni.usd.get_context(context_name).get_stage()
+        self._edit_target_undo = None
+
+    def do(self):
+        edit_target = self._stage.GetEditTarget()
+        layer = edit_target.GetLayer()
+
+        # Read the composed attributes before changing anything: the stage can't be read in the change block
+        attributes = []
+        for path, value in self._values:
+            attribute = self._stage.GetAttributeAtPath(path)
+            if not attribute:
+                carb.log_warn(f"{self.__class__.__name__}: {path} is not a valid attribute")
+                continue
+            attributes.append(
+                (
+                    path,
+                    edit_target.MapToSpecPath(path),
+                    attribute.GetTypeName(),
+                    attribute.GetVariability(),
+                    attribute.IsCustom(),
+                    value,
+                )
+            )
+
+        self._edit_target_undo = UsdEditTargetUndo(edit_target)
+        for path, *_ in attributes:
+            self._edit_target_undo.reserve(path)
+
+        with Sdf.ChangeBlock():
+            for _, spec_path, type_name, variability, custom, value in attributes:
+                attribute_spec = layer.GetAttributeAtPath(spec_path)
+                if not attribute_spec:
+                    prim_spec = Sdf.CreatePrimInLayer(layer, spec_path.GetPrimPath())
+                    attribute_spec = Sdf.AttributeSpec(prim_spec, spec_path.name, type_name, variability, custom)
+                attribute_spec.default = value
+
+    def undo(self):
+        with Sdf.ChangeBlock():
+            if self._edit_target_undo:
+                self._edit_target_undo.undo()
+        self._edit_target_undo = None
+
+
 omni.kit.commands.register_all_commands_in_module(__name__)
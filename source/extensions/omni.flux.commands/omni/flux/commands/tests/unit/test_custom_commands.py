@@ -284,3 +284,36 @@ class TestCustomCommands(omni.kit.test.AsyncTestCase):
         self.assertEqual(len(stack), 1)
         # Should be empty because we removed the override and prim
         self.assertEqual(len(stack2), 0)
+
+    async def test_set_attribute_values_sets_values_on_edit_target_and_undo(self):
+        # Arrange
+        layer0 = Sdf.Layer.CreateAnonymous()
+        layer1 = Sdf.Layer.CreateAnonymous()
+        self.stage.GetRootLayer().subLayerPaths.append(layer0.identifier)
+        self.stage.GetRootLayer().subLayerPaths.append(layer1.identifier)
+        paths = []
+        with Usd.EditContext(self.stage, layer1):
+            for _ in range(100):
+                prim = await self.__define_prim()
+                prim.CreateAttribute("value", Sdf.ValueTypeNames.Int).Set(-1)
+                paths.append(prim.GetAttribute("value").GetPath())
+        self.stage.SetEditTarget(Usd.EditTarget(layer0))
+
+        # Act
+        omni.kit.commands.execute(
+            "SetAttributeValues",
+            values=[(path, index) for index, path in enumerate(paths)] + [("/World/Invalid.value", 1)],
+            stage=self.stage,
+        )
+
+        # Assert
+        self.assertEqual(list(range(100)), [self.stage.GetAttributeAtPath(path).Get() for path in paths])
+        self.assertTrue(all(layer0.GetAttributeAtPath(path) for path in paths))
+        self.assertFalse(self.stage.GetPrimAtPath("/World/Invalid"))
+
+        # Act
+        omni.kit.undo.undo()
+
+        # Assert
+        self.assertEqual([-1] * 100, [self.stage.GetAttributeAtPath(path).Get() for path in paths])
+        self.assertFalse(any(layer0.GetAttributeAtPath(path) for path in paths))
@@ -16,16 +16,30 @@
 """
 
 import abc
-from typing import Any, Optional, Type, Union
-
+import base64
+import binascii
+import hashlib
+import inspect
+import json
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple, Type, Union
+
+import omni.usd
 from fast_version import VersionedAPIRouter
-from fastapi import Depends, Path, Query
+from fastapi import Depends, Path, Query, Request, Response
 from omni.flux.factory.base import PluginBase
 from omni.flux.service.shared import BaseServiceModel
 from omni.services.core import exceptions
 from omni.services.core.routers import ServiceAPIRouter
+from pxr import Sdf, Tf, Usd
 from pydantic import Field, ValidationError, create_model
 
+# The number of responses kept by every service
+_RESPONSE_CACHE_SIZE = 32
+# The query parameters that select a page of a response instead of changing the response
+_PAGINATION_QUERY_PARAMS = {"cursor", "limit"}
+
 
 class APIRouter(VersionedAPIRouter, ServiceAPIRouter):
     pass
@@ -41,6 +55,16 @@ class ServiceBase(PluginBase, abc.ABC):
     def __init__(self, *args, **kwargs):
         self._router = APIRouter()
 
+        # The nonce keeps the revisions unique across processes & stages so an ETag is never matched by other data
+        self._revision_nonce = uuid.uuid4().hex
+        self._revision_count = 0
+        self._response_cache: OrderedDict[str, Tuple[str, Any]] = OrderedDict()
+        self._watched_context_name = None
+        self._stage_changed = False
+        self._stage_listener = None
+        self._layers_listener = None
+        self._stage_event_sub = None
+
         self.register_endpoints()
 
     @classmethod
@@ -78,6 +102,200 @@ class ServiceBase(PluginBase, abc.ABC):
         """
         return self._router
 
+    @property
+    def revision(self) -> str:
+        """
+        The revision is bumped every time the data served by the service changes. Cached responses are only used for
+        the revision they were computed for.
+
+        Returns:
+            The current revision
+        """
+        if self._stage_changed:
+            # The stage changed without any layer change, like when loading payloads
+            self.bump_revision()
+        return f"{self._revision_nonce}-{self._revision_count}"
+
+    def bump_revision(self):
+        """
+        Invalidate the cached responses, the ETags & the pagination cursors given for the current revision
+        """
+        self._revision_count += 1
+        self._stage_changed = False
+        self._response_cache.clear()
+
+    def watch_stage(self, context_name: str = ""):
+        """
+        Bump the revision every time the stage of a USD context changes, is opened or is closed. Changes only editing
+        the session layers don't bump the revision.
+
+        Args:
+            context_name: The USD context name
+        """
+        self._watched_context_name = context_name
+        context = omni.usd.get_context(context_name)
+        self._stage_event_sub = context.get_stage_event_stream().create_subscription_to_pop(
+            self._on_stage_event, name=f"{self.name} response cache"
+        )
+        self._register_stage_listener(context.get_stage())
+
+    def _register_stage_listener(self, stage: Optional[Usd.Stage]):
+        for listener in (self._stage_listener, self._layers_listener):
+            if listener:
+                listener.Revoke()
+        self._stage_listener = None
+        self._layers_listener = None
+        self._stage_changed = False
+        if stage:
+            self._stage_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+            self._layers_listener = Tf.Notice.RegisterGlobally(Sdf.Notice.LayersDidChange, self._on_layers_changed)
+
+    def _on_stage_event(self, event):
+        if event.type not in [int(omni.usd.StageEventType.OPENED), int(omni.usd.StageEventType.CLOSED)]:
+            return
+        self._register_stage_listener(omni.usd.get_context(self._watched_context_name).get_stage())
+        self._revision_nonce = uuid.uuid4().hex
+        self.bump_revision()
+
+    def _on_objects_changed(self, _notice, _sender):
+        # The layer changes are sent after the stage changes: wait for them to know which layers changed. Stage changes
+        # without layer changes bump the revision when it is read.
+        self._stage_changed = True
+
+    def _on_layers_changed(self, notice, _sender):
+        if not self._stage_changed:
+            return
+        self._stage_changed = False
+
+        stage = omni.usd.get_context(self._watched_context_name).get_stage()
+        if not stage:
+            return
+        # The session layers only hold transient edits, like the viewport camera, that are not served by the services
+        session_layers = set(stage.GetLayerStack(includeSessionLayers=True)) - set(
+            stage.GetLayerStack(includeSessionLayers=False)
+        )
+        if any(layer not in session_layers for layer in notice.GetLayers()):
+            self.bump_revision()
+
+    async def get_cached_response(
+        self,
+        request: Request,
+        response: Response,
+        compute: Callable[[], Any],
+        items_field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> Any:
+        """
+        Get the response of a request from the cache or compute it and cache it for the current revision.
+
+        The response has an `ETag` header and a "304 Not Modified" response is returned, without computing the
+        response, if the request has a matching `If-None-Match` header.
+
+        List responses can be paginated: the `X-Next-Cursor` header of a page is the cursor of the next page. Cursors
+        are only valid for the revision they were given for.
+
+        Args:
+            request: The request to respond to
+            response: The response of the endpoint, used to set the headers
+            compute: Function returning the response model or an awaitable of the response model
+            items_field: The list field of the response model to paginate. None to disable the pagination
+            cursor: The cursor of the page to return. None for the first page
+            limit: The maximum number of items in a page. None to return all the items
+            use_cache: Whether to use the cache & ETags or not. Responses depending on data that doesn't bump the
+                       revision, like the selection, should not be cached.
+
+        Raises:
+            exceptions.KitServicesBaseException: If the cursor or the limit is not valid
+
+        Returns:
+            The response model, a page of the response model or a "304 Not Modified" response
+        """
+        revision = self.revision
+        if use_cache:
+            etag = self._get_etag(request, revision)
+            if self._etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+
+            key = self._get_cache_key(request)
+            cached = self._response_cache.get(key)
+            if cached is not None and cached[0] == revision:
+                self._response_cache.move_to_end(key)
+                value = cached[1]
+            else:
+                value = await self._compute(compute)
+                self._response_cache[key] = (revision, value)
+                self._response_cache.move_to_end(key)
+                while len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+        else:
+            value = await self._compute(compute)
+
+        if items_field is None or (cursor is None and limit is None):
+            return value
+        return self._paginate(value, items_field, cursor, limit, revision, response)
+
+    @staticmethod
+    async def _compute(compute: Callable[[], Any]) -> Any:
+        value = compute()
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    @staticmethod
+    def _get_cache_key(request: Request) -> str:
+        query = sorted((k, v) for k, v in request.query_params.multi_items() if k not in _PAGINATION_QUERY_PARAMS)
+        return json.dumps([request.url.path, query])
+
+    def _get_etag(self, request: Request, revision: str) -> str:
+        query = sorted(request.query_params.multi_items())
+        data = json.dumps([self.name, revision, request.url.path, query])
+        return f'"{hashlib.sha1(data.encode("utf-8")).hexdigest()}"'
+
+    @staticmethod
+    def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        if not if_none_match:
+            return False
+        for value in if_none_match.split(","):
+            value = value.strip()
+            if value == "*" or value.removeprefix("W/") == etag:
+                return True
+        return False
+
+    def _paginate(
+        self,
+        value: Any,
+        items_field: str,
+        cursor: Optional[str],
+        limit: Optional[int],
+        revision: str,
+        response: Response,
+    ) -> Any:
+        if limit is not None and limit < 1:
+            ServiceBase.raise_error(422, "The limit must be greater than 0")
+
+        start = 0
+        if cursor is not None:
+            try:
+                cursor_revision, start = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+                if not isinstance(start, int) or start < 0:
+                    raise ValueError("Invalid offset")
+            except (ValueError, TypeError, binascii.Error) as e:
+                ServiceBase.raise_error(422, f"The cursor is not valid: {e}")
+            if cursor_revision != revision:
+                ServiceBase.raise_error(
+                    409, "The data changed since the cursor was given. Request the first page again."
+                )
+
+        items = getattr(value, items_field)
+        stop = len(items) if limit is None else start + limit
+        if stop < len(items):
+            next_cursor = json.dumps([revision, stop]).encode("ascii")
+            response.headers["X-Next-Cursor"] = base64.urlsafe_b64encode(next_cursor).decode("ascii")
+        return value.copy(update={items_field: items[start:stop]})
+
     @staticmethod
     def inject_hidden_fields(base_model: Type[BaseServiceModel], **kwargs) -> Type[BaseServiceModel]:
         """
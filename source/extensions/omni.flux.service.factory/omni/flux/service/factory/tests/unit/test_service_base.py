@@ -17,11 +17,13 @@
 
 from unittest.mock import call, patch
 
-from fastapi import Depends, Query
+import omni.usd
+from fastapi import Depends, Query, Request, Response
 from omni.flux.service.factory import ServiceBase
 from omni.flux.service.shared import BaseServiceModel
 from omni.kit.test.async_unittest import AsyncTestCase
 from omni.services.core import exceptions, routers
+from pxr import Usd
 
 
 class TestService(ServiceBase):
@@ -38,6 +40,17 @@ class TestModel(BaseServiceModel):
     value: bool = True
 
 
+class TestListModel(BaseServiceModel):
+    items: list[int]
+
+
+def _get_request(query: str = "", etag: str | None = None) -> Request:
+    headers = [(b"if-none-match", etag.encode("utf-8"))] if etag else []
+    return Request(
+        {"type": "http", "method": "GET", "path": "/test", "query_string": query.encode("utf-8"), "headers": headers}
+    )
+
+
 class TestServiceBase(AsyncTestCase):
     # Before running each test
     async def setUp(self):
@@ -152,3 +165,133 @@ class TestServiceBase(AsyncTestCase):
         # Assert
         self.assertEqual(cm.exception.status_code, error_code)
         self.assertEqual(cm.exception.detail, str(error_message))
+
+    async def test_get_cached_response_computes_once_per_revision(self):
+        # Arrange
+        service = TestService()
+        calls = []
+
+        def compute():
+            calls.append(True)
+            return TestListModel(items=[len(calls)])
+
+        # Act
+        first = await service.get_cached_response(_get_request("a=1"), Response(), compute)
+        second = await service.get_cached_response(_get_request("a=1"), Response(), compute)
+        other = await service.get_cached_response(_get_request("a=2"), Response(), compute)
+        service.bump_revision()
+        third = await service.get_cached_response(_get_request("a=1"), Response(), compute)
+
+        # Assert
+        self.assertEqual(3, len(calls))
+        self.assertEqual([1], first.items)
+        self.assertEqual([1], second.items)
+        self.assertEqual([2], other.items)
+        self.assertEqual([3], third.items)
+
+    async def test_get_cached_response_returns_not_modified_for_matching_etag(self):
+        # Arrange
+        service = TestService()
+        response = Response()
+        await service.get_cached_response(_get_request(), response, lambda: TestListModel(items=[1]))
+        etag = response.headers["ETag"]
+
+        # Act
+        not_modified = await service.get_cached_response(_get_request(etag=etag), Response(), lambda: None)
+        service.bump_revision()
+        modified = await service.get_cached_response(
+            _get_request(etag=etag), Response(), lambda: TestListModel(items=[2])
+        )
+
+        # Assert
+        self.assertIsInstance(not_modified, Response)
+        self.assertEqual(304, not_modified.status_code)
+        self.assertEqual([2], modified.items)
+
+    async def test_get_cached_response_paginates_with_cursor(self):
+        # Arrange
+        service = TestService()
+        items = []
+        cursor = None
+
+        async def compute():
+            return TestListModel(items=list(range(5)))
+
+        # Act
+        while True:
+            response = Response()
+            page = await service.get_cached_response(
+                _get_request(), response, compute, items_field="items", cursor=cursor, limit=2
+            )
+            items.append(page.items)
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        # Assert
+        self.assertEqual([[0, 1], [2, 3], [4]], items)
+
+    async def test_get_cached_response_invalid_cursor_raises_error(self):
+        # Arrange
+        service = TestService()
+        response = Response()
+        await service.get_cached_response(
+            _get_request(), response, lambda: TestListModel(items=[1, 2]), items_field="items", limit=1
+        )
+        cursor = response.headers["X-Next-Cursor"]
+        service.bump_revision()
+
+        for value, expected_code in [(cursor, 409), ("invalid", 422)]:
+            with self.subTest(cursor=value):
+                # Act
+                with self.assertRaises(exceptions.KitServicesBaseException) as cm:
+                    await service.get_cached_response(
+                        _get_request(),
+                        Response(),
+                        lambda: TestListModel(items=[1, 2]),
+                        items_field="items",
+                        cursor=value,
+                    )
+
+                # Assert
+                self.assertEqual(expected_code, cm.exception.status_code)
+
+    async def test_revision_is_unique_per_service(self):
+        # Arrange
+        service = TestService()
+        other_service = TestService()
+        response = Response()
+        other_response = Response()
+
+        # Act
+        await service.get_cached_response(_get_request(), response, lambda: TestListModel(items=[1]))
+        await other_service.get_cached_response(_get_request(), other_response, lambda: TestListModel(items=[1]))
+
+        # Assert
+        self.assertNotEqual(service.revision, other_service.revision)
+        self.assertNotEqual(response.headers["ETag"], other_response.headers["ETag"])
+
+    async def test_watch_stage_ignores_session_layer_changes(self):
+        # Arrange
+        context = omni.usd.get_context()
+        await context.new_stage_async()
+        stage = context.get_stage()
+
+        service = TestService()
+        service.watch_stage()
+        revision = service.revision
+
+        # Act
+        with Usd.EditContext(stage, stage.GetSessionLayer()):
+            stage.DefinePrim("/SessionPrim", "Xform")
+        session_revision = service.revision
+
+        stage.DefinePrim("/RootPrim", "Xform")
+        root_revision = service.revision
+
+        # Assert
+        self.assertEqual(revision, session_revision)
+        self.assertNotEqual(revision, root_revision)
+
+        service._register_stage_listener(None)  # noqa PLW0212
+        await context.close_stage_async()
@@ -34,6 +34,17 @@ class StageManagerFilterPlugin(_StageManagerUIPluginBase, abc.ABC):
 
     _on_filter_items_changed: _Event = PrivateAttr(_Event())
 
+    @property
+    def depends_on_descendants(self) -> bool:
+        """
+        Whether the filtered state of an item depends on its descendants. Items can't be filtered again alone when the
+        stage changes, so interaction plugins filter all the items again while the filter is enabled.
+
+        Returns:
+            True if the filter result of an item depends on its descendants, False otherwise
+        """
+        return False
+
     @abc.abstractmethod
     def filter_items(self, items: Iterable[Any]) -> list[Any]:
         """
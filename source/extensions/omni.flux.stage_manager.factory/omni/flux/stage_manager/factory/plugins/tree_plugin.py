@@ -65,6 +65,7 @@ class StageManagerTreeItem(_TreeItemBase):
                 "_tooltip": None,
                 "_parent": None,
                 "_data": None,
+                "_identity": None,
             }
         )
         return default_attr
@@ -115,13 +116,28 @@ class StageManagerTreeItem(_TreeItemBase):
     def can_have_children(self) -> bool:
         return bool(self._children)
 
+    @property
+    def identity(self) -> str:
+        """
+        A stable identity for the item, used to compare and hash items. Computed once when first accessed.
+        """
+        if self._identity is None:
+            self._identity = self._get_identity()
+        return self._identity
+
+    def _get_identity(self) -> str:
+        """
+        Compute the identity of the item. Should be overridden when the item data has a cheaper unique identifier.
+        """
+        return self.display_name + self.tooltip + str(self.data)
+
     def __eq__(self, other):
         if isinstance(other, StageManagerTreeItem):
-            return self.display_name == other.display_name and self.tooltip == other.tooltip and self.data == other.data
+            return self.identity == other.identity
         return False
 
     def __hash__(self):
-        return hash(self.display_name + self.tooltip + str(self.data))
+        return hash(self.identity)
 
 
 class StageManagerTreeModel(_TreeModelBase[StageManagerTreeItem], Generic[DataType]):
@@ -133,6 +149,8 @@ class StageManagerTreeModel(_TreeModelBase[StageManagerTreeItem], Generic[DataTy
         super().__init__()
 
         self._context_items: list[Any] = []
+        self._items_by_identity: dict[str, StageManagerTreeItem] | None = None
+        self._items_by_hash: dict[int, StageManagerTreeItem] | None = None
         self._filter_functions: list[Callable[[Iterable[Any]], list[Any]]] = []
         self._column_count = 0
 
@@ -144,6 +162,8 @@ class StageManagerTreeModel(_TreeModelBase[StageManagerTreeItem], Generic[DataTy
             {
                 "_items": None,
                 "_context_items": None,
+                "_items_by_identity": None,
+                "_items_by_hash": None,
                 "_filter_functions": None,
                 "_column_count": None,
             }
@@ -153,9 +173,29 @@ class StageManagerTreeModel(_TreeModelBase[StageManagerTreeItem], Generic[DataTy
     @property
     def items_dict(self) -> dict[int, StageManagerTreeItem]:
         """
-        Get a dictionary of item hashes and items
+        Get a dictionary of item hashes and items. The dictionary is built once per refresh.
+        """
+        if self._items_by_hash is None:
+            self._items_by_hash = {hash(item): item for item in self._get_items_by_identity().values()}
+        return self._items_by_hash
+
+    def get_items_by_identity(self, identities: Iterable[str]) -> list[StageManagerTreeItem]:
         """
-        return {hash(item): item for item in self.iter_items_children()}
+        Get the tree items from their identities. The identity map is built once per refresh.
+
+        Args:
+            identities: The identities of the items to get
+
+        Returns:
+            The existing items, in the order of the given identities
+        """
+        items_by_identity = self._get_items_by_identity()
+        return [items_by_identity[identity] for identity in identities if identity in items_by_identity]
+
+    def _get_items_by_identity(self) -> dict[str, StageManagerTreeItem]:
+        if self._items_by_identity is None:
+            self._items_by_identity = {item.identity: item for item in self.iter_items_children()}
+        return self._items_by_identity
 
     @property
     def context_items(self) -> list[Any]:
@@ -191,6 +231,13 @@ class StageManagerTreeModel(_TreeModelBase[StageManagerTreeItem], Generic[DataTy
         """
         self._item_changed(None)
 
+    def _item_changed(self, item: StageManagerTreeItem | None):
+        # The root items were rebuilt, the identity map is outdated
+        if item is None:
+            self._items_by_identity = None
+            self._items_by_hash = None
+        super()._item_changed(item)
+
     def find_items(self, predicate: Callable[[StageManagerTreeItem], bool]) -> list[StageManagerTreeItem]:
         """
         Get a tree item from its data
@@ -18,23 +18,94 @@
 from typing import TYPE_CHECKING, Iterable
 
 from omni import ui
+from omni.flux.utils.common import EventSubscription as _EventSubscription
+from pydantic import Field, PrivateAttr
 
 from .base import StageManagerUSDFilterPlugin as _StageManagerUSDFilterPlugin
+from .search_index import StagePrimSearchIndex as _StagePrimSearchIndex
+from .search_index import get_stage_search_index as _get_stage_search_index
 
 if TYPE_CHECKING:
-    from pxr import Usd
+    from pxr import Sdf, Usd
 
 
 class SearchFilterPlugin(_StageManagerUSDFilterPlugin):
-    # TODO StageManager: Build proper plugin
-
     display_name: str = "Search"
-    tooltip: str = "Search through the list of prims"
+    tooltip: str = (
+        "Search through the list of prims by name or hash.\n"
+        "Include a '/' to search by path and use '*', '?' or '[...]' for glob patterns."
+    )
+
+    search_query: str = Field("", description="The search query used to filter the prims", exclude=True)
+    include_parents: bool = Field(
+        True, description="Keep the parents of the matching prims so they can be displayed in hierarchical trees"
+    )
+
+    _string_field: ui.StringField | None = PrivateAttr(None)
+    _value_changed_sub: _EventSubscription | None = PrivateAttr(None)
+
+    _matching_paths: set["Sdf.Path"] | None = PrivateAttr(None)
+    _matching_paths_key: tuple | None = PrivateAttr(None)
+
+    @property
+    def depends_on_descendants(self) -> bool:
+        # The parents are kept when any of their descendants match the query
+        return self.include_parents and bool(self.search_query.strip())
 
     def filter_items(self, items: Iterable["Usd.Prim"]) -> list["Usd.Prim"]:
-        return list(items)
+        items = list(items)
+        if not items or not self.search_query.strip():
+            return items
+
+        index = _get_stage_search_index(items[0].GetStage())
+        if not index:
+            return items
+
+        paths = self._get_matching_paths(index)
+        return [item for item in items if item.GetPath() in paths]
+
+    def _get_matching_paths(self, index: _StagePrimSearchIndex) -> set["Sdf.Path"]:
+        """
+        Get the paths of the prims matching the search query and, if the parents are included, of their ancestors.
+
+        Items are filtered once per traversed level so the paths are only computed again when the query, the stage or
+        the index revision changes.
+
+        Args:
+            index: the search index of the filtered stage
+
+        Returns:
+            The paths of the prims to keep
+        """
+        index.update()
+        key = (index, self.search_query, self.include_parents, index.revision)
+        if self._matching_paths is not None and self._matching_paths_key == key:
+            return self._matching_paths
+
+        paths = index.find_paths(self.search_query)
+        if self.include_parents:
+            for path in list(paths):
+                parent_path = path.GetParentPath()
+                while not parent_path.IsAbsoluteRootPath() and parent_path not in paths:
+                    paths.add(parent_path)
+                    parent_path = parent_path.GetParentPath()
+
+        self._matching_paths = paths
+        self._matching_paths_key = key
+        return paths
 
     def build_ui(self):  # noqa PLW0221
         with ui.HStack(spacing=ui.Pixel(8)):
             ui.Label(self.display_name, width=0)
-            ui.StringField(width=ui.Pixel(300), height=ui.Pixel(24))
+            self._string_field = ui.StringField(width=ui.Pixel(300), height=ui.Pixel(24), tooltip=self.tooltip)
+
+        self._string_field.model.set_value(self.search_query)
+        self._value_changed_sub = self._string_field.model.subscribe_value_changed_fn(self._on_search_value_changed)
+
+    def _on_search_value_changed(self, model: ui.AbstractValueModel):
+        if model.as_string == self.search_query:
+            return
+        self.search_query = model.as_string
+        self._matching_paths = None
+        self._matching_paths_key = None
+        self._filter_items_changed()
@@ -0,0 +1,252 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["StagePrimSearchIndex", "get_stage_search_index"]
+
+import re
+from bisect import bisect_left, insort
+from fnmatch import fnmatchcase
+
+from omni.flux.utils.common.stage_index import StageIndex as _StageIndex
+from omni.flux.utils.common.stage_index import StageIndexRegistry as _StageIndexRegistry
+from pxr import Sdf, Tf, Usd
+
+# Above this number of resynced paths, rebuilding the index is faster than updating it
+_MAX_PENDING_PATHS = 10000
+
+_GLOB_CHARACTERS = re.compile(r"[*?\[\]]")
+# The wildcards & the character classes of a glob pattern. Unclosed brackets are matched literally by `fnmatch`.
+_GLOB_TOKENS = re.compile(r"\[!?\]?[^\]]*\]|[*?]")
+_TRIGRAM_SIZE = 3
+
+
+def _get_trigrams(value: str) -> set[str]:
+    return {value[i : i + _TRIGRAM_SIZE] for i in range(len(value) - _TRIGRAM_SIZE + 1)}
+
+
+class StagePrimSearchIndex(_StageIndex):
+    def __init__(self, stage: Usd.Stage):
+        """
+        Case-insensitive search index of the prims of a stage.
+
+        Prim names, which include the asset hashes of captured prims, are indexed by trigrams to answer substring and
+        glob queries. Prim paths are kept sorted to answer path prefix and glob queries.
+
+        The index is built on the first query and then updated from the stage `ObjectsChanged` notices: resynced prims
+        are indexed again with their children. The revision of the index changes every time it applies the changes.
+
+        Args:
+            stage: the stage to index
+        """
+        super().__init__(stage)
+        self._built = False
+        self._revision = 0
+        self._pending_resyncs: set[Sdf.Path] = set()
+
+        self._names: dict[Sdf.Path, str] = {}  # prim path -> lowercase prim name
+        self._paths_by_name: dict[str, set[Sdf.Path]] = {}
+        self._names_by_trigram: dict[str, set[str]] = {}
+        self._sorted_paths: list[str] = []  # sorted lowercase prim paths
+        self._paths_by_key: dict[str, set[Sdf.Path]] = {}  # lowercase prim path -> prim paths
+
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    @property
+    def revision(self) -> int:
+        """Incremented every time the index is rebuilt or updated from the stage changes"""
+        return self._revision
+
+    def _on_objects_changed(self, notice, sender):
+        if not self._built or sender != self.stage:
+            return
+        # Only resyncs can add, remove or rename prims
+        for path in notice.GetResyncedPaths():
+            if path.IsPrimPath() or path == Sdf.Path.absoluteRootPath:
+                self._pending_resyncs.add(path)
+
+    def _add(self, path: Sdf.Path):
+        if path in self._names:
+            return
+        name = path.name.lower()
+        self._names[path] = name
+
+        paths = self._paths_by_name.setdefault(name, set())
+        if not paths:
+            for trigram in _get_trigrams(name):
+                self._names_by_trigram.setdefault(trigram, set()).add(name)
+        paths.add(path)
+
+        key = str(path).lower()
+        paths = self._paths_by_key.setdefault(key, set())
+        if not paths:
+            insort(self._sorted_paths, key)
+        paths.add(path)
+
+    def _remove(self, path: Sdf.Path):
+        name = self._names.pop(path, None)
+        if name is None:
+            return
+
+        paths = self._paths_by_name[name]
+        paths.discard(path)
+        if not paths:
+            del self._paths_by_name[name]
+            for trigram in _get_trigrams(name):
+                names = self._names_by_trigram[trigram]
+                names.discard(name)
+                if not names:
+                    del self._names_by_trigram[trigram]
+
+        key = str(path).lower()
+        paths = self._paths_by_key[key]
+        paths.discard(path)
+        if not paths:
+            del self._paths_by_key[key]
+            del self._sorted_paths[bisect_left(self._sorted_paths, key)]
+
+    def _iter_keys_with_prefix(self, prefix: str):
+        for index in range(bisect_left(self._sorted_paths, prefix), len(self._sorted_paths)):
+            key = self._sorted_paths[index]
+            if not key.startswith(prefix):
+                break
+            yield key
+
+    def rebuild(self):
+        """Index all the prims of the stage again"""
+        self._pending_resyncs.clear()
+        self._names.clear()
+        self._paths_by_name.clear()
+        self._names_by_trigram.clear()
+        self._paths_by_key.clear()
+        self._sorted_paths.clear()
+        for prim in self.stage.TraverseAll():
+            self._add(prim.GetPath())
+        self._built = True
+        self._revision += 1
+
+    def update(self):
+        """Apply the changes of the stage since the last query. Called by every query."""
+        if not self._built or len(self._pending_resyncs) > _MAX_PENDING_PATHS:
+            self.rebuild()
+            return
+        if not self._pending_resyncs:
+            return
+        resyncs = sorted(self._pending_resyncs)
+        self._pending_resyncs.clear()
+        if resyncs[0] == Sdf.Path.absoluteRootPath:
+            self.rebuild()
+            return
+        self._revision += 1
+
+        # Sorted paths list a prim before its descendants: the descendants are updated with the prim
+        roots = []
+        for path in resyncs:
+            if not roots or not path.HasPrefix(roots[-1]):
+                roots.append(path)
+
+        stage = self.stage
+        for root in roots:
+            # Lowercase keys can be shared by prims of different case, only remove the root and its descendants
+            key = str(root).lower()
+            removed_paths = list(self._paths_by_key.get(key, ()))
+            for child_key in list(self._iter_keys_with_prefix(f"{key}/")):
+                removed_paths.extend(self._paths_by_key[child_key])
+            for path in removed_paths:
+                if path.HasPrefix(root):
+                    self._remove(path)
+
+            prim = stage.GetPrimAtPath(root)
+            if prim.IsValid():
+                for child_prim in Usd.PrimRange(prim, Usd.PrimAllPrimsPredicate):
+                    self._add(child_prim.GetPath())
+
+    def find_paths(self, query: str) -> set[Sdf.Path]:
+        """
+        Find the prims matching a case-insensitive search query.
+
+        Queries containing a `/` are matched against the prim paths: plain queries match the paths starting with the
+        query. Other queries are matched against the prim names: plain queries match the names containing the query.
+        Glob patterns (`*`, `?` and `[...]`) must match the whole path or name.
+
+        Args:
+            query: the search query
+
+        Returns:
+            The paths of the matching prims
+        """
+        self.update()
+        query = query.strip().lower()
+        if not query:
+            return set(self._names)
+
+        is_glob = bool(_GLOB_CHARACTERS.search(query))
+
+        if "/" in query:
+            # The characters before the first glob character are a prefix of every matching path
+            prefix = _GLOB_CHARACTERS.split(query, maxsplit=1)[0] if is_glob else query
+            keys = self._iter_keys_with_prefix(prefix)
+            if is_glob:
+                keys = (key for key in keys if fnmatchcase(key, query))
+            return {path for key in keys for path in self._paths_by_key[key]}
+
+        # Every trigram of the literal parts of the query is in the matching names
+        trigrams = set()
+        for part in _GLOB_TOKENS.split(query) if is_glob else [query]:
+            trigrams.update(_get_trigrams(part))
+
+        if trigrams:
+            names = None
+            for trigram in sorted(trigrams, key=lambda t: len(self._names_by_trigram.get(t, ()))):
+                candidates = self._names_by_trigram.get(trigram)
+                if not candidates:
+                    return set()
+                names = set(candidates) if names is None else names & candidates
+        else:
+            # Queries shorter than a trigram are checked against every distinct name
+            names = self._paths_by_name.keys()
+
+        if is_glob:
+            names = [name for name in names if fnmatchcase(name, query)]
+        else:
+            names = [name for name in names if query in name]
+        return {path for name in names for path in self._paths_by_name[name]}
+
+    def destroy(self):
+        if self._listener:
+            self._listener.Revoke()
+        self._listener = None
+        self._names.clear()
+        self._paths_by_name.clear()
+        self._names_by_trigram.clear()
+        self._paths_by_key.clear()
+        self._sorted_paths.clear()
+
+
+def get_stage_search_index(stage: Usd.Stage) -> StagePrimSearchIndex | None:
+    """
+    Get the search index of a stage. The index is created once per stage and kept up to date with the stage changes.
+
+    Args:
+        stage: the stage to index
+
+    Returns:
+        The search index of the stage or None if the stage is not valid
+    """
+    return _INDEXES.get(stage)
+
+
+_INDEXES = _StageIndexRegistry(StagePrimSearchIndex)
@@ -0,0 +1,98 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from unittest.mock import patch
+
+import omni.kit.test
+from omni.flux.stage_manager.plugin.filter.usd.search import SearchFilterPlugin as _SearchFilterPlugin
+from omni.flux.stage_manager.plugin.filter.usd.search_index import StagePrimSearchIndex as _StagePrimSearchIndex
+from pxr import Sdf, Usd
+
+from .test_search_index import _find_paths_brute_force
+
+
+class TestSearchFilterPlugin(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.stage = Usd.Stage.CreateInMemory()
+        for index in range(16):
+            self.stage.DefinePrim(f"/World/Meshes/mesh_{index:02X}", "Xform")
+            self.stage.DefinePrim(f"/World/Meshes/mesh_{index:02X}/Child_{index % 4}", "Xform")
+        for index in range(4):
+            self.stage.DefinePrim(f"/World/Lights/Light_{index:02X}", "SphereLight")
+
+        self.plugin = _SearchFilterPlugin.construct(search_query="child_1", include_parents=True)
+
+    # After running each test
+    async def tearDown(self):
+        self.plugin = None
+        self.stage = None
+
+    def _traverse(self, prims) -> set[Sdf.Path]:
+        """Filter every level of the stage like a recursive interaction plugin traversal"""
+        prims = list(prims)
+        paths = {prim.GetPath() for prim in self.plugin.filter_items(prims)}
+        for prim in prims:
+            paths.update(self._traverse(prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate)))
+        return paths
+
+    def _get_expected_paths(self) -> set[Sdf.Path]:
+        paths = _find_paths_brute_force(self.stage, self.plugin.search_query)
+        return {prefix for path in paths for prefix in path.GetPrefixes()}
+
+    async def test_filter_items_recursive_traversal_should_search_once(self):
+        with patch.object(
+            _StagePrimSearchIndex, "find_paths", autospec=True, side_effect=_StagePrimSearchIndex.find_paths
+        ) as find_paths_mock:
+            # Act
+            paths = self._traverse(self.stage.GetPseudoRoot().GetChildren())
+
+        # Assert
+        self.assertEqual(self._get_expected_paths(), paths)
+        self.assertEqual(1, find_paths_mock.call_count)
+
+    async def test_filter_items_after_stage_changes_should_search_again(self):
+        # Arrange
+        self._traverse(self.stage.GetPseudoRoot().GetChildren())
+
+        with patch.object(
+            _StagePrimSearchIndex, "find_paths", autospec=True, side_effect=_StagePrimSearchIndex.find_paths
+        ) as find_paths_mock:
+            # Act
+            self.stage.DefinePrim("/World/Lights/Light_00/Child_1", "Xform")
+            self.stage.RemovePrim("/World/Meshes/mesh_05")
+            paths = self._traverse(self.stage.GetPseudoRoot().GetChildren())
+
+        # Assert
+        self.assertEqual(self._get_expected_paths(), paths)
+        self.assertIn(Sdf.Path("/World/Lights/Light_00/Child_1"), paths)
+        self.assertEqual(1, find_paths_mock.call_count)
+
+    async def test_filter_items_after_query_changes_should_search_again(self):
+        # Arrange
+        self._traverse(self.stage.GetPseudoRoot().GetChildren())
+
+        with patch.object(
+            _StagePrimSearchIndex, "find_paths", autospec=True, side_effect=_StagePrimSearchIndex.find_paths
+        ) as find_paths_mock:
+            # Act
+            self.plugin.search_query = "light"
+            paths = self._traverse(self.stage.GetPseudoRoot().GetChildren())
+
+        # Assert
+        self.assertEqual(self._get_expected_paths(), paths)
+        self.assertEqual(1, find_paths_mock.call_count)
@@ -0,0 +1,124 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from fnmatch import fnmatchcase
+
+import omni.kit.test
+from omni.flux.stage_manager.plugin.filter.usd.search_index import StagePrimSearchIndex as _StagePrimSearchIndex
+from pxr import Sdf, Usd
+
+_QUERIES = [
+    "",
+    "me",
+    "mesh",
+    "MESH_0a",
+    "light",
+    "renamed",
+    "mesh_*",
+    "*_0[ab]",
+    "mesh_[!0]*",
+    "[lm]*_1?",
+    "mesh_[0ab1]*",
+    "*[bcd]",
+    "ab[c",
+    "/world/",
+    "/World/Meshes/",
+    "/world/*/mesh_?1",
+    "/world/[lm]*",
+]
+
+
+def _find_paths_brute_force(stage: Usd.Stage, query: str) -> set[Sdf.Path]:
+    """The stage traversal the index replaced"""
+    query = query.strip().lower()
+    is_glob = any(character in query for character in "*?[]")
+    paths = set()
+    for prim in stage.TraverseAll():
+        path = prim.GetPath()
+        if "/" in query:
+            value = str(path).lower()
+            is_match = fnmatchcase(value, query) if is_glob else value.startswith(query)
+        else:
+            value = path.name.lower()
+            is_match = fnmatchcase(value, query) if is_glob else query in value
+        if is_match:
+            paths.add(path)
+    return paths
+
+
+class TestStagePrimSearchIndex(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.stage = Usd.Stage.CreateInMemory()
+        for index in range(32):
+            self.stage.DefinePrim(f"/World/Meshes/mesh_{index:02X}", "Xform")
+            self.stage.DefinePrim(f"/World/Meshes/mesh_{index:02X}/Child_{index % 4}", "Xform")
+        for index in range(8):
+            self.stage.DefinePrim(f"/World/Lights/Light_{index:02X}", "SphereLight")
+
+        self.index = _StagePrimSearchIndex(self.stage)
+
+    # After running each test
+    async def tearDown(self):
+        self.index.destroy()
+        self.index = None
+        self.stage = None
+
+    def _assert_matches_brute_force(self):
+        for query in _QUERIES:
+            with self.subTest(query=query):
+                self.assertEqual(_find_paths_brute_force(self.stage, query), self.index.find_paths(query))
+
+    async def test_find_paths_should_match_traversal(self):
+        self._assert_matches_brute_force()
+
+    async def test_find_paths_after_add_should_match_traversal(self):
+        # Arrange
+        self.index.find_paths("")
+
+        # Act
+        self.stage.DefinePrim("/World/Meshes/mesh_0A/Added", "Xform")
+        self.stage.DefinePrim("/World/Meshes/Mesh_New_1B", "Xform")
+        self.stage.DefinePrim("/World/Lights/light_0a", "SphereLight")
+
+        # Assert
+        self._assert_matches_brute_force()
+
+    async def test_find_paths_after_remove_should_match_traversal(self):
+        # Arrange
+        self.index.find_paths("")
+
+        # Act
+        self.stage.RemovePrim("/World/Lights")
+        self.stage.RemovePrim("/World/Meshes/mesh_01")
+        self.stage.RemovePrim("/World/Meshes/mesh_1A/Child_2")
+
+        # Assert
+        self._assert_matches_brute_force()
+
+    async def test_find_paths_after_rename_should_match_traversal(self):
+        # Arrange
+        self.index.find_paths("")
+
+        # Act
+        edit = Sdf.BatchNamespaceEdit()
+        edit.Add(Sdf.NamespaceEdit.Rename("/World/Meshes/mesh_0B", "renamed_0B"))
+        edit.Add(Sdf.NamespaceEdit.Rename("/World/Lights", "MeshLights"))
+        self.assertTrue(self.stage.GetRootLayer().Apply(edit))
+
+        # Assert
+        self._assert_matches_brute_force()
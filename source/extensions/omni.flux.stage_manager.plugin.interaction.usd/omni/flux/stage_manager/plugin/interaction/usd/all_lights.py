@@ -15,7 +15,6 @@
 * limitations under the License.
 """
 
-import omni.kit.app
 from omni.flux.stage_manager.factory.plugins import StageManagerFilterPlugin as _StageManagerFilterPlugin
 
 from .base import StageManagerUSDInteractionPlugin as _StageManagerUSDInteractionPlugin
@@ -43,21 +42,11 @@ class AllLightsInteractionPlugin(_StageManagerUSDInteractionPlugin):
         "IsCaptureStateWidgetPlugin",
     ]
 
-    async def _update_context_items_deferred(self):
-        await omni.kit.app.get_app().next_update_async()
-
-        if not self._is_active:
-            return
-
-        self._set_context_name()
-
+    @classmethod
+    @property
+    def _filter_during_traversal(cls) -> bool:
         # Only filter the items after getting all the children
-        context_items = self._filter_context_items(
-            self._traverse_children_recursive(self._context.get_items(), filter_prims=False)
-        )
-
-        self.tree.model.context_items = context_items
-        self.tree.model.refresh()
+        return False
 
     class Config(_StageManagerUSDInteractionPlugin.Config):
         fields = {
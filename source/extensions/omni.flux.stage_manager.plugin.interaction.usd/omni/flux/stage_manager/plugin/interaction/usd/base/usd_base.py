@@ -27,9 +27,12 @@ from omni.flux.stage_manager.factory.plugins import StageManagerInteractionPlugi
 from omni.flux.utils.common import EventSubscription as _EventSubscription
 from omni.flux.utils.common.decorators import ignore_function_decorator as _ignore_function_decorator
 from omni.flux.utils.common.utils import get_omni_prims as _get_omni_prims
-from pxr import Usd
+from pxr import Sdf, Usd
 from pydantic import Field, PrivateAttr
 
+# Above this number of changed paths, rebuilding the context items is faster than updating them
+_MAX_PENDING_PATHS = 1000
+
 
 class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
     synchronize_selection: bool = Field(True, description="Synchronize the USD selection between the stage and the UI")
@@ -41,6 +44,13 @@ class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
     _update_context_task: Future | None = PrivateAttr(None)
     _items_changed_task: Future | None = PrivateAttr(None)
 
+    _full_update_required: bool = PrivateAttr(True)
+    _pending_resynced_paths: set[Sdf.Path] = PrivateAttr(set())
+    _pending_changed_paths: set[Sdf.Path] = PrivateAttr(set())
+    _context_stage: Usd.Stage | None = PrivateAttr(None)
+    _context_children: dict[Sdf.Path, list[Usd.Prim]] = PrivateAttr({})
+    _context_item_paths: set[Sdf.Path] = PrivateAttr(set())
+
     @classmethod
     @property
     def compatible_data_type(cls):
@@ -62,6 +72,17 @@ class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
     def _select_all_children(cls) -> bool:
         return True
 
+    @classmethod
+    @property
+    def _filter_during_traversal(cls) -> bool:
+        """
+        Whether the children of the prims filtered out should be skipped during the recursive traversal.
+
+        Returns:
+            bool: True to only traverse the children of the filtered prims, False to traverse all the children.
+        """
+        return True
+
     def set_active(self, value: bool):
         # Convert `set_active` to an async method since `_update_context_items` is also async
         if self._set_active_task:
@@ -119,9 +140,23 @@ class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
         if not refresh:
             return
 
-        self._update_context_items()
+        # Keep the changed paths to only update the affected context items
+        for path in notice.GetResyncedPaths():
+            if path.IsPrimPath() or path == Sdf.Path.absoluteRootPath:
+                self._pending_resynced_paths.add(path)
+            else:
+                self._pending_changed_paths.add(path.GetPrimPath())
+        for path in notice.GetChangedInfoOnlyPaths():
+            self._pending_changed_paths.add(path.GetPrimPath())
+
+        self._schedule_context_items_update()
 
     def _update_context_items(self):
+        # Rebuild all the context items on the next update
+        self._full_update_required = True
+        self._schedule_context_items_update()
+
+    def _schedule_context_items_update(self):
         # Use a deferred method to combine all the updates caught within 1 frame into a single call
         if self._update_context_task:
             self._update_context_task.cancel()
@@ -136,15 +171,175 @@ class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
 
         self._set_context_name()
 
-        context_items = self._context.get_items()
-        if self.recursive_traversal:
-            context_items = self._traverse_children_recursive(context_items)
-        else:
-            context_items = self._filter_context_items(context_items)
+        resynced_paths = self._pending_resynced_paths.copy()
+        changed_paths = self._pending_changed_paths - resynced_paths
+        self._pending_resynced_paths.clear()
+        self._pending_changed_paths.clear()
+
+        stage = omni.usd.get_context(self._context_name).get_stage()
+        full_update = (
+            self._full_update_required
+            or stage != self._context_stage
+            or any(
+                filter_plugin.enabled and filter_plugin.depends_on_descendants
+                for filter_plugin in self.filters + self.required_filters
+            )
+        )
+        self._full_update_required = False
+
+        if full_update or not self._update_context_items_incremental(stage, resynced_paths, changed_paths):
+            self._context_stage = stage
+            self._context_children.clear()
+            self._context_item_paths.clear()
+            self._context_children[Sdf.Path.absoluteRootPath] = self._traverse_context_items(self._context.get_items())
 
-        self.tree.model.context_items = context_items
+        self.tree.model.context_items = self._get_traversed_context_items(Sdf.Path.absoluteRootPath)
         self.tree.model.refresh()
 
+    def _update_context_items_incremental(
+        self, stage: Usd.Stage, resynced_paths: set[Sdf.Path], changed_paths: set[Sdf.Path]
+    ) -> bool:
+        """
+        Update the traversed context items from the paths changed since the last update.
+
+        Resynced prims are traversed and filtered again with their children. Prims with changed properties are filtered
+        again alone and only traversed again if their filtered state changed.
+
+        Args:
+            stage: The stage of the context
+            resynced_paths: The resynced prim paths
+            changed_paths: The prim paths with changed properties
+
+        Returns:
+            False if the context items should be rebuilt instead, True otherwise
+        """
+        sorted_paths = sorted(resynced_paths)
+        if len(sorted_paths) + len(changed_paths) > _MAX_PENDING_PATHS:
+            return False
+        if sorted_paths and sorted_paths[0] == Sdf.Path.absoluteRootPath:
+            return False
+
+        # Sorted paths list a prim before its descendants: the descendants are traversed with the prim
+        roots = []
+        for path in sorted_paths:
+            if not roots or not path.HasPrefix(roots[-1]):
+                roots.append(path)
+
+        for path in roots:
+            self._remove_context_subtree(path)
+            self._insert_context_subtree(stage, path)
+
+        for path in changed_paths:
+            if any(path.HasPrefix(root) for root in roots):
+                continue
+            if path.GetParentPath() not in self._context_children:
+                continue
+            prim = stage.GetPrimAtPath(path)
+            if not prim.IsValid():
+                continue
+            is_filtered = bool(self._filter_context_items([prim]))
+            if is_filtered == (path in self._context_item_paths):
+                continue
+            if self._filter_during_traversal:
+                # The children of the prim were either skipped or traversed: traverse the prim again
+                self._remove_context_subtree(path)
+                self._insert_context_subtree(stage, path)
+            elif is_filtered:
+                self._context_item_paths.add(path)
+            else:
+                self._context_item_paths.discard(path)
+
+        return True
+
+    def _remove_context_subtree(self, path: Sdf.Path):
+        """
+        Remove a prim and its traversed children from the context items.
+
+        Args:
+            path: The path of the prim to remove
+        """
+        siblings = self._context_children.get(path.GetParentPath())
+        if siblings is not None:
+            self._context_children[path.GetParentPath()] = [prim for prim in siblings if prim.GetPath() != path]
+
+        stack = [path]
+        while stack:
+            current_path = stack.pop()
+            self._context_item_paths.discard(current_path)
+            stack.extend(prim.GetPath() for prim in self._context_children.pop(current_path, []))
+
+    def _insert_context_subtree(self, stage: Usd.Stage, path: Sdf.Path):
+        """
+        Traverse a prim and its children and insert them in the context items if the parent prim was traversed.
+
+        Args:
+            stage: The stage of the context
+            path: The path of the prim to insert
+        """
+        parent_path = path.GetParentPath()
+        siblings = self._context_children.get(parent_path)
+        if siblings is None:
+            return
+
+        if parent_path == Sdf.Path.absoluteRootPath:
+            candidates = list(self._context.get_items())
+        else:
+            parent = stage.GetPrimAtPath(parent_path)
+            candidates = list(parent.GetFilteredChildren(Usd.PrimAllPrimsPredicate)) if parent.IsValid() else []
+
+        # Keep the siblings in the same order as a full traversal
+        order = {prim.GetPath(): index for index, prim in enumerate(candidates)}
+        if path not in order:
+            return
+
+        traversed = self._traverse_context_items([candidates[order[path]]])
+        if not traversed:
+            return
+
+        self._context_children[parent_path] = sorted(
+            siblings + traversed, key=lambda prim: order.get(prim.GetPath(), len(order))
+        )
+
+    def _traverse_context_items(self, prims: Iterable[Usd.Prim]) -> list[Usd.Prim]:
+        """
+        Filter the given prims and, for recursive traversals, traverse their children recursively.
+
+        The traversed children and the filtered prims are kept to only update the affected prims when the stage changes.
+
+        Args:
+            prims: The list of prims to traverse
+
+        Returns:
+            The list of traversed prims
+        """
+        prims = list(prims)
+        filtered_prims = self._filter_context_items(prims)
+        self._context_item_paths.update(prim.GetPath() for prim in filtered_prims)
+
+        traversed_prims = filtered_prims if self._filter_during_traversal else prims
+        if self.recursive_traversal:
+            for prim in traversed_prims:
+                self._context_children[prim.GetPath()] = self._traverse_context_items(
+                    prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate)
+                )
+        return traversed_prims
+
+    def _get_traversed_context_items(self, path: Sdf.Path) -> list[Usd.Prim]:
+        """
+        Get the filtered context items under a traversed prim.
+
+        Args:
+            path: The path of the traversed prim
+
+        Returns:
+            The filtered prims of each level, followed by the filtered children of every prim
+        """
+        children = self._context_children.get(path, [])
+        context_items = [prim for prim in children if prim.GetPath() in self._context_item_paths]
+        for prim in children:
+            context_items.extend(self._get_traversed_context_items(prim.GetPath()))
+        return context_items
+
     def _on_item_changed(self, model, item):
         # Convert `_on_item_changed` to an async method since `_update_context_items` is also async
         if self._items_changed_task:
@@ -191,26 +386,6 @@ class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
                 if hasattr(widget_plugin, attribute_name):
                     widget_plugin.context_name = value
 
-    def _traverse_children_recursive(self, prims: Iterable[Usd.Prim], filter_prims: bool = True) -> list[Usd.Prim]:
-        """
-        Get a filtered list of all the prims and their children recursively.
-
-        Args:
-            prims: The list of prims to traverse
-
-        Returns:
-            A filtered list of all the prims and their children
-        """
-        filtered_prims = self._filter_context_items(prims) if filter_prims else list(prims)
-        children = filtered_prims.copy()
-        for prim in filtered_prims:
-            children.extend(
-                self._traverse_children_recursive(
-                    prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate), filter_prims=filter_prims
-                )
-            )
-        return children
-
     @_ignore_function_decorator(attrs=["_selection_update_lock"])
     def _update_tree_selection(self):
         if not self.synchronize_selection or not self._is_active:
@@ -221,21 +396,18 @@ class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
         if selection:
             self._item_expansion_states.clear()
 
-        def is_selected_item(selected_prim_paths, item) -> bool:
-            prim = item.data.get("prim")
-            should_select = prim and prim.GetPath() in selected_prim_paths
-
-            # Expand the selected items and their parents
-            if should_select:
-                self._item_expansion_states[hash(item)] = should_select
-                parent = item.parent
-                while parent:
-                    self._item_expansion_states[hash(parent)] = should_select
-                    parent = parent.parent
+        # USD tree items are identified by their prim path
+        selected_items = self.tree.model.get_items_by_identity(selection)
 
-            return should_select
+        # Expand the selected items and their parents
+        for item in selected_items:
+            self._item_expansion_states[hash(item)] = True
+            parent = item.parent
+            while parent:
+                self._item_expansion_states[hash(parent)] = True
+                parent = parent.parent
 
-        self._tree_widget.selection = self.tree.model.find_items(lambda item: is_selected_item(selection, item))
+        self._tree_widget.selection = selected_items
         self._update_expansion_states()
 
     def _on_selection_changed(self, items):
@@ -0,0 +1,153 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from typing import Iterable
+from unittest.mock import Mock, patch
+
+import omni.kit.test
+import omni.usd
+from omni.flux.stage_manager.plugin.interaction.usd.all_lights import (
+    AllLightsInteractionPlugin as _AllLightsInteractionPlugin,
+)
+from omni.flux.stage_manager.plugin.interaction.usd.all_prims import (
+    AllPrimsInteractionPlugin as _AllPrimsInteractionPlugin,
+)
+from pxr import Sdf, Tf, Usd
+
+_HIDDEN_ATTRIBUTE = "test:hidden"
+
+
+class _RecursivePrimsInteractionPlugin(_AllPrimsInteractionPlugin):
+    # The default base behavior: the children of the prims filtered out are skipped
+    recursive_traversal: bool = True
+
+
+class _FakeContext:
+    context_name = ""
+
+    def get_items(self) -> list[Usd.Prim]:
+        return omni.usd.get_context(self.context_name).get_stage().GetPseudoRoot().GetChildren()
+
+
+class _HiddenFilter:
+    enabled = True
+    depends_on_descendants = False
+
+    @staticmethod
+    def filter_items(items: Iterable[Usd.Prim]) -> list[Usd.Prim]:
+        return [item for item in items if not item.GetAttribute(_HIDDEN_ATTRIBUTE).Get()]
+
+
+class TestStageManagerUSDInteractionPlugin(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.stage = None
+
+    # After running each test
+    async def tearDown(self):
+        await omni.usd.get_context().close_stage_async()
+        self.stage = None
+
+    async def test_incremental_update_should_match_full_rebuild(self):
+        for plugin_class in [_RecursivePrimsInteractionPlugin, _AllLightsInteractionPlugin]:
+            with self.subTest(plugin=plugin_class.__name__):
+                await self._create_stage()
+                await self._run_stage_edits(plugin_class)
+
+    async def _create_stage(self):
+        await omni.usd.get_context().new_stage_async()
+        self.stage = omni.usd.get_context().get_stage()
+
+        for path, type_name, hidden in [
+            ("/World", "Xform", False),
+            ("/World/A", "Xform", False),
+            ("/World/A/Light", "SphereLight", False),
+            ("/World/A/Cube", "Cube", False),
+            ("/World/B", "Xform", True),
+            ("/World/B/Light", "DiskLight", False),
+            ("/World/B/Group", "Xform", False),
+            ("/World/B/Group/Light", "RectLight", False),
+        ]:
+            prim = self.stage.DefinePrim(path, type_name)
+            prim.CreateAttribute(_HIDDEN_ATTRIBUTE, Sdf.ValueTypeNames.Bool).Set(hidden)
+
+    async def _run_stage_edits(self, plugin_class):
+        # Arrange
+        plugin = plugin_class.construct(tree=Mock(), filters=[_HiddenFilter()], columns=[], required_filters=[])
+        plugin._context = _FakeContext()  # noqa PLW0212
+        plugin._is_active = True  # noqa PLW0212
+
+        listener = Tf.Notice.Register(
+            Usd.Notice.ObjectsChanged,
+            lambda notice, _: plugin._on_usd_event_occurred(notice),  # noqa PLW0212
+            self.stage,
+        )
+
+        incremental_results = []
+        original_update = plugin_class._update_context_items_incremental  # noqa PLW0212
+
+        def update_incremental(*args, **kwargs):
+            incremental_results.append(original_update(*args, **kwargs))
+            return incremental_results[-1]
+
+        def add_prim():
+            self.stage.DefinePrim("/World/C", "Xform")
+            self.stage.DefinePrim("/World/C/Light", "SphereLight")
+
+        def rename_prim():
+            edit = Sdf.BatchNamespaceEdit()
+            edit.Add(Sdf.NamespaceEdit.Rename("/World/A", "Renamed"))
+            self.assertTrue(self.stage.GetRootLayer().Apply(edit))
+
+        def flip_filters():
+            self.stage.GetPrimAtPath("/World/Renamed").GetAttribute(_HIDDEN_ATTRIBUTE).Set(True)
+            self.stage.GetPrimAtPath("/World/B").GetAttribute(_HIDDEN_ATTRIBUTE).Set(False)
+            self.stage.GetPrimAtPath("/World/B/Group").GetAttribute(_HIDDEN_ATTRIBUTE).Set(True)
+
+        try:
+            plugin._update_context_items()  # noqa PLW0212
+            await plugin._update_context_task  # noqa PLW0212
+
+            with patch.object(
+                plugin_class, "_update_context_items_incremental", autospec=True, side_effect=update_incremental
+            ):
+                for name, edit, expected_path in [
+                    ("add", add_prim, "/World/C/Light"),
+                    ("remove", lambda: self.stage.RemovePrim("/World/A/Cube"), "/World/A/Light"),
+                    ("rename", rename_prim, "/World/Renamed/Light"),
+                    ("attribute", flip_filters, "/World/B/Light"),
+                ]:
+                    # Act
+                    edit()
+                    await plugin._update_context_task  # noqa PLW0212
+                    incremental_items = self._get_context_item_paths(plugin)
+
+                    plugin._update_context_items()  # noqa PLW0212
+                    await plugin._update_context_task  # noqa PLW0212
+                    rebuilt_items = self._get_context_item_paths(plugin)
+
+                    # Assert
+                    self.assertEqual([True], incremental_results, msg=name)
+                    self.assertEqual(rebuilt_items, incremental_items, msg=name)
+                    self.assertIn(expected_path, incremental_items, msg=name)
+                    incremental_results.clear()
+        finally:
+            listener.Revoke()
+
+    @staticmethod
+    def _get_context_item_paths(plugin) -> list[str]:
+        return [str(prim.GetPath()) for prim in plugin.tree.model.context_items]
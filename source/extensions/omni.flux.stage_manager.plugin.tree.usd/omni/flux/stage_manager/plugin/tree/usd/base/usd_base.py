@@ -40,6 +40,13 @@ class StageManagerUSDTreeItem(_StageManagerTreeItem):
     def default_attr(self) -> dict[str, None]:
         return super().default_attr
 
+    def _get_identity(self) -> str:
+        # A prim is only displayed once per tree, use its path as the item identity
+        prim = self.data.get("prim")
+        if prim is not None:
+            return str(prim.GetPath())
+        return super()._get_identity()
+
 
 class StageManagerUSDTreeModel(_StageManagerTreeModel[Usd.Prim]):
     @property
@@ -0,0 +1,117 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import time
+
+import carb
+import omni.kit.test
+from omni.flux.stage_manager.plugin.tree.usd.virtual_groups import VirtualGroupsItem as _VirtualGroupsItem
+from omni.flux.stage_manager.plugin.tree.usd.virtual_groups import VirtualGroupsModel as _VirtualGroupsModel
+from pxr import Sdf, Usd
+
+
+def _create_stage(prim_count: int) -> Usd.Stage:
+    stage = Usd.Stage.CreateInMemory()
+    with Sdf.ChangeBlock():
+        root_spec = Sdf.PrimSpec(stage.GetRootLayer(), "RootNode", Sdf.SpecifierDef, "Xform")
+        meshes_spec = Sdf.PrimSpec(root_spec, "meshes", Sdf.SpecifierDef, "Scope")
+        for index in range(prim_count):
+            Sdf.PrimSpec(meshes_spec, f"mesh_{index:016X}", Sdf.SpecifierDef, "Xform")
+    return stage
+
+
+def _find_selected_items(model: _VirtualGroupsModel, selection: list[str]) -> list[_VirtualGroupsItem]:
+    """The tree walk the identity lookup replaced"""
+    return model.find_items(lambda item: item.data.get("prim") and item.data["prim"].GetPath() in selection)
+
+
+class TestTreeItems(omni.kit.test.AsyncTestCase):
+    async def test_usd_items_should_be_identified_by_prim_path(self):
+        # Arrange
+        stage = _create_stage(2)
+        prim = stage.GetPrimAtPath("/RootNode/meshes/mesh_0000000000000000")
+        other_prim = stage.GetPrimAtPath("/RootNode/meshes/mesh_0000000000000001")
+
+        # Act
+        item = _VirtualGroupsItem("Mesh", "Tooltip", prim=prim)
+        renamed_item = _VirtualGroupsItem("Renamed Mesh", "Other Tooltip", prim=prim)
+        other_item = _VirtualGroupsItem("Mesh", "Tooltip", prim=other_prim)
+        group_item = _VirtualGroupsItem("Group", "Group Tooltip", children=[item])
+
+        # Assert
+        self.assertEqual(str(prim.GetPath()), item.identity)
+        self.assertEqual(item, renamed_item)
+        self.assertEqual(hash(item), hash(renamed_item))
+        self.assertNotEqual(item, other_item)
+        self.assertEqual(group_item, _VirtualGroupsItem("Group", "Group Tooltip"))
+        self.assertNotEqual(group_item, item)
+
+    async def test_get_items_by_identity_should_return_refreshed_items(self):
+        # Arrange
+        stage = _create_stage(3)
+        prims = list(stage.GetPrimAtPath("/RootNode/meshes").GetChildren())
+        model = _VirtualGroupsModel()
+        model.context_items = prims
+        model.refresh()
+
+        paths = [str(prim.GetPath()) for prim in prims]
+        items = model.get_items_by_identity(paths)
+
+        # Act
+        model.context_items = prims[1:]
+        model.refresh()
+        refreshed_items = model.get_items_by_identity(paths)
+
+        # Assert
+        self.assertEqual(paths, [item.identity for item in items])
+        self.assertEqual(paths[1:], [item.identity for item in refreshed_items])
+        self.assertTrue(all(item in model.get_item_children(None) for item in refreshed_items))
+        self.assertEqual({hash(item): item for item in refreshed_items}, model.items_dict)
+
+    async def test_selection_sync_benchmark(self):
+        for prim_count in (1_000, 10_000, 100_000):
+            with self.subTest(prim_count=prim_count):
+                # Arrange
+                stage = _create_stage(prim_count)
+                model = _VirtualGroupsModel()
+                model.context_items = stage.GetPrimAtPath("/RootNode/meshes").GetChildren()
+                model.refresh()
+
+                selection = [f"/RootNode/meshes/mesh_{index:016X}" for index in range(0, prim_count, prim_count // 10)]
+
+                # Act
+                start = time.perf_counter()
+                reference_items = _find_selected_items(model, selection)
+                reference_elapsed = time.perf_counter() - start
+
+                start = time.perf_counter()
+                first_items = model.get_items_by_identity(selection)
+                first_elapsed = time.perf_counter() - start
+
+                start = time.perf_counter()
+                items = model.get_items_by_identity(selection)
+                elapsed = time.perf_counter() - start
+
+                carb.log_info(
+                    f"Selected {len(selection)} of {prim_count} items: tree walk {reference_elapsed:.4f}s, "
+                    f"first lookup {first_elapsed:.4f}s, next lookups {elapsed:.6f}s"
+                )
+
+                # Assert
+                self.assertEqual(selection, [item.identity for item in items])
+                self.assertEqual(first_items, items)
+                self.assertEqual(set(reference_items), set(items))
@@ -33,5 +33,6 @@ __all__ = [
 # respective modules.
 
 from .event import *
+from .extension import FluxUtilsCommonExtension
 from .serialize import Converter, Serializer
 from .utils import *
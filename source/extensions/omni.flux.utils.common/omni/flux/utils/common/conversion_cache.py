@@ -0,0 +1,350 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "EXTS_CONVERSION_CACHE_ENABLED",
+    "EXTS_CONVERSION_CACHE_MAX_SIZE_MB",
+    "EXTS_CONVERSION_CACHE_PATH",
+    "EXTS_CONVERSION_CACHE_USE_HARD_LINKS",
+    "ConversionCache",
+    "get_conversion_cache",
+    "run_cached_conversion",
+]
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, Union
+
+import carb
+import carb.settings
+import carb.tokens
+
+from .conversion_scheduler import get_conversion_scheduler as _get_conversion_scheduler
+from .metadata_store import close_metadata_stores as _close_metadata_stores
+
+EXTS_CONVERSION_CACHE_ENABLED = "/exts/omni.flux.utils.common/conversion_cache/enabled"
+EXTS_CONVERSION_CACHE_PATH = "/exts/omni.flux.utils.common/conversion_cache/path"
+EXTS_CONVERSION_CACHE_MAX_SIZE_MB = "/exts/omni.flux.utils.common/conversion_cache/max_size_mb"
+EXTS_CONVERSION_CACHE_USE_HARD_LINKS = "/exts/omni.flux.utils.common/conversion_cache/use_hard_links"
+
+# Increment to invalidate all the entries when the way outputs are produced changes
+_CACHE_VERSION = 1
+_METADATA_SUFFIX = ".json"
+
+_INSTANCE = None
+_INSTANCE_LOCK = threading.Lock()
+
+
+def _hash_file(file_path: Union[Path, str], block_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        while True:
+            buf = file.read(block_size)
+            if not buf:
+                break
+            digest.update(buf)
+    return digest.hexdigest()
+
+
+class ConversionCache:
+    def __init__(self, root: Union[Path, str], max_size: Optional[int] = None, use_hard_links: bool = True):
+        """
+        A local content-addressed cache of converted files. Entries are keyed by the hash of the source file and the
+        conversion parameters, so the same source converted with the same parameters is never converted twice, even
+        from another project.
+
+        The least recently used entries are removed when the cache grows over `max_size`. The last use of an entry is
+        tracked with the modification time of its metadata file, never with the cached file itself since it can be
+        shared with outputs through hard links.
+
+        Every entry stores the hash, size & modification time of its content. Entries are hashed again when their size
+        or modification time changed, and entries that don't match their hash anymore are removed instead of being
+        used.
+
+        Args:
+            root: the directory of the cache
+            max_size: the maximum size of the cache, in bytes. None for no limit
+            use_hard_links: give back the cached files with hard links when possible instead of copies
+        """
+        self._root = Path(root)
+        self._max_size = max_size
+        self._use_hard_links = use_hard_links
+
+        self._lock = threading.Lock()
+        self._size = None
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @staticmethod
+    def get_key(source_hash: str, conversion: str, parameters: Sequence[str] = ()) -> str:
+        """
+        Get the key of a conversion.
+
+        Args:
+            source_hash: the hash of the content of the source file
+            conversion: the name of the conversion, like the tool used to convert the file
+            parameters: the parameters of the conversion, like the format or the mip-map settings
+
+        Returns:
+            The key of the cache entry
+        """
+        data = json.dumps([_CACHE_VERSION, source_hash, conversion, list(parameters)])
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _get_entry_paths(self, key: str) -> Tuple[Path, Path]:
+        entry = self._root / key[:2] / key
+        return entry, entry.with_name(key + _METADATA_SUFFIX)
+
+    @staticmethod
+    def _write_metadata(metadata_path: Path, metadata: dict):
+        # Write next to the metadata first so other processes never read half written metadata
+        temp_path = metadata_path.with_name(f".{metadata_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            temp_path.write_text(json.dumps(metadata), encoding="utf-8")
+            os.replace(temp_path, metadata_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def _remove_entry(self, key: str):
+        for path in self._get_entry_paths(key):
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                continue
+            if self._size is not None and path.suffix != _METADATA_SUFFIX:
+                self._size -= size
+
+    def fetch(self, key: str, out_path: Union[Path, str]) -> bool:
+        """
+        Give back a cached file. The cached file is checked before being used.
+
+        Args:
+            key: the key of the cache entry
+            out_path: the path to write the cached file to
+
+        Returns:
+            True if the file was found in the cache and written to the output path, False otherwise
+        """
+        entry, metadata_path = self._get_entry_paths(key)
+        try:
+            metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+            stat = entry.stat()
+            # Only hash the entry again when it was touched since it was last checked
+            if stat.st_size != metadata["size"] or stat.st_mtime_ns != metadata.get("mtime_ns"):
+                if stat.st_size != metadata["size"] or _hash_file(entry) != metadata["hash"]:
+                    carb.log_warn(f"The conversion cache entry {entry} is corrupted. Removing it.")
+                    with self._lock:
+                        self._remove_entry(key)
+                    return False
+                metadata["mtime_ns"] = stat.st_mtime_ns
+                self._write_metadata(metadata_path, metadata)
+        except (OSError, ValueError, KeyError):
+            return False
+
+        out_path = Path(out_path)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the output first so the output is never left half written
+        temp_path = out_path.with_name(f".{out_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            linked = False
+            if self._use_hard_links:
+                try:
+                    os.link(entry, temp_path)
+                    linked = True
+                except OSError:
+                    pass
+            if not linked:
+                shutil.copyfile(entry, temp_path)
+            os.replace(temp_path, out_path)
+        except OSError as e:
+            carb.log_warn(f"Unable to use the conversion cache entry {entry}: {e}")
+            temp_path.unlink(missing_ok=True)
+            return False
+
+        try:
+            # Keep track of the last use for the LRU eviction. The entry can be hard linked to outputs: don't touch it
+            os.utime(metadata_path)
+        except OSError:
+            pass
+        return True
+
+    def store(self, key: str, path: Union[Path, str]) -> bool:
+        """
+        Add a converted file to the cache. The file is copied so later changes to the file don't affect the cache.
+
+        Args:
+            key: the key of the cache entry
+            path: the converted file
+
+        Returns:
+            True if the file was added to the cache, False otherwise
+        """
+        entry, metadata_path = self._get_entry_paths(key)
+        temp_path = entry.with_name(f".{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, temp_path)
+            stat = temp_path.stat()
+            size = stat.st_size
+            metadata = {"hash": _hash_file(temp_path), "size": size, "mtime_ns": stat.st_mtime_ns}
+            with self._lock:
+                if entry.exists():
+                    self._remove_entry(key)
+                os.replace(temp_path, entry)
+                self._write_metadata(metadata_path, metadata)
+                if self._size is not None:
+                    self._size += size
+            self._evict()
+        except OSError as e:
+            carb.log_warn(f"Unable to add {path} to the conversion cache: {e}")
+            temp_path.unlink(missing_ok=True)
+            return False
+        return True
+
+    @staticmethod
+    def break_hard_link(path: Union[Path, str]):
+        """
+        Replace a file shared with hard links by a copy, so writing to the file doesn't change the other links (like the
+        cache entry the file was given back from).
+
+        Args:
+            path: the file to detach
+        """
+        path = Path(path)
+        try:
+            if path.stat().st_nlink <= 1:
+                return
+        except OSError:
+            return
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            shutil.copyfile(path, temp_path)
+            os.replace(temp_path, path)
+        except OSError as e:
+            carb.log_warn(f"Unable to replace the hard link {path} by a copy: {e}")
+            temp_path.unlink(missing_ok=True)
+
+    def _get_entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        if not self._root.exists():
+            return entries
+        for directory in self._root.iterdir():
+            if not directory.is_dir():
+                continue
+            for path in directory.iterdir():
+                if path.suffix == _METADATA_SUFFIX or path.name.startswith("."):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                try:
+                    last_use = path.with_name(path.name + _METADATA_SUFFIX).stat().st_mtime
+                except OSError:
+                    last_use = stat.st_mtime
+                entries.append((last_use, stat.st_size, path.name))
+        return entries
+
+    def get_size(self) -> int:
+        """Get the size of the cached files, in bytes"""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._get_entries())
+            return self._size
+
+    def _evict(self):
+        if self._max_size is None or self.get_size() <= self._max_size:
+            return
+        with self._lock:
+            # Other processes can use the same cache: look at the entries on disk
+            entries = sorted(self._get_entries())
+            self._size = sum(size for _, size, _ in entries)
+            for _, _, key in entries:
+                if self._size <= self._max_size:
+                    break
+                self._remove_entry(key)
+
+    def clear(self):
+        """Remove all the entries of the cache"""
+        with self._lock:
+            _close_metadata_stores(self._root)
+            shutil.rmtree(self._root, ignore_errors=True)
+            self._size = 0
+
+
+def get_conversion_cache() -> Optional[ConversionCache]:
+    """
+    Get the conversion cache shared by the extensions. It is configured with the `conversion_cache` settings of the
+    extension.
+
+    Returns:
+        The shared conversion cache or None if the cache is disabled
+    """
+    global _INSTANCE
+    settings = carb.settings.get_settings()
+    if not settings.get(EXTS_CONVERSION_CACHE_ENABLED):
+        return None
+    with _INSTANCE_LOCK:
+        if _INSTANCE is None:
+            max_size_mb = settings.get(EXTS_CONVERSION_CACHE_MAX_SIZE_MB)
+            _INSTANCE = ConversionCache(
+                carb.tokens.get_tokens_interface().resolve(settings.get(EXTS_CONVERSION_CACHE_PATH)),
+                max_size=max_size_mb * 1024 * 1024 if max_size_mb else None,
+                use_hard_links=bool(settings.get(EXTS_CONVERSION_CACHE_USE_HARD_LINKS)),
+            )
+        return _INSTANCE
+
+
+async def run_cached_conversion(
+    cache: Optional[ConversionCache],
+    key: Optional[str],
+    out_path: Union[Path, str],
+    convert: Callable[[], Awaitable[Any]],
+) -> Tuple[bool, Any]:
+    """
+    Give back the output of a conversion from the cache or run the conversion and add its output to the cache.
+    The blocking cache operations run in the conversion scheduler.
+
+    Args:
+        cache: the cache to use. None to always run the conversion
+        key: the key of the conversion. See `ConversionCache.get_key`. None to always run the conversion
+        out_path: the output of the conversion
+        convert: function that runs the conversion and writes the output
+
+    Returns:
+        True if the output came from the cache, and the result of the conversion (None if the output came from the
+        cache)
+    """
+    if cache is None or key is None:
+        return False, await convert()
+
+    scheduler = _get_conversion_scheduler()
+    if await scheduler.run(cache.fetch, key, out_path):
+        return True, None
+    # The previous output can be a hard link to a cache entry: don't let the conversion overwrite the entry
+    await scheduler.run(cache.break_hard_link, out_path)
+    result = await convert()
+    await scheduler.run(cache.store, key, out_path)
+    return False, result
@@ -0,0 +1,336 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "EXTS_CONVERSION_SCHEDULER_MAX_WORKERS",
+    "EXTS_CONVERSION_SCHEDULER_MEMORY_PER_WORKER_MB",
+    "ConversionScheduler",
+    "get_available_memory",
+    "get_conversion_scheduler",
+]
+
+import asyncio
+import heapq
+import itertools
+import os
+import subprocess
+import sys
+import threading
+from typing import Any, Callable, List, Optional
+
+import carb
+import carb.settings
+
+EXTS_CONVERSION_SCHEDULER_MAX_WORKERS = "/exts/omni.flux.utils.common/conversion_scheduler/max_workers"
+EXTS_CONVERSION_SCHEDULER_MEMORY_PER_WORKER_MB = (
+    "/exts/omni.flux.utils.common/conversion_scheduler/memory_per_worker_mb"
+)
+
+_DEFAULT_MEMORY_PER_WORKER_MB = 1024
+_MEMINFO_PATH = "/proc/meminfo"
+
+_INSTANCE = None
+_INSTANCE_LOCK = threading.Lock()
+
+
+def get_available_memory() -> Optional[int]:
+    """
+    Get the physical memory available on the machine.
+
+    Returns:
+        The available memory in bytes or None if it can't be read on the current platform
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class MemoryStatusEx(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", wintypes.DWORD),
+                    ("dwMemoryLoad", wintypes.DWORD),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            status = MemoryStatusEx()
+            status.dwLength = ctypes.sizeof(status)
+            if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return None
+            return status.ullAvailPhys
+
+        if sys.platform.startswith("linux"):
+            # The free pages don't count the caches the kernel can reclaim: prefer the kernel estimate when available
+            available = _read_meminfo_available(_MEMINFO_PATH)
+            if available is not None:
+                return available
+
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _read_meminfo_available(meminfo_path: str) -> Optional[int]:
+    try:
+        with open(meminfo_path, encoding="utf-8") as meminfo:
+            for line in meminfo:
+                name, _, value = line.partition(":")
+                if name == "MemAvailable":
+                    # The values are in kibibytes: "MemAvailable:   12345678 kB"
+                    return int(value.split()[0]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class _Job:
+    def __init__(self, loop: asyncio.AbstractEventLoop, future: asyncio.Future, func: Callable, args, kwargs):
+        self.loop = loop
+        self.future = future
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def set_result(self, value: Any):
+        if not self.future.done():
+            self.future.set_result(value)
+
+    def set_exception(self, exception: BaseException):
+        if not self.future.done():
+            self.future.set_exception(exception)
+
+
+class ConversionScheduler:
+    def __init__(self, max_workers: Optional[int] = None, memory_per_worker_mb: Optional[int] = None):
+        """
+        Run blocking conversion jobs (texture compression, upscaling, etc.) in a shared pool of threads and give back
+        awaitable futures.
+
+        Jobs with the highest priority start first. Jobs with the same priority start in the order they were submitted.
+        Cancelling the future of a job that didn't start yet removes it from the queue, and cancelling the future of a
+        process started with `run_process` kills the process.
+
+        Args:
+            max_workers: maximum number of jobs running at the same time. None or 0 to use the number of CPUs,
+                         limited by the available memory.
+            memory_per_worker_mb: memory a job is expected to use, in megabytes. Used to limit the number of workers
+                                  based on the available memory.
+        """
+        self._memory_per_worker_mb = memory_per_worker_mb or _DEFAULT_MEMORY_PER_WORKER_MB
+        self._max_workers = self._get_max_workers(max_workers)
+
+        self._condition = threading.Condition()
+        self._queue: List[tuple] = []
+        self._sequence = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._idle_threads = 0
+        self._shutdown = False
+
+    @property
+    def max_workers(self) -> int:
+        """The maximum number of jobs running at the same time"""
+        return self._max_workers
+
+    def _get_max_workers(self, value: Optional[int]) -> int:
+        if value:
+            return max(value, 1)
+        workers = os.cpu_count() or 1
+        available_memory = get_available_memory()
+        if available_memory is not None:
+            workers = min(workers, available_memory // (self._memory_per_worker_mb * 1024 * 1024))
+        return max(workers, 1)
+
+    def set_max_workers(self, value: Optional[int]):
+        """
+        Set the maximum number of jobs running at the same time. Running jobs are not interrupted.
+
+        Args:
+            value: the maximum number of jobs. None or 0 to size it from the number of CPUs and the available memory.
+        """
+        max_workers = self._get_max_workers(value)
+        with self._condition:
+            self._max_workers = max_workers
+            self._ensure_workers()
+            self._condition.notify_all()
+
+    @property
+    def pending_count(self) -> int:
+        """The number of jobs waiting for a worker"""
+        with self._condition:
+            return len(self._queue)
+
+    def submit(self, func: Callable, *args, priority: int = 0, **kwargs) -> asyncio.Future:
+        """
+        Queue a blocking function. Must be called from a thread with a running event loop.
+
+        Args:
+            func: the function to run
+            args: the positional arguments of the function
+            priority: jobs with a higher priority start first
+            kwargs: the keyword arguments of the function
+
+        Returns:
+            A future resolved with the value returned by the function
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        job = _Job(loop, future, func, args, kwargs)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("The conversion scheduler was shut down")
+            heapq.heappush(self._queue, (-priority, next(self._sequence), job))
+            self._ensure_workers()
+            self._condition.notify()
+        return future
+
+    async def run(self, func: Callable, *args, priority: int = 0, **kwargs) -> Any:
+        """
+        Run a blocking function in the scheduler and wait for its result.
+
+        Args:
+            func: the function to run
+            args: the positional arguments of the function
+            priority: jobs with a higher priority start first
+            kwargs: the keyword arguments of the function
+
+        Returns:
+            The value returned by the function
+        """
+        return await self.submit(func, *args, priority=priority, **kwargs)
+
+    def submit_process(self, cmd: List[str], priority: int = 0, check: bool = True) -> asyncio.Future:
+        """
+        Queue a process. The process is killed if the future is cancelled while it runs.
+
+        Args:
+            cmd: the command to run
+            priority: jobs with a higher priority start first
+            check: resolve the future with a `subprocess.CalledProcessError` if the process failed
+
+        Returns:
+            A future resolved with the `subprocess.CompletedProcess` of the command
+        """
+        cancelled = threading.Event()
+        future = self.submit(self._run_process, cmd, cancelled, check, priority=priority)
+        future.add_done_callback(lambda f: cancelled.set() if f.cancelled() else None)
+        return future
+
+    async def run_process(self, cmd: List[str], priority: int = 0, check: bool = True) -> subprocess.CompletedProcess:
+        """
+        Run a process in the scheduler and wait for it to finish.
+
+        Args:
+            cmd: the command to run
+            priority: jobs with a higher priority start first
+            check: raise a `subprocess.CalledProcessError` if the process failed
+
+        Returns:
+            The completed process with its output
+        """
+        return await self.submit_process(cmd, priority=priority, check=check)
+
+    @staticmethod
+    def _run_process(cmd: List[str], cancelled: threading.Event, check: bool) -> subprocess.CompletedProcess:
+        with subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        ) as process:
+            while True:
+                try:
+                    stdout, stderr = process.communicate(timeout=0.1)
+                    break
+                except subprocess.TimeoutExpired:
+                    if cancelled.is_set():
+                        process.kill()
+                        process.communicate()
+                        raise asyncio.CancelledError()  # noqa B904
+        result = subprocess.CompletedProcess(cmd, process.returncode, stdout=stdout, stderr=stderr)
+        if check:
+            result.check_returncode()
+        return result
+
+    def _ensure_workers(self):
+        # Called with the condition acquired
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        missing = min(len(self._queue) - self._idle_threads, self._max_workers - len(self._threads))
+        for _ in range(max(missing, 0)):
+            thread = threading.Thread(target=self._work, name="FluxConversionScheduler", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _work(self):
+        while True:
+            with self._condition:
+                self._idle_threads += 1
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                self._idle_threads -= 1
+                if self._shutdown or len(self._threads) > self._max_workers:
+                    self._threads.remove(threading.current_thread())
+                    return
+                _, _, job = heapq.heappop(self._queue)
+
+            if job.future.cancelled():
+                continue
+            try:
+                result = job.func(*job.args, **job.kwargs)
+            except BaseException as e:  # noqa PLW0718
+                try:
+                    job.loop.call_soon_threadsafe(job.set_exception, e)
+                except RuntimeError:
+                    carb.log_warn(f"The event loop of a conversion job is closed: {e}")
+            else:
+                try:
+                    job.loop.call_soon_threadsafe(job.set_result, result)
+                except RuntimeError:
+                    carb.log_warn("The event loop of a conversion job is closed")
+
+    def shutdown(self):
+        """Cancel the jobs waiting for a worker and stop the workers once their current job is done"""
+        with self._condition:
+            self._shutdown = True
+            queue = self._queue
+            self._queue = []
+            self._condition.notify_all()
+        for _, _, job in queue:
+            try:
+                job.loop.call_soon_threadsafe(job.future.cancel)
+            except RuntimeError:
+                pass
+
+
+def get_conversion_scheduler() -> ConversionScheduler:
+    """
+    Get the conversion scheduler shared by the extensions. It is sized with the `conversion_scheduler` settings of the
+    extension.
+
+    Returns:
+        The shared conversion scheduler
+    """
+    global _INSTANCE
+    with _INSTANCE_LOCK:
+        if _INSTANCE is None:
+            settings = carb.settings.get_settings()
+            _INSTANCE = ConversionScheduler(
+                max_workers=settings.get(EXTS_CONVERSION_SCHEDULER_MAX_WORKERS) or None,
+                memory_per_worker_mb=settings.get(EXTS_CONVERSION_SCHEDULER_MEMORY_PER_WORKER_MB) or None,
+            )
+        return _INSTANCE
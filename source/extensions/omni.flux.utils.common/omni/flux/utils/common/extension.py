@@ -0,0 +1,32 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import carb
+import omni.ext
+
+from .metadata_store import close_metadata_stores as _close_metadata_stores
+
+
+class FluxUtilsCommonExtension(omni.ext.IExt):
+    """Close the shared resources of the utils"""
+
+    def on_startup(self, ext_id):
+        carb.log_info("[omni.flux.utils.common] Startup")
+
+    def on_shutdown(self):
+        carb.log_info("[omni.flux.utils.common] Shutdown")
+        _close_metadata_stores()
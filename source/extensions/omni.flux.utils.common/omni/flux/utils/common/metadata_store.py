@@ -0,0 +1,354 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "EXTS_METADATA_STORE_ENABLED",
+    "METADATA_SIDECAR_SUFFIX",
+    "METADATA_STORE_FILE_NAME",
+    "MetadataStore",
+    "close_metadata_stores",
+    "get_metadata_store",
+    "is_metadata_store_enabled",
+]
+
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import carb
+import carb.settings
+
+EXTS_METADATA_STORE_ENABLED = "/exts/omni.flux.utils.common/metadata_store/enabled"
+
+METADATA_SIDECAR_SUFFIX = ".meta"
+METADATA_STORE_FILE_NAME = ".flux_metadata.db"
+
+_SQLITE_BATCH_SIZE = 500
+
+_STORES: Dict[str, "MetadataStore"] = {}
+_STORES_LOCK = threading.Lock()
+
+
+class MetadataStore:
+    def __init__(self, directory: Union[Path, str]):
+        """
+        The metadata of all the files of a directory, stored in a single SQLite database instead of one `.meta` JSON
+        sidecar file per file.
+
+        The database uses write-ahead logging so readers don't wait for writers, and every write is done in a
+        transaction. Use `transaction` to group many writes in a single transaction.
+
+        The legacy sidecar files can be imported in the database with `import_sidecars` and written back with
+        `export_sidecars`.
+
+        Args:
+            directory: the directory of the files
+        """
+        self._directory = Path(directory)
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+        self._checked_sidecars = set()
+
+        self._connection = sqlite3.connect(
+            str(self._directory / METADATA_STORE_FILE_NAME), isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "file TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (file, key)"
+            ") WITHOUT ROWID"
+        )
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["MetadataStore"]:
+        """
+        Group the writes done in the context in a single transaction. Transactions can be nested: only the outermost
+        transaction commits. Nothing is written if an exception is raised in the context.
+        """
+        with self._lock:
+            if self._transaction_depth == 0:
+                self._connection.execute("BEGIN IMMEDIATE")
+            self._transaction_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self._connection.execute("ROLLBACK")
+                raise
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self._connection.execute("COMMIT")
+
+    def read(self, file_name: str, key: str) -> Tuple[bool, Any]:
+        """
+        Read a metadata key of a file
+
+        Args:
+            file_name: the name of the file in the directory
+            key: the key to read
+
+        Returns:
+            True if the key exists, and the value of the key
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM metadata WHERE file = ? AND key = ?", (file_name, key)
+            ).fetchone()
+        if row is None:
+            return False, None
+        return True, json.loads(row[0])
+
+    def read_all(self, file_name: str) -> Dict[str, Any]:
+        """
+        Read all the metadata of a file
+
+        Args:
+            file_name: the name of the file in the directory
+
+        Returns:
+            The metadata of the file
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT key, value FROM metadata WHERE file = ?", (file_name,)).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def read_many(self, file_names: Iterable[str], key: str) -> Dict[str, Any]:
+        """
+        Read a metadata key of many files
+
+        Args:
+            file_names: the names of the files in the directory
+            key: the key to read
+
+        Returns:
+            The value of the key for the files that have it
+        """
+        file_names = list(file_names)
+        result = {}
+        with self._lock:
+            for index in range(0, len(file_names), _SQLITE_BATCH_SIZE):
+                batch = file_names[index : index + _SQLITE_BATCH_SIZE]  # noqa E203
+                placeholders = ", ".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT file, value FROM metadata WHERE key = ? AND file IN ({placeholders})", (key, *batch)
+                ).fetchall()
+                result.update({file_name: json.loads(value) for file_name, value in rows})
+        return result
+
+    def get_file_names(self) -> List[str]:
+        """Get the names of the files that have metadata"""
+        with self._lock:
+            return [row[0] for row in self._connection.execute("SELECT DISTINCT file FROM metadata").fetchall()]
+
+    def write(self, file_name: str, key: str, value: Any, append: bool = False):
+        """
+        Write a metadata key of a file
+
+        Args:
+            file_name: the name of the file in the directory
+            key: the key to write
+            value: the value of the key
+            append: whether the value should be appended to a list or overwritten if is already exists
+        """
+        self.write_many([(file_name, key, value)], append=append)
+
+    def write_many(self, items: Iterable[Tuple[str, str, Any]], append: bool = False):
+        """
+        Write many metadata keys in a single transaction
+
+        Args:
+            items: the file names in the directory, keys and values to write
+            append: whether the values should be appended to lists or overwritten if they already exist
+        """
+        with self.transaction():
+            for file_name, key, value in items:
+                if append:
+                    exists, current = self.read(file_name, key)
+                    if not exists:
+                        value = [value]
+                    elif isinstance(current, list):
+                        value = current + [value]
+                    else:
+                        value = [current, value]
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO metadata (file, key, value) VALUES (?, ?, ?)",
+                    (file_name, key, json.dumps(value)),
+                )
+
+    def delete(self, file_name: str, key: Optional[str] = None):
+        """
+        Delete a metadata key of a file
+
+        Args:
+            file_name: the name of the file in the directory
+            key: the key to delete. None to delete all the metadata of the file
+        """
+        with self.transaction():
+            if key is None:
+                self._connection.execute("DELETE FROM metadata WHERE file = ?", (file_name,))
+            else:
+                self._connection.execute("DELETE FROM metadata WHERE file = ? AND key = ?", (file_name, key))
+
+    def import_sidecar(self, file_name: str, overwrite: bool = False) -> bool:
+        """
+        Import the legacy `.meta` sidecar file of a file
+
+        Args:
+            file_name: the name of the file in the directory
+            overwrite: replace the keys that already exist in the database
+
+        Returns:
+            True if a sidecar file was imported, False otherwise
+        """
+        sidecar_path = self._directory / (file_name + METADATA_SIDECAR_SUFFIX)
+        try:
+            data = json.loads(sidecar_path.read_bytes())
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict):
+            return False
+        with self.transaction():
+            existing = {} if overwrite else self.read_all(file_name)
+            self.write_many((file_name, key, value) for key, value in data.items() if key not in existing)
+        return True
+
+    def ensure_sidecar_imported(self, file_name: str):
+        """
+        Import the legacy `.meta` sidecar file of a file the first time the file is used, so the metadata written
+        before the store was enabled is still found. Keys that already exist in the database are kept.
+
+        Args:
+            file_name: the name of the file in the directory
+        """
+        with self._lock:
+            if file_name in self._checked_sidecars:
+                return
+            self._checked_sidecars.add(file_name)
+        self.import_sidecar(file_name)
+
+    def import_sidecars(self, remove: bool = False, overwrite: bool = False) -> int:
+        """
+        Import all the legacy `.meta` sidecar files of the directory in a single transaction
+
+        Args:
+            remove: delete the sidecar files once imported
+            overwrite: replace the keys that already exist in the database
+
+        Returns:
+            The number of imported sidecar files
+        """
+        imported = []
+        with self.transaction():
+            for entry in os.scandir(self._directory):
+                if not entry.is_file() or not entry.name.endswith(METADATA_SIDECAR_SUFFIX):
+                    continue
+                file_name = entry.name[: -len(METADATA_SIDECAR_SUFFIX)]
+                if self.import_sidecar(file_name, overwrite=overwrite):
+                    imported.append(entry.path)
+                self._checked_sidecars.add(file_name)
+        if remove:
+            for path in imported:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    carb.log_warn(f"Unable to remove the imported metadata file {path}: {e}")
+        return len(imported)
+
+    def export_sidecars(self) -> int:
+        """
+        Write the metadata of every file of the database to legacy `.meta` sidecar files
+
+        Returns:
+            The number of written sidecar files
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT file, key, value FROM metadata ORDER BY file").fetchall()
+        files: Dict[str, Dict[str, Any]] = {}
+        for file_name, key, value in rows:
+            files.setdefault(file_name, {})[key] = json.loads(value)
+        for file_name, data in files.items():
+            sidecar_path = self._directory / (file_name + METADATA_SIDECAR_SUFFIX)
+            sidecar_path.write_text(json.dumps(data, indent=4), encoding="utf-8")
+        return len(files)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def is_metadata_store_enabled() -> bool:
+    """Tell if the metadata is stored in per-directory databases instead of sidecar files"""
+    return bool(carb.settings.get_settings().get(EXTS_METADATA_STORE_ENABLED))
+
+
+def get_metadata_store(directory: Union[Path, str], create: bool = True) -> Optional[MetadataStore]:
+    """
+    Get the metadata store of a directory. Stores are opened once and shared.
+
+    Args:
+        directory: the directory of the files
+        create: create the database if it doesn't exist yet
+
+    Returns:
+        The metadata store or None if the metadata store is disabled, if there is no database and `create` is False or
+        if the database can't be opened
+    """
+    if not is_metadata_store_enabled():
+        return None
+    key = os.path.normcase(os.path.abspath(str(directory)))
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is not None:
+            return store
+        if not create and not os.path.exists(os.path.join(key, METADATA_STORE_FILE_NAME)):
+            return None
+        if not os.path.isdir(key):
+            return None
+        try:
+            store = MetadataStore(key)
+        except sqlite3.Error as e:
+            carb.log_warn(f"Unable to open the metadata store of {key}: {e}")
+            return None
+        _STORES[key] = store
+        return store
+
+
+def close_metadata_stores(directory: Optional[Union[Path, str]] = None):
+    """
+    Close the opened metadata stores. Stores must be closed before their directory is removed.
+
+    Args:
+        directory: only close the stores of this directory and its sub-directories. Close all the stores if None
+    """
+    prefix = None
+    if directory is not None:
+        prefix = os.path.normcase(os.path.abspath(str(directory)))
+    with _STORES_LOCK:
+        for key in list(_STORES):
+            if prefix is not None and key != prefix and not key.startswith(os.path.join(prefix, "")):
+                continue
+            _STORES.pop(key).close()
@@ -17,11 +17,112 @@
 
 from __future__ import annotations
 
+__all__ = ["OmniUrl", "StatCache", "exists_urls_async", "stat_urls_async"]
+
+import asyncio
+import time
+from contextvars import ContextVar, Token
 from pathlib import Path, PurePosixPath, PureWindowsPath
-from typing import Any, Callable, Iterator, List, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import omni.client
 
+StatResult = Tuple[omni.client.Result, Optional[omni.client.ListEntry]]
+
+
+class StatCache:
+    """
+    An opt-in cache for the `omni.client.stat` results used by `OmniUrl`.
+
+    The cache is only used while it is active, so the cached results can't leak outside the scope where the file system
+    is known to be stable.
+
+    Examples:
+        >>> with StatCache(ttl=5.0) as cache:
+        >>>     exists = [OmniUrl(p).exists for p in paths]  # Each unique path is only stat'ed once
+        >>>     cache.invalidate(output_path)  # Invalidate a path after writing it
+    """
+
+    # Each thread & asyncio task has its own stack of active caches
+    _active_caches: ContextVar[Tuple[StatCache, ...]] = ContextVar("active_stat_caches", default=())
+
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        Args:
+            ttl: The time in seconds a stat result stays valid. If None, the results stay valid until invalidated.
+        """
+        self._ttl = ttl
+        self._entries: Dict[str, Tuple[float, StatResult]] = {}
+        self._tokens: List[Token] = []
+
+    def __enter__(self) -> StatCache:
+        self._tokens.append(self._active_caches.set(self._active_caches.get() + (self,)))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._active_caches.reset(self._tokens.pop())
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def get_active(cls) -> Optional[StatCache]:
+        """
+        Get the innermost active cache, if any
+        """
+        active_caches = cls._active_caches.get()
+        return active_caches[-1] if active_caches else None
+
+    def get(self, url: Union[str, Path, OmniUrl]) -> Optional[StatResult]:
+        """
+        Get the cached stat result for a URL.
+
+        Args:
+            url: The URL to get the result for
+
+        Returns:
+            The cached (Result, ListEntry) tuple, or None if the URL is not cached or the result expired.
+        """
+        key = self._get_key(url)
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        timestamp, result = cached
+        if self._ttl is not None and time.monotonic() - timestamp > self._ttl:
+            del self._entries[key]
+            return None
+        return result
+
+    def set(self, url: Union[str, Path, OmniUrl], result: StatResult):
+        """
+        Cache the stat result for a URL.
+
+        Args:
+            url: The URL to set the result for
+            result: The (Result, ListEntry) tuple returned by `omni.client.stat`
+        """
+        self._entries[self._get_key(url)] = (time.monotonic(), result)
+
+    def invalidate(self, url: Optional[Union[str, Path, OmniUrl]] = None):
+        """
+        Invalidate the cached results.
+
+        Args:
+            url: The URL to invalidate. Every child of the URL will also be invalidated. If None, the whole cache is
+                 invalidated.
+        """
+        if url is None:
+            self._entries.clear()
+            return
+        key = self._get_key(url)
+        for cached_key in [k for k in self._entries if k == key or k.startswith(f"{key}/")]:
+            del self._entries[cached_key]
+
+    @staticmethod
+    def _get_key(url: Union[str, Path, OmniUrl]) -> str:
+        return str(url).replace("\\", "/").rstrip("/")
+
 
 class OmniUrl:
     """
@@ -66,16 +167,33 @@ class OmniUrl:
         url = self / list_entry.relative_path
         return OmniUrl(url, list_entry=list_entry)
 
+    def stat(self) -> StatResult:
+        """
+        Stat the URL. If a `StatCache` is active, the cached result will be used when available.
+
+        Returns:
+            The (Result, ListEntry) tuple returned by `omni.client.stat`
+        """
+        cache = StatCache.get_active()
+        if cache is not None:
+            cached = cache.get(self._url)
+            if cached is not None:
+                return cached
+        result = omni.client.stat(self._url)
+        if cache is not None:
+            cache.set(self._url, result)
+        return result
+
     @property
     def is_directory(self) -> bool:
         """returns True if path points to a directory."""
-        result, entry = omni.client.stat(self._url)
+        result, entry = self.stat()
         return bool(result == omni.client.Result.OK and entry.flags & omni.client.ItemFlags.CAN_HAVE_CHILDREN)
 
     @property
     def is_file(self) -> bool:
         """returns True if path points to a file."""
-        result, entry = omni.client.stat(self._url)
+        result, entry = self.stat()
         return bool(result == omni.client.Result.OK and not entry.flags & omni.client.ItemFlags.CAN_HAVE_CHILDREN)
 
     def iterdir(self):
@@ -92,7 +210,7 @@ class OmniUrl:
         """return True if the file or folder exists."""
         if self._list_entry:
             return True
-        res, self._list_entry = omni.client.stat(self._url)
+        res, self._list_entry = self.stat()
         if res != omni.client.Result.OK:
             return False
         if self._list_entry:
@@ -183,8 +301,98 @@ class OmniUrl:
         """
         Delete the item and wait for the result.
         """
+        cache = StatCache.get_active()
+        if cache is not None:
+            cache.invalidate(self._url)
         return omni.client.delete(str(self._url))
 
     def __truediv__(self, arg):
         new_path = self.path / PurePosixPath(arg)
         return self.with_path(new_path)
+
+
+async def stat_urls_async(
+    urls: Iterable[Union[str, Path, OmniUrl]], list_directories: bool = True
+) -> Dict[str, StatResult]:
+    """
+    Stat many URLs concurrently.
+
+    When multiple URLs share the same parent directory, the directory is listed once instead of stat'ing every URL.
+    The results are stored in the active `StatCache`, if any.
+
+    Args:
+        urls: The URLs to stat
+        list_directories: Whether URLs sharing the same parent should be resolved using a directory listing
+
+    Returns:
+        A dictionary of (Result, ListEntry) tuples using the URL strings as keys
+    """
+    cache = StatCache.get_active()
+    results: Dict[str, StatResult] = {}
+
+    # Group the URLs by parent directory to find where directory listings can be used
+    urls_by_parent: Dict[str, List[OmniUrl]] = {}
+    for url in urls:
+        omni_url = OmniUrl(url)
+        if str(omni_url) in results:
+            continue
+        cached = cache.get(omni_url) if cache is not None else None
+        if cached is not None:
+            results[str(omni_url)] = cached
+            continue
+        results[str(omni_url)] = None
+        urls_by_parent.setdefault(omni_url.parent_url, []).append(omni_url)
+
+    async def stat_url(omni_url: OmniUrl):
+        results[str(omni_url)] = await omni.client.stat_async(str(omni_url))
+
+    async def list_directory(parent_url: str, children: List[OmniUrl]):
+        result, entries = await omni.client.list_async(parent_url)
+        # If the parent doesn't exist, none of the children exist either
+        if result == omni.client.Result.ERROR_NOT_FOUND:
+            for child in children:
+                results[str(child)] = (result, None)
+            return
+        # Fallback on individual stats if the directory can't be listed
+        if result != omni.client.Result.OK:
+            await asyncio.gather(*[stat_url(child) for child in children])
+            return
+        entries_by_name = {entry.relative_path: entry for entry in entries}
+        missing_children = []
+        for child in children:
+            entry = entries_by_name.get(child.name)
+            if entry is None:
+                # The name might not be an exact match on case-insensitive file systems so stat the child to make sure
+                missing_children.append(child)
+            else:
+                results[str(child)] = (omni.client.Result.OK, entry)
+        await asyncio.gather(*[stat_url(child) for child in missing_children])
+
+    tasks = []
+    for parent_url, children in urls_by_parent.items():
+        if list_directories and len(children) > 1:
+            tasks.append(list_directory(parent_url, children))
+        else:
+            tasks.extend(stat_url(child) for child in children)
+    await asyncio.gather(*tasks)
+
+    if cache is not None:
+        for children in urls_by_parent.values():
+            for child in children:
+                cache.set(child, results[str(child)])
+
+    return results
+
+
+async def exists_urls_async(urls: Iterable[Union[str, Path, OmniUrl]]) -> Dict[str, bool]:
+    """
+    Check if many URLs exist concurrently. See `stat_urls_async`.
+
+    Args:
+        urls: The URLs to check
+
+    Returns:
+        A dictionary of existence values using the URL strings as keys
+    """
+    results = await stat_urls_async(urls)
+    return {url: bool(result == omni.client.Result.OK and entry) for url, (result, entry) in results.items()}
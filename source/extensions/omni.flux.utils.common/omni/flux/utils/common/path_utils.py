@@ -16,24 +16,34 @@
 """
 
 __all__ = [
+    "EXTS_HASHING_ALGORITHM",
+    "HASH_ALGORITHMS",
+    "UdimIndex",
     "cleanup_file",
+    "copy_metadata",
     "delete_metadata",
     "get_absolute_path_from_relative",
+    "get_default_hash_algorithm",
+    "get_hash_algorithm",
     "get_new_hash",
     "get_udim_sequence",
     "hash_file",
+    "hash_files",
     "hash_match_metadata",
     "is_absolute_path",
     "is_file_path_valid",
+    "is_metadata_file",
     "is_udim_texture",
     "get_invalid_extensions",
     "read_file",
     "read_json_file",
     "read_metadata",
+    "read_metadata_batch",
     "texture_to_udim",
     "write_file",
     "write_json_file",
     "write_metadata",
+    "write_metadata_batch",
 ]
 
 import hashlib
@@ -44,14 +54,24 @@ import platform
 import posixpath
 import re
 import subprocess
+import threading
+import time
 import typing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, Token
 from io import BytesIO
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import carb
+import carb.settings
 import carb.tokens
 import omni.client
+from omni.flux.utils.common.metadata_store import METADATA_SIDECAR_SUFFIX as _METADATA_SIDECAR_SUFFIX
+from omni.flux.utils.common.metadata_store import METADATA_STORE_FILE_NAME as _METADATA_STORE_FILE_NAME
+from omni.flux.utils.common.metadata_store import MetadataStore as _MetadataStore
+from omni.flux.utils.common.metadata_store import get_metadata_store as _get_metadata_store
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
 
 if typing.TYPE_CHECKING:
@@ -61,6 +81,26 @@ _REGEX_MATCH_UDIM = re.compile("^.*(<UDIM>|<UVTILE0>|<UVTILE1>).*")
 _REGEX_UDIM_GROUP_UV_TILE = re.compile("^(.*)(<UDIM>|<UVTILE0>|<UVTILE1>)(.*)")
 _REGEX_UDIM_GROUP_NUMBERS = re.compile("^(.*)([0-9][0-9][0-9][0-9])(.*)")
 
+EXTS_HASHING_ALGORITHM = "/exts/omni.flux.utils.common/hashing/algorithm"
+
+# Hashes are stored as `<algorithm>:<digest>`, except MD5 hashes that are stored without a tag like they always were
+HASH_ALGORITHMS = {
+    "md5": hashlib.md5,
+    "sha256": hashlib.sha256,
+    "blake2b": lambda: hashlib.blake2b(digest_size=16),
+}
+_LEGACY_HASH_ALGORITHM = "md5"
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+# (path, algorithm) -> (size, modification time, inode, change time, hash) of the last hashed files, to never re-read
+# unchanged files
+_HASH_MEMO: "OrderedDict[tuple, tuple]" = OrderedDict()
+_HASH_MEMO_MAX_SIZE = 10000
+# Files changed more recently than the coarsest file system time resolution (FAT) are not remembered: they could be
+# changed again without changing their times
+_HASH_MEMO_MIN_AGE_NS = 2 * 1000 * 1000 * 1000
+_HASH_MEMO_LOCK = threading.Lock()
+
 
 def is_absolute_path(path: str) -> bool:
     """Check if the path is absolute or not"""
@@ -204,6 +244,9 @@ def get_new_hash(abs_in_path_str: str, abs_out_path_str: str, key: str = "src_ha
     If the current metadata file exists but the hash in the metadata is different than the current one,
     the hash is returned.
 
+    The input file is hashed with the algorithm of the hash in the metadata, so hashes written with another algorithm
+    stay valid. A new hash is always computed with the default algorithm.
+
     Args:
         abs_in_path_str: the input file
         abs_out_path_str: the output file
@@ -212,11 +255,14 @@ def get_new_hash(abs_in_path_str: str, abs_out_path_str: str, key: str = "src_ha
     Returns:
         A hash or none
     """
-    src_hash = hash_file(abs_in_path_str)
+    old_src_hash = read_metadata(abs_out_path_str, key)
+    algorithm = get_hash_algorithm(old_src_hash) if old_src_hash else None
+    src_hash = hash_file(abs_in_path_str, algorithm=algorithm)
     if src_hash is None:
         return None
-    old_src_hash = read_metadata(abs_out_path_str, key)
     if old_src_hash is None or src_hash != old_src_hash:
+        if algorithm is not None and algorithm != get_default_hash_algorithm():
+            src_hash = hash_file(abs_in_path_str)
         return src_hash
     return None
 
@@ -232,43 +278,146 @@ def hash_match_metadata(file_path: str, key: str = "src_hash") -> Optional[bool]
     Returns:
         True is the hash of the file match the one in the metadata
     """
-    src_hash = hash_file(file_path)
-    if src_hash is None:
-        return False
     old_src_hash = read_metadata(file_path, key)
-    if old_src_hash is None or src_hash != old_src_hash:
+    if old_src_hash is None:
+        return False
+    src_hash = hash_file(file_path, algorithm=get_hash_algorithm(old_src_hash))
+    if src_hash is None or src_hash != old_src_hash:
         return False
     return True
 
 
-def hash_file(file_path: str, block_size: int = 8192) -> typing.Optional[str]:
+def get_default_hash_algorithm() -> str:
+    """
+    Get the algorithm used to hash files, set with the `hashing/algorithm` setting of the extension
+
+    Returns:
+        The name of the algorithm
+    """
+    algorithm = carb.settings.get_settings().get(EXTS_HASHING_ALGORITHM)
+    if algorithm not in HASH_ALGORITHMS:
+        if algorithm:
+            carb.log_warn(f"Unsupported hash algorithm: {algorithm}. Using {_LEGACY_HASH_ALGORITHM} instead.")
+        return _LEGACY_HASH_ALGORITHM
+    return algorithm
+
+
+def get_hash_algorithm(file_hash: str) -> str:
+    """
+    Get the algorithm a hash was computed with
+
+    Args:
+        file_hash: a hash returned by `hash_file`
+
+    Returns:
+        The name of the algorithm
+    """
+    algorithm, separator, _ = str(file_hash).partition(":")
+    if separator and algorithm in HASH_ALGORITHMS:
+        return algorithm
+    return _LEGACY_HASH_ALGORITHM
+
+
+def hash_file(
+    file_path: str, block_size: int = _HASH_BLOCK_SIZE, algorithm: Optional[str] = None
+) -> typing.Optional[str]:
     """
     Generate a hash from the data in a file.
 
+    Hashes are remembered with the size, inode & times of the file, so an unchanged file is never read twice. Files
+    changed in the last 2 seconds are always read.
+
     Args:
         file_path: the json file path
         block_size: block size to read the file
+        algorithm: the algorithm to use, from `HASH_ALGORITHMS`. None to use the default algorithm.
 
     Returns:
-        string containing the md5 hexdigest of the passed in file's contents
+        string containing the hexdigest of the passed in file's contents, prefixed by the algorithm for algorithms
+        other than md5
     """
     file_path = carb.tokens.get_tokens_interface().resolve(file_path)
+    algorithm = algorithm or get_default_hash_algorithm()
     new_hash = None
     try:
-        m = hashlib.md5()
-        with open(file_path, "rb") as asset_file:
+        stat = os.stat(file_path)
+        memo_key = (os.path.abspath(file_path), algorithm)
+        memo_stat = (stat.st_size, stat.st_mtime_ns, stat.st_ino, stat.st_ctime_ns)
+        with _HASH_MEMO_LOCK:
+            memo = _HASH_MEMO.get(memo_key)
+            if memo and memo[:4] == memo_stat:
+                _HASH_MEMO.move_to_end(memo_key)
+                return memo[4]
+
+        m = HASH_ALGORITHMS[algorithm]()
+        # Read in a reusable buffer: hashlib releases the GIL for large updates, so files can be hashed in parallel
+        buffer = bytearray(block_size)
+        view = memoryview(buffer)
+        with open(file_path, "rb", buffering=0) as asset_file:
             while True:
-                buf = asset_file.read(block_size)
-                if not buf:
+                size = asset_file.readinto(buffer)
+                if not size:
                     break
-                m.update(buf)
+                m.update(view[:size])
         new_hash = m.hexdigest()
+        if algorithm != _LEGACY_HASH_ALGORITHM:
+            new_hash = f"{algorithm}:{new_hash}"
+
+        if time.time_ns() - max(stat.st_mtime_ns, stat.st_ctime_ns) >= _HASH_MEMO_MIN_AGE_NS:
+            with _HASH_MEMO_LOCK:
+                _HASH_MEMO[memo_key] = (*memo_stat, new_hash)
+                _HASH_MEMO.move_to_end(memo_key)
+                while len(_HASH_MEMO) > _HASH_MEMO_MAX_SIZE:
+                    _HASH_MEMO.popitem(last=False)
 
     except OSError:
         carb.log_error(f"Error opening asset file for hashing: {file_path}.")
     return new_hash
 
 
+def hash_files(
+    file_paths: Iterable[str], algorithm: Optional[str] = None, max_workers: Optional[int] = None
+) -> Dict[str, Optional[str]]:
+    """
+    Generate the hashes of multiple files in parallel. See `hash_file`.
+
+    Args:
+        file_paths: the files to hash
+        algorithm: the algorithm to use, from `HASH_ALGORITHMS`. None to use the default algorithm.
+        max_workers: the maximum number of files hashed at the same time. None to use the executor default.
+
+    Returns:
+        The hash of every file, or None for the files that couldn't be read
+    """
+    file_paths = list(dict.fromkeys(file_paths))
+    if len(file_paths) <= 1:
+        return {file_path: hash_file(file_path, algorithm=algorithm) for file_path in file_paths}
+    algorithm = algorithm or get_default_hash_algorithm()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="FluxHashFiles") as executor:
+        hashes = executor.map(lambda file_path: hash_file(file_path, algorithm=algorithm), file_paths)
+        return dict(zip(file_paths, hashes))
+
+
+def _get_file_metadata_store(file_path: Path, create: bool) -> Optional[_MetadataStore]:
+    store = _get_metadata_store(file_path.parent, create=create)
+    if store is not None:
+        store.ensure_sidecar_imported(file_path.name)
+    return store
+
+
+def _set_metadata_value(data: typing.Dict[str, typing.Any], key: str, value: typing.Any, append: bool):
+    if append:
+        if key in data:
+            if isinstance(data[key], list):
+                data[key].append(value)
+            else:
+                data[key] = [data[key], value]
+        else:
+            data[key] = [value]
+    else:
+        data[key] = value
+
+
 def delete_metadata(file_path: str, key: str):
     """
     Delete a specific metadata key from a file
@@ -281,7 +430,11 @@ def delete_metadata(file_path: str, key: str):
         None
     """
     file_path_p = Path(carb.tokens.get_tokens_interface().resolve(file_path))
-    file_path = file_path_p.with_suffix(file_path_p.suffix + ".meta")
+    store = _get_file_metadata_store(file_path_p, create=False)
+    if store is not None:
+        store.delete(file_path_p.name, key)
+        return
+    file_path = file_path_p.with_suffix(file_path_p.suffix + _METADATA_SIDECAR_SUFFIX)
     if file_path.exists():
         data = read_json_file(str(file_path))
         if key in data:
@@ -302,24 +455,40 @@ def write_metadata(file_path: str, key: str, value: typing.Any, append: bool = F
     Returns:
         None
     """
-    file_path_p = Path(carb.tokens.get_tokens_interface().resolve(file_path))
-    file_path = file_path_p.with_suffix(file_path_p.suffix + ".meta")
-    file_path_str = str(file_path)
-    if file_path.exists():
-        data = read_json_file(file_path_str)
-        if append:
-            if key in data:
-                if isinstance(data[key], list):
-                    data[key].append(value)
-                else:
-                    data[key] = [data[key], value]
-            else:
-                data[key] = [value]
-        else:
-            data[key] = value
-        write_json_file(file_path_str, data)
-    else:
-        write_json_file(file_path_str, {key: [value]} if append else {key: value})
+    write_metadata_batch([(file_path, key, value)], append=append)
+
+
+def write_metadata_batch(items: Iterable[Tuple[str, str, typing.Any]], append: bool = False):
+    """
+    Write many metadata keys at once. The metadata of every file is read & written only once, and the keys stored in a
+    metadata store are written in a single transaction per directory.
+
+    Args:
+        items: the file paths (not the metadata files), keys and values to write
+        append: whether the values should be appended to lists or overwritten if they already exist
+
+    Returns:
+        None
+    """
+    files: Dict[Path, List[Tuple[str, typing.Any]]] = {}
+    for file_path, key, value in items:
+        file_path_p = Path(carb.tokens.get_tokens_interface().resolve(str(file_path)))
+        files.setdefault(file_path_p, []).append((key, value))
+
+    stores: Dict[_MetadataStore, List[Tuple[str, str, typing.Any]]] = {}
+    for file_path_p, values in files.items():
+        store = _get_file_metadata_store(file_path_p, create=True)
+        if store is not None:
+            stores.setdefault(store, []).extend((file_path_p.name, key, value) for key, value in values)
+            continue
+        metadata_path = file_path_p.with_suffix(file_path_p.suffix + _METADATA_SIDECAR_SUFFIX)
+        data = read_json_file(str(metadata_path)) if metadata_path.exists() else {}
+        for key, value in values:
+            _set_metadata_value(data, key, value, append)
+        write_json_file(str(metadata_path), data)
+
+    for store, store_items in stores.items():
+        store.write_many(store_items, append=append)
 
 
 def read_metadata(file_path: str, key: str) -> typing.Optional[typing.Any]:
@@ -334,7 +503,10 @@ def read_metadata(file_path: str, key: str) -> typing.Optional[typing.Any]:
         The value of the key
     """
     file_path_p = Path(carb.tokens.get_tokens_interface().resolve(file_path))
-    file_path = file_path_p.with_suffix(file_path_p.suffix + ".meta")
+    store = _get_file_metadata_store(file_path_p, create=False)
+    if store is not None:
+        return store.read(file_path_p.name, key)[1]
+    file_path = file_path_p.with_suffix(file_path_p.suffix + _METADATA_SIDECAR_SUFFIX)
     if file_path.exists():
         data = read_json_file(str(file_path))
         if key in data:
@@ -342,6 +514,78 @@ def read_metadata(file_path: str, key: str) -> typing.Optional[typing.Any]:
     return None
 
 
+def read_metadata_batch(file_paths: Iterable[str], key: str) -> Dict[str, typing.Any]:
+    """
+    Read a metadata key for many files. The keys stored in a metadata store are read with a single query per
+    directory.
+
+    Args:
+        file_paths: the file paths to read the metadata for (not the metadata files)
+        key: the key to read
+
+    Returns:
+        The value of the key for every file path, None if the file has no value for the key
+    """
+    result = {}
+    stores: Dict[_MetadataStore, Dict[str, str]] = {}
+    for file_path in file_paths:
+        file_path_p = Path(carb.tokens.get_tokens_interface().resolve(str(file_path)))
+        store = _get_file_metadata_store(file_path_p, create=False)
+        if store is not None:
+            stores.setdefault(store, {})[file_path_p.name] = file_path
+            continue
+        result[file_path] = read_metadata(str(file_path), key)
+
+    for store, store_files in stores.items():
+        values = store.read_many(store_files, key)
+        for file_name, file_path in store_files.items():
+            result[file_path] = values.get(file_name)
+    return result
+
+
+def copy_metadata(source_file_path: str, destination_file_path: str):
+    """
+    Copy all the metadata of a file to another file. The metadata of the destination is replaced.
+
+    Args:
+        source_file_path: the file path to copy the metadata from (not the metadata file)
+        destination_file_path: the file path to copy the metadata to (not the metadata file)
+
+    Returns:
+        None
+    """
+    source_path = Path(carb.tokens.get_tokens_interface().resolve(source_file_path))
+    source_store = _get_file_metadata_store(source_path, create=False)
+    if source_store is not None:
+        data = source_store.read_all(source_path.name)
+    else:
+        metadata_path = source_path.with_suffix(source_path.suffix + _METADATA_SIDECAR_SUFFIX)
+        data = read_json_file(str(metadata_path)) if metadata_path.exists() else {}
+
+    destination_path = Path(carb.tokens.get_tokens_interface().resolve(destination_file_path))
+    destination_store = _get_file_metadata_store(destination_path, create=True)
+    if destination_store is not None:
+        with destination_store.transaction():
+            destination_store.delete(destination_path.name)
+            destination_store.write_many((destination_path.name, key, value) for key, value in data.items())
+        return
+    write_json_file(str(destination_path.with_suffix(destination_path.suffix + _METADATA_SIDECAR_SUFFIX)), data)
+
+
+def is_metadata_file(file_path: typing.Union[_OmniUrl, Path, str]) -> bool:
+    """
+    Tell if a file is used to store metadata: a `.meta` sidecar file or a metadata store database
+
+    Args:
+        file_path: the file path to check
+
+    Returns:
+        True if the file stores metadata
+    """
+    name = _OmniUrl(file_path).name
+    return name.endswith(_METADATA_SIDECAR_SUFFIX) or name.startswith(_METADATA_STORE_FILE_NAME)
+
+
 def cleanup_file(file_path: typing.Union[_OmniUrl, Path, str]):
     """
     Cleanup/delete a file + his metadata file
@@ -350,11 +594,17 @@ def cleanup_file(file_path: typing.Union[_OmniUrl, Path, str]):
         file_path: the file to delete/cleanup
     """
     file_url = _OmniUrl(file_path)
-    meta_file_url = file_url.with_suffix(file_url.suffix + ".meta")
+    meta_file_url = file_url.with_suffix(file_url.suffix + _METADATA_SIDECAR_SUFFIX)
 
     # Cleanup the file
     file_url.delete()
 
+    # Cleanup the metadata store entries if the metadata is stored in a database
+    file_path_p = Path(file_url.path)
+    store = _get_metadata_store(file_path_p.parent, create=False)
+    if store is not None:
+        store.delete(file_path_p.name)
+
     # Cleanup the meta file if it exists
     if meta_file_url.exists:
         meta_file_url.delete()
@@ -376,9 +626,91 @@ def is_udim_texture(file_path: typing.Union[_OmniUrl, Path, str]) -> bool:
     return False
 
 
+class UdimIndex:
+    """
+    An opt-in index of the UDIM tiles used by `get_udim_sequence`.
+
+    While the index is active, every directory is listed once and its UDIM tiles are grouped by texture, so getting the
+    tiles of a texture doesn't list the directory again.
+
+    Examples:
+        >>> with UdimIndex() as index:
+        >>>     tiles = [get_udim_sequence(p) for p in udim_paths]  # Each directory is only listed once
+        >>>     index.invalidate(output_directory)  # Invalidate a directory after writing files in it
+    """
+
+    # Each thread & asyncio task has its own stack of active indexes
+    _active_indexes: ContextVar[Tuple["UdimIndex", ...]] = ContextVar("active_udim_indexes", default=())
+
+    def __init__(self):
+        # Directory -> (texture prefix, texture suffix) -> tiles
+        self._directories: Dict[str, Dict[Tuple[str, str], List[str]]] = {}
+        self._tokens: List[Token] = []
+
+    def __enter__(self) -> "UdimIndex":
+        self._tokens.append(self._active_indexes.set(self._active_indexes.get() + (self,)))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._active_indexes.reset(self._tokens.pop())
+        self._directories.clear()
+
+    def __len__(self) -> int:
+        return len(self._directories)
+
+    @classmethod
+    def get_active(cls) -> Optional["UdimIndex"]:
+        """
+        Get the innermost active index, if any
+        """
+        active_indexes = cls._active_indexes.get()
+        return active_indexes[-1] if active_indexes else None
+
+    def get_sequence(self, file_path: typing.Union[_OmniUrl, Path, str]) -> List[str]:
+        """
+        Get the list of the textures from an UDIM path
+
+        Args:
+            file_path: the file path that contains <UDIM> or <UVTILE0> or <UVTILE1>
+
+        Returns:
+            The list of UDIM textures
+        """
+        file_url = _OmniUrl(file_path)
+        match = _REGEX_UDIM_GROUP_UV_TILE.match(str(file_url))
+        if not match:
+            return []
+        key = self._get_key(str(file_url).replace("\\", "/").rpartition("/")[0])
+        tiles = self._directories.get(key)
+        if tiles is None:
+            tiles = {}
+            for file in _OmniUrl(file_url.parent_url).iterdir():
+                tile_match = _REGEX_UDIM_GROUP_NUMBERS.match(str(file))
+                if tile_match and int(tile_match.group(2)) >= 1001:
+                    tiles.setdefault((tile_match.group(1), tile_match.group(3)), []).append(str(file))
+            self._directories[key] = tiles
+        return list(tiles.get((match.group(1), match.group(3)), []))
+
+    def invalidate(self, directory: Optional[typing.Union[_OmniUrl, Path, str]] = None):
+        """
+        Invalidate the indexed directories.
+
+        Args:
+            directory: The directory to invalidate. If None, the whole index is invalidated.
+        """
+        if directory is None:
+            self._directories.clear()
+            return
+        self._directories.pop(self._get_key(directory), None)
+
+    @staticmethod
+    def _get_key(directory: typing.Union[_OmniUrl, Path, str]) -> str:
+        return str(directory).replace("\\", "/").rstrip("/")
+
+
 def get_udim_sequence(file_path: typing.Union[_OmniUrl, Path, str]) -> List[str]:
     """
-    Get the list of the textures from an UDIM path
+    Get the list of the textures from an UDIM path. If a `UdimIndex` is active, the indexed tiles will be used.
 
     Args:
         file_path: the file path that contains <UDIM> or <UVTILE0> or <UVTILE1>
@@ -388,6 +720,9 @@ def get_udim_sequence(file_path: typing.Union[_OmniUrl, Path, str]) -> List[str]
     """
     result = []
     if is_udim_texture(file_path):
+        index = UdimIndex.get_active()
+        if index is not None:
+            return index.get_sequence(file_path)
         file_url = _OmniUrl(file_path)
         match0 = _REGEX_UDIM_GROUP_UV_TILE.match(str(file_url))
         for file in _OmniUrl(file_url.parent_url).iterdir():
@@ -0,0 +1,99 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["StageIndex", "StageIndexRegistry"]
+
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+from pxr import Usd
+
+
+class StageIndex:
+    def __init__(self, stage: Usd.Stage):
+        """
+        Base class of the indexes built for a stage.
+
+        The index doesn't keep the stage alive: it only holds the pseudo-root prim of the stage, which expires with it.
+
+        Args:
+            stage: the indexed stage
+        """
+        self._pseudo_root = stage.GetPseudoRoot()
+
+    @property
+    def stage(self) -> Optional[Usd.Stage]:
+        """The indexed stage or None if the stage was closed"""
+        if not self._pseudo_root.IsValid():
+            return None
+        return self._pseudo_root.GetStage()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the indexed stage was closed"""
+        return not self._pseudo_root.IsValid()
+
+    def destroy(self):
+        """Release the resources of the index, like the stage listeners"""
+
+
+T = TypeVar("T", bound=StageIndex)
+
+
+class StageIndexRegistry(Generic[T]):
+    def __init__(self, create_index: Callable[[Usd.Stage], T]):
+        """
+        Keep one index per stage without keeping the stages alive.
+
+        The indexes are keyed by the pseudo-root prim of their stage, so the indexes of closed stages are destroyed on
+        the next lookup.
+
+        Args:
+            create_index: create the index of a stage
+        """
+        self._create_index = create_index
+        self._indexes: Dict[Usd.Prim, T] = {}
+
+    def get(self, stage: Usd.Stage) -> Optional[T]:
+        """
+        Get the index of a stage, creating it on the first call.
+
+        Args:
+            stage: the indexed stage
+
+        Returns:
+            The index of the stage or None if the stage is not valid
+        """
+        if not stage:
+            return None
+        self.purge()
+        key = stage.GetPseudoRoot()
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._create_index(stage)
+            self._indexes[key] = index
+        return index
+
+    def purge(self):
+        """Destroy the indexes of the closed stages"""
+        for key in [key for key, index in self._indexes.items() if index.expired]:
+            self._indexes.pop(key).destroy()
+
+    def clear(self):
+        """Destroy all the indexes"""
+        for index in self._indexes.values():
+            index.destroy()
+        self._indexes.clear()
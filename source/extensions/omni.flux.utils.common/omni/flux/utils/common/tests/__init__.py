@@ -15,9 +15,13 @@
 * limitations under the License.
 """
 
+from .unit.test_conversion_cache import TestConversionCache
+from .unit.test_conversion_scheduler import TestConversionScheduler
 from .unit.test_decorators import TestLimitRecursion
 from .unit.test_layer_utils import TestLayerUtils
+from .unit.test_metadata_store import TestMetadataStore
 from .unit.test_omni_url import TestOmniUrl
 from .unit.test_path_utils import TestPathUtils
 from .unit.test_serialize import TestSerializer
+from .unit.test_stage_index import TestStageIndex
 from .unit.test_symlink import TestSymlink
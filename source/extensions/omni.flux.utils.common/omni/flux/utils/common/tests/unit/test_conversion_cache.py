@@ -0,0 +1,163 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import omni.kit.test
+from omni.flux.utils.common.conversion_cache import ConversionCache as _ConversionCache
+from omni.flux.utils.common.conversion_cache import run_cached_conversion as _run_cached_conversion
+
+
+class TestConversionCache(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.cache = _ConversionCache(self.temp_path / "cache")
+
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, content: bytes) -> Path:
+        path = self.temp_path / name
+        path.write_bytes(content)
+        return path
+
+    async def test_get_key_should_depend_on_source_and_parameters(self):
+        # Act
+        key = self.cache.get_key("hash", "nvtt_export", ["--format", "bc7"])
+
+        # Assert
+        self.assertEqual(key, self.cache.get_key("hash", "nvtt_export", ["--format", "bc7"]))
+        self.assertNotEqual(key, self.cache.get_key("other_hash", "nvtt_export", ["--format", "bc7"]))
+        self.assertNotEqual(key, self.cache.get_key("hash", "nvtt_export", ["--format", "bc5"]))
+        self.assertNotEqual(key, self.cache.get_key("hash", "octahedral_dx", ["--format", "bc7"]))
+
+    async def test_fetch_stored_file_should_write_output(self):
+        for use_hard_links in (True, False):
+            with self.subTest(use_hard_links=use_hard_links):
+                # Arrange
+                cache = _ConversionCache(self.temp_path / f"cache_{use_hard_links}", use_hard_links=use_hard_links)
+                converted = self._write("converted.dds", b"converted")
+                out_path = self.temp_path / f"out_{use_hard_links}.dds"
+                self.assertTrue(cache.store("key", converted))
+
+                # Act
+                value = cache.fetch("key", out_path)
+
+                # Assert
+                self.assertTrue(value)
+                self.assertEqual(b"converted", out_path.read_bytes())
+
+    async def test_fetch_missing_entry_should_return_false(self):
+        # Act
+        value = self.cache.fetch("missing", self.temp_path / "out.dds")
+
+        # Assert
+        self.assertFalse(value)
+        self.assertFalse((self.temp_path / "out.dds").exists())
+
+    async def test_fetch_corrupted_entry_should_remove_entry(self):
+        # Arrange
+        self.cache.store("key", self._write("converted.dds", b"converted"))
+        entry = next(path for path in self.cache.root.rglob("key"))
+        entry.write_bytes(b"corrupted")
+
+        # Act
+        value = self.cache.fetch("key", self.temp_path / "out.dds")
+
+        # Assert
+        self.assertFalse(value)
+        self.assertFalse(entry.exists())
+        self.assertFalse((self.temp_path / "out.dds").exists())
+
+    async def test_store_over_max_size_should_evict_least_recently_used(self):
+        # Arrange
+        cache = _ConversionCache(self.temp_path / "cache_max", max_size=30)
+        for index, key in enumerate(["old", "middle", "new"]):
+            cache.store(key, self._write(f"{key}.dds", b"0123456789"))
+            # Make the entries older than the next ones
+            metadata_path = next(cache.root.rglob(f"{key}.json"))
+            os.utime(metadata_path, (index, index))
+        # Use the oldest entry so it is not the least recently used anymore
+        cache.fetch("old", self.temp_path / "out.dds")
+
+        # Act
+        cache.store("newest", self._write("newest.dds", b"0123456789"))
+
+        # Assert
+        self.assertEqual(30, cache.get_size())
+        self.assertFalse(cache.fetch("middle", self.temp_path / "out.dds"))
+        for key in ["old", "new", "newest"]:
+            self.assertTrue(cache.fetch(key, self.temp_path / "out.dds"))
+
+    async def test_fetch_unchanged_entry_should_not_hash_or_touch_entry(self):
+        # Arrange
+        out_path = self.temp_path / "out.dds"
+        self.cache.store("key", self._write("converted.dds", b"converted"))
+        entry = next(path for path in self.cache.root.rglob("key"))
+        os.utime(entry, ns=(0, 0))
+        self.cache.fetch("key", out_path)
+
+        # Act
+        with patch(
+            "omni.flux.utils.common.conversion_cache._hash_file", side_effect=AssertionError("Should not hash")
+        ):
+            value = self.cache.fetch("key", out_path)
+
+        # Assert
+        self.assertTrue(value)
+        self.assertEqual(0, entry.stat().st_mtime_ns)
+        self.assertEqual(b"converted", out_path.read_bytes())
+
+    async def test_break_hard_link_should_not_change_entry(self):
+        # Arrange
+        out_path = self.temp_path / "out.dds"
+        self.cache.store("key", self._write("converted.dds", b"converted"))
+        self.cache.fetch("key", out_path)
+
+        # Act
+        self.cache.break_hard_link(out_path)
+        out_path.write_bytes(b"overwritten")
+
+        # Assert
+        other_path = self.temp_path / "other.dds"
+        self.assertTrue(self.cache.fetch("key", other_path))
+        self.assertEqual(b"converted", other_path.read_bytes())
+
+    async def test_run_cached_conversion_should_only_convert_once(self):
+        # Arrange
+        out_path = self.temp_path / "out.dds"
+        calls = []
+
+        async def convert():
+            calls.append(True)
+            out_path.write_bytes(b"converted")
+            return "result"
+
+        # Act
+        first = await _run_cached_conversion(self.cache, "key", out_path, convert)
+        out_path.unlink()
+        second = await _run_cached_conversion(self.cache, "key", out_path, convert)
+
+        # Assert
+        self.assertEqual((False, "result"), first)
+        self.assertEqual((True, None), second)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(b"converted", out_path.read_bytes())
@@ -0,0 +1,162 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import asyncio
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import omni.kit.test
+from omni.flux.utils.common import conversion_scheduler as _conversion_scheduler
+from omni.flux.utils.common.conversion_scheduler import ConversionScheduler as _ConversionScheduler
+
+
+class TestConversionScheduler(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.scheduler = _ConversionScheduler(max_workers=1)
+
+    async def tearDown(self):
+        self.scheduler.shutdown()
+
+    async def test_max_workers_auto_should_be_limited_by_cpus_and_memory(self):
+        # Arrange
+        gigabyte = 1024 * 1024 * 1024
+        values = [(32, 64 * gigabyte, 32), (32, 6 * gigabyte, 6), (32, None, 32), (4, 0, 1)]
+
+        for cpu_count, memory, expected in values:
+            with (
+                self.subTest(cpu_count=cpu_count, memory=memory),
+                patch("os.cpu_count", return_value=cpu_count),
+                patch(
+                    "omni.flux.utils.common.conversion_scheduler.get_available_memory",
+                    return_value=memory,
+                ),
+            ):
+                # Act
+                scheduler = _ConversionScheduler(memory_per_worker_mb=1024)
+
+                # Assert
+                self.assertEqual(expected, scheduler.max_workers)
+
+    async def test_get_available_memory_linux_should_read_meminfo(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            meminfo_path = Path(temp_dir) / "meminfo"
+            fallback = 4 * 1024 * 1024
+            values = [
+                ("MemTotal:       16384 kB\nMemFree:          1024 kB\nMemAvailable:     8192 kB\n", 8192 * 1024),
+                ("MemTotal:       16384 kB\nMemFree:          1024 kB\n", fallback),
+                (None, fallback),
+            ]
+
+            for content, expected in values:
+                if content is None:
+                    meminfo_path.unlink()
+                else:
+                    meminfo_path.write_text(content, encoding="utf-8")
+                with (
+                    self.subTest(content=content),
+                    patch.object(sys, "platform", "linux"),
+                    patch.object(_conversion_scheduler, "_MEMINFO_PATH", str(meminfo_path)),
+                    patch("os.sysconf", side_effect=lambda name: 1024 if name == "SC_AVPHYS_PAGES" else 4096),
+                ):
+                    # Act
+                    value = _conversion_scheduler.get_available_memory()
+
+                    # Assert
+                    self.assertEqual(expected, value)
+
+    async def test_run_should_return_result(self):
+        # Act
+        value = await self.scheduler.run(lambda a, b=0: a + b, 1, b=2)
+
+        # Assert
+        self.assertEqual(3, value)
+
+    async def test_run_should_raise_exception(self):
+        # Arrange
+        def func():
+            raise ValueError("Test")
+
+        # Act
+        with self.assertRaises(ValueError):
+            await self.scheduler.run(func)
+
+    async def test_submit_should_start_highest_priority_first(self):
+        # Arrange
+        started = threading.Event()
+        release = threading.Event()
+        order = []
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        blocking = self.scheduler.submit(block)
+        await asyncio.get_event_loop().run_in_executor(None, started.wait, 5)
+
+        # Act
+        futures = [
+            self.scheduler.submit(order.append, "low", priority=-1),
+            self.scheduler.submit(order.append, "default"),
+            self.scheduler.submit(order.append, "high", priority=10),
+            self.scheduler.submit(order.append, "default 2"),
+        ]
+        release.set()
+        await asyncio.gather(blocking, *futures)
+
+        # Assert
+        self.assertEqual(["high", "default", "default 2", "low"], order)
+
+    async def test_cancelled_job_should_not_run(self):
+        # Arrange
+        started = threading.Event()
+        release = threading.Event()
+        order = []
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        blocking = self.scheduler.submit(block)
+        await asyncio.get_event_loop().run_in_executor(None, started.wait, 5)
+
+        # Act
+        cancelled = self.scheduler.submit(order.append, "cancelled")
+        other = self.scheduler.submit(order.append, "other")
+        cancelled.cancel()
+        release.set()
+        await asyncio.gather(blocking, other)
+
+        # Assert
+        self.assertEqual(["other"], order)
+
+    async def test_run_process_should_return_output(self):
+        # Act
+        result = await self.scheduler.run_process([sys.executable, "-c", "print('hello')"])
+
+        # Assert
+        self.assertEqual(0, result.returncode)
+        self.assertEqual("hello", result.stdout.strip())
+
+    async def test_run_process_failed_should_raise_called_process_error(self):
+        # Act
+        with self.assertRaises(subprocess.CalledProcessError):
+            await self.scheduler.run_process([sys.executable, "-c", "import sys; sys.exit(3)"])
@@ -0,0 +1,127 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import omni.kit.test
+from omni.flux.utils.common import path_utils as _path_utils
+from omni.flux.utils.common.metadata_store import MetadataStore as _MetadataStore
+from omni.flux.utils.common.metadata_store import close_metadata_stores as _close_metadata_stores
+from omni.flux.utils.common.metadata_store import get_metadata_store as _get_metadata_store
+
+
+class TestMetadataStore(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.store = _MetadataStore(self.temp_path)
+
+    async def tearDown(self):
+        self.store.close()
+        _close_metadata_stores()
+        self.temp_dir.cleanup()
+
+    async def test_write_read_should_keep_values(self):
+        # Act
+        self.store.write("texture.dds", "src_hash", "12345")
+        self.store.write("texture.dds", "fixes", "fix_a", append=True)
+        self.store.write("texture.dds", "fixes", "fix_b", append=True)
+
+        # Assert
+        self.assertEqual((True, "12345"), self.store.read("texture.dds", "src_hash"))
+        self.assertEqual((False, None), self.store.read("texture.dds", "missing"))
+        self.assertEqual({"src_hash": "12345", "fixes": ["fix_a", "fix_b"]}, self.store.read_all("texture.dds"))
+
+    async def test_read_many_should_return_existing_values(self):
+        # Arrange
+        self.store.write_many((f"texture_{index}.dds", "src_hash", index) for index in range(1000))
+
+        # Act
+        values = self.store.read_many([f"texture_{index}.dds" for index in range(0, 1200, 2)], "src_hash")
+
+        # Assert
+        self.assertEqual({f"texture_{index}.dds": index for index in range(0, 1000, 2)}, values)
+
+    async def test_failed_transaction_should_not_write(self):
+        # Act
+        with self.assertRaises(ValueError):
+            with self.store.transaction():
+                self.store.write("texture.dds", "src_hash", "12345")
+                raise ValueError("Test")
+
+        # Assert
+        self.assertEqual((False, None), self.store.read("texture.dds", "src_hash"))
+
+    async def test_import_export_sidecars_should_keep_metadata(self):
+        # Arrange
+        (self.temp_path / "texture.dds.meta").write_text(json.dumps({"src_hash": "12345", "validation": True}))
+        self.store.write("texture.dds", "src_hash", "67890")
+
+        # Act
+        imported = self.store.import_sidecars(remove=True)
+
+        # Assert
+        self.assertEqual(1, imported)
+        self.assertFalse((self.temp_path / "texture.dds.meta").exists())
+        self.assertEqual({"src_hash": "67890", "validation": True}, self.store.read_all("texture.dds"))
+
+        # Act
+        exported = self.store.export_sidecars()
+
+        # Assert
+        self.assertEqual(1, exported)
+        self.assertEqual(
+            {"src_hash": "67890", "validation": True},
+            json.loads((self.temp_path / "texture.dds.meta").read_text()),
+        )
+
+    async def test_path_utils_enabled_store_should_replace_sidecars(self):
+        # Arrange
+        (self.temp_path / "legacy.dds.meta").write_text(json.dumps({"src_hash": "legacy"}))
+        paths = [str(self.temp_path / name) for name in ("texture.dds", "legacy.dds", "missing.dds")]
+
+        with patch("omni.flux.utils.common.metadata_store.is_metadata_store_enabled", return_value=True):
+            # Act
+            _path_utils.write_metadata_batch([(paths[0], "src_hash", "12345"), (paths[0], "validation", True)])
+            values = _path_utils.read_metadata_batch(paths, "src_hash")
+
+            # Assert
+            self.assertEqual({paths[0]: "12345", paths[1]: "legacy", paths[2]: None}, values)
+            self.assertTrue(_path_utils.read_metadata(paths[0], "validation"))
+            self.assertFalse((self.temp_path / "texture.dds.meta").exists())
+            self.assertTrue(_path_utils.is_metadata_file(self.temp_path / "legacy.dds.meta"))
+
+    async def test_close_metadata_stores_should_only_close_directory_stores(self):
+        # Arrange
+        (self.temp_path / "textures" / "sub").mkdir(parents=True)
+        (self.temp_path / "textures_other").mkdir()
+
+        with patch("omni.flux.utils.common.metadata_store.is_metadata_store_enabled", return_value=True):
+            store = _get_metadata_store(self.temp_path / "textures")
+            sub_store = _get_metadata_store(self.temp_path / "textures" / "sub")
+            other_store = _get_metadata_store(self.temp_path / "textures_other")
+
+            # Act
+            _close_metadata_stores(self.temp_path / "textures")
+
+            # Assert
+            self.assertIsNot(store, _get_metadata_store(self.temp_path / "textures"))
+            self.assertIsNot(sub_store, _get_metadata_store(self.temp_path / "textures" / "sub"))
+            self.assertIs(other_store, _get_metadata_store(self.temp_path / "textures_other"))
@@ -15,10 +15,15 @@
 * limitations under the License.
 """
 
+import asyncio
+import threading
+import time
 from pathlib import Path
+from unittest.mock import patch
 
+import omni.client
 import omni.kit.test
-from omni.flux.utils.common.omni_url import OmniUrl
+from omni.flux.utils.common.omni_url import OmniUrl, StatCache, exists_urls_async, stat_urls_async
 from omni.kit.test_suite.helpers import get_test_data_path
 
 
@@ -356,3 +361,119 @@ class TestOmniUrl(omni.kit.test.AsyncTestCase):
         self.assertEquals(OmniUrl(r"/path/to/my_file.usd").with_suffix(""), OmniUrl(r"/path/to/my_file"))
         self.assertEquals(OmniUrl(r"./path/to/my_file.usd").with_suffix(""), OmniUrl(r"path/to/my_file"))
         self.assertEquals(OmniUrl(r"../path/to/my_file.usd").with_suffix(""), OmniUrl(r"../path/to/my_file"))
+
+    async def test_stat_cache_should_only_stat_each_url_once(self):
+        # Arrange
+        local_path = Path(get_test_data_path(__name__))
+
+        with patch.object(omni.client, "stat", wraps=omni.client.stat) as stat_mock:
+            # Act
+            with StatCache() as cache:
+                for _ in range(3):
+                    self.assertTrue(OmniUrl(local_path / "file.txt").exists)
+                    self.assertTrue(OmniUrl(local_path / "file.txt").is_file)
+                    self.assertFalse(OmniUrl(local_path / "nofile.txt").exists)
+                cached_count = len(cache)
+
+            # Outside the scope, the cache should not be used anymore
+            self.assertTrue(OmniUrl(local_path / "file.txt").exists)
+
+        # Assert
+        self.assertEqual(2, cached_count)
+        self.assertEqual(3, stat_mock.call_count)
+        self.assertIsNone(StatCache.get_active())
+
+    async def test_stat_cache_should_only_be_active_in_its_thread_and_task(self):
+        # Arrange
+        thread_caches = []
+        task_started = asyncio.Event()
+        task_can_finish = asyncio.Event()
+
+        async def use_other_cache():
+            with StatCache() as other_cache:
+                task_started.set()
+                await task_can_finish.wait()
+                return StatCache.get_active() is other_cache
+
+        # Act
+        other_task = asyncio.ensure_future(use_other_cache())
+        await task_started.wait()
+        with StatCache() as cache:
+            thread = threading.Thread(target=lambda: thread_caches.append(StatCache.get_active()))
+            thread.start()
+            thread.join()
+            active_cache = StatCache.get_active()
+            task_can_finish.set()
+            other_task_result = await other_task
+
+        # Assert
+        self.assertEqual([None], thread_caches)
+        self.assertIs(cache, active_cache)
+        self.assertTrue(other_task_result)
+        self.assertIsNone(StatCache.get_active())
+
+    async def test_stat_cache_ttl_should_expire_results(self):
+        # Arrange
+        url = OmniUrl(Path(get_test_data_path(__name__)) / "file.txt")
+
+        with StatCache(ttl=0.01) as cache:
+            cache.set(url, url.stat())
+
+            # Act
+            time.sleep(0.02)
+            val = cache.get(url)
+
+        # Assert
+        self.assertIsNone(val)
+
+    async def test_stat_cache_invalidate_should_remove_url_and_children(self):
+        # Arrange
+        local_path = Path(get_test_data_path(__name__))
+        directory_url = OmniUrl(local_path)
+        file_url = OmniUrl(local_path / "file.txt")
+
+        with StatCache() as cache:
+            cache.set(directory_url, directory_url.stat())
+            cache.set(file_url, file_url.stat())
+
+            # Act
+            cache.invalidate(directory_url)
+
+            # Assert
+            self.assertIsNone(cache.get(directory_url))
+            self.assertIsNone(cache.get(file_url))
+
+    async def test_stat_urls_async_should_list_shared_directories_once(self):
+        # Arrange
+        local_path = Path(get_test_data_path(__name__))
+        urls = [str(OmniUrl(local_path / name)) for name in ["file.txt", "my_file.usd", "nofile.txt"]]
+
+        with (
+            patch.object(omni.client, "list_async", wraps=omni.client.list_async) as list_mock,
+            patch.object(omni.client, "stat_async", wraps=omni.client.stat_async) as stat_mock,
+        ):
+            with StatCache() as cache:
+                # Act
+                val = await exists_urls_async(urls)
+
+                # Assert
+                self.assertEqual(3, len(cache))
+
+        self.assertDictEqual({urls[0]: True, urls[1]: True, urls[2]: False}, val)
+        self.assertEqual(1, list_mock.call_count)
+        # The missing file is stat'ed to make sure it's not a case mismatch
+        self.assertEqual(1, stat_mock.call_count)
+
+    async def test_stat_urls_async_missing_parent_should_not_stat_children(self):
+        # Arrange
+        local_path = Path(get_test_data_path(__name__)) / "nodir"
+        urls = [str(OmniUrl(local_path / name)) for name in ["file_0.txt", "file_1.txt"]]
+
+        with patch.object(omni.client, "stat_async", wraps=omni.client.stat_async) as stat_mock:
+            # Act
+            val = await stat_urls_async(urls)
+
+        # Assert
+        self.assertEqual(0, stat_mock.call_count)
+        for url in urls:
+            self.assertNotEqual(omni.client.Result.OK, val[url][0])
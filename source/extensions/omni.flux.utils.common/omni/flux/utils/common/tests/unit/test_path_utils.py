@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+import hashlib
 import json
 import os
 import tempfile
@@ -132,6 +133,97 @@ class TestPathUtils(omni.kit.test.AsyncTestCase):
             with tempfile.NamedTemporaryFile("w") as tmpfile:
                 self.assertTrue(_path_utils.hash_match_metadata(tmpfile.name))
 
+    async def test_hash_file_should_tag_algorithm(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "texture.png")
+            Path(file_path).write_bytes(b"content")
+
+            for algorithm, expected in {
+                "md5": hashlib.md5(b"content").hexdigest(),
+                "sha256": f"sha256:{hashlib.sha256(b'content').hexdigest()}",
+                "blake2b": f"blake2b:{hashlib.blake2b(b'content', digest_size=16).hexdigest()}",
+            }.items():
+                with self.subTest(name=f"hash_file_{algorithm}"):
+                    file_hash = _path_utils.hash_file(file_path, algorithm=algorithm)
+
+                    self.assertEqual(expected, file_hash)
+                    self.assertEqual(algorithm, _path_utils.get_hash_algorithm(file_hash))
+
+    async def test_hash_file_unchanged_file_should_not_be_read_again(self):
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            patch.object(_path_utils, "_HASH_MEMO_MIN_AGE_NS", 0),
+        ):
+            file_path = os.path.join(temp_dir, "texture.png")
+            Path(file_path).write_bytes(b"content")
+            file_hash = _path_utils.hash_file(file_path, algorithm="md5")
+
+            with patch("builtins.open", side_effect=AssertionError("The file should not be read")):
+                self.assertEqual(file_hash, _path_utils.hash_file(file_path, algorithm="md5"))
+
+            Path(file_path).write_bytes(b"new content")
+            self.assertEqual(hashlib.md5(b"new content").hexdigest(), _path_utils.hash_file(file_path, algorithm="md5"))
+
+    async def test_hash_file_rewritten_with_same_size_and_mtime_should_be_read_again(self):
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            patch.object(_path_utils, "_HASH_MEMO_MIN_AGE_NS", 0),
+        ):
+            file_path = os.path.join(temp_dir, "texture.png")
+            Path(file_path).write_bytes(b"content")
+            stat = os.stat(file_path)
+            _path_utils.hash_file(file_path, algorithm="md5")
+
+            # Same size & modification time, only the change time tells the file was written again
+            Path(file_path).write_bytes(b"CONTENT")
+            os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            self.assertEqual(hashlib.md5(b"CONTENT").hexdigest(), _path_utils.hash_file(file_path, algorithm="md5"))
+
+    async def test_hash_file_recently_changed_file_should_be_read_again(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "texture.png")
+            Path(file_path).write_bytes(b"content")
+            _path_utils.hash_file(file_path, algorithm="md5")
+
+            with patch("builtins.open", wraps=open) as open_mock:
+                file_hash = _path_utils.hash_file(file_path, algorithm="md5")
+
+            open_mock.assert_called_once()
+            self.assertEqual(hashlib.md5(b"content").hexdigest(), file_hash)
+
+    async def test_hash_match_metadata_should_use_metadata_algorithm(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "texture.png")
+            Path(file_path).write_bytes(b"content")
+
+            for algorithm in _path_utils.HASH_ALGORITHMS:
+                with self.subTest(name=f"hash_match_metadata_{algorithm}"):
+                    file_hash = _path_utils.hash_file(file_path, algorithm=algorithm)
+                    _path_utils.write_metadata(file_path, "src_hash", file_hash)
+
+                    self.assertTrue(_path_utils.hash_match_metadata(file_path))
+
+    async def test_hash_files_should_hash_all_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_paths = []
+            for index in range(8):
+                file_path = os.path.join(temp_dir, f"texture_{index}.png")
+                Path(file_path).write_bytes(f"content {index}".encode())
+                file_paths.append(file_path)
+            missing_path = os.path.join(temp_dir, "missing.png")
+
+            with patch.object(carb, "log_error"):
+                hashes = _path_utils.hash_files(file_paths + [missing_path], algorithm="md5")
+
+            self.assertEqual(
+                {
+                    **{path: hashlib.md5(f"content {i}".encode()).hexdigest() for i, path in enumerate(file_paths)},
+                    missing_path: None,
+                },
+                hashes,
+            )
+
     async def test_delete_metadata(self):
         with patch.object(_path_utils, "hash_file") as mock:
             hash_str = "fd32abf0d19be70ea063dd7e9b4706e5"
@@ -239,6 +331,34 @@ class TestPathUtils(omni.kit.test.AsyncTestCase):
                 ],
             )
 
+    async def test_get_udim_sequence_active_index_should_list_directory_once(self):
+        with patch.object(OmniUrl, "iterdir") as mock:
+            mock.return_value = [
+                "c:/toto.1001.png",
+                "c:/toto.1002.png",
+                "c:/toto.1001.dds",
+                "c:/tata.1001.png",
+                "c:/toto.png",
+            ]
+            with _path_utils.UdimIndex() as index:
+                self.assertEqual(
+                    _path_utils.get_udim_sequence("c:/toto.<UDIM>.png"), ["c:/toto.1001.png", "c:/toto.1002.png"]
+                )
+                self.assertEqual(_path_utils.get_udim_sequence("c:/toto.<UDIM>.dds"), ["c:/toto.1001.dds"])
+                self.assertEqual(_path_utils.get_udim_sequence("c:/tata.<UDIM>.png"), ["c:/tata.1001.png"])
+                self.assertEqual(_path_utils.get_udim_sequence("c:/titi.<UDIM>.png"), [])
+                self.assertEqual(1, mock.call_count)
+
+                mock.return_value = ["c:/toto.1001.png", "c:/toto.1002.png", "c:/toto.1003.png"]
+                index.invalidate("c:/")
+                self.assertEqual(
+                    _path_utils.get_udim_sequence("c:/toto.<UDIM>.png"),
+                    ["c:/toto.1001.png", "c:/toto.1002.png", "c:/toto.1003.png"],
+                )
+                self.assertEqual(2, mock.call_count)
+
+            self.assertIsNone(_path_utils.UdimIndex.get_active())
+
     async def test_texture_to_udim(self):
         for text_in, text_out in {
             "c:/toto.1001.png": "c:/toto.<UDIM>.png",
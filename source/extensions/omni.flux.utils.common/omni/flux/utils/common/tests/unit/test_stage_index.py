@@ -0,0 +1,74 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import gc
+
+import omni.kit.test
+from omni.flux.utils.common.stage_index import StageIndex as _StageIndex
+from omni.flux.utils.common.stage_index import StageIndexRegistry as _StageIndexRegistry
+from pxr import Usd
+
+
+class _FakeIndex(_StageIndex):
+    def __init__(self, stage: Usd.Stage):
+        super().__init__(stage)
+        self.destroyed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+
+class TestStageIndex(omni.kit.test.AsyncTestCase):
+    async def test_get_should_return_one_index_per_stage(self):
+        # Arrange
+        registry = _StageIndexRegistry(_FakeIndex)
+        stage = Usd.Stage.CreateInMemory()
+        other_stage = Usd.Stage.CreateInMemory()
+
+        # Act
+        index = registry.get(stage)
+        same_index = registry.get(stage.GetPseudoRoot().GetStage())
+        other_index = registry.get(other_stage)
+
+        # Assert
+        self.assertIs(index, same_index)
+        self.assertIsNot(index, other_index)
+        self.assertEqual(stage, index.stage)
+        self.assertIsNone(registry.get(None))
+
+        registry.clear()
+        self.assertTrue(index.destroyed)
+        self.assertTrue(other_index.destroyed)
+
+    async def test_get_should_not_keep_stages_alive(self):
+        # Arrange
+        registry = _StageIndexRegistry(_FakeIndex)
+        stage = Usd.Stage.CreateInMemory()
+        index = registry.get(stage)
+
+        # Act
+        del stage
+        gc.collect()
+        other_index = registry.get(Usd.Stage.CreateInMemory())
+
+        # Assert
+        self.assertTrue(index.expired)
+        self.assertIsNone(index.stage)
+        self.assertTrue(index.destroyed)
+        self.assertFalse(other_index.destroyed)
+
+        registry.clear()
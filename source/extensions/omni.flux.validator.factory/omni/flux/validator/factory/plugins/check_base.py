@@ -199,6 +199,11 @@ class Schema(_BaseSchema):
     resultor_plugins: Optional[List[_ResultorSchema]]
     stop_if_fix_failed: bool = False  # stop the whole process if the fix/auto fix failed
     pause_if_fix_failed: bool = True  # pause the whole process if the fix/auto fix failed
+    # Resources (like prim paths) the check reads and writes. Checks that access different resources can run at the
+    # same time. A check without reads and writes can access anything and never runs at the same time as other checks.
+    reads: Optional[List[str]] = None
+    writes: Optional[List[str]] = None
+    run_after: Optional[List[str]] = None  # names of the check plugins that must finish before this one starts
 
     @validator("selector_plugins", allow_reuse=True)
     def at_least_one(cls, v):  # noqa
@@ -19,8 +19,16 @@ __all__ = [
     "EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST",
     "EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT",
     "EXTS_MASS_VALIDATOR_SERVICE_PREFIX",
+    "EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS",
+    "EXTS_VALIDATOR_MANAGER_PROGRESS_UPDATE_RATE",
     "ManagerCore",
+    "SchemaDelta",
     "ValidationSchema",
+    "apply_schema_delta",
+    "get_check_dependencies",
+    "get_schema_delta",
+    "resources_overlap",
+    "run_in_dependency_order",
     "validation_schema_json_encoder",
 ]
 
@@ -28,7 +36,13 @@ from .manager import (
     EXTS_MASS_VALIDATOR_SERVICE_PREFIX,
     EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST,
     EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT,
+    EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS,
+    EXTS_VALIDATOR_MANAGER_PROGRESS_UPDATE_RATE,
     ManagerCore,
+    SchemaDelta,
     ValidationSchema,
+    apply_schema_delta,
+    get_schema_delta,
     validation_schema_json_encoder,
 )
+from .scheduler import get_check_dependencies, resources_overlap, run_in_dependency_order
@@ -21,6 +21,7 @@ import io
 import pathlib
 import pprint
 import sys
+import time
 from collections.abc import Iterable
 from contextlib import asynccontextmanager, contextmanager, redirect_stderr, redirect_stdout
 from enum import Enum as _Enum
@@ -46,9 +47,16 @@ from omni.flux.validator.factory import SetupDataTypeVar as _SetupDataTypeVar
 from omni.flux.validator.factory import get_instance as _get_factory_instance
 from pydantic import BaseModel, Field, validator
 
+from .scheduler import get_check_dependencies as _get_check_dependencies
+from .scheduler import run_in_dependency_order as _run_in_dependency_order
+
 EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST = "/exts/omni.services.transport.server.http/host"
 EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT = "/exts/omni.services.transport.server.http/port"
 EXTS_MASS_VALIDATOR_SERVICE_PREFIX = "/exts/omni.flux.validator.mass.service/service/prefix"
+EXTS_VALIDATOR_MANAGER_PROGRESS_UPDATE_RATE = "/exts/omni.flux.validator.manager.core/progress_update_rate"
+EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS = "/exts/omni.flux.validator.manager.core/max_concurrent_checks"
+
+SchemaDelta = List[Tuple[List[Union[str, int]], Any]]
 
 
 @contextmanager
@@ -159,6 +167,66 @@ def validation_schema_json_encoder(obj):
     return JSONEncoder().default(obj)
 
 
+def get_schema_delta(previous: Any, current: Any) -> SchemaDelta:
+    """
+    Get the changes between 2 serialized schemas.
+
+    Dictionaries with the same keys and lists with the same length are compared item by item. Any other value that
+    changed is replaced as a whole.
+
+    Args:
+        previous: the previous value of the schema. Usually the result of `ValidationSchema.dict()`
+        current: the current value of the schema
+
+    Returns:
+        A list of changes. Each change is the path of keys and indexes to the value and the new value.
+    """
+
+    def _get_delta(path, previous_value, current_value):
+        if isinstance(previous_value, dict) and isinstance(current_value, dict):
+            if previous_value.keys() == current_value.keys():
+                for key, value in current_value.items():
+                    yield from _get_delta([*path, key], previous_value[key], value)
+                return
+        elif isinstance(previous_value, list) and isinstance(current_value, list):
+            if len(previous_value) == len(current_value):
+                for index, value in enumerate(current_value):
+                    yield from _get_delta([*path, index], previous_value[index], value)
+                return
+        if type(previous_value) is not type(current_value) or previous_value != current_value:
+            yield path, current_value
+
+    return list(_get_delta([], previous, current))
+
+
+def apply_schema_delta(data: Dict, delta: SchemaDelta) -> Dict:
+    """
+    Apply changes generated by `get_schema_delta` to a serialized schema.
+
+    Args:
+        data: the serialized schema to update. It will be modified in place
+        delta: the changes to apply
+
+    Raises:
+        ValueError: if a change doesn't match the structure of the schema
+
+    Returns:
+        The updated schema
+    """
+    for path, value in delta:
+        if not path:
+            data = value
+            continue
+        try:
+            target = data
+            for key in path[:-1]:
+                target = target[key]
+            target[path[-1]] = value
+        except (KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"The change {path} doesn't match the schema") from e
+    return data
+
+
 class ManagerCore:
     def __init__(self, schema: Dict):
         """
@@ -205,12 +273,21 @@ class ManagerCore:
         self.__is_ready_to_run = {}
         self.__pause_validation = False
         self.__stop_validation = False
+        self.__stop_reported = False
         self.__progress = 0.0
         self.__model = ValidationSchema(**schema)
         self.__model.on_progress_callback = self._on_run_progress
         self.__model.on_finished_callback = self._on_run_finished
 
         self.__model_original = None
+        self.__plugins = None
+
+        self.__update_request_task = None
+        self.__update_request_pending = False
+        self.__update_request_flush = asyncio.Event()
+        self.__last_update_request_time = 0.0
+        self.__last_update_request_data = None
+
         self.__subs_validator_run_by_plugin = {}
         self.__subs_validator_enable_by_plugin = {}
         self.__subs_validator_is_ready_to_run_by_plugin = {}
@@ -309,26 +386,37 @@ class ManagerCore:
     def update_model(self, model: ValidationSchema):
         """Return the current model of the schema"""
         self.__model.update(model.dict())
+        self.__plugins = None
+
+    def __get_plugins(self) -> List[_BaseSchema]:
+        """Get all the plugins of the schema, including nested plugins. The result is cached until the model changes"""
+        if self.__plugins is None:
+            plugins = []
+
+            def nester_get_plugins(model):
+                to_dict = model.dict()
+                for attr in to_dict.keys():
+                    next_plugin = getattr(model, attr)
+                    next_plugins = []
+                    if isinstance(next_plugin, _BaseSchema):
+                        next_plugins = [next_plugin]
+                    elif isinstance(next_plugin, Iterable):
+                        next_plugins = [nexp for nexp in next_plugin if isinstance(nexp, _BaseSchema)]
+
+                    for plugin in next_plugins:
+                        plugins.append(plugin)
+                        nester_get_plugins(plugin)
+
+            nester_get_plugins(self.__model)
+            self.__plugins = plugins
+        return self.__plugins
 
     @_ignore_function_decorator(attrs=["_ignore_on_run_progress"])
     def _on_run_progress(self, progress, set_schema_value=True, force_not_send_request: bool = False):
         carb.log_info(f"Progress: {progress}%")
 
-        def nester_on_run_progress(model):
-            to_dict = model.dict()
-            for attr in to_dict.keys():
-                next_plugin = getattr(model, attr)
-                next_plugins = []
-                if isinstance(next_plugin, _BaseSchema):
-                    next_plugins = [next_plugin]
-                elif isinstance(next_plugin, Iterable):
-                    next_plugins = [nexp for nexp in next_plugin if isinstance(nexp, _BaseSchema)]
-
-                for plugin in next_plugins:
-                    plugin.instance.set_global_progress(progress)
-                    nester_on_run_progress(plugin)
-
-        nester_on_run_progress(self.__model)
+        for plugin in self.__get_plugins():
+            plugin.instance.set_global_progress(progress)
 
         self.__progress = progress
         self.__on_run_progress(progress)
@@ -339,25 +427,93 @@ class ManagerCore:
         if not force_not_send_request and self.__model.send_request:
             self._send_update_request()
 
-    def _send_update_request(self):
-        """This method handles the POST request to update a schema. It sends an HTTP post request with JSON data of
-        current model instance, and expects status code 200 if everything is okay."""
+    def _send_update_request(self, flush: bool = False):
+        """
+        Queue an update of the schema on the mass validator service.
+
+        Updates are sent in the background at the rate set in `EXTS_VALIDATOR_MANAGER_PROGRESS_UPDATE_RATE`. Updates
+        queued while waiting are merged, and only the values that changed since the last update are sent.
+
+        Args:
+            flush: send the queued update without waiting for the rate limit
+        """
+        self.__update_request_pending = True
+        if flush:
+            self.__update_request_flush.set()
+        if self.__update_request_task is None or self.__update_request_task.done():
+            self.__update_request_task = asyncio.ensure_future(self.__process_update_requests())
+
+    async def __wait_for_update_requests(self):
+        """Send the queued update right away and wait until every update was sent"""
+        if self.__update_request_task is None or self.__update_request_task.done():
+            return
+        self.__update_request_flush.set()
+        await self.__update_request_task
+
+    async def __process_update_requests(self):
+        while self.__update_request_pending:
+            update_rate = self.__settings.get(EXTS_VALIDATOR_MANAGER_PROGRESS_UPDATE_RATE) or 0
+            if update_rate > 0 and not self.__update_request_flush.is_set():
+                delay = self.__last_update_request_time + 1.0 / update_rate - time.monotonic()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self.__update_request_flush.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+
+            self.__update_request_pending = False
+            self.__update_request_flush.clear()
+
+            # Serialize the model when sending to merge all the changes made since the last update
+            data = self.__model.dict()
+            changes = None
+            if self.__last_update_request_data is not None and self.__model.uuid:
+                changes = get_schema_delta(self.__last_update_request_data, data)
+                if not changes:
+                    continue
+
+            try:
+                await asyncio.get_event_loop().run_in_executor(
+                    None, functools.partial(self.__put_update_request, self.__get_update_request_url(), data, changes)
+                )
+                self.__last_update_request_data = data
+            except ValueError as e:
+                # The service might not have the previous schema anymore. Send the whole schema instead.
+                self.__last_update_request_data = None
+                if changes is None:
+                    carb.log_error(f"Unable to update the schema on the mass validator service: {e}")
+                else:
+                    self.__update_request_pending = True
+                    self.__update_request_flush.set()
+            finally:
+                self.__last_update_request_time = time.monotonic()
+
+    def __get_update_request_url(self) -> str:
         host = self.__settings.get(EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST)
         port = self.__settings.get(EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT)
         prefix = self.__settings.get(EXTS_MASS_VALIDATOR_SERVICE_PREFIX)
 
-        data = dumps(self.__model.dict(), default=validation_schema_json_encoder)
         url = f"http://{host}:{port}{prefix}/mass-validator/schema"  # use IP. localhost is very slow
         if self.__current_queue_id:
             url += f"?queue_id={self.__current_queue_id}"  # Set the query param if we have a queue ID
+        return url
+
+    def __put_update_request(self, url: str, data: Dict, changes: Optional[SchemaDelta]):
+        """This method handles the request to update a schema. It sends an HTTP PUT request with the whole schema, or
+        an HTTP PATCH request with only the changed values, and expects status code 200 if everything is okay.
 
+        This method is blocking and should be executed outside the main thread."""
         r = None
         try:
             # Sending a schema update request should be quick. Set a short timeout.
-            r = requests.put(url, data=data, timeout=5)
+            if changes is None:
+                r = requests.put(url, data=dumps(data, default=validation_schema_json_encoder), timeout=5)
+            else:
+                body = {"uuid": data["uuid"], "changes": changes}
+                r = requests.patch(url, data=dumps(body, default=validation_schema_json_encoder), timeout=5)
             r.raise_for_status()
-        except (requests.exceptions.ConnectionError, requests.exceptions.HTTPError) as e:
-            raise ValueError(r.text) from e
+        except (requests.exceptions.ConnectionError, requests.exceptions.HTTPError, requests.exceptions.Timeout) as e:
+            raise ValueError(r.text if r is not None else str(e)) from e
 
     def get_progress(self):
         return self.__progress
@@ -375,7 +531,7 @@ class ManagerCore:
         self.__on_run_finished(result, message=message)
 
         if not force_not_send_request and self.__model.send_request:
-            self._send_update_request()
+            self._send_update_request(flush=True)
 
     def is_run_finished(self):
         return self.__run_finished
@@ -544,8 +700,11 @@ class ManagerCore:
     def __do_stop_validation(self):
         if self.__stop_validation:
             error_message = "Stopped validation"
-            self._on_run_finished(False, message=error_message)
-            self.__on_run_stopped()
+            # Checks running at the same time all stop: only report it once
+            if not self.__stop_reported:
+                self.__stop_reported = True
+                self._on_run_finished(False, message=error_message)
+                self.__on_run_stopped()
             with disable_exception_traceback():
                 raise ValueError(error_message)
 
@@ -564,16 +723,61 @@ class ManagerCore:
 
         progress_check_add = (100 / size_plugins) / 2  # divide by 2 because we start at 50
         checked_ran = 0
-        for check_plugin_model in self.__model.check_plugins:
-            progress_check += progress_check_add
-            self._on_run_progress(progress_check)
-            if not check_plugin_model.enabled:
-                continue
-            checked_ran += 1
-            await self.__run_context(
-                check_plugin_model.context_plugin, functools.partial(self.__run_check, check_plugin_model), context_data
+
+        check_plugins = self.__model.check_plugins
+        dependencies = _get_check_dependencies(check_plugins)
+        max_concurrent_checks = self.__settings.get(EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS) or 1
+        enabled_indexes = [index for index, plugin in enumerate(check_plugins) if plugin.enabled]
+        # Run the checks one after the other when none of them can run at the same time
+        sequential = max_concurrent_checks <= 1 or all(
+            previous in dependencies[current] for previous, current in zip(enabled_indexes, enabled_indexes[1:])
+        )
+
+        if sequential:
+            for check_plugin_model in check_plugins:
+                progress_check += progress_check_add
+                self._on_run_progress(progress_check)
+                if not check_plugin_model.enabled:
+                    continue
+                checked_ran += 1
+                await self.__run_context(
+                    check_plugin_model.context_plugin,
+                    functools.partial(self.__run_check, check_plugin_model),
+                    context_data,
+                )
+                await self.__run_resultor(check_plugin_model, progress_check, progress_check_add)
+        else:
+            # Only one context plugin sets up or exits at a time, the checks run at the same time
+            context_lock = asyncio.Lock()
+
+            async def run_check(index: int):
+                check_plugin_model = check_plugins[index]
+                if not check_plugin_model.enabled:
+                    return
+                # Don't start new checks while the validation is paused
+                while self.__pause_validation and not self.__stop_validation:
+                    await omni.kit.app.get_app().next_update_async()
+                if self.__stop_validation:
+                    self.__do_stop_validation()
+                await self.__run_context_locked(
+                    context_lock,
+                    check_plugin_model.context_plugin,
+                    functools.partial(self.__run_check, check_plugin_model),
+                    context_data,
+                )
+
+            async def on_check_finished(index: int):
+                # Report the progress and run the resultors in the order of the schema to keep the results stable
+                nonlocal progress_check
+                progress_check += progress_check_add
+                self._on_run_progress(progress_check)
+                if check_plugins[index].enabled:
+                    await self.__run_resultor(check_plugins[index], progress_check, progress_check_add)
+
+            checked_ran = len(enabled_indexes)
+            await _run_in_dependency_order(
+                dependencies, run_check, on_finished=on_check_finished, max_concurrency=max_concurrent_checks
             )
-            await self.__run_resultor(check_plugin_model, progress_check, progress_check_add)
 
         self.__model.validation_passed = True
 
@@ -590,6 +794,36 @@ class ManagerCore:
 
         self._on_run_finished(self.__no_check_failed, message="Check done")
 
+    async def __run_context_locked(
+        self,
+        lock: asyncio.Lock,
+        context_plugin,
+        run_callback: Callable[[_SetupDataTypeVar], Awaitable[None]],
+        parent_context: _SetupDataTypeVar,
+    ):
+        """
+        Run a context plugin while holding the lock, except during the run callback
+        """
+        locked = False
+
+        async def run_callback_unlocked(context_data: _SetupDataTypeVar):
+            nonlocal locked
+            lock.release()
+            locked = False
+            try:
+                await run_callback(context_data)
+            finally:
+                await lock.acquire()
+                locked = True
+
+        await lock.acquire()
+        locked = True
+        try:
+            await self.__run_context(context_plugin, run_callback_unlocked, parent_context)
+        finally:
+            if locked:
+                lock.release()
+
     async def __run_context(
         self,
         context_plugin,
@@ -958,10 +1192,13 @@ class ManagerCore:
         self._on_run_started()
         self.__current_queue_id = queue_id
         self.__stop_validation = False
+        self.__stop_reported = False
         self.__pause_validation = False
         self.__no_check_failed = True
         self.__print_result = print_result
         self.__silent = silent
+        # the service might not have the schema from a previous run. Start by sending the whole schema.
+        self.__last_update_request_data = None
 
         # reset progress for all plugins
         def nester_reset_progress(model):
@@ -990,11 +1227,14 @@ class ManagerCore:
                 self._on_run_progress(50)
                 await self.__run_context(self.__model.context_plugin, self.__run_check_groups, None)
 
-        if self.__silent:
-            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+        try:
+            if self.__silent:
+                with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                    await go()
+            else:
                 await go()
-        else:
-            await go()
+        finally:
+            await self.__wait_for_update_requests()
 
     def destroy(self):
         self.__subs_validator_run_by_plugin = None
@@ -1017,4 +1257,6 @@ class ManagerCore:
 
         if self._last_run_task:
             self._last_run_task.cancel()
+        if self.__update_request_task:
+            self.__update_request_task.cancel()
         self.__model = None
@@ -0,0 +1,140 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set
+
+from omni.flux.validator.factory import CheckSchema as _CheckSchema
+
+# Resource that overlaps with every other resource
+ALL_RESOURCES = "*"
+
+
+def resources_overlap(first: Sequence[str], second: Sequence[str]) -> bool:
+    """
+    Tell if two lists of resources share at least one resource.
+
+    Resources are compared like paths: `/World/Looks` overlaps with `/World/Looks/Material` but not with
+    `/World/Meshes`. The `*` resource overlaps with everything.
+
+    Args:
+        first: the first list of resources
+        second: the second list of resources
+
+    Returns:
+        True if at least one resource of the first list overlaps with one resource of the second list
+    """
+    for resource_a in first:
+        for resource_b in second:
+            if ALL_RESOURCES in (resource_a, resource_b) or resource_a == resource_b:
+                return True
+            short, long = sorted((resource_a.rstrip("/"), resource_b.rstrip("/")), key=len)
+            if long.startswith(short + "/"):
+                return True
+    return False
+
+
+def _checks_conflict(previous: _CheckSchema, current: _CheckSchema) -> bool:
+    if previous.name in (current.run_after or []):
+        return True
+    # Checks that don't declare what they access can touch anything
+    if (previous.reads is None and previous.writes is None) or (current.reads is None and current.writes is None):
+        return True
+    previous_writes = previous.writes or []
+    current_writes = current.writes or []
+    return (
+        resources_overlap(previous_writes, (current.reads or []) + current_writes)
+        or resources_overlap(current_writes, previous.reads or [])
+    )
+
+
+def get_check_dependencies(check_plugins: Sequence[_CheckSchema]) -> List[Set[int]]:
+    """
+    Build the dependency graph of the check plugins. A check depends on an earlier check when one of them writes a
+    resource the other one reads or writes, when it must run after it (`run_after`) or when one of them doesn't declare
+    the resources it accesses. Disabled checks have no dependency and nothing depends on them.
+
+    Args:
+        check_plugins: the check plugins, in the order of the schema
+
+    Returns:
+        For each check plugin, the indexes of the earlier check plugins that must finish before it starts
+    """
+    dependencies = []
+    for index, current in enumerate(check_plugins):
+        current_dependencies = set()
+        if current.enabled:
+            for previous_index, previous in enumerate(check_plugins[:index]):
+                if previous.enabled and _checks_conflict(previous, current):
+                    current_dependencies.add(previous_index)
+        dependencies.append(current_dependencies)
+    return dependencies
+
+
+async def run_in_dependency_order(
+    dependencies: Sequence[Set[int]],
+    run: Callable[[int], Awaitable[Any]],
+    on_finished: Optional[Callable[[int], Awaitable[Any]]] = None,
+    max_concurrency: int = 1,
+):
+    """
+    Run jobs concurrently while respecting their dependencies. When multiple jobs are ready, the one with the lowest
+    index starts first.
+
+    Args:
+        dependencies: for each job, the indexes of the jobs that must finish before it starts. Jobs can only depend on
+                      jobs with a lower index.
+        run: function that runs the job with the given index
+        on_finished: function called for each finished job, always in the order of the indexes
+        max_concurrency: maximum number of jobs running at the same time
+
+    Raises:
+        The exception of the first job that failed. The other running jobs are cancelled.
+    """
+    count = len(dependencies)
+    not_started = list(range(count))
+    running: Dict[asyncio.Future, int] = {}
+    finished = set()
+    next_to_report = 0
+    try:
+        while next_to_report < count:
+            for index in list(not_started):
+                if len(running) >= max(max_concurrency, 1):
+                    break
+                if dependencies[index] <= finished:
+                    not_started.remove(index)
+                    running[asyncio.ensure_future(run(index))] = index
+
+            while next_to_report in finished:
+                if on_finished is not None:
+                    await on_finished(next_to_report)
+                next_to_report += 1
+            if next_to_report >= count:
+                break
+
+            if not running:
+                raise ValueError(f"The job {next_to_report} depends on a job that can't run before it")
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=running.get):
+                index = running.pop(task)
+                task.result()
+                finished.add(index)
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
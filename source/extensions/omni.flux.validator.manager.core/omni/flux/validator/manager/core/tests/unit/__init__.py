@@ -16,4 +16,5 @@
 """
 
 from .test_core import *
+from .test_scheduler import *
 from .test_schema import *
@@ -17,14 +17,23 @@
 """
 import asyncio
 import sys
+from json import loads
 from pathlib import Path
 from typing import Any, Optional
-from unittest.mock import call, patch
+from unittest.mock import Mock, call, patch
 
+import carb.settings
 import omni.kit.app
+import requests
 from omni.flux.validator.factory import BaseValidatorRunMode as _BaseValidatorRunMode
 from omni.flux.validator.factory import ResultorBase as _ResultorBase
 from omni.flux.validator.factory import get_instance as _get_factory_instance
+from omni.flux.validator.manager.core import (
+    EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS as _EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS,
+)
+from omni.flux.validator.manager.core import (
+    EXTS_VALIDATOR_MANAGER_PROGRESS_UPDATE_RATE as _EXTS_VALIDATOR_MANAGER_PROGRESS_UPDATE_RATE,
+)
 from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
 from omni.flux.validator.plugin.check.usd.example.print_prims import PrintPrims as _PrintPrims
 from omni.flux.validator.plugin.context.usd_stage.current_stage import CurrentStage as _CurrentStage
@@ -105,6 +114,28 @@ def _create_good_schema():
     )
 
 
+def _create_concurrent_schema():
+    # The checks write different prims so they can run at the same time
+    return _ManagerCore(
+        {
+            "name": "Test",
+            "context_plugin": {"name": "CurrentStage", "data": {"context_name": ""}},
+            "check_plugins": [
+                {
+                    "name": "PrintPrims",
+                    "selector_plugins": [{"name": "AllPrims", "data": {}}],
+                    "data": {},
+                    "context_plugin": {"name": "CurrentStage", "data": {"context_name": ""}},
+                    "pause_if_fix_failed": False,
+                    "reads": [f"/World/Cube{index}"],
+                    "writes": [f"/World/Cube{index}"],
+                }
+                for index in range(3)
+            ],
+        }
+    )
+
+
 class TestCore(AsyncTestCase):
     async def setUp(self):
         await arrange_windows()
@@ -384,6 +415,68 @@ class TestCore(AsyncTestCase):
             await core.deferred_run()
             self.assertTrue(m_mocked.called)
 
+    async def test_send_update_request_should_send_whole_schema_then_throttled_delta(self):
+        async def wait_for_call(mock):
+            for _ in range(100):
+                if mock.called:
+                    break
+                await omni.kit.app.get_app().next_update_async()
+
+        settings = carb.settings.get_settings()
+        update_rate = settings.get(_EXTS_VALIDATOR_MANAGER_PROGRESS_UPDATE_RATE)
+        settings.set(_EXTS_VALIDATOR_MANAGER_PROGRESS_UPDATE_RATE, 1)
+
+        core = _create_good_schema()
+        core.model.uuid = "test_uuid"
+
+        try:
+            with (
+                patch.object(requests, "put") as put_mock,
+                patch.object(requests, "patch") as patch_mock,
+            ):
+                # The first update sends the whole schema
+                for _ in range(10):
+                    core._send_update_request()
+                await wait_for_call(put_mock)
+
+                # The next updates are merged and wait for the rate limit
+                core.model.progress = 42.0
+                for _ in range(10):
+                    core._send_update_request()
+                for _ in range(5):
+                    await omni.kit.app.get_app().next_update_async()
+                self.assertFalse(patch_mock.called)
+
+                # Flushing sends the pending update right away
+                core._send_update_request(flush=True)
+                await wait_for_call(patch_mock)
+        finally:
+            settings.set(_EXTS_VALIDATOR_MANAGER_PROGRESS_UPDATE_RATE, update_rate)
+
+        self.assertEqual(1, put_mock.call_count)
+        self.assertEqual(1, patch_mock.call_count)
+        self.assertEqual("test_uuid", loads(put_mock.call_args[1]["data"])["uuid"])
+        self.assertDictEqual(
+            {"uuid": "test_uuid", "changes": [[["progress"], 42.0]]}, loads(patch_mock.call_args[1]["data"])
+        )
+
+    async def test_send_update_request_delta_failed_should_send_whole_schema(self):
+        core = _create_good_schema()
+        core.model.uuid = "test_uuid"
+        core.model.send_request = True
+
+        response_mock = Mock()
+        response_mock.raise_for_status.side_effect = requests.exceptions.HTTPError()
+
+        with (
+            patch.object(requests, "put") as put_mock,
+            patch.object(requests, "patch", return_value=response_mock) as patch_mock,
+        ):
+            await core.deferred_run()
+
+        self.assertEqual(patch_mock.call_count + 1, put_mock.call_count)
+        self.assertEqual(100, loads(put_mock.call_args[1]["data"])["progress"])
+
     async def test_run_stopped(self):
         def sub_stopped_count_fn():
             nonlocal sub_stopped_count
@@ -477,6 +570,114 @@ class TestCore(AsyncTestCase):
         # Because the check crashes, it pauses 1 time. And after we resume by hand.
         self.assertTrue(sub_paused_count == [True, False])
 
+    async def test_run_concurrent_checks_should_serialize_contexts(self):
+        running_checks = 0
+        max_running_checks = 0
+        exiting_contexts = 0
+        max_exiting_contexts = 0
+
+        async def _custom_check(*args, **kwargs):
+            """We slow down the check 3 frames"""
+            nonlocal running_checks, max_running_checks
+            running_checks += 1
+            max_running_checks = max(max_running_checks, running_checks)
+            for _ in range(3):
+                await omni.kit.app.get_app().next_update_async()
+            running_checks -= 1
+            return True, "Ok", []
+
+        async def _custom_on_exit(*args, **kwargs):
+            """We slow down the context exit 2 frames"""
+            nonlocal exiting_contexts, max_exiting_contexts
+            exiting_contexts += 1
+            max_exiting_contexts = max(max_exiting_contexts, exiting_contexts)
+            for _ in range(2):
+                await omni.kit.app.get_app().next_update_async()
+            exiting_contexts -= 1
+            return True, "Exit ok"
+
+        settings = carb.settings.get_settings()
+        max_concurrent_checks = settings.get(_EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS)
+        settings.set(_EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS, 3)
+
+        core = _create_concurrent_schema()
+        finished = []
+        _sub = core.subscribe_run_finished(lambda result, message=None: finished.append(result))  # noqa
+
+        try:
+            with (
+                patch.object(_PrintPrims, "_check", wraps=_custom_check),
+                patch.object(_CurrentStage, "_on_exit", wraps=_custom_on_exit),
+            ):
+                await core.deferred_run()
+        finally:
+            settings.set(_EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS, max_concurrent_checks)
+
+        self.assertEqual([True], finished)
+        self.assertEqual(3, max_running_checks)
+        self.assertEqual(1, max_exiting_contexts)
+
+    async def test_run_concurrent_checks_stopped_should_stop_once(self):
+        async def _custom_check(*args, **kwargs):
+            """We slow down the check 3 frames"""
+            for _ in range(3):
+                await omni.kit.app.get_app().next_update_async()
+            return True, "Ok", []
+
+        async def do_stop(_core):
+            """We slow down the stop 2 frames. So it will happen in the middle of the checks"""
+            for _ in range(2):
+                await omni.kit.app.get_app().next_update_async()
+            _core.stop()
+
+        settings = carb.settings.get_settings()
+        max_concurrent_checks = settings.get(_EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS)
+        settings.set(_EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS, 3)
+
+        core = _create_concurrent_schema()
+        stopped = []
+        _sub = core.subscribe_run_stopped(lambda: stopped.append(True))  # noqa
+
+        try:
+            with self.assertRaises(ValueError), patch.object(_PrintPrims, "_check", wraps=_custom_check):
+                asyncio.ensure_future(do_stop(core))
+                await core.deferred_run()
+        finally:
+            settings.set(_EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS, max_concurrent_checks)
+
+        self.assertEqual([True], stopped)
+
+    async def test_run_concurrent_checks_paused_should_not_start_checks(self):
+        started_checks = 0
+
+        async def _custom_check(*args, **kwargs):
+            nonlocal started_checks
+            started_checks += 1
+            return True, "Ok", []
+
+        settings = carb.settings.get_settings()
+        max_concurrent_checks = settings.get(_EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS)
+        settings.set(_EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS, 3)
+
+        core = _create_concurrent_schema()
+        # Pause as soon as the run starts, before the checks start
+        _sub = core.subscribe_run_progress(lambda progress: core.pause() if progress == 50 else None)  # noqa
+
+        try:
+            with patch.object(_PrintPrims, "_check", wraps=_custom_check):
+                run_task = asyncio.ensure_future(core.deferred_run())
+                for _ in range(5):
+                    await omni.kit.app.get_app().next_update_async()
+                paused_started_checks = started_checks
+
+                core.resume()
+                await run_task
+        finally:
+            settings.set(_EXTS_VALIDATOR_MANAGER_MAX_CONCURRENT_CHECKS, max_concurrent_checks)
+
+        self.assertEqual(0, paused_started_checks)
+        self.assertEqual(3, started_checks)
+
     async def test_run_mode_all(self):
         async def _custom_check(*args, **kwargs):
             return True, "Ok", []
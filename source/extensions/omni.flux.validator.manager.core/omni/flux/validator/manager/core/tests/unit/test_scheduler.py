@@ -0,0 +1,120 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+from omni.flux.validator.manager.core import get_check_dependencies as _get_check_dependencies
+from omni.flux.validator.manager.core import resources_overlap as _resources_overlap
+from omni.flux.validator.manager.core import run_in_dependency_order as _run_in_dependency_order
+from omni.kit.test.async_unittest import AsyncTestCase
+
+
+def _check(name, reads=None, writes=None, run_after=None, enabled=True):
+    check = Mock(reads=reads, writes=writes, run_after=run_after, enabled=enabled)
+    check.name = name
+    return check
+
+
+class TestCheckScheduler(AsyncTestCase):
+    async def test_resources_overlap_should_compare_paths(self):
+        # Arrange
+        values = [
+            (["/World/Looks"], ["/World/Looks"], True),
+            (["/World/Looks"], ["/World/Looks/Material"], True),
+            (["/World/Looks/"], ["/World/Looks/Material"], True),
+            (["/World/Looks"], ["/World/LooksOther"], False),
+            (["/World/Looks"], ["/World/Meshes"], False),
+            (["/World/Looks"], ["*"], True),
+            ([], ["*"], False),
+        ]
+
+        for first, second, expected in values:
+            with self.subTest(first=first, second=second):
+                # Act
+                value = _resources_overlap(first, second)
+
+                # Assert
+                self.assertEqual(expected, value)
+
+    async def test_get_check_dependencies_should_only_link_conflicting_checks(self):
+        # Arrange
+        checks = [
+            _check("Textures", reads=["/World/Looks"], writes=["/World/Looks"]),
+            _check("Meshes", reads=["/World/Meshes"], writes=["/World/Meshes"]),
+            _check("Materials", reads=["/World/Looks/Material"]),
+            _check("Report", run_after=["Meshes"]),
+            _check("Disabled", enabled=False),
+            _check("Normals", writes=["/World/Meshes/Cube"]),
+        ]
+
+        # Act
+        dependencies = _get_check_dependencies(checks)
+
+        # Assert
+        # `Report` declares nothing so it waits for all the previous checks, and the next checks wait for it
+        self.assertEqual([set(), set(), {0}, {0, 1, 2}, set(), {1, 3}], dependencies)
+
+    async def test_run_in_dependency_order_should_run_independent_jobs_concurrently(self):
+        # Arrange
+        dependencies = [set(), set(), {0}, set()]
+        events = []
+        running = 0
+        max_running = 0
+
+        async def run(index):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            events.append(f"start {index}")
+            # The first job is the longest
+            for _ in range(4 if index == 0 else 1):
+                await asyncio.sleep(0)
+            running -= 1
+
+        finished = []
+
+        async def on_finished(index):
+            finished.append(index)
+
+        # Act
+        await _run_in_dependency_order(dependencies, run, on_finished=on_finished, max_concurrency=2)
+
+        # Assert
+        self.assertEqual(2, max_running)
+        self.assertEqual(["start 0", "start 1", "start 3", "start 2"], events)
+        self.assertEqual([0, 1, 2, 3], finished)
+
+    async def test_run_in_dependency_order_failed_job_should_cancel_other_jobs(self):
+        # Arrange
+        cancelled = []
+
+        async def run(index):
+            if index == 1:
+                raise ValueError("Failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(index)
+                raise
+
+        # Act
+        with self.assertRaises(ValueError):
+            await _run_in_dependency_order([set(), set(), {1}], run, max_concurrency=3)
+
+        # Assert
+        self.assertEqual([0], cancelled)
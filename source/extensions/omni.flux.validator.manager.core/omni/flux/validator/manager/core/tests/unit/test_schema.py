@@ -16,6 +16,8 @@
 """
 
 from omni.flux.validator.manager.core import ValidationSchema as _ValidationSchema
+from omni.flux.validator.manager.core import apply_schema_delta as _apply_schema_delta
+from omni.flux.validator.manager.core import get_schema_delta as _get_schema_delta
 from omni.kit.test.async_unittest import AsyncTestCase
 from pydantic import ValidationError
 
@@ -84,3 +86,43 @@ class TestUpdateMethod(AsyncTestCase):
 
         with self.assertRaises(ValidationError):
             self.mymodel_instance.update(update_data)
+
+
+class TestSchemaDelta(AsyncTestCase):
+    async def test_get_schema_delta_should_only_return_changed_values(self):
+        previous = _ValidationSchema(**_good_schema()).dict()
+
+        current_schema = _ValidationSchema(**_good_schema())
+        current_schema.progress = 50.0
+        current_schema.check_plugins[0].enabled = True
+        current = current_schema.dict()
+
+        delta = _get_schema_delta(previous, current)
+
+        self.assertListEqual([(["progress"], 50.0), (["check_plugins", 0, "enabled"], True)], delta)
+        self.assertListEqual([], _get_schema_delta(current, current))
+
+    async def test_get_schema_delta_should_replace_lists_with_different_length(self):
+        previous = {"values": [1, 2], "finished": (False, "Nothing")}
+        current = {"values": [1, 2, 3], "finished": (True, "Ok")}
+
+        delta = _get_schema_delta(previous, current)
+
+        self.assertListEqual([(["values"], [1, 2, 3]), (["finished"], (True, "Ok"))], delta)
+
+    async def test_apply_schema_delta_should_update_previous_schema(self):
+        previous = _ValidationSchema(**_good_schema()).dict()
+
+        current_schema = _ValidationSchema(**_good_schema())
+        current_schema.name = "Test2"
+        current_schema.check_plugins[0].selector_plugins[0].enabled = False
+        current = current_schema.dict()
+
+        result = _apply_schema_delta(previous, _get_schema_delta(previous, current))
+
+        self.assertDictEqual(current, result)
+        self.assertEqual("Test2", _ValidationSchema.parse_obj(result).name)
+
+    async def test_apply_schema_delta_invalid_path_should_raise(self):
+        with self.assertRaises(ValueError):
+            _apply_schema_delta(_good_schema(), [(["check_plugins", 5, "enabled"], True)])
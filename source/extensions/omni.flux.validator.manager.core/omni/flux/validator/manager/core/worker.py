@@ -0,0 +1,157 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import traceback
+from typing import BinaryIO, Optional
+
+import carb
+import omni.kit.app
+from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+from omni.flux.validator.manager.core import validation_schema_json_encoder as _validation_schema_json_encoder
+
+
+def main():
+    example = """
+    Example:
+
+        worker.bat --port 50000 --token my_token
+    """
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Run a validation worker. The worker connects to the given local port and runs the schemas it receives "
+            "until it is asked to exit."
+        ),
+        epilog=example,
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument("--port", type=int, help="Local port to connect to", required=True)
+    parser.add_argument("--token", type=str, help="Token used to identify the worker", required=True)
+    args = parser.parse_args()
+
+    asyncio.ensure_future(run(args.port, args.token))
+
+
+def get_memory_usage() -> Optional[int]:
+    """
+    Get the memory used by the current process.
+
+    Returns:
+        The resident memory in bytes or None if it can't be read on the current platform
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return None
+            return counters.WorkingSetSize
+
+        with open("/proc/self/statm", "r", encoding="utf-8") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _send(stream: BinaryIO, message: dict):
+    stream.write(json.dumps(message, default=_validation_schema_json_encoder).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+async def _run_job(stream: BinaryIO, job: dict):
+    job_id = job["id"]
+    finished_message = None
+
+    def on_progress(progress: float):
+        _send(stream, {"type": "progress", "id": job_id, "progress": progress})
+
+    def on_finished(_result: bool, message: Optional[str] = None):
+        nonlocal finished_message
+        finished_message = message
+
+    result = False
+    message = "Ok"
+    core = None
+    try:
+        core = _ManagerCore(job["schema"])
+        _sub_progress = core.subscribe_run_progress(on_progress)  # noqa F841
+        _sub_finished = core.subscribe_run_finished(on_finished)  # noqa F841
+        await core.deferred_run(print_result=job.get("print_result", False), queue_id=job.get("queue_id"))
+        result = True
+    except Exception:  # noqa PLW0718
+        message = finished_message or str(traceback.format_exc())
+        carb.log_error(message)
+    finally:
+        if core is not None:
+            core.destroy()
+
+    _send(
+        stream,
+        {"type": "result", "id": job_id, "result": result, "message": message, "memory": get_memory_usage()},
+    )
+
+
+async def run(port: int, token: str):
+    exit_code = 1
+    try:
+        with socket.create_connection(("127.0.0.1", port)) as connection:
+            stream = connection.makefile("rwb")
+            _send(stream, {"type": "hello", "token": token, "pid": os.getpid()})
+
+            loop = asyncio.get_event_loop()
+            while True:
+                # Read in a thread so the app keeps updating while waiting for the next job
+                line = await loop.run_in_executor(None, stream.readline)
+                if not line:
+                    break
+                job = json.loads(line)
+                if job.get("type") == "exit":
+                    break
+                await _run_job(stream, job)
+        exit_code = 0
+    except OSError:
+        carb.log_error(traceback.format_exc())
+    finally:
+        omni.kit.app.get_app().post_quit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,21 @@
 * limitations under the License.
 """
 
-__all__ = ["Executors", "MassValidationResponseModel"]
+__all__ = [
+    "Executors",
+    "MassValidationJobListResponseModel",
+    "MassValidationJobResponseModel",
+    "MassValidationJobStatus",
+    "MassValidationResponseModel",
+    "MassValidationTaskResultListResponseModel",
+    "MassValidationTaskResultModel",
+]
 
-from .enums import Executors
-from .models import MassValidationResponseModel
+from .enums import Executors, MassValidationJobStatus
+from .models import (
+    MassValidationJobListResponseModel,
+    MassValidationJobResponseModel,
+    MassValidationResponseModel,
+    MassValidationTaskResultListResponseModel,
+    MassValidationTaskResultModel,
+)
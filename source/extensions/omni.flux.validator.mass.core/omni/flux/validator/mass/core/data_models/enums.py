@@ -15,7 +15,7 @@
 * limitations under the License.
 """
 
-from enum import IntEnum
+from enum import Enum, IntEnum
 
 
 class Executors(IntEnum):
@@ -29,3 +29,19 @@ class Executors(IntEnum):
             formatted_name = " ".join(part.capitalize() for part in executor.name.split("_")[:-1])
             formatted_names.append(formatted_name)
         return formatted_names
+
+
+class MassValidationJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (
+            MassValidationJobStatus.SUCCEEDED,
+            MassValidationJobStatus.FAILED,
+            MassValidationJobStatus.CANCELLED,
+        )
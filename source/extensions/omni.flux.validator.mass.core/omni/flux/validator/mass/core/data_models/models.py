@@ -17,8 +17,40 @@
 
 from omni.flux.service.shared import BaseServiceModel
 
+from .enums import MassValidationJobStatus
+
 # RESPONSE MODELS
 
 
 class MassValidationResponseModel(BaseServiceModel):
     completed_schemas: list[dict]  # List of ValidationSchema dicts
+
+
+class MassValidationTaskResultModel(BaseServiceModel):
+    index: int
+    status: MassValidationJobStatus
+    progress: float
+    message: str | None = None
+    validation_schema: dict | None = None  # ValidationSchema dict, set once the task is finished
+
+
+class MassValidationJobResponseModel(BaseServiceModel):
+    job_id: str
+    schema_name: str
+    status: MassValidationJobStatus
+    progress: float
+    task_count: int
+    finished_task_count: int
+    failed_task_count: int
+    message: str | None = None
+
+
+class MassValidationJobListResponseModel(BaseServiceModel):
+    jobs: list[MassValidationJobResponseModel]
+    total: int  # Total number of jobs, ignoring the pagination
+
+
+class MassValidationTaskResultListResponseModel(BaseServiceModel):
+    job_id: str
+    results: list[MassValidationTaskResultModel]
+    total: int  # Total number of tasks in the job, ignoring the pagination
@@ -15,13 +15,17 @@
 * limitations under the License.
 """
 
+import asyncio
+import atexit
+import functools
 import subprocess
 import sys
 import tempfile
+import threading
 import traceback
 from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import carb
 import carb.settings
@@ -40,6 +44,7 @@ from omni.flux.validator.manager.core import (
 from omni.flux.validator.manager.core import validation_schema_json_encoder as _validation_schema_json_encoder
 
 from .base_executor import BaseExecutor as _BaseExecutor
+from .process_pool import ProcessWorkerPool as _ProcessWorkerPool
 
 if TYPE_CHECKING:
     from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
@@ -48,15 +53,24 @@ if TYPE_CHECKING:
 OVERRIDE_EXPERIENCE = (
     "/exts/omni.flux.validator.mass.core/override_process_experience"  # list of paths of schema separated by a coma
 )
+PROCESS_POOL_ENABLED = "/exts/omni.flux.validator.mass.core/process_pool/enabled"
+PROCESS_POOL_MAX_JOBS_PER_WORKER = "/exts/omni.flux.validator.mass.core/process_pool/max_jobs_per_worker"
+PROCESS_POOL_MAX_MEMORY_GROWTH_MB = "/exts/omni.flux.validator.mass.core/process_pool/max_memory_growth_mb"
+PROCESS_POOL_STARTUP_TIMEOUT = "/exts/omni.flux.validator.mass.core/process_pool/startup_timeout"
 
 
 class ExternalProcessExecutor(_BaseExecutor):
 
     _EXECUTOR = None
+    # The worker processes are shared by all the executors to keep them warm between mass validations
+    _PROCESS_POOLS: Dict[bool, _ProcessWorkerPool] = {}
+    _PROCESS_POOLS_LOCK = threading.Lock()
 
     def __init__(self):
         """
         Executor that will run job(s) in ThreadPoolExecutor. Multiple processes can be set from the UI.
+
+        When the process pool is enabled, each job is sent to a long-lived Kit process instead of starting a new one.
         """
         super().__init__()
         self.__settings = carb.settings.get_settings()
@@ -85,22 +99,19 @@ class ExternalProcessExecutor(_BaseExecutor):
     def _update_processor_count(self, processor_count: int):
         self._enabled_processor_count = processor_count
         self._EXECUTOR = _ThreadPoolExecutor(max_workers=self._enabled_processor_count)
+        with self._PROCESS_POOLS_LOCK:
+            process_pools = list(self._PROCESS_POOLS.values())
+        for process_pool in process_pools:
+            process_pool.set_max_idle_workers(self._enabled_processor_count)
 
-    def _worker(
-        self,
-        core: "_ManagerCore",
-        print_result: bool = False,
-        silent: bool = False,
-        timeout: Optional[int] = None,
-        standalone: Optional[bool] = False,
-        queue_id: str | None = None,
-    ):
+    def _get_process_args(self) -> List[str]:
+        """Get the arguments to start a Kit process that can run a validation"""
         exe_ext = carb.tokens.get_tokens_interface().resolve("${exe_ext}")
         kit_folder = carb.tokens.get_tokens_interface().resolve("${kit}")
         kit_path = Path(kit_folder) / f"kit{exe_ext}"
         app_filename = carb.tokens.get_tokens_interface().resolve("${app_filename}")
 
-        override_experience = carb.settings.get_settings().get(OVERRIDE_EXPERIENCE)
+        override_experience = self.__settings.get(OVERRIDE_EXPERIENCE)
         if override_experience:
             experience_path = carb.tokens.get_tokens_interface().resolve(override_experience)
         else:
@@ -108,8 +119,126 @@ class ExternalProcessExecutor(_BaseExecutor):
             app = carb.tokens.get_tokens_interface().resolve("${omni.flux.validator.mass.core}")
             experience_path = Path(app) / "apps" / "omni.flux.app.validator.mass_cli.kit"
 
+        args = [str(kit_path), str(experience_path), "--no-window"]
+        extra_args = sys.argv[2:] if len(sys.argv) >= 2 else []
+        ignore_arg = False
+        for extra_arg in extra_args:
+            # if this is the standalone, we delete args between --start-future-args-remove and
+            # --end-future-args-remove
+            if app_filename == "omni.flux.app.validator.mass_cli":
+                if extra_arg == "--start-future-args-remove":
+                    ignore_arg = True
+                if extra_arg == "--end-future-args-remove":
+                    ignore_arg = False
+                    continue
+                if ignore_arg:
+                    continue
+            args.append(extra_arg)
+
+        # remove error: <_overlapped.Overlapped object at 0x000002694A2C4B70> still has pending operation at
+        # deallocation, the process may crash
+        args.append("--/exts/omni.kit.async_engine/event_loop_windows=SelectorEventLoop")
+
+        host = self.__settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST)
+        port = self.__settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT)
+
+        args.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST}={host}")
+        args.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT}={port}")
+
+        prefix = self.__settings.get(_EXTS_MASS_VALIDATOR_SERVICE_PREFIX)
+
+        if prefix:
+            args.append(f"--{_EXTS_MASS_VALIDATOR_SERVICE_PREFIX}={prefix}")
+
+        return args
+
+    def _get_manager_script_path(self, script_name: str) -> Path:
         validator_cli_root_ext = carb.tokens.get_tokens_interface().resolve("${omni.flux.validator.manager.core}")
-        exec_cmd = f"{Path(validator_cli_root_ext).joinpath('omni', 'flux', 'validator', 'manager', 'core', 'cli.py')}"
+        return Path(validator_cli_root_ext).joinpath("omni", "flux", "validator", "manager", "core", script_name)
+
+    def _launch_pool_worker(self, port: int, token: str, silent: bool = False) -> subprocess.Popen:
+        worker_cmd = f'"{self._get_manager_script_path("worker.py")}" --port {port} --token {token}'
+        args = [*self._get_process_args(), "--exec", worker_cmd]
+        print(f"Start validation worker {' '.join(args)}")
+        output = subprocess.DEVNULL if silent else None
+        return subprocess.Popen(args, stdout=output, stderr=output)  # noqa PLR1732
+
+    def _get_process_pool(self, silent: bool = False) -> _ProcessWorkerPool:
+        """Get the pool of workers. Workers of a silent pool don't print to the stdout."""
+        with self._PROCESS_POOLS_LOCK:
+            process_pool = self._PROCESS_POOLS.get(silent)
+            if process_pool is None:
+                if not self._PROCESS_POOLS:
+                    atexit.register(ExternalProcessExecutor.shutdown_process_pools)
+                max_jobs = self.__settings.get(PROCESS_POOL_MAX_JOBS_PER_WORKER)
+                max_memory_growth = self.__settings.get(PROCESS_POOL_MAX_MEMORY_GROWTH_MB)
+                process_pool = _ProcessWorkerPool(
+                    functools.partial(self._launch_pool_worker, silent=silent),
+                    max_jobs_per_worker=max_jobs or None,
+                    max_memory_growth=max_memory_growth * 1024 * 1024 if max_memory_growth else None,
+                    max_idle_workers=self._enabled_processor_count,
+                    startup_timeout=self.__settings.get(PROCESS_POOL_STARTUP_TIMEOUT) or None,
+                )
+                self._PROCESS_POOLS[silent] = process_pool
+            return process_pool
+
+    def _worker(
+        self,
+        core: "_ManagerCore",
+        print_result: bool = False,
+        silent: bool = False,
+        timeout: Optional[int] = None,
+        standalone: Optional[bool] = False,
+        queue_id: str | None = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        if not self.__settings.get(PROCESS_POOL_ENABLED):
+            return self._run_in_new_process(
+                core,
+                print_result=print_result,
+                silent=silent,
+                timeout=timeout,
+                standalone=standalone,
+                queue_id=queue_id,
+            )
+
+        def on_progress(progress: float):
+            # The worker already sends its updates to the micro service: only update the core of this process
+            loop.call_soon_threadsafe(
+                functools.partial(core._on_run_progress, progress, force_not_send_request=True)  # noqa PLW0212
+            )
+
+        try:
+            # for standalone, we don't need to send a request to a micro service
+            core.model.send_request = not standalone
+            result, message = self._get_process_pool(silent).run(
+                core.model.dict(),
+                print_result=print_result,
+                timeout=timeout,
+                queue_id=queue_id,
+                progress_callback=on_progress if loop else None,
+            )
+        except Exception:  # noqa PLW0718
+            result = False
+            message = str(traceback.format_exc())
+
+        if not silent:
+            if result:
+                print(message)
+            else:
+                carb.log_error(message)
+        return result, message
+
+    def _run_in_new_process(
+        self,
+        core: "_ManagerCore",
+        print_result: bool = False,
+        silent: bool = False,
+        timeout: Optional[int] = None,
+        standalone: Optional[bool] = False,
+        queue_id: str | None = None,
+    ):
+        exec_cmd = f"{self._get_manager_script_path('cli.py')}"
 
         with tempfile.NamedTemporaryFile("w", delete=False, suffix=".json") as tmp_file:
             jsonfile = tmp_file.name
@@ -121,21 +250,7 @@ class ExternalProcessExecutor(_BaseExecutor):
                 core.model.json(indent=4, encoder=_validation_schema_json_encoder).encode("utf-8"),
                 raise_if_error=True,
             )
-            cmd = [f'"{str(kit_path)}"', f'"{str(experience_path)}"', "--no-window"]
-            extra_args = sys.argv[2:] if len(sys.argv) >= 2 else []
-            ignore_arg = False
-            for extra_arg in extra_args:
-                # if this is the standalone, we delete args between --start-future-args-remove and
-                # --end-future-args-remove
-                if app_filename == "omni.flux.app.validator.mass_cli":
-                    if extra_arg == "--start-future-args-remove":
-                        ignore_arg = True
-                    if extra_arg == "--end-future-args-remove":
-                        ignore_arg = False
-                        continue
-                    if ignore_arg:
-                        continue
-                cmd.append(f'"{extra_arg}"')
+            cmd = [f'"{arg}"' for arg in self._get_process_args()]
             sub_cmd = [f'\\"{exec_cmd}\\"']
             sub_cmd.extend(["-s", rf"\"{Path(jsonfile).resolve()}\""])
             if print_result:
@@ -145,21 +260,6 @@ class ExternalProcessExecutor(_BaseExecutor):
 
             sub_cmd_str = " ".join(sub_cmd)
 
-            # remove error: <_overlapped.Overlapped object at 0x000002694A2C4B70> still has pending operation at
-            # deallocation, the process may crash
-            cmd.append("--/exts/omni.kit.async_engine/event_loop_windows=SelectorEventLoop")
-
-            host = self.__settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST)
-            port = self.__settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT)
-
-            cmd.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST}={host}")
-            cmd.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT}={port}")
-
-            prefix = self.__settings.get(_EXTS_MASS_VALIDATOR_SERVICE_PREFIX)
-
-            if prefix:
-                cmd.append(f"--{_EXTS_MASS_VALIDATOR_SERVICE_PREFIX}={prefix}")
-
             cmd.extend(["--exec", f'"{sub_cmd_str}"'])
 
             print(f"Run {' '.join(cmd)}")
@@ -206,6 +306,15 @@ class ExternalProcessExecutor(_BaseExecutor):
 
         return result, message
 
+    @classmethod
+    def shutdown_process_pools(cls):
+        """Stop the worker processes shared by the executors"""
+        with cls._PROCESS_POOLS_LOCK:
+            process_pools = list(cls._PROCESS_POOLS.values())
+            cls._PROCESS_POOLS.clear()
+        for process_pool in process_pools:
+            process_pool.shutdown()
+
     def submit(
         self,
         core: "_ManagerCore",
@@ -223,4 +332,5 @@ class ExternalProcessExecutor(_BaseExecutor):
             timeout=timeout,
             standalone=standalone,
             queue_id=queue_id,
+            loop=asyncio.get_event_loop(),
         )
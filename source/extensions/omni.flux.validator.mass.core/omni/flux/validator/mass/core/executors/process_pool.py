@@ -0,0 +1,339 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import itertools
+import json
+import secrets
+import socket
+import subprocess
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import carb
+from omni.flux.validator.manager.core import validation_schema_json_encoder as _validation_schema_json_encoder
+
+# Callable that starts a worker process connecting to the given local port with the given token
+WorkerLauncher = Callable[[int, str], subprocess.Popen]
+
+
+class ProcessWorker:
+    def __init__(self, launcher: WorkerLauncher, startup_timeout: Optional[float] = None):
+        """
+        A long-lived validation process. Jobs are sent to the process with a local socket and the results are streamed
+        back as newline-delimited JSON messages.
+
+        Args:
+            launcher: function that starts the worker process
+            startup_timeout: maximum time to wait for the process to connect, in seconds
+
+        Raises:
+            ChildProcessError: if the process didn't connect in time or stopped while starting
+        """
+        self._process = None
+        self._connection = None
+        self._stream = None
+        self._jobs_count = 0
+        self._initial_memory = None
+        self._memory = None
+
+        token = secrets.token_hex(16)
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            server.settimeout(1.0)
+            self._process = launcher(server.getsockname()[1], token)
+
+            deadline = time.monotonic() + startup_timeout if startup_timeout else None
+            while self._connection is None:
+                try:
+                    self._connection, _ = server.accept()
+                except socket.timeout:
+                    if self._process.poll() is not None:
+                        raise ChildProcessError(
+                            f"The validation worker stopped while starting (exit code {self._process.returncode})"
+                        )
+                    if deadline is not None and time.monotonic() > deadline:
+                        self.stop(graceful=False)
+                        raise ChildProcessError(f"The validation worker didn't start in {startup_timeout}sc")
+
+        self._connection.settimeout(startup_timeout)
+        self._stream = self._connection.makefile("rwb")
+        try:
+            hello = self._read_message()
+        except (OSError, ValueError) as e:
+            self.stop(graceful=False)
+            raise ChildProcessError("The validation worker didn't identify itself") from e
+        if hello.get("type") != "hello" or hello.get("token") != token:
+            self.stop(graceful=False)
+            raise ChildProcessError("An unknown process connected instead of the validation worker")
+
+    @property
+    def is_alive(self) -> bool:
+        """Tell if the process is still running"""
+        return self._stream is not None and self._process.poll() is None
+
+    @property
+    def jobs_count(self) -> int:
+        """The number of jobs the worker ran"""
+        return self._jobs_count
+
+    @property
+    def memory_growth(self) -> Optional[int]:
+        """The memory used by the worker since the end of its first job, in bytes. None if unknown."""
+        if self._initial_memory is None or self._memory is None:
+            return None
+        return self._memory - self._initial_memory
+
+    def _send_message(self, message: Dict[str, Any]):
+        self._stream.write(json.dumps(message, default=_validation_schema_json_encoder).encode("utf-8") + b"\n")
+        self._stream.flush()
+
+    def _read_message(self) -> Dict[str, Any]:
+        line = self._stream.readline()
+        if not line:
+            raise ChildProcessError("The validation worker closed the connection")
+        return json.loads(line)
+
+    def run_job(
+        self,
+        job: Dict[str, Any],
+        timeout: Optional[float] = None,
+        progress_callback: Optional[Callable[[float], Any]] = None,
+    ) -> Tuple[bool, str]:
+        """
+        Run a job in the worker and wait for the result.
+
+        Args:
+            job: the job to run. It must contain the serialized schema under the `schema` key
+            timeout: maximum time the job can take, in seconds
+            progress_callback: function called with the progress of the job
+
+        Raises:
+            TimeoutError: if the job didn't finish in time
+            ChildProcessError: if the worker stopped while running the job
+
+        Returns:
+            The result of the job and the message
+        """
+        job_id = job["id"]
+        deadline = time.monotonic() + timeout if timeout else None
+        try:
+            self._connection.settimeout(timeout)
+            self._send_message(job)
+            while True:
+                if deadline is not None:
+                    self._connection.settimeout(max(deadline - time.monotonic(), 0.001))
+                message = self._read_message()
+                if message.get("id") != job_id:
+                    continue
+                if message.get("type") == "progress":
+                    if progress_callback:
+                        progress_callback(message["progress"])
+                    continue
+                if message.get("type") == "result":
+                    break
+        except socket.timeout as e:
+            raise TimeoutError(f"Time out expired ({timeout}sc)") from e
+        except (OSError, ValueError) as e:
+            raise ChildProcessError(f"The validation worker stopped unexpectedly: {e}") from e
+
+        self._jobs_count += 1
+        self._memory = message.get("memory")
+        if self._initial_memory is None:
+            self._initial_memory = self._memory
+        return message["result"], message["message"]
+
+    def stop(self, graceful: bool = True, timeout: float = 10.0):
+        """
+        Stop the worker process.
+
+        Args:
+            graceful: ask the worker to exit before killing it
+            timeout: time to wait for the worker to exit, in seconds
+        """
+        if graceful and self._stream is not None:
+            try:
+                self._send_message({"type": "exit"})
+            except (OSError, ValueError):
+                pass
+        for closeable in [self._stream, self._connection]:
+            if closeable is None:
+                continue
+            try:
+                closeable.close()
+            except (OSError, ValueError):
+                pass
+        self._stream = None
+        self._connection = None
+
+        if self._process is None or self._process.poll() is not None:
+            return
+        if graceful:
+            try:
+                self._process.wait(timeout=timeout)
+                return
+            except subprocess.TimeoutExpired:
+                pass
+        self._process.kill()
+
+
+class ProcessWorkerPool:
+    def __init__(
+        self,
+        launcher: WorkerLauncher,
+        max_jobs_per_worker: Optional[int] = None,
+        max_memory_growth: Optional[int] = None,
+        max_idle_workers: Optional[int] = None,
+        startup_timeout: Optional[float] = None,
+    ):
+        """
+        A pool of long-lived validation processes. Workers are started when needed and reused for the next jobs.
+
+        A worker is replaced after `max_jobs_per_worker` jobs, when its memory grew more than `max_memory_growth` or
+        when it crashed.
+
+        Args:
+            launcher: function that starts a worker process
+            max_jobs_per_worker: number of jobs a worker can run before it is replaced. None for no limit
+            max_memory_growth: memory a worker can use on top of the memory it used after its first job before it is
+                               replaced, in bytes. None for no limit
+            max_idle_workers: number of workers to keep waiting for a job. None for no limit
+            startup_timeout: maximum time to wait for a worker to start, in seconds
+        """
+        self._launcher = launcher
+        self._max_jobs_per_worker = max_jobs_per_worker
+        self._max_memory_growth = max_memory_growth
+        self._max_idle_workers = max_idle_workers
+        self._startup_timeout = startup_timeout
+
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count()
+        self._idle_workers: List[ProcessWorker] = []
+        self._busy_workers: List[ProcessWorker] = []
+
+    @property
+    def workers_count(self) -> int:
+        """The number of running workers"""
+        with self._lock:
+            return len(self._idle_workers) + len(self._busy_workers)
+
+    def set_max_idle_workers(self, value: Optional[int]):
+        """
+        Set the number of workers to keep waiting for a job. Extra idle workers are stopped.
+
+        Args:
+            value: the number of workers. None for no limit
+        """
+        with self._lock:
+            self._max_idle_workers = value
+            to_stop = self._pop_extra_idle_workers()
+        for worker in to_stop:
+            worker.stop()
+
+    def _pop_extra_idle_workers(self) -> List[ProcessWorker]:
+        if self._max_idle_workers is None or len(self._idle_workers) <= self._max_idle_workers:
+            return []
+        extra = self._idle_workers[self._max_idle_workers :]
+        del self._idle_workers[self._max_idle_workers :]
+        return extra
+
+    def _acquire(self) -> ProcessWorker:
+        while True:
+            with self._lock:
+                worker = self._idle_workers.pop() if self._idle_workers else None
+            if worker is None:
+                # Start the process outside the lock: other threads can use the idle workers meanwhile
+                worker = ProcessWorker(self._launcher, startup_timeout=self._startup_timeout)
+            elif not worker.is_alive:
+                carb.log_warn("A validation worker stopped while waiting for a job. Starting a new one.")
+                worker.stop(graceful=False)
+                continue
+            with self._lock:
+                self._busy_workers.append(worker)
+            return worker
+
+    def _release(self, worker: ProcessWorker, recycle: bool = False, kill: bool = False):
+        with self._lock:
+            self._busy_workers.remove(worker)
+            if not recycle and not kill:
+                self._idle_workers.append(worker)
+                to_stop = self._pop_extra_idle_workers()
+            else:
+                to_stop = [worker]
+        for stopped_worker in to_stop:
+            stopped_worker.stop(graceful=not kill)
+
+    def _should_recycle(self, worker: ProcessWorker) -> bool:
+        if self._max_jobs_per_worker is not None and worker.jobs_count >= self._max_jobs_per_worker:
+            return True
+        memory_growth = worker.memory_growth
+        if self._max_memory_growth is not None and memory_growth is not None:
+            if memory_growth > self._max_memory_growth:
+                carb.log_info(f"Replacing a validation worker that grew by {memory_growth} bytes")
+                return True
+        return False
+
+    def run(
+        self,
+        schema: Dict[str, Any],
+        print_result: bool = False,
+        timeout: Optional[float] = None,
+        queue_id: str | None = None,
+        progress_callback: Optional[Callable[[float], Any]] = None,
+    ) -> Tuple[bool, str]:
+        """
+        Run a schema in a worker of the pool. This call is blocking and can be made from multiple threads.
+
+        Args:
+            schema: the serialized schema to run
+            print_result: print the result or not into the worker stdout
+            timeout: maximum time the job can take, in seconds
+            queue_id: the queue ID to use. Needed if you have multiple widgets that shows different queues
+            progress_callback: function called with the progress of the job
+
+        Returns:
+            The result of the job and the message
+        """
+        try:
+            worker = self._acquire()
+        except ChildProcessError as e:
+            return False, str(e)
+
+        job = {
+            "type": "job",
+            "id": next(self._job_ids),
+            "schema": schema,
+            "print_result": print_result,
+            "queue_id": queue_id,
+        }
+        try:
+            result, message = worker.run_job(job, timeout=timeout, progress_callback=progress_callback)
+        except (TimeoutError, ChildProcessError) as e:
+            # The worker state is unknown: never reuse it
+            self._release(worker, kill=True)
+            return False, str(e)
+
+        self._release(worker, recycle=self._should_recycle(worker))
+        return result, message
+
+    def shutdown(self):
+        """Stop all the idle workers. Busy workers are stopped when their job is done."""
+        with self._lock:
+            to_stop = self._idle_workers
+            self._idle_workers = []
+            self._max_idle_workers = 0
+        for worker in to_stop:
+            worker.stop()
@@ -17,8 +17,15 @@
 
 from unittest.mock import patch
 
+import carb.settings
 import omni.kit.app
 from omni.flux.validator.mass.core import ManagerMassCore as _ManagerMassCore
+from omni.flux.validator.mass.core.executors.external_process_executor import (
+    PROCESS_POOL_ENABLED as _PROCESS_POOL_ENABLED,
+)
+from omni.flux.validator.mass.core.executors.external_process_executor import (
+    ExternalProcessExecutor as _ExternalProcessExecutor,
+)
 from omni.kit.test.async_unittest import AsyncTestCase
 from omni.kit.test_suite.helpers import get_test_data_path
 
@@ -34,9 +41,13 @@ class TestExecutors(AsyncTestCase):
 
     async def setUp(self):
         _register_fake_plugins()
+        self._settings = carb.settings.get_settings()
+        self._process_pool_enabled = self._settings.get(_PROCESS_POOL_ENABLED)
+        self._settings.set(_PROCESS_POOL_ENABLED, False)
 
     # After running each test
     async def tearDown(self):
+        self._settings.set(_PROCESS_POOL_ENABLED, self._process_pool_enabled)
         _unregister_fake_plugins()
 
     async def test_create_task_current_process_executor(self):
@@ -111,3 +122,46 @@ class TestExecutors(AsyncTestCase):
                 self.assertEqual(run_mock.call_count, 4)
                 self.assertEqual(core_added_mock.call_count, 4)
                 self.assertIsNotNone(result)
+
+    async def test_create_tasks_external_process_executor_process_pool(self):
+        self._settings.set(_PROCESS_POOL_ENABLED, True)
+        with patch.object(_ExternalProcessExecutor, "_get_process_pool") as pool_mock:
+            pool_mock.return_value.run.return_value = (True, "Ok")
+            core = _ManagerMassCore(schema_paths=self.SCHEMAS)
+            items = core.schema_model.get_item_children(None)
+
+            with (
+                patch("subprocess.run") as run_mock,
+                patch.object(core, "_on_core_added") as core_added_mock,
+            ):
+                result = await core.create_tasks(1, [item._data for item in items])  # noqa
+                for _ in range(len(items) * 2):
+                    await omni.kit.app.get_app().next_update_async()
+
+            # The jobs are sent to the pool instead of starting a process per job
+            self.assertFalse(run_mock.called)
+            self.assertEqual(pool_mock.return_value.run.call_count, 2)
+            self.assertEqual(core_added_mock.call_count, 2)
+            self.assertEqual([(True, "Ok")] * 2, [task.result() for _, task in result])
+
+    async def test_process_pool_progress_should_update_core_progress(self):
+        self._settings.set(_PROCESS_POOL_ENABLED, True)
+
+        def run(*_args, progress_callback=None, **_kwargs):
+            progress_callback(42.0)
+            return True, "Ok"
+
+        with patch.object(_ExternalProcessExecutor, "_get_process_pool") as pool_mock:
+            pool_mock.return_value.run.side_effect = run
+            core = _ManagerMassCore(schema_paths=self.SCHEMAS)
+            items = core.schema_model.get_item_children(None)
+
+            with patch.object(core, "_on_core_added"):
+                result = await core.create_tasks(1, [items[0]._data])  # noqa
+                for _ in range(len(items) * 2):
+                    await omni.kit.app.get_app().next_update_async()
+
+            validation_core, task = result[0]
+            self.assertEqual((True, "Ok"), task.result())
+            self.assertEqual(42.0, validation_core.get_progress())
+            self.assertEqual(42.0, validation_core.model.progress)
@@ -0,0 +1,189 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import json
+import socket
+import subprocess
+import threading
+from unittest.mock import Mock
+
+from omni.flux.validator.mass.core.executors.process_pool import ProcessWorkerPool as _ProcessWorkerPool
+from omni.kit.test.async_unittest import AsyncTestCase
+
+
+class _FakeWorkerProcess:
+    """Emulate a validation worker process in a thread"""
+
+    def __init__(self, port: int, token: str):
+        self.returncode = None
+        self._killed = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(port, token), daemon=True)
+        self._thread.start()
+
+    def _send(self, stream, message: dict):
+        stream.write(json.dumps(message).encode("utf-8") + b"\n")
+        stream.flush()
+
+    def _run(self, port: int, token: str):
+        exit_code = 0
+        with socket.create_connection(("127.0.0.1", port)) as connection:
+            stream = connection.makefile("rwb")
+            self._send(stream, {"type": "hello", "token": token})
+            while True:
+                line = stream.readline()
+                if not line:
+                    break
+                job = json.loads(line)
+                if job["type"] == "exit":
+                    break
+                behavior = job["schema"].get("behavior", "ok")
+                if behavior == "crash":
+                    exit_code = 1
+                    break
+                if behavior == "hang":
+                    self._killed.wait()
+                    break
+                self._send(stream, {"type": "progress", "id": job["id"], "progress": 50.0})
+                self._send(
+                    stream,
+                    {
+                        "type": "result",
+                        "id": job["id"],
+                        "result": True,
+                        "message": "Ok",
+                        "memory": job["schema"].get("memory"),
+                    },
+                )
+        if self.returncode is None:
+            self.returncode = exit_code
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise subprocess.TimeoutExpired("fake_worker", timeout)
+        return self.returncode
+
+    def kill(self):
+        self.returncode = -9
+        self._killed.set()
+
+
+class TestProcessWorkerPool(AsyncTestCase):
+    async def setUp(self):
+        self.processes = []
+        self.launcher = Mock(side_effect=self._launch)
+
+    # After running each test
+    async def tearDown(self):
+        for process in self.processes:
+            process.kill()
+        self.processes = None
+        self.launcher = None
+
+    def _launch(self, port: int, token: str):
+        process = _FakeWorkerProcess(port, token)
+        self.processes.append(process)
+        return process
+
+    async def test_run_should_reuse_worker(self):
+        # Arrange
+        pool = _ProcessWorkerPool(self.launcher)
+        progress_mock = Mock()
+
+        # Act
+        results = [pool.run({"name": "Test"}, progress_callback=progress_mock) for _ in range(3)]
+
+        # Assert
+        self.assertListEqual([(True, "Ok")] * 3, results)
+        self.assertEqual(1, self.launcher.call_count)
+        self.assertEqual(1, pool.workers_count)
+        self.assertEqual(3, progress_mock.call_count)
+
+        pool.shutdown()
+        self.assertEqual(0, pool.workers_count)
+        self.assertEqual(0, self.processes[0].wait(timeout=5))
+
+    async def test_run_should_replace_worker_after_max_jobs(self):
+        # Arrange
+        pool = _ProcessWorkerPool(self.launcher, max_jobs_per_worker=2)
+
+        # Act
+        results = [pool.run({"name": "Test"}) for _ in range(3)]
+
+        # Assert
+        self.assertListEqual([(True, "Ok")] * 3, results)
+        self.assertEqual(2, self.launcher.call_count)
+        self.assertEqual(0, self.processes[0].wait(timeout=5))
+
+        pool.shutdown()
+
+    async def test_run_should_replace_worker_when_memory_grows(self):
+        # Arrange
+        pool = _ProcessWorkerPool(self.launcher, max_memory_growth=100)
+
+        # Act
+        for memory in [1000, 1050, 1200, 1000]:
+            pool.run({"name": "Test", "memory": memory})
+
+        # Assert
+        self.assertEqual(2, self.launcher.call_count)
+
+        pool.shutdown()
+
+    async def test_run_crashed_worker_should_fail_and_start_new_worker(self):
+        # Arrange
+        pool = _ProcessWorkerPool(self.launcher)
+
+        # Act
+        crash_result, crash_message = pool.run({"name": "Test", "behavior": "crash"})
+        result = pool.run({"name": "Test"})
+
+        # Assert
+        self.assertFalse(crash_result)
+        self.assertIn("stopped unexpectedly", crash_message)
+        self.assertEqual((True, "Ok"), result)
+        self.assertEqual(2, self.launcher.call_count)
+
+        pool.shutdown()
+
+    async def test_run_timeout_should_kill_worker(self):
+        # Arrange
+        pool = _ProcessWorkerPool(self.launcher)
+
+        # Act
+        result, message = pool.run({"name": "Test", "behavior": "hang"}, timeout=0.5)
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual("Time out expired (0.5sc)", message)
+        self.assertEqual(-9, self.processes[0].poll())
+        self.assertEqual(0, pool.workers_count)
+
+    async def test_set_max_idle_workers_should_stop_extra_workers(self):
+        # Arrange
+        pool = _ProcessWorkerPool(self.launcher)
+        pool.run({"name": "Test"})
+
+        # Act
+        pool.set_max_idle_workers(0)
+
+        # Assert
+        self.assertEqual(0, pool.workers_count)
+        self.assertEqual(0, self.processes[0].wait(timeout=5))
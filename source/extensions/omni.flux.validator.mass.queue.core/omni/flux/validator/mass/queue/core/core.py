@@ -15,17 +15,26 @@
 * limitations under the License.
 """
 
+from collections import OrderedDict
 from typing import Callable
 
 from omni.flux.utils.common import Event as _Event
 from omni.flux.utils.common import EventSubscription as _EventSubscription
 from omni.flux.validator.manager.core import ValidationSchema as _ValidationSchema  # FastAPI needs the full import
+from omni.flux.validator.manager.core import apply_schema_delta as _apply_schema_delta
+from omni.flux.validator.mass.queue.core.data_models import (
+    UpdateSchemaDeltaRequestModel as _UpdateSchemaDeltaRequestModel,
+)
 from omni.flux.validator.mass.queue.core.data_models import UpdateSchemaRequestModel as _UpdateSchemaRequestModel
 
+# Maximum number of schemas kept to apply the changes sent with `update_schema_delta`
+MAX_SCHEMA_BASELINES = 256
+
 
 class ValidatorMassQueueCore:
     def __init__(self):
         self.__on_update_item = _Event()
+        self.__schema_baselines = OrderedDict()
 
     def subscribe_on_update_item(self, function: Callable[[_ValidationSchema, str | None], None]):
         """
@@ -40,4 +49,32 @@ class ValidatorMassQueueCore:
         return _EventSubscription(self.__on_update_item, function)
 
     def update_schema(self, data: _UpdateSchemaRequestModel):
-        self.__on_update_item(data.validation_schema, queue_id=data.queue_id)
+        schema = data.validation_schema
+        if schema.uuid:
+            self.__set_schema_baseline(schema.uuid, schema.dict())
+        self.__on_update_item(schema, queue_id=data.queue_id)
+
+    def update_schema_delta(self, data: _UpdateSchemaDeltaRequestModel):
+        """
+        Apply the changes to the last schema received for the same UUID and trigger the *on_update_item* event.
+
+        Args:
+            data: the UUID of the schema and the changes to apply
+
+        Raises:
+            ValueError: if no schema was received for the UUID or the changes can't be applied to it
+        """
+        uuid = data.schema_delta.uuid
+        baseline = self.__schema_baselines.pop(uuid, None)
+        if baseline is None:
+            raise ValueError(f"No schema with the UUID {uuid} was received. Send the whole schema first.")
+        baseline = _apply_schema_delta(baseline, data.schema_delta.changes)
+        schema = _ValidationSchema.parse_obj(baseline)
+        self.__set_schema_baseline(uuid, baseline)
+        self.__on_update_item(schema, queue_id=data.queue_id)
+
+    def __set_schema_baseline(self, uuid: str, data: dict):
+        self.__schema_baselines[uuid] = data
+        self.__schema_baselines.move_to_end(uuid)
+        while len(self.__schema_baselines) > MAX_SCHEMA_BASELINES:
+            self.__schema_baselines.popitem(last=False)
@@ -15,6 +15,6 @@
 * limitations under the License.
 """
 
-__all__ = ["UpdateSchemaRequestModel"]
+__all__ = ["SchemaDeltaModel", "UpdateSchemaDeltaRequestModel", "UpdateSchemaRequestModel"]
 
-from .models import UpdateSchemaRequestModel
+from .models import SchemaDeltaModel, UpdateSchemaDeltaRequestModel, UpdateSchemaRequestModel
@@ -15,8 +15,11 @@
 * limitations under the License.
 """
 
+from typing import Any, List, Tuple, Union
+
 from omni.flux.service.shared import BaseServiceModel
 from omni.flux.validator.manager.core import ValidationSchema
+from pydantic import StrictInt, StrictStr
 
 # REQUEST MODELS
 
@@ -24,3 +27,13 @@ from omni.flux.validator.manager.core import ValidationSchema
 class UpdateSchemaRequestModel(BaseServiceModel):
     validation_schema: ValidationSchema
     queue_id: str | None = None
+
+
+class SchemaDeltaModel(BaseServiceModel):
+    uuid: str
+    changes: List[Tuple[List[Union[StrictInt, StrictStr]], Any]]
+
+
+class UpdateSchemaDeltaRequestModel(BaseServiceModel):
+    schema_delta: SchemaDeltaModel
+    queue_id: str | None = None
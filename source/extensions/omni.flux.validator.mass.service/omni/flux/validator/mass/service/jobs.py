@@ -0,0 +1,360 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["MassValidationJob", "MassValidationJobManager"]
+
+import asyncio
+import concurrent.futures
+import traceback
+import uuid
+from collections import OrderedDict
+from json import dumps, loads
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import carb
+from omni.flux.utils.common import Event as _Event
+from omni.flux.utils.common import EventSubscription as _EventSubscription
+from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+from omni.flux.validator.manager.core import ValidationSchema as _ValidationSchema
+from omni.flux.validator.manager.core import validation_schema_json_encoder as _validation_schema_json_encoder
+from omni.flux.validator.mass.core import ManagerMassCore as _ManagerMassCore
+from omni.flux.validator.mass.core.data_models import Executors as _Executors
+from omni.flux.validator.mass.core.data_models import MassValidationJobResponseModel as _MassValidationJobResponseModel
+from omni.flux.validator.mass.core.data_models import MassValidationJobStatus as _MassValidationJobStatus
+from omni.flux.validator.mass.core.data_models import MassValidationTaskResultModel as _MassValidationTaskResultModel
+from omni.flux.validator.mass.queue.core import ValidatorMassQueueCore as _ValidatorMassQueueCore
+
+# Number of finished jobs kept so their status and results can still be queried
+MAX_FINISHED_JOBS = 1000
+
+
+class _MassValidationJobTask:
+    def __init__(self, index: int, core: _ManagerCore, future: asyncio.Future | concurrent.futures.Future):
+        self.index = index
+        self.core = core
+        self.future = future
+        # The schema is replaced by the updates sent by external processes
+        self.schema: _ValidationSchema = core.model
+        self.status = _MassValidationJobStatus.RUNNING
+        self.message: str | None = None
+        self.schema_dict: dict | None = None
+        self.sub_run_progress = None
+
+    def finish(self, status: _MassValidationJobStatus, message: str | None = None):
+        self.status = status
+        self.message = message
+        self.sub_run_progress = None
+        # Serialize to JSON using the custom encoder and convert back to a dict after
+        self.schema_dict = loads(dumps(self.schema.dict(), default=_validation_schema_json_encoder))
+
+    @property
+    def progress(self) -> float:
+        return 1.0 if self.status.is_finished else self.schema.progress or 0.0
+
+    def to_model(self) -> _MassValidationTaskResultModel:
+        return _MassValidationTaskResultModel(
+            index=self.index,
+            status=self.status,
+            progress=self.progress,
+            message=self.message,
+            validation_schema=self.schema_dict,
+        )
+
+
+class MassValidationJob:
+    def __init__(
+        self,
+        schema_name: str,
+        mass_core: _ManagerMassCore,
+        executor: _Executors,
+        queue_core: _ValidatorMassQueueCore,
+        standalone: bool = False,
+    ):
+        """
+        A mass validation job: cook the templates of every item of the mass core and run the resulting tasks in the
+        background.
+
+        Args:
+            schema_name: the name of the schema the job was created from
+            mass_core: the mass core holding the items to validate
+            executor: the executor used to run the tasks
+            queue_core: the queue receiving the schema updates sent by external processes
+            standalone: does the process run in a standalone mode or not (like a CLI)
+        """
+        self._job_id = uuid.uuid4().hex
+        self._schema_name = schema_name
+        self._mass_core = mass_core
+        self._executor = executor
+        self._queue_core = queue_core
+        self._standalone = standalone
+
+        self._status = _MassValidationJobStatus.QUEUED
+        self._message = None
+        self._error = None
+        self._tasks: List[_MassValidationJobTask] = []
+        self._tasks_by_uuid: Dict[str, _MassValidationJobTask] = {}
+        self._uuids = set()
+        self._run_task = None
+        self._sub_update_item = None
+
+        self.__on_changed = _Event()
+
+    @property
+    def job_id(self) -> str:
+        return self._job_id
+
+    @property
+    def status(self) -> _MassValidationJobStatus:
+        return self._status
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """The exception raised while cooking the templates or creating the tasks, if any"""
+        return self._error
+
+    @property
+    def tasks_count(self) -> int:
+        return len(self._tasks)
+
+    def subscribe_changed(self, function: Callable[[], Any]):
+        """
+        Subscribe to the *on_changed* event, triggered when the status or the progress of the job changed.
+
+        Args:
+            function: the callback to execute when the event is triggered
+
+        Returns:
+            An object that will automatically unsubscribe when destroyed.
+        """
+        return _EventSubscription(self.__on_changed, function)
+
+    def start(self):
+        """Start running the job in the background"""
+        if self._run_task is None:
+            self._run_task = asyncio.ensure_future(self._run())
+
+    async def wait(self):
+        """Wait for the job to finish"""
+        if self._run_task is None:
+            return
+        try:
+            await asyncio.shield(self._run_task)
+        except asyncio.CancelledError:
+            # The job was cancelled before it started
+            if not self._run_task.cancelled():
+                raise
+
+    def cancel(self) -> bool:
+        """
+        Cancel the job. Tasks waiting for an executor are cancelled and tasks running in the current process are
+        stopped. Tasks already running in an external process finish but their result is ignored.
+
+        Returns:
+            False if the job was already finished, True otherwise
+        """
+        if self._status.is_finished:
+            return False
+        if self._run_task is not None:
+            self._run_task.cancel()
+        if self._status == _MassValidationJobStatus.QUEUED:
+            # The job didn't start yet so it won't handle the cancellation itself
+            self._finish(_MassValidationJobStatus.CANCELLED, "The job was cancelled")
+        return True
+
+    def get_response_model(self) -> _MassValidationJobResponseModel:
+        finished = [task for task in self._tasks if task.status.is_finished]
+        if self._status.is_finished:
+            progress = 1.0
+        elif self._tasks:
+            progress = sum(task.progress for task in self._tasks) / len(self._tasks)
+        else:
+            progress = 0.0
+        return _MassValidationJobResponseModel(
+            job_id=self._job_id,
+            schema_name=self._schema_name,
+            status=self._status,
+            progress=progress,
+            task_count=len(self._tasks),
+            finished_task_count=len(finished),
+            failed_task_count=len([task for task in finished if task.status != _MassValidationJobStatus.SUCCEEDED]),
+            message=self._message,
+        )
+
+    def get_task_results(self, offset: int = 0, limit: Optional[int] = None) -> List[_MassValidationTaskResultModel]:
+        """
+        Get the status and the result of the tasks of the job.
+
+        Args:
+            offset: index of the first task to return
+            limit: maximum number of tasks to return. None for all the tasks
+
+        Returns:
+            The task results
+        """
+        end = None if limit is None else offset + limit
+        return [task.to_model() for task in self._tasks[offset:end]]
+
+    def get_completed_schemas(self) -> List[dict]:
+        """Get the serialized schemas of the finished tasks"""
+        return [task.schema_dict for task in self._tasks if task.schema_dict is not None]
+
+    def _on_changed(self, *_):
+        self.__on_changed()
+
+    def _on_update_item(self, schema: _ValidationSchema, queue_id: str | None = None):
+        task = self._tasks_by_uuid.get(schema.uuid) if schema.uuid else None
+        if task is None or task.status.is_finished:
+            return
+        task.schema = schema
+        self._on_changed()
+
+    def _set_unique_uuids(self, templates: List[Dict[Any, Any]]):
+        # Updates sent by external processes are matched with the tasks using the schema UUID
+        for template in templates:
+            value = (template.get("uuid") or "").replace("-", "")
+            if not value or value in self._uuids:
+                value = uuid.uuid4().hex
+                template["uuid"] = value
+            self._uuids.add(value)
+
+    def _finish(self, status: _MassValidationJobStatus, message: str | None = None):
+        self._status = status
+        self._message = message
+        self._sub_update_item = None
+        self._on_changed()
+
+    async def _run(self):
+        self._status = _MassValidationJobStatus.RUNNING
+        self._sub_update_item = self._queue_core.subscribe_on_update_item(self._on_update_item)
+        self._on_changed()
+        try:
+            for item in self._mass_core.schema_model.get_item_children(None):
+                cooked_templates = await item.cook_template()
+                self._set_unique_uuids(cooked_templates)
+                results = await self._mass_core.create_tasks(
+                    self._executor, cooked_templates, standalone=self._standalone
+                )
+                for core, future in results:
+                    task = _MassValidationJobTask(len(self._tasks), core, future)
+                    task.sub_run_progress = core.subscribe_run_progress(self._on_changed)
+                    self._tasks.append(task)
+                    if core.model.uuid:
+                        self._tasks_by_uuid[core.model.uuid] = task
+                self._on_changed()
+
+            await asyncio.gather(*(self._wait_for_task(task) for task in self._tasks))
+        except asyncio.CancelledError:
+            self._cancel_tasks()
+            self._finish(_MassValidationJobStatus.CANCELLED, "The job was cancelled")
+            return
+        except Exception as e:  # noqa PLW0718
+            carb.log_error(traceback.format_exc())
+            self._error = e
+            self._cancel_tasks()
+            self._finish(_MassValidationJobStatus.FAILED, str(e))
+            return
+
+        if all(task.status == _MassValidationJobStatus.SUCCEEDED for task in self._tasks):
+            self._finish(_MassValidationJobStatus.SUCCEEDED)
+        else:
+            self._finish(
+                _MassValidationJobStatus.FAILED,
+                "The validation did not complete successfully. See the logs for more information.",
+            )
+
+    async def _wait_for_task(self, task: _MassValidationJobTask):
+        # Executors can be asyncio or concurrent libraries. Cancelling the job stops the tasks with `_cancel_tasks`.
+        try:
+            _, message = await asyncio.shield(asyncio.wrap_future(task.future))
+        except asyncio.CancelledError:
+            if not task.future.cancelled():
+                raise
+            task.finish(_MassValidationJobStatus.CANCELLED, "The task was cancelled")
+        except Exception as e:  # noqa PLW0718
+            carb.log_error(traceback.format_exc())
+            task.finish(_MassValidationJobStatus.FAILED, str(e))
+        else:
+            status = (
+                _MassValidationJobStatus.SUCCEEDED if task.schema.validation_passed else _MassValidationJobStatus.FAILED
+            )
+            task.finish(status, message)
+        self._on_changed()
+
+    def _cancel_tasks(self):
+        for task in self._tasks:
+            if task.status.is_finished:
+                continue
+            if isinstance(task.future, concurrent.futures.Future):
+                task.future.cancel()
+            else:
+                # Asyncio futures are resolved by the core when it stops
+                task.core.stop()
+            task.finish(_MassValidationJobStatus.CANCELLED, "The task was cancelled")
+
+
+class MassValidationJobManager:
+    def __init__(self, max_finished_jobs: int = MAX_FINISHED_JOBS):
+        """
+        Keep track of the mass validation jobs. The oldest finished jobs are forgotten when there are more than
+        `max_finished_jobs` finished jobs.
+
+        Args:
+            max_finished_jobs: number of finished jobs to keep
+        """
+        self._max_finished_jobs = max_finished_jobs
+        self._jobs: OrderedDict[str, MassValidationJob] = OrderedDict()
+
+    def submit(self, job: MassValidationJob) -> MassValidationJob:
+        """
+        Start a job and keep track of it.
+
+        Args:
+            job: the job to start
+
+        Returns:
+            The started job
+        """
+        self._prune_finished_jobs()
+        self._jobs[job.job_id] = job
+        job.start()
+        return job
+
+    def get_job(self, job_id: str) -> Optional[MassValidationJob]:
+        return self._jobs.get(job_id)
+
+    def get_jobs(
+        self, offset: int = 0, limit: Optional[int] = None, status: _MassValidationJobStatus | None = None
+    ) -> Tuple[List[MassValidationJob], int]:
+        """
+        Get the jobs in the order they were submitted.
+
+        Args:
+            offset: index of the first job to return
+            limit: maximum number of jobs to return. None for all the jobs
+            status: only return the jobs with this status. None for all the jobs
+
+        Returns:
+            The jobs and the total number of jobs matching the status
+        """
+        jobs = [job for job in self._jobs.values() if status is None or job.status == status]
+        end = None if limit is None else offset + limit
+        return jobs[offset:end], len(jobs)
+
+    def _prune_finished_jobs(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.status.is_finished]
+        for job_id in finished[: max(len(finished) - self._max_finished_jobs, 0)]:
+            del self._jobs[job_id]
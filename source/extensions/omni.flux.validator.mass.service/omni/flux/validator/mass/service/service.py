@@ -17,20 +17,39 @@
 
 __all__ = ["MassValidatorService"]
 
-import traceback
-from json import dumps, loads
+import asyncio
 
 import carb
-import omni.kit.app
+from fastapi.responses import StreamingResponse
 from omni.flux.service.factory import ServiceBase
 from omni.flux.utils.common import path_utils
-from omni.flux.validator.manager.core import ValidationSchema, validation_schema_json_encoder
+from omni.flux.validator.manager.core import ValidationSchema
 from omni.flux.validator.mass.core import ManagerMassCore
-from omni.flux.validator.mass.core.data_models import Executors, MassValidationResponseModel
+from omni.flux.validator.mass.core.data_models import (
+    Executors,
+    MassValidationJobListResponseModel,
+    MassValidationJobResponseModel,
+    MassValidationJobStatus,
+    MassValidationResponseModel,
+    MassValidationTaskResultListResponseModel,
+)
 from omni.flux.validator.mass.queue.core import get_mass_validation_queue_instance
-from omni.flux.validator.mass.queue.core.data_models import UpdateSchemaRequestModel
+from omni.flux.validator.mass.queue.core.data_models import (
+    SchemaDeltaModel,
+    UpdateSchemaDeltaRequestModel,
+    UpdateSchemaRequestModel,
+)
 from pydantic import ValidationError, create_model
 
+from .jobs import MassValidationJob, MassValidationJobManager
+
+# Pagination of the job endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+# Maximum time without a server-sent event before a keep-alive comment is sent, in seconds
+EVENTS_KEEP_ALIVE_INTERVAL = 15.0
+
 
 class MassValidatorService(ServiceBase):
     def __init__(
@@ -51,7 +70,7 @@ class MassValidatorService(ServiceBase):
         self._schema_models = schema_models
         self._standalone = standalone
 
-        self._update_subscriptions = {}
+        self._jobs = MassValidationJobManager()
 
         super().__init__()
 
@@ -79,6 +98,97 @@ class MassValidatorService(ServiceBase):
                 or "OK"
             )
 
+        @self.router.patch(
+            path="/schema",
+            description=(
+                "Update the mass validation schema with the values that changed since the last update. "
+                "The whole schema must have been sent with a PUT request first."
+            ),
+        )
+        async def update_schema_delta(
+            body: SchemaDeltaModel,
+            queue_id: str = ServiceBase.describe_query_param(  # noqa B008
+                None, "ID to describe which queue should be updated"
+            ),
+        ) -> str:
+            try:
+                self._mass_queue_core.update_schema_delta(
+                    UpdateSchemaDeltaRequestModel(schema_delta=body, queue_id=queue_id)
+                )
+            except ValueError as e:
+                ServiceBase.raise_error(409, e)
+            return "OK"
+
+        @self.router.get(
+            path="/jobs",
+            description="Get the mass validation jobs in the order they were submitted.",
+            response_model=MassValidationJobListResponseModel,
+        )
+        async def get_jobs(
+            offset: int = ServiceBase.describe_query_param(0, "Index of the first job to return"),  # noqa B008
+            limit: int = ServiceBase.describe_query_param(  # noqa B008
+                DEFAULT_PAGE_SIZE, f"Maximum number of jobs to return. Must be between 1 and {MAX_PAGE_SIZE}"
+            ),
+            status: MassValidationJobStatus = ServiceBase.describe_query_param(  # noqa B008
+                None, "Only return the jobs with this status"
+            ),
+        ) -> MassValidationJobListResponseModel:
+            self.__validate_page(offset, limit)
+            jobs, total = self._jobs.get_jobs(offset=offset, limit=limit, status=status)
+            return MassValidationJobListResponseModel(jobs=[job.get_response_model() for job in jobs], total=total)
+
+        @self.router.get(
+            path="/jobs/{job_id}",
+            description="Get the status and the progress of a mass validation job.",
+            response_model=MassValidationJobResponseModel,
+        )
+        async def get_job(job_id: str) -> MassValidationJobResponseModel:
+            return self.__get_job(job_id).get_response_model()
+
+        @self.router.get(
+            path="/jobs/{job_id}/results",
+            description="Get the status and the result of the tasks of a mass validation job.",
+            response_model=MassValidationTaskResultListResponseModel,
+        )
+        async def get_job_results(
+            job_id: str,
+            offset: int = ServiceBase.describe_query_param(0, "Index of the first task to return"),  # noqa B008
+            limit: int = ServiceBase.describe_query_param(  # noqa B008
+                DEFAULT_PAGE_SIZE, f"Maximum number of tasks to return. Must be between 1 and {MAX_PAGE_SIZE}"
+            ),
+        ) -> MassValidationTaskResultListResponseModel:
+            self.__validate_page(offset, limit)
+            job = self.__get_job(job_id)
+            return MassValidationTaskResultListResponseModel(
+                job_id=job.job_id,
+                results=job.get_task_results(offset=offset, limit=limit),
+                total=job.tasks_count,
+            )
+
+        @self.router.get(
+            path="/jobs/{job_id}/events",
+            description=(
+                "Stream the status of a mass validation job as server-sent events. "
+                "A `progress` event is sent when the job changes and a `finished` event is sent when the job is done."
+            ),
+            response_class=StreamingResponse,
+        )
+        async def stream_job_events(job_id: str) -> StreamingResponse:
+            job = self.__get_job(job_id)
+            return StreamingResponse(self.__stream_job_events(job), media_type="text/event-stream")
+
+        @self.router.delete(
+            path="/jobs/{job_id}",
+            description="Cancel a mass validation job.",
+            response_model=MassValidationJobResponseModel,
+        )
+        async def cancel_job(job_id: str) -> MassValidationJobResponseModel:
+            job = self.__get_job(job_id)
+            if not job.cancel():
+                ServiceBase.raise_error(409, f"The job {job_id} is already finished")
+            await job.wait()
+            return job.get_response_model()
+
         def build_queue_endpoint(_schema_model):
             """
             Dynamically build endpoints for the various schemas provided in the init
@@ -96,12 +206,7 @@ class MassValidatorService(ServiceBase):
             # Build the schema to pass to the ManagerMassCOre
             schema = ValidationSchema(**data)
 
-            @self.router.post(
-                path=f"/queue/{_schema_model['name'].lower()}",
-                description="Add an item to the mass validation queue.",
-                response_model=MassValidationResponseModel,
-            )
-            async def add_item_to_queue(body: dynamic_model) -> MassValidationResponseModel:
+            async def submit_job(body) -> MassValidationJob:
                 # Update the dict non-destructively to only update the values set in the body
                 updated_dict = self.__update_dict_recursively(schema.dict(), body.dict())
 
@@ -112,67 +217,94 @@ class MassValidatorService(ServiceBase):
                     # An error occurred while building the schema model
                     ServiceBase.raise_error(422, e)
 
-                items = mass_core.schema_model.get_item_children(None)
-
-                tasks = {}
-                for item in items:
+                for item in mass_core.schema_model.get_item_children(None):
                     if not all(item.model.is_ready_to_run().values()):
                         ServiceBase.raise_error(
                             422, "One or more input is invalid. Remove of fix the inputs before continuing."
                         )
 
-                    cooked_templates = None
-                    try:
-                        cooked_templates = await item.cook_template()
-                    except (ValueError, ValidationError) as e:
-                        carb.log_error(traceback.format_exc())
-                        ServiceBase.raise_error(422, e)
-
-                    results = await mass_core.create_tasks(
+                return self._jobs.submit(
+                    MassValidationJob(
+                        _schema_model["name"],
+                        mass_core,
                         body.executor,
-                        cooked_templates,
+                        self._mass_queue_core,
                         standalone=self._standalone,
                     )
+                )
 
-                    # Accumulate the Future variables
-                    for model, task in results:
-                        tasks[task] = model.model
-
-                        # Subscribe to the schema update event and update the associated result
-                        self._update_subscriptions[task] = self._mass_queue_core.subscribe_on_update_item(
-                            lambda updated_schema, queue_id: tasks.update({task: updated_schema})  # noqa
-                        )
+            @self.router.post(
+                path=f"/queue/{_schema_model['name'].lower()}",
+                description=(
+                    "Add an item to the mass validation queue and wait for the validation to finish. "
+                    f"Use `POST {self.prefix}/queue/{_schema_model['name'].lower()}/jobs` to get a job ID right away."
+                ),
+                response_model=MassValidationResponseModel,
+            )
+            async def add_item_to_queue(body: dynamic_model) -> MassValidationResponseModel:
+                job = await submit_job(body)
+                await job.wait()
 
-                # Executors can be asyncio or concurrent libraries
-                tasks_in_progress = list(tasks.keys())
-                while bool(tasks_in_progress):
-                    await omni.kit.app.get_app().next_update_async()
-                    completed_tasks = []
-                    for task in tasks_in_progress:
-                        if not task.done():
-                            continue
-                        completed_tasks.append(task)
-                    for task in completed_tasks:
-                        # Remove the task subscription when the task completes
-                        self._update_subscriptions.pop(task)
-                        tasks_in_progress.remove(task)
-
-                if not all(v.validation_passed for v in tasks.values()):
+                if job.error is not None:
+                    ServiceBase.raise_error(422, job.error)
+                if job.status != MassValidationJobStatus.SUCCEEDED:
                     ServiceBase.raise_error(
                         500, "The validation did not complete successfully. See the logs for more information."
                     )
+                return MassValidationResponseModel(completed_schemas=job.get_completed_schemas())
 
-                # Serialize to JSON using the custom encoder and convert back to a dict after
-                completed_schemas_dicts = [
-                    loads(dumps(v.dict(), default=validation_schema_json_encoder)) for v in tasks.values()
-                ]
-                return MassValidationResponseModel(completed_schemas=completed_schemas_dicts)
+            @self.router.post(
+                path=f"/queue/{_schema_model['name'].lower()}/jobs",
+                description=(
+                    "Add an item to the mass validation queue without waiting for the validation to finish. "
+                    f"Use the returned job ID with the `{self.prefix}/jobs` endpoints to follow the validation."
+                ),
+                response_model=MassValidationJobResponseModel,
+                status_code=202,
+            )
+            async def submit_item_job(body: dynamic_model) -> MassValidationJobResponseModel:
+                job = await submit_job(body)
+                return job.get_response_model()
 
             return add_item_to_queue
 
         for schema_model in self._schema_models:
             build_queue_endpoint(schema_model)
 
+    def __get_job(self, job_id: str) -> MassValidationJob:
+        job = self._jobs.get_job(job_id)
+        if job is None:
+            ServiceBase.raise_error(404, f"No job with the ID {job_id} was found")
+        return job
+
+    @staticmethod
+    def __validate_page(offset: int, limit: int):
+        if offset < 0:
+            ServiceBase.raise_error(422, "The offset must be positive")
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            ServiceBase.raise_error(422, f"The limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    @staticmethod
+    async def __stream_job_events(job: MassValidationJob):
+        """
+        Yield a server-sent event every time the job changes. Changes that happen while an event is sent are merged
+        into the next event.
+        """
+        changed = asyncio.Event()
+        _sub = job.subscribe_changed(changed.set)  # noqa F841
+        while True:
+            changed.clear()
+            response = job.get_response_model()
+            event = "finished" if response.status.is_finished else "progress"
+            yield f"event: {event}\ndata: {response.json()}\n\n"
+            if response.status.is_finished:
+                break
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=EVENTS_KEEP_ALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                # Comment line to keep the connection alive
+                yield ": keep-alive\n\n"
+
     def __update_dict_recursively(self, dictionary: dict, updates: dict):
         """
         Recursively update a dictionary.
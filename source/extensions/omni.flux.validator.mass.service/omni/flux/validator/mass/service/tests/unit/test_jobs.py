@@ -0,0 +1,227 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+from omni.flux.validator.mass.core.data_models import Executors as _Executors
+from omni.flux.validator.mass.core.data_models import MassValidationJobStatus as _MassValidationJobStatus
+from omni.flux.validator.mass.service.jobs import MassValidationJob as _MassValidationJob
+from omni.flux.validator.mass.service.jobs import MassValidationJobManager as _MassValidationJobManager
+from omni.kit.test.async_unittest import AsyncTestCase
+
+
+class FakeMassCore:
+    def __init__(self, task_count: int = 3):
+        """
+        A mass core creating tasks that only finish when their future is resolved by the test
+
+        Args:
+            task_count: the number of tasks to create
+        """
+        self.futures: list[asyncio.Future] = []
+        self.cores: list[Mock] = []
+        self._task_count = task_count
+
+        item = Mock()
+        item.cook_template = self._cook_template
+        self.schema_model = Mock()
+        self.schema_model.get_item_children.return_value = [item]
+
+    async def _cook_template(self):
+        return [{"uuid": None} for _ in range(self._task_count)]
+
+    async def create_tasks(self, executor, templates, standalone=False):
+        results = []
+        for template in templates:
+            future = asyncio.get_event_loop().create_future()
+            core = Mock()
+            core.model = Mock(uuid=template["uuid"], progress=0.0, validation_passed=True)
+            core.model.dict.return_value = {"uuid": template["uuid"]}
+            core.stop.side_effect = future.cancel
+            self.futures.append(future)
+            self.cores.append(core)
+            results.append((core, future))
+        return results
+
+    def finish_tasks(self, validation_passed: bool = True):
+        for core, future in zip(self.cores, self.futures):
+            core.model.validation_passed = validation_passed
+            if not future.done():
+                future.set_result((validation_passed, "Done"))
+
+
+def create_job(mass_core: FakeMassCore, schema_name: str = "Fake") -> _MassValidationJob:
+    return _MassValidationJob(schema_name, mass_core, _Executors.CURRENT_PROCESS_EXECUTOR, Mock())
+
+
+async def wait_for_tasks(job: _MassValidationJob, task_count: int):
+    for _ in range(100):
+        if job.tasks_count == task_count:
+            return
+        await asyncio.sleep(0)
+    raise TimeoutError(f"The job didn't create {task_count} tasks")
+
+
+class TestMassValidationJob(AsyncTestCase):
+    async def test_job_lifecycle_should_succeed(self):
+        # Arrange
+        mass_core = FakeMassCore()
+        job = create_job(mass_core)
+        statuses = []
+        _sub = job.subscribe_changed(lambda: statuses.append(job.status))  # noqa F841
+
+        # Act
+        queued_status = job.status
+        job.start()
+        await wait_for_tasks(job, 3)
+        running_model = job.get_response_model()
+        mass_core.finish_tasks()
+        await job.wait()
+
+        # Assert
+        self.assertEqual(_MassValidationJobStatus.QUEUED, queued_status)
+        self.assertEqual(_MassValidationJobStatus.RUNNING, running_model.status)
+        self.assertEqual(3, running_model.task_count)
+        self.assertEqual(0, running_model.finished_task_count)
+
+        model = job.get_response_model()
+        self.assertEqual(_MassValidationJobStatus.SUCCEEDED, model.status)
+        self.assertEqual(1.0, model.progress)
+        self.assertEqual(3, model.finished_task_count)
+        self.assertEqual(0, model.failed_task_count)
+        self.assertEqual(3, len(job.get_completed_schemas()))
+        self.assertEqual(_MassValidationJobStatus.RUNNING, statuses[0])
+        self.assertEqual(_MassValidationJobStatus.SUCCEEDED, statuses[-1])
+
+    async def test_job_failed_validation_should_fail(self):
+        # Arrange
+        mass_core = FakeMassCore()
+        job = create_job(mass_core)
+
+        # Act
+        job.start()
+        await wait_for_tasks(job, 3)
+        mass_core.finish_tasks(validation_passed=False)
+        await job.wait()
+
+        # Assert
+        model = job.get_response_model()
+        self.assertEqual(_MassValidationJobStatus.FAILED, model.status)
+        self.assertEqual(3, model.failed_task_count)
+        self.assertTrue(all(r.status == _MassValidationJobStatus.FAILED for r in job.get_task_results()))
+
+    async def test_cancel_running_job_should_cancel_tasks(self):
+        # Arrange
+        mass_core = FakeMassCore()
+        job = create_job(mass_core)
+        job.start()
+        await wait_for_tasks(job, 3)
+
+        # Act
+        cancelled = job.cancel()
+        await job.wait()
+        cancelled_again = job.cancel()
+
+        # Assert
+        self.assertTrue(cancelled)
+        self.assertFalse(cancelled_again)
+        self.assertEqual(_MassValidationJobStatus.CANCELLED, job.status)
+        self.assertTrue(all(future.cancelled() for future in mass_core.futures))
+        self.assertTrue(all(r.status == _MassValidationJobStatus.CANCELLED for r in job.get_task_results()))
+
+    async def test_cancel_queued_job_should_cancel_job(self):
+        # Arrange
+        job = create_job(FakeMassCore())
+
+        # Act
+        cancelled = job.cancel()
+        await job.wait()
+
+        # Assert
+        self.assertTrue(cancelled)
+        self.assertEqual(_MassValidationJobStatus.CANCELLED, job.status)
+        self.assertEqual(0, job.tasks_count)
+
+    async def test_get_task_results_should_page_results(self):
+        # Arrange
+        mass_core = FakeMassCore(task_count=5)
+        job = create_job(mass_core)
+        job.start()
+        await wait_for_tasks(job, 5)
+        mass_core.finish_tasks()
+        await job.wait()
+
+        # Act
+        page = job.get_task_results(offset=1, limit=2)
+        last_page = job.get_task_results(offset=4, limit=2)
+        all_results = job.get_task_results()
+
+        # Assert
+        self.assertEqual([1, 2], [result.index for result in page])
+        self.assertEqual([4], [result.index for result in last_page])
+        self.assertEqual(5, len(all_results))
+        self.assertTrue(all(result.validation_schema is not None for result in all_results))
+
+
+class TestMassValidationJobManager(AsyncTestCase):
+    async def test_get_jobs_should_filter_and_page_jobs(self):
+        # Arrange
+        manager = _MassValidationJobManager()
+        mass_cores = [FakeMassCore(task_count=1) for _ in range(3)]
+        jobs = [manager.submit(create_job(mass_core)) for mass_core in mass_cores]
+        for job in jobs:
+            await wait_for_tasks(job, 1)
+        mass_cores[0].finish_tasks()
+        await jobs[0].wait()
+
+        # Act
+        page, total = manager.get_jobs(offset=1, limit=1)
+        running, running_total = manager.get_jobs(status=_MassValidationJobStatus.RUNNING)
+
+        # Assert
+        self.assertEqual([jobs[1]], page)
+        self.assertEqual(3, total)
+        self.assertEqual(jobs[1:], running)
+        self.assertEqual(2, running_total)
+        self.assertIs(jobs[2], manager.get_job(jobs[2].job_id))
+        self.assertIsNone(manager.get_job("unknown"))
+
+        for job in jobs[1:]:
+            job.cancel()
+            await job.wait()
+
+    async def test_submit_should_forget_oldest_finished_jobs(self):
+        # Arrange
+        manager = _MassValidationJobManager(max_finished_jobs=1)
+        first_job = create_job(FakeMassCore())
+        second_job = create_job(FakeMassCore())
+        for job in (first_job, second_job):
+            manager.submit(job)
+            job.cancel()
+            await job.wait()
+
+        # Act
+        third_job = manager.submit(create_job(FakeMassCore()))
+
+        # Assert
+        self.assertIsNone(manager.get_job(first_job.job_id))
+        self.assertIs(second_job, manager.get_job(second_job.job_id))
+        self.assertIs(third_job, manager.get_job(third_job.job_id))
+
+        third_job.cancel()
+        await third_job.wait()
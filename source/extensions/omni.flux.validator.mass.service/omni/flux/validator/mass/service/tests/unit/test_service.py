@@ -0,0 +1,229 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import carb
+from fastapi.testclient import TestClient
+from omni.flux.validator.mass.core.data_models import MassValidationJobStatus as _MassValidationJobStatus
+from omni.flux.validator.mass.service.jobs import MassValidationJob as _MassValidationJob
+from omni.flux.validator.mass.service.service import MassValidatorService as _MassValidatorService
+from omni.kit.test.async_unittest import AsyncTestCase
+from omni.services.core import main
+
+from .fake_plugins import register_fake_plugins as _register_fake_plugins
+from .fake_plugins import unregister_fake_plugins as _unregister_fake_plugins
+from .test_jobs import FakeMassCore as _FakeMassCore
+from .test_jobs import create_job as _create_job
+from .test_jobs import wait_for_tasks as _wait_for_tasks
+
+_SCHEMA = {
+    "name": "Fake",
+    "context_plugin": {"name": "FakeContext", "data": {}},
+    "check_plugins": [
+        {
+            "name": "FakeCheck",
+            "selector_plugins": [{"name": "FakeSelector", "data": {}}],
+            "data": {},
+            "context_plugin": {"name": "FakeContext", "data": {}},
+            "pause_if_fix_failed": False,
+        }
+    ],
+}
+
+
+class TestMassValidatorService(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        _register_fake_plugins()
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        schema_path = Path(self.temp_dir.name) / "fake.json"
+        schema_path.write_text(json.dumps(_SCHEMA), encoding="utf-8")
+
+        # Register the service in the app
+        self.service = _MassValidatorService(schema_models=[{"path": str(schema_path), "name": "Fake"}])
+        main.register_router(router=self.service.router, prefix=self.service.prefix)
+
+        # Setup a test client to send requests
+        host = carb.settings.get_settings().get("/exts/omni.services.transport.server.http/host")
+        port = carb.settings.get_settings().get("/exts/omni.services.transport.server.http/port")
+        self.client = TestClient(main.get_app(), base_url=f"http://{host}:{port}")
+
+    # After running each test
+    async def tearDown(self):
+        main.deregister_router(router=self.service.router)
+        _unregister_fake_plugins()
+        self.temp_dir.cleanup()
+
+        self.client = None
+        self.service = None
+        self.temp_dir = None
+
+    async def _submit_finished_job(self, task_count: int = 3) -> _MassValidationJob:
+        # Jobs run on the test event loop so they are finished before sending requests
+        mass_core = _FakeMassCore(task_count=task_count)
+        job = self.service._jobs.submit(_create_job(mass_core))  # noqa PLW0212
+        await _wait_for_tasks(job, task_count)
+        mass_core.finish_tasks()
+        await job.wait()
+        return job
+
+    async def test_get_jobs_should_return_paged_jobs(self):
+        # Arrange
+        jobs = [await self._submit_finished_job() for _ in range(3)]
+
+        # Act
+        response = self.client.get(f"{self.service.prefix}/jobs", params={"offset": 1, "limit": 1})
+        filtered_response = self.client.get(f"{self.service.prefix}/jobs", params={"status": "running"})
+
+        # Assert
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, response.json()["total"])
+        self.assertEqual([jobs[1].job_id], [job["job_id"] for job in response.json()["jobs"]])
+        self.assertEqual(200, filtered_response.status_code)
+        self.assertEqual({"jobs": [], "total": 0}, filtered_response.json())
+
+    async def test_get_jobs_invalid_page_should_return_unprocessable_entity(self):
+        # Act
+        negative_offset_response = self.client.get(f"{self.service.prefix}/jobs", params={"offset": -1})
+        zero_limit_response = self.client.get(f"{self.service.prefix}/jobs", params={"limit": 0})
+
+        # Assert
+        self.assertEqual(422, negative_offset_response.status_code)
+        self.assertEqual(422, zero_limit_response.status_code)
+
+    async def test_get_job_should_return_job_status(self):
+        # Arrange
+        job = await self._submit_finished_job()
+
+        # Act
+        response = self.client.get(f"{self.service.prefix}/jobs/{job.job_id}")
+
+        # Assert
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(job.job_id, response.json()["job_id"])
+        self.assertEqual(_MassValidationJobStatus.SUCCEEDED.value, response.json()["status"])
+        self.assertEqual(3, response.json()["finished_task_count"])
+
+    async def test_get_job_results_should_return_paged_results(self):
+        # Arrange
+        job = await self._submit_finished_job(task_count=5)
+
+        # Act
+        response = self.client.get(
+            f"{self.service.prefix}/jobs/{job.job_id}/results", params={"offset": 2, "limit": 2}
+        )
+
+        # Assert
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(5, response.json()["total"])
+        self.assertEqual([2, 3], [result["index"] for result in response.json()["results"]])
+
+    async def test_stream_job_events_finished_job_should_send_finished_event(self):
+        # Arrange
+        job = await self._submit_finished_job()
+
+        # Act
+        response = self.client.get(f"{self.service.prefix}/jobs/{job.job_id}/events")
+
+        # Assert
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        self.assertTrue(response.text.startswith("event: finished\n"))
+        self.assertEqual(1, response.text.count("event: "))
+
+    async def test_stream_job_events_running_job_should_send_progress_until_finished(self):
+        # Arrange
+        mass_core = _FakeMassCore()
+        job = self.service._jobs.submit(_create_job(mass_core))  # noqa PLW0212
+        await _wait_for_tasks(job, 3)
+        events = _MassValidatorService._MassValidatorService__stream_job_events(job)  # noqa PLW0212
+
+        # Act
+        first_event = await events.__anext__()
+        mass_core.finish_tasks()
+        other_events = [event async for event in events]
+
+        # Assert
+        self.assertTrue(first_event.startswith("event: progress\n"))
+        self.assertTrue(other_events[-1].startswith("event: finished\n"))
+        self.assertEqual(
+            _MassValidationJobStatus.SUCCEEDED.value,
+            json.loads(other_events[-1].split("data: ", 1)[1])["status"],
+        )
+
+    async def test_cancel_job_should_cancel_queued_job(self):
+        # Arrange
+        with patch.object(_MassValidationJob, "start"):
+            job = self.service._jobs.submit(_create_job(_FakeMassCore()))  # noqa PLW0212
+
+        # Act
+        response = self.client.delete(f"{self.service.prefix}/jobs/{job.job_id}")
+
+        # Assert
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(_MassValidationJobStatus.CANCELLED.value, response.json()["status"])
+        self.assertEqual(_MassValidationJobStatus.CANCELLED, job.status)
+
+    async def test_cancel_job_finished_job_should_return_conflict(self):
+        # Arrange
+        job = await self._submit_finished_job()
+
+        # Act
+        response = self.client.delete(f"{self.service.prefix}/jobs/{job.job_id}")
+
+        # Assert
+        self.assertEqual(409, response.status_code)
+        self.assertEqual(_MassValidationJobStatus.SUCCEEDED, job.status)
+
+    async def test_unknown_job_should_return_not_found(self):
+        for method, path in [
+            ("get", "/jobs/unknown"),
+            ("get", "/jobs/unknown/results"),
+            ("get", "/jobs/unknown/events"),
+            ("delete", "/jobs/unknown"),
+        ]:
+            with self.subTest(method=method, path=path):
+                # Act
+                response = getattr(self.client, method)(f"{self.service.prefix}{path}")
+
+                # Assert
+                self.assertEqual(404, response.status_code)
+
+    async def test_submit_item_job_should_return_queued_job(self):
+        # Arrange
+        # Don't start the job in the request, it is run on the test event loop below
+        with patch.object(_MassValidationJob, "start"):
+            # Act
+            response = self.client.post(f"{self.service.prefix}/queue/fake/jobs", json={"executor": 0})
+
+        # Assert
+        self.assertEqual(202, response.status_code)
+        self.assertEqual("Fake", response.json()["schema_name"])
+        self.assertEqual(_MassValidationJobStatus.QUEUED.value, response.json()["status"])
+
+        job = self.service._jobs.get_job(response.json()["job_id"])  # noqa PLW0212
+        self.assertIsNotNone(job)
+
+        job.start()
+        await job.wait()
+        self.assertEqual(_MassValidationJobStatus.SUCCEEDED, job.status)
+        self.assertGreater(job.tasks_count, 0)
@@ -15,15 +15,39 @@
 * limitations under the License.
 """
 
-from typing import Any, Tuple
+from typing import Any, List, Sequence, Tuple
 
+import numpy as np
 import omni.ui as ui
 import omni.usd
-from pxr import Sdf, Usd, UsdGeom
+from pxr import Sdf, Usd, UsdGeom, Vt
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
 
 
+def get_subsets_vertex_indices(
+    face_vertex_indices: Sequence[int], subsets_face_indices: Sequence[Sequence[int]]
+) -> List[np.ndarray]:
+    """
+    Get the vertex indices of the triangles of many subsets of a triangulated mesh at once. The faces of all the
+    subsets are gathered in a single pass over the face-vertex indices, so overlapping subsets cost no more than
+    disjoint ones.
+
+    Args:
+        face_vertex_indices: the face-vertex indices of the triangulated mesh
+        subsets_face_indices: the face indices of every subset. Subsets can overlap or be empty
+
+    Returns:
+        The vertex indices of the triangles of every subset, 3 per face, in the order of the subset faces
+    """
+    triangles = np.asarray(face_vertex_indices, dtype=np.int32).reshape(-1, 3)
+    faces = [np.asarray(face_indices, dtype=np.int64).ravel() for face_indices in subsets_face_indices]
+    if not faces:
+        return []
+    vertex_indices = triangles[np.concatenate(faces)].ravel()
+    return np.split(vertex_indices, np.cumsum([len(face_indices) * 3 for face_indices in faces])[:-1])
+
+
 class AddVertexIndicesToGeomSubsets(_CheckBaseUSD):
     class Data(_CheckBaseUSD.Data):
         pass
@@ -72,31 +96,19 @@ class AddVertexIndicesToGeomSubsets(_CheckBaseUSD):
                 all_pass = False
                 continue
 
-            face_vertex_indices = mesh.GetFaceVertexIndicesAttr().Get()
-            display_predicate = Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate)
-            children_iterator = iter(Usd.PrimRange(prim, display_predicate))
-            prim_passed = True
-            for child_prim in children_iterator:
-                if child_prim.IsA(UsdGeom.Subset):
-                    vert_indices_attr = child_prim.GetAttribute(self._attr_name)
-                    if not vert_indices_attr:
+            subsets = self._get_subsets(prim)
+            prim_passed = all(child_prim.GetAttribute(self._attr_name) for child_prim, _ in subsets)
+            if prim_passed:
+                expected_vertex_indices = get_subsets_vertex_indices(
+                    mesh.GetFaceVertexIndicesAttr().Get(), [face_indices for _, face_indices in subsets]
+                )
+                for (child_prim, _), expected in zip(subsets, expected_vertex_indices):
+                    vert_indices = np.asarray(child_prim.GetAttribute(self._attr_name).Get() or [], dtype=np.int32)
+                    # Only the indices of the subset faces are compared
+                    if len(vert_indices) < len(expected) or not np.array_equal(vert_indices[: len(expected)], expected):
                         prim_passed = False
                         break
 
-                    subset = UsdGeom.Subset(child_prim)
-                    face_indices = subset.GetIndicesAttr().Get()
-                    vert_indices = vert_indices_attr.Get()
-                    for i, face_index in enumerate(face_indices):
-                        if (
-                            vert_indices[i * 3 + 0] != face_vertex_indices[face_index * 3 + 0]
-                            or vert_indices[i * 3 + 1] != face_vertex_indices[face_index * 3 + 1]
-                            or vert_indices[i * 3 + 2] != face_vertex_indices[face_index * 3 + 2]
-                        ):
-                            prim_passed = False
-                            break
-                if not prim_passed:
-                    break
-
             if not prim_passed:
                 message += f"- FAIL: {str(prim.GetPath())}\n"
                 all_pass = False
@@ -136,26 +148,30 @@ class AddVertexIndicesToGeomSubsets(_CheckBaseUSD):
                     message += f"- Invalid input - not triangulated: {str(prim.GetPath())}\n"
                     all_pass = False
                     continue
-                face_vertex_indices = mesh.GetFaceVertexIndicesAttr().Get()
-                display_predicate = Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate)
-                children_iterator = iter(Usd.PrimRange(prim, display_predicate))
-                for child_prim in children_iterator:
-                    if child_prim.IsA(UsdGeom.Subset):
-                        subset = UsdGeom.Subset(child_prim)
-                        face_indices = subset.GetIndicesAttr().Get()
-                        vert_indices = []
-                        for face_index in face_indices:
-                            vert_indices.append(face_vertex_indices[face_index * 3 + 0])
-                            vert_indices.append(face_vertex_indices[face_index * 3 + 1])
-                            vert_indices.append(face_vertex_indices[face_index * 3 + 2])
-                        child_prim.CreateAttribute(self._attr_name, Sdf.ValueTypeNames.IntArray).Set(vert_indices)
+                subsets = self._get_subsets(prim)
+                subsets_vertex_indices = get_subsets_vertex_indices(
+                    mesh.GetFaceVertexIndicesAttr().Get(), [face_indices for _, face_indices in subsets]
+                )
+                for (child_prim, _), vert_indices in zip(subsets, subsets_vertex_indices):
+                    child_prim.CreateAttribute(self._attr_name, Sdf.ValueTypeNames.IntArray).Set(
+                        Vt.IntArray.FromNumpy(vert_indices)
+                    )
 
                 message += f"- PASS: {str(prim.GetPath())}\n"
 
         return all_pass, message, None
 
     def _is_triangulated(self, faces):
-        return set(faces) == {3}
+        return len(faces) > 0 and bool(np.all(np.asarray(faces) == 3))
+
+    def _get_subsets(self, prim: Usd.Prim) -> List[Tuple[Usd.Prim, Any]]:
+        """Get the GeomSubset prims under a mesh with their face indices"""
+        subsets = []
+        display_predicate = Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate)
+        for child_prim in Usd.PrimRange(prim, display_predicate):
+            if child_prim.IsA(UsdGeom.Subset):
+                subsets.append((child_prim, UsdGeom.Subset(child_prim).GetIndicesAttr().Get() or []))
+        return subsets
 
     @omni.usd.handle_exception
     async def _build_ui(self, schema_data: Data) -> Any:
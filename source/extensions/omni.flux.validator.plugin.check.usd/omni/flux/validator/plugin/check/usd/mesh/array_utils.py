@@ -0,0 +1,44 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from typing import Any
+
+import numpy as np
+
+
+def remap_array(values: Any, element_map: np.ndarray, element_size: int = 1) -> Any:
+    """
+    Build a new Vt array from the elements of another one: `new[i] = values[element_map[i]]`. Numeric arrays are
+    remapped in bulk with NumPy, other arrays (tokens, strings...) element by element.
+
+    Args:
+        values: the Vt array to remap
+        element_map: the element of `values` to use for every element of the new array
+        element_size: the number of values of every element
+
+    Returns:
+        The new Vt array, with the same type as `values`
+    """
+    array = np.asarray(values)
+    if element_size > 1:
+        array = array.reshape((-1, element_size) + array.shape[1:])
+    remapped = array[element_map]
+    if element_size > 1:
+        remapped = remapped.reshape((-1,) + remapped.shape[2:])
+    if array.dtype.kind in "biuf":
+        return type(values).FromNumpy(np.ascontiguousarray(remapped))
+    return type(values)(remapped.tolist())
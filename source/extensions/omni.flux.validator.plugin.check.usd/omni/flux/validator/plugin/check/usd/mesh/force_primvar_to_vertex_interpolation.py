@@ -17,11 +17,13 @@
 
 from typing import Any, Tuple
 
+import numpy as np
 import omni.ui as ui
 import omni.usd
-from pxr import Sdf, Usd, UsdGeom
+from pxr import Sdf, Usd, UsdGeom, Vt
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from .array_utils import remap_array as _remap_array
 
 
 class ForcePrimvarToVertexInterpolation(_CheckBaseUSD):
@@ -137,7 +139,6 @@ class ForcePrimvarToVertexInterpolation(_CheckBaseUSD):
             {
                 "primvar": primvar,
                 "values": primvar.ComputeFlattened(),
-                "fixed_values": [],
                 "interpolation": primvar.GetInterpolation(),
                 "element_size": primvar.GetElementSize(),
             }
@@ -145,24 +146,20 @@ class ForcePrimvarToVertexInterpolation(_CheckBaseUSD):
             if primvar.GetInterpolation() in geom_tokens
         ]
 
-        fixed_indices = range(0, len(face_vertex_indices))
-        fixed_points = [points[face_vertex_indices[i]] for i in fixed_indices]
+        # Every face-vertex becomes its own vertex: the vertex data is re-indexed in bulk with the face-vertex indices
+        vertex_map = np.asarray(face_vertex_indices, dtype=np.int64)
+        fixed_indices = Vt.IntArray.FromNumpy(np.arange(len(vertex_map), dtype=np.int32))
+        fixed_points = _remap_array(points, vertex_map)
 
         for primvar in primvars:
-            if primvar["interpolation"] == UsdGeom.Tokens.vertex:
-                element_size = primvar["element_size"]
-                primvar["fixed_values"] = [
-                    primvar["values"][face_vertex_indices[i] * element_size + j]
-                    for i in fixed_indices
-                    for j in range(element_size)
-                ]
+            if primvar["interpolation"] == UsdGeom.Tokens.vertex and primvar["values"] is not None:
+                primvar["values"] = _remap_array(primvar["values"], vertex_map, primvar["element_size"])
 
         normals_interp = mesh.GetNormalsInterpolation()
         normals = mesh.GetNormalsAttr().Get()
         if normals_interp == UsdGeom.Tokens.vertex and normals:
             # Normals are currently in the (old) vertex order.  need to expand them to be 1 normal per vertex per face
-            fixed_normals = [normals[face_vertex_indices[i]] for i in fixed_indices]
-            mesh.GetNormalsAttr().Set(fixed_normals)
+            mesh.GetNormalsAttr().Set(_remap_array(normals, vertex_map))
         else:
             # Normals are already in 1 normal per vertex per face, need to set it to vertex so that triangulation
             # doesn't break it.
@@ -171,8 +168,6 @@ class ForcePrimvarToVertexInterpolation(_CheckBaseUSD):
         mesh.GetFaceVertexIndicesAttr().Set(fixed_indices)
         mesh.GetPointsAttr().Set(fixed_points)
         for primvar in primvars:
-            if primvar["interpolation"] == UsdGeom.Tokens.vertex:
-                primvar["values"] = primvar["fixed_values"]
             primvar["primvar"].Set(primvar["values"])
             primvar["primvar"].BlockIndices()
             primvar["primvar"].SetInterpolation(UsdGeom.Tokens.vertex)
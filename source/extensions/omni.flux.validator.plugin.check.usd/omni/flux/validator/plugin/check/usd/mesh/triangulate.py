@@ -15,13 +15,83 @@
 * limitations under the License.
 """
 
-from typing import Any, Tuple
+from typing import Any, Sequence, Tuple
 
+import numpy as np
 import omni.ui as ui
 import omni.usd
-from pxr import Sdf, Usd, UsdGeom
+from pxr import Sdf, Usd, UsdGeom, Vt
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from .array_utils import remap_array as _remap_array
+
+
+def fan_triangulate(
+    face_vertex_counts: Sequence[int], face_vertex_indices: Sequence[int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fan-triangulate polygons: a face with N vertices gives the N - 2 triangles (v0, vk+1, vk+2). Faces with less than
+    3 vertices don't give any triangle.
+
+    Args:
+        face_vertex_counts: the number of vertices of every face
+        face_vertex_indices: the vertex indices of every face, one after the other
+
+    Returns:
+        The vertex indices of the triangles, the old face of every triangle and the old face-vertex of every triangle
+        corner
+    """
+    counts = np.asarray(face_vertex_counts, dtype=np.int64)
+    indices = np.asarray(face_vertex_indices)
+
+    triangle_counts = np.maximum(counts - 2, 0)
+    face_map = np.repeat(np.arange(len(counts)), triangle_counts)
+    # The first face-vertex of every face & the first triangle of every face
+    face_starts = np.cumsum(counts) - counts
+    triangle_starts = np.cumsum(triangle_counts) - triangle_counts
+    ranks = np.arange(len(face_map)) - triangle_starts[face_map]
+
+    corner_map = np.empty((len(face_map), 3), dtype=np.int64)
+    corner_map[:, 0] = face_starts[face_map]
+    corner_map[:, 1] = corner_map[:, 0] + ranks + 1
+    corner_map[:, 2] = corner_map[:, 0] + ranks + 2
+    corner_map = corner_map.ravel()
+
+    return indices[corner_map], face_map, corner_map
+
+
+def remap_face_indices(face_map: np.ndarray, face_indices: Sequence[int], face_count: int) -> np.ndarray:
+    """
+    Get the new faces made from a list of old faces, like the faces of a GeomSubset.
+
+    Args:
+        face_map: the old face of every new face. See `fan_triangulate`
+        face_indices: the old faces. Invalid faces are ignored
+        face_count: the number of old faces
+
+    Returns:
+        The sorted new faces
+    """
+    face_indices = np.asarray(face_indices, dtype=np.int64)
+    selected = np.zeros(face_count, dtype=bool)
+    selected[face_indices[(face_indices >= 0) & (face_indices < face_count)]] = True
+    return np.flatnonzero(selected[face_map])
+
+
+def _remap_attribute(attr: Usd.Attribute, element_map: np.ndarray, element_count: int, element_size: int = 1) -> bool:
+    """
+    Remap the default value & the time samples of an array attribute. Values that don't have the expected size are
+    left untouched.
+    """
+    if not attr or not attr.HasAuthoredValue():
+        return False
+    times = [Usd.TimeCode.Default()] + [Usd.TimeCode(time) for time in attr.GetTimeSamples()]
+    for time in times:
+        values = attr.Get(time)
+        if values is None or len(values) != element_count * element_size:
+            continue
+        attr.Set(_remap_array(values, element_map, element_size), time)
+    return True
 
 
 class Triangulate(_CheckBaseUSD):
@@ -102,7 +172,7 @@ class Triangulate(_CheckBaseUSD):
         ui.Label("None")
 
     def _is_triangulated(self, faces):
-        return set(faces) == {3}
+        return len(faces) > 0 and bool(np.all(np.asarray(faces) == 3))
 
     def _triangulate_mesh(self, prim: Usd.Prim):
         # indices and faces converted to triangles
@@ -119,42 +189,34 @@ class Triangulate(_CheckBaseUSD):
         if not indices or not faces:
             return True
 
-        indices_offset = 0
-        new_face_counts = []
-        triangles = []
-        subsets = []
+        triangles, face_map, corner_map = fan_triangulate(faces, indices)
 
         # need to update geom subset face lists
         display_predicate = Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate)
-        children_iterator = iter(Usd.PrimRange(prim, display_predicate))
-        for child_prim in children_iterator:
-            if child_prim.IsA(UsdGeom.Subset):
-                subset = UsdGeom.Subset.Get(prim.GetStage(), child_prim.GetPath())
-                subsets.append(
-                    {
-                        "subset": subset,
-                        "old_faces": set(subset.GetIndicesAttr().Get()),  # set of old face indices in this subset
-                        "new_faces": [],  # the new face index list
-                    }
-                )
-
-        for old_face_index, face_count in enumerate(faces):
-            start_index = indices[indices_offset]
-            for face_index in range(face_count - 2):
-                for subset in subsets:
-                    if old_face_index in subset["old_faces"]:
-                        subset["new_faces"].append(len(new_face_counts))
-                new_face_counts.append(3)
-                index1 = indices_offset + face_index + 1
-                index2 = indices_offset + face_index + 2
-                triangles.append(start_index)
-                triangles.append(indices[index1])
-                triangles.append(indices[index2])
-            indices_offset += face_count
-
-        for subset in subsets:
-            subset["subset"].GetIndicesAttr().Set(subset["new_faces"])
-
-        mesh.GetFaceVertexIndicesAttr().Set(triangles)
-        mesh.GetFaceVertexCountsAttr().Set(new_face_counts)
+        for child_prim in Usd.PrimRange(prim, display_predicate):
+            if not child_prim.IsA(UsdGeom.Subset):
+                continue
+            subset = UsdGeom.Subset.Get(prim.GetStage(), child_prim.GetPath())
+            subset_faces = remap_face_indices(face_map, subset.GetIndicesAttr().Get() or [], len(faces))
+            subset.GetIndicesAttr().Set(Vt.IntArray.FromNumpy(subset_faces.astype(np.int32)))
+
+        # face-varying & uniform values follow their face-vertex & face
+        element_maps = {
+            UsdGeom.Tokens.faceVarying: (corner_map, len(indices)),
+            UsdGeom.Tokens.uniform: (face_map, len(faces)),
+        }
+        for primvar in UsdGeom.PrimvarsAPI(prim).GetPrimvars():
+            element_map = element_maps.get(primvar.GetInterpolation())
+            if element_map is None:
+                continue
+            if primvar.IsIndexed():
+                _remap_attribute(primvar.GetIndicesAttr(), *element_map)
+            else:
+                _remap_attribute(primvar.GetAttr(), *element_map, element_size=primvar.GetElementSize())
+        element_map = element_maps.get(mesh.GetNormalsInterpolation())
+        if element_map is not None:
+            _remap_attribute(mesh.GetNormalsAttr(), *element_map)
+
+        mesh.GetFaceVertexIndicesAttr().Set(Vt.IntArray.FromNumpy(triangles.astype(np.int32)))
+        mesh.GetFaceVertexCountsAttr().Set(Vt.IntArray.FromNumpy(np.full(len(face_map), 3, dtype=np.int32)))
         return True
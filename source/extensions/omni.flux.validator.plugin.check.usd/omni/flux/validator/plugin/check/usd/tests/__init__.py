@@ -26,6 +26,7 @@ from .unit.mesh.test_add_vertex_indices_to_geom_subsets import *
 from .unit.mesh.test_force_primvar_to_vertex_interpolation import *
 from .unit.mesh.test_strip_extra_attributes import *
 from .unit.mesh.test_triangulate import *
+from .unit.mesh.test_triangulate_kernel import *
 from .unit.meta.test_default_prim import *
 from .unit.meta.test_wrap_root_prims import *
 from .unit.paths.test_relative_asset_paths import *
@@ -33,5 +34,7 @@ from .unit.paths.test_relative_references import *
 from .unit.test_print_prims import *
 from .unit.texture.test_convert_to_dds import *
 from .unit.texture.test_convert_to_octahedral import *
+from .unit.texture.test_mass_texture_preview import *
+from .unit.texture.test_texture_utils import *
 from .unit.xform.test_apply_unit_scale import *
 from .unit.xform.test_reset_pivot import *
@@ -15,12 +15,29 @@
 * limitations under the License.
 """
 
+import time
+
+import carb
+import numpy as np
 import omni.usd
 from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+from omni.flux.validator.plugin.check.usd.mesh.add_vertex_indices_to_geom_subsets import (
+    get_subsets_vertex_indices as _get_subsets_vertex_indices,
+)
 from omni.kit.test.async_unittest import AsyncTestCase
 from omni.kit.test_suite.helpers import arrange_windows, get_test_data_path, open_stage, wait_stage_loading
 
 
+def _reference_subset_vertex_indices(face_vertex_indices, face_indices):
+    """The per-face loop the array implementation replaced"""
+    vert_indices = []
+    for face_index in face_indices:
+        vert_indices.append(face_vertex_indices[face_index * 3 + 0])
+        vert_indices.append(face_vertex_indices[face_index * 3 + 1])
+        vert_indices.append(face_vertex_indices[face_index * 3 + 2])
+    return vert_indices
+
+
 class TestAddVertexIndicesToGeomSubsets(AsyncTestCase):
     async def setUp(self):
         await arrange_windows()
@@ -189,3 +206,51 @@ class TestAddVertexIndicesToGeomSubsets(AsyncTestCase):
                 self.assertEquals(tri_indices[i * 3 + 0], parent_indices[face * 3 + 0])
                 self.assertEquals(tri_indices[i * 3 + 1], parent_indices[face * 3 + 1])
                 self.assertEquals(tri_indices[i * 3 + 2], parent_indices[face * 3 + 2])
+
+    async def test_get_subsets_vertex_indices_should_match_reference(self):
+        # Arrange
+        rng = np.random.default_rng(0)
+        face_count = 1000
+        face_vertex_indices = rng.integers(0, 500, face_count * 3).tolist()
+        subsets = [
+            [],
+            list(range(0, face_count, 2)),
+            list(range(0, face_count, 3)),  # overlaps the previous subset
+            rng.integers(0, face_count, 50).tolist(),  # unsorted, with duplicates
+            [face_count - 1],
+        ]
+
+        # Act
+        values = _get_subsets_vertex_indices(face_vertex_indices, subsets)
+
+        # Assert
+        self.assertEqual(len(subsets), len(values))
+        for face_indices, value in zip(subsets, values):
+            self.assertEqual(_reference_subset_vertex_indices(face_vertex_indices, face_indices), value.tolist())
+
+    async def test_get_subsets_vertex_indices_no_subsets_should_return_empty_list(self):
+        # Act
+        values = _get_subsets_vertex_indices([0, 1, 2], [])
+
+        # Assert
+        self.assertEqual([], values)
+
+    async def test_get_subsets_vertex_indices_benchmark(self):
+        rng = np.random.default_rng(0)
+        for face_count, subset_count in ((10_000, 10), (1_000_000, 100), (1_000_000, 1000)):
+            with self.subTest(face_count=face_count, subset_count=subset_count):
+                # Arrange
+                face_vertex_indices = rng.integers(0, face_count, face_count * 3, dtype=np.int32)
+                subsets = np.array_split(rng.permutation(face_count), subset_count)
+
+                # Act
+                start = time.perf_counter()
+                values = _get_subsets_vertex_indices(face_vertex_indices, subsets)
+                elapsed = time.perf_counter() - start
+                carb.log_info(f"Computed {subset_count} subsets of {face_count} faces in {elapsed:.3f}s")
+
+                # Assert
+                self.assertEqual(subset_count, len(values))
+                for face_indices, value in zip(subsets[:3], values):
+                    np.testing.assert_array_equal(face_vertex_indices.reshape(-1, 3)[face_indices].ravel(), value)
+                self.assertEqual(face_count * 3, sum(len(value) for value in values))
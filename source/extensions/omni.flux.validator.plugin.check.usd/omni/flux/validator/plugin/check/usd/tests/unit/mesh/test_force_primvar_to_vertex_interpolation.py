@@ -15,11 +15,94 @@
 * limitations under the License.
 """
 
+import time
+
+import carb
+import numpy as np
 import omni.usd
 from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+from omni.flux.validator.plugin.check.usd.mesh.force_primvar_to_vertex_interpolation import (
+    ForcePrimvarToVertexInterpolation as _ForcePrimvarToVertexInterpolation,
+)
 from omni.kit.test.async_unittest import AsyncTestCase
 from omni.kit.test_suite.helpers import arrange_windows, get_test_data_path, open_stage, wait_stage_loading
-from pxr import UsdGeom
+from pxr import Sdf, Usd, UsdGeom, Vt
+
+
+def _reference_align_vertex_data(prim: Usd.Prim):
+    """The list comprehension implementation the bulk array implementation replaced"""
+    mesh = UsdGeom.Mesh(prim)
+    face_vertex_indices = mesh.GetFaceVertexIndicesAttr().Get()
+    points = mesh.GetPointsAttr().Get()
+
+    primvar_api = UsdGeom.PrimvarsAPI(prim)
+    geom_tokens = [UsdGeom.Tokens.faceVarying, UsdGeom.Tokens.varying, UsdGeom.Tokens.vertex]
+    primvars = [
+        {
+            "primvar": primvar,
+            "values": primvar.ComputeFlattened(),
+            "interpolation": primvar.GetInterpolation(),
+            "element_size": primvar.GetElementSize(),
+        }
+        for primvar in primvar_api.GetPrimvars()
+        if primvar.GetInterpolation() in geom_tokens
+    ]
+
+    fixed_indices = range(0, len(face_vertex_indices))
+    fixed_points = [points[face_vertex_indices[i]] for i in fixed_indices]
+    for primvar in primvars:
+        if primvar["interpolation"] == UsdGeom.Tokens.vertex:
+            element_size = primvar["element_size"]
+            primvar["values"] = [
+                primvar["values"][face_vertex_indices[i] * element_size + j]
+                for i in fixed_indices
+                for j in range(element_size)
+            ]
+
+    normals_interp = mesh.GetNormalsInterpolation()
+    normals = mesh.GetNormalsAttr().Get()
+    if normals_interp == UsdGeom.Tokens.vertex and normals:
+        mesh.GetNormalsAttr().Set([normals[face_vertex_indices[i]] for i in fixed_indices])
+    else:
+        mesh.SetNormalsInterpolation(UsdGeom.Tokens.vertex)
+
+    mesh.GetFaceVertexIndicesAttr().Set(fixed_indices)
+    mesh.GetPointsAttr().Set(fixed_points)
+    for primvar in primvars:
+        primvar["primvar"].Set(primvar["values"])
+        primvar["primvar"].BlockIndices()
+        primvar["primvar"].SetInterpolation(UsdGeom.Tokens.vertex)
+
+
+def _create_grid_mesh(stage: Usd.Stage, size: int) -> Usd.Prim:
+    """A grid of `size` x `size` quads using every interpolation handled by the check"""
+    rng = np.random.default_rng(0)
+    point_count = (size + 1) * (size + 1)
+    rows, columns = np.divmod(np.arange(size * size), size)
+    first = rows * (size + 1) + columns
+    face_vertex_indices = np.stack([first, first + 1, first + size + 2, first + size + 1], axis=1).ravel()
+    corner_count = len(face_vertex_indices)
+
+    mesh = UsdGeom.Mesh.Define(stage, "/Grid")
+    mesh.CreatePointsAttr(Vt.Vec3fArray.FromNumpy(rng.random((point_count, 3), dtype=np.float32)))
+    mesh.CreateFaceVertexCountsAttr(Vt.IntArray.FromNumpy(np.full(size * size, 4, dtype=np.int32)))
+    mesh.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(face_vertex_indices.astype(np.int32)))
+    mesh.CreateNormalsAttr(Vt.Vec3fArray.FromNumpy(rng.random((point_count, 3), dtype=np.float32)))
+    mesh.SetNormalsInterpolation(UsdGeom.Tokens.vertex)
+
+    primvar_api = UsdGeom.PrimvarsAPI(mesh)
+    st = primvar_api.CreatePrimvar("st", Sdf.ValueTypeNames.TexCoord2fArray, UsdGeom.Tokens.faceVarying)
+    st.Set(Vt.Vec2fArray.FromNumpy(rng.random((4, 2), dtype=np.float32)))
+    st.SetIndices(Vt.IntArray.FromNumpy(rng.integers(0, 4, corner_count, dtype=np.int32)))
+    weights = primvar_api.CreatePrimvar(
+        "weights", Sdf.ValueTypeNames.FloatArray, UsdGeom.Tokens.vertex, elementSize=2
+    )
+    weights.Set(Vt.FloatArray.FromNumpy(rng.random(point_count * 2, dtype=np.float32)))
+    color = primvar_api.CreatePrimvar("displayColor", Sdf.ValueTypeNames.Color3fArray, UsdGeom.Tokens.varying)
+    color.Set(Vt.Vec3fArray.FromNumpy(rng.random((point_count, 3), dtype=np.float32)))
+    names = primvar_api.CreatePrimvar("names", Sdf.ValueTypeNames.TokenArray, UsdGeom.Tokens.vertex)
+    names.Set(Vt.TokenArray([f"point_{index % 7}" for index in range(point_count)]))
+    return mesh.GetPrim()
 
 
 class TestForcePrimvarToVertexInterpolation(AsyncTestCase):
@@ -212,3 +295,47 @@ class TestForcePrimvarToVertexInterpolation(AsyncTestCase):
             self.assertNotEqual(interpolation, UsdGeom.Tokens.varying)
             if interpolation == UsdGeom.Tokens.vertex:
                 self.assertEquals(len(points) * primvar.GetElementSize(), len(primvar.Get()))
+
+    async def test_align_vertex_data_should_match_reference_benchmark(self):
+        for size in (10, 100, 500):
+            with self.subTest(faces=size * size):
+                # Arrange
+                stage = Usd.Stage.CreateInMemory()
+                prim = _create_grid_mesh(stage, size)
+                reference_stage = Usd.Stage.CreateInMemory()
+                reference_prim = _create_grid_mesh(reference_stage, size)
+
+                # Act
+                start = time.perf_counter()
+                value = _ForcePrimvarToVertexInterpolation()._align_vertex_data(prim)  # noqa PLW0212
+                elapsed = time.perf_counter() - start
+
+                reference_start = time.perf_counter()
+                _reference_align_vertex_data(reference_prim)
+                reference_elapsed = time.perf_counter() - reference_start
+
+                carb.log_info(
+                    f"Aligned the vertex data of {size * size} faces in {elapsed:.3f}s "
+                    f"(list comprehensions: {reference_elapsed:.3f}s)"
+                )
+
+                # Assert
+                self.assertTrue(value)
+                attributes = prim.GetAuthoredAttributes()
+                self.assertEqual(
+                    sorted(attr.GetName() for attr in reference_prim.GetAuthoredAttributes()),
+                    sorted(attr.GetName() for attr in attributes),
+                )
+                for attr in attributes:
+                    reference_attr = reference_prim.GetAttribute(attr.GetName())
+                    self.assertEqual(reference_attr.GetMetadata("interpolation"), attr.GetMetadata("interpolation"))
+                    self.assertEqual(reference_attr.GetMetadata("elementSize"), attr.GetMetadata("elementSize"))
+                    self.assertEqual(reference_attr.GetTypeName(), attr.GetTypeName())
+                    reference_values = reference_attr.Get()
+                    values = attr.Get()
+                    if reference_values is None:
+                        self.assertIsNone(values, msg=attr.GetName())
+                        continue
+                    np.testing.assert_array_equal(
+                        np.asarray(reference_values), np.asarray(values), err_msg=attr.GetName()
+                    )
@@ -0,0 +1,156 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import time
+
+import carb
+import carb.settings
+import numpy as np
+import omni.kit.test
+from omni.flux.validator.plugin.check.usd.mesh.triangulate import Triangulate as _Triangulate
+from omni.flux.validator.plugin.check.usd.mesh.triangulate import fan_triangulate as _fan_triangulate
+from omni.flux.validator.plugin.check.usd.mesh.triangulate import remap_face_indices as _remap_face_indices
+from pxr import Gf, Sdf, Usd, UsdGeom, Vt
+
+# Opt-in setting adding the 5M faces mesh to the benchmark, which needs about 1 GB of memory and a few seconds:
+# --/exts/omni.flux.validator.plugin.check.usd/tests/run_large_benchmarks=true
+_RUN_LARGE_BENCHMARKS_SETTING = "/exts/omni.flux.validator.plugin.check.usd/tests/run_large_benchmarks"
+
+
+def _reference_triangulate(faces, indices, subsets):
+    """The per-face loop the vectorized triangulation replaced"""
+    indices_offset = 0
+    new_face_counts = []
+    triangles = []
+    new_subsets = [[] for _ in subsets]
+    for old_face_index, face_count in enumerate(faces):
+        start_index = indices[indices_offset]
+        for face_index in range(face_count - 2):
+            for subset_index, subset in enumerate(subsets):
+                if old_face_index in subset:
+                    new_subsets[subset_index].append(len(new_face_counts))
+            new_face_counts.append(3)
+            triangles.append(start_index)
+            triangles.append(indices[indices_offset + face_index + 1])
+            triangles.append(indices[indices_offset + face_index + 2])
+        indices_offset += face_count
+    return triangles, new_subsets
+
+
+def _grid_mesh(face_count: int):
+    """A grid of quads, with a fan of N-gons every 7 faces"""
+    counts = np.full(face_count, 4, dtype=np.int64)
+    counts[::7] = 6
+    indices = np.arange(counts.sum(), dtype=np.int64) % (face_count + 1)
+    return counts, indices
+
+
+class TestTriangulateKernel(omni.kit.test.AsyncTestCase):
+    async def test_fan_triangulate_should_match_reference(self):
+        rng = np.random.default_rng(0)
+        for face_count in (1, 10, 10_000):
+            with self.subTest(face_count=face_count):
+                # Arrange
+                faces = rng.integers(1, 9, face_count).tolist()
+                indices = rng.integers(0, 1000, sum(faces)).tolist()
+                subsets = [set(rng.integers(-5, face_count + 5, face_count // 3 + 1).tolist()) for _ in range(3)]
+
+                # Act
+                triangles, face_map, _ = _fan_triangulate(faces, indices)
+                new_subsets = [_remap_face_indices(face_map, list(subset), face_count) for subset in subsets]
+
+                # Assert
+                expected_triangles, expected_subsets = _reference_triangulate(faces, indices, subsets)
+                self.assertEqual(expected_triangles, triangles.tolist())
+                for expected, value in zip(expected_subsets, new_subsets):
+                    self.assertEqual(expected, value.tolist())
+
+    async def test_fan_triangulate_should_map_corners_to_old_face_vertices(self):
+        # Arrange
+        faces = [4, 2, 3]
+        indices = [10, 11, 12, 13, 20, 21, 30, 31, 32]
+
+        # Act
+        triangles, face_map, corner_map = _fan_triangulate(faces, indices)
+
+        # Assert
+        self.assertEqual([10, 11, 12, 10, 12, 13, 30, 31, 32], triangles.tolist())
+        self.assertEqual([0, 0, 2], face_map.tolist())
+        self.assertEqual([0, 1, 2, 0, 2, 3, 6, 7, 8], corner_map.tolist())
+
+    async def test_fan_triangulate_synthetic_meshes_benchmark(self):
+        face_counts = [10_000, 100_000, 1_000_000]
+        if carb.settings.get_settings().get(_RUN_LARGE_BENCHMARKS_SETTING):
+            face_counts.append(5_000_000)
+        for face_count in face_counts:
+            with self.subTest(face_count=face_count):
+                # Arrange
+                faces, indices = _grid_mesh(face_count)
+                subset = np.arange(0, face_count, 3)
+
+                # Act
+                start = time.perf_counter()
+                triangles, face_map, corner_map = _fan_triangulate(faces, indices)
+                new_subset = _remap_face_indices(face_map, subset, face_count)
+                elapsed = time.perf_counter() - start
+                carb.log_info(f"Triangulated {face_count} faces in {elapsed:.3f}s")
+
+                # Assert
+                self.assertEqual(int((faces - 2).sum()) * 3, len(triangles))
+                np.testing.assert_array_equal(indices[corner_map], triangles)
+                np.testing.assert_array_equal(indices[corner_map[::3]], indices[(np.cumsum(faces) - faces)[face_map]])
+                self.assertEqual(int((faces[subset] - 2).sum()), len(new_subset))
+                self.assertTrue(np.all(face_map[new_subset] % 3 == 0))
+
+    async def test_triangulate_mesh_should_remap_primvars_normals_and_subsets(self):
+        # Arrange
+        stage = Usd.Stage.CreateInMemory()
+        mesh = UsdGeom.Mesh.Define(stage, "/Mesh")
+        mesh.CreatePointsAttr([Gf.Vec3f(i, 0, 0) for i in range(6)])
+        mesh.CreateFaceVertexCountsAttr([4, 3])
+        mesh.CreateFaceVertexIndicesAttr([0, 1, 2, 3, 3, 4, 5])
+        mesh.CreateNormalsAttr([Gf.Vec3f(i, 0, 0) for i in range(7)])
+        mesh.SetNormalsInterpolation(UsdGeom.Tokens.faceVarying)
+
+        primvars_api = UsdGeom.PrimvarsAPI(mesh)
+        st = primvars_api.CreatePrimvar("st", Sdf.ValueTypeNames.TexCoord2fArray, UsdGeom.Tokens.faceVarying)
+        st.Set([Gf.Vec2f(i, i) for i in range(7)])
+        indexed = primvars_api.CreatePrimvar("indexed", Sdf.ValueTypeNames.FloatArray, UsdGeom.Tokens.faceVarying)
+        indexed.Set([0.5, 1.5])
+        indexed.SetIndices(Vt.IntArray([0, 1, 0, 1, 0, 1, 0]))
+        uniform = primvars_api.CreatePrimvar("uniform", Sdf.ValueTypeNames.IntArray, UsdGeom.Tokens.uniform)
+        uniform.Set([7, 8])
+        vertex = primvars_api.CreatePrimvar("vertex", Sdf.ValueTypeNames.FloatArray, UsdGeom.Tokens.vertex)
+        vertex.Set([float(i) for i in range(6)])
+        subset = UsdGeom.Subset.Define(stage, "/Mesh/Subset")
+        subset.CreateIndicesAttr([1])
+
+        # Act
+        value = _Triangulate()._triangulate_mesh(mesh.GetPrim())  # noqa PLW0212
+
+        # Assert
+        self.assertTrue(value)
+        self.assertEqual([3, 3, 3], list(mesh.GetFaceVertexCountsAttr().Get()))
+        self.assertEqual([0, 1, 2, 0, 2, 3, 3, 4, 5], list(mesh.GetFaceVertexIndicesAttr().Get()))
+        corners = [0, 1, 2, 0, 2, 3, 4, 5, 6]
+        self.assertEqual([Gf.Vec3f(i, 0, 0) for i in corners], list(mesh.GetNormalsAttr().Get()))
+        self.assertEqual([Gf.Vec2f(i, i) for i in corners], list(st.Get()))
+        self.assertEqual([0.5, 1.5], list(indexed.Get()))
+        self.assertEqual([0, 1, 0, 0, 0, 1, 0, 1, 0], list(indexed.GetIndices()))
+        self.assertEqual([7, 7, 8], list(uniform.Get()))
+        self.assertEqual([float(i) for i in range(6)], list(vertex.Get()))
+        self.assertEqual([2], list(subset.GetIndicesAttr().Get()))
@@ -0,0 +1,86 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from omni.flux.validator.plugin.check.usd.texture.mass_texture_preview import (
+    MassTexturePreview as _MassTexturePreview,
+)
+from omni.kit.test.async_unittest import AsyncTestCase
+from pxr import Usd, UsdGeom, UsdShade
+
+
+class TestMassTexturePreview(AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = TemporaryDirectory()  # noqa PLR1732
+        self.temp_path = Path(self.temp_dir.name)
+
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    async def test_get_preview_bindings_should_group_geometry_by_bound_material(self):
+        # Arrange
+        ingested_path = str(self.temp_path / "ingested.usda")
+        ingested_stage = Usd.Stage.CreateNew(ingested_path)
+        UsdShade.Material.Define(ingested_stage, "/Looks/Ingested")
+        ingested_stage.Save()
+
+        stage = Usd.Stage.CreateInMemory()
+        stage.GetRootLayer().subLayerPaths.append(ingested_path)
+        default_material = UsdShade.Material.Define(stage, "/Looks/Default")
+        other_material = UsdShade.Material.Define(stage, "/Looks/Other")
+        mesh = UsdGeom.Mesh.Define(stage, "/World/Mesh")
+        UsdShade.MaterialBindingAPI.Apply(mesh.GetPrim()).Bind(default_material)
+        subset = UsdGeom.Subset.Define(stage, "/World/Mesh/Subset")
+        UsdShade.MaterialBindingAPI.Apply(subset.GetPrim()).Bind(other_material)
+        UsdGeom.Mesh.Define(stage, "/World/Unbound")
+        group = UsdGeom.Xform.Define(stage, "/World/Group")
+        UsdShade.MaterialBindingAPI.Apply(group.GetPrim()).Bind(default_material)
+        UsdGeom.Mesh.Define(stage, "/World/Group/Child")
+
+        # Act
+        material_prims, prims_by_material = _MassTexturePreview._get_preview_bindings(  # noqa PLW0212
+            stage, ingested_path
+        )
+
+        # Assert
+        self.assertEqual(["/Looks/Ingested"], [str(prim.GetPath()) for prim in material_prims])
+        self.assertEqual(
+            {
+                "/Looks/Default": ["/World/Mesh", "/World/Group/Child"],
+                "/Looks/Other": ["/World/Mesh/Subset"],
+            },
+            prims_by_material,
+        )
+
+    async def test_get_preview_bindings_no_material_in_layer_should_not_compute_bindings(self):
+        # Arrange
+        stage = Usd.Stage.CreateInMemory()
+        material = UsdShade.Material.Define(stage, "/Looks/Default")
+        mesh = UsdGeom.Mesh.Define(stage, "/World/Mesh")
+        UsdShade.MaterialBindingAPI.Apply(mesh.GetPrim()).Bind(material)
+
+        # Act
+        material_prims, prims_by_material = _MassTexturePreview._get_preview_bindings(  # noqa PLW0212
+            stage, str(self.temp_path / "missing.usda")
+        )
+
+        # Assert
+        self.assertEqual([], material_prims)
+        self.assertEqual({}, prims_by_material)
@@ -0,0 +1,65 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import omni.client
+import omni.kit.test
+from omni.flux.utils.common.omni_url import OmniUrl, StatCache
+from omni.flux.validator.plugin.check.usd.texture.texture_utils import stat_textures_async
+from pxr import Sdf, Usd
+
+
+class TestTextureUtils(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = TemporaryDirectory()  # noqa PLR1732
+        self.temp_path = Path(self.temp_dir.name)
+
+        self.stage = Usd.Stage.CreateInMemory()
+        self.texture_paths = []
+        for index in range(4):
+            texture_path = self.temp_path / f"texture_{index}.png"
+            texture_path.write_bytes(b"")
+            self.texture_paths.append(texture_path)
+
+            prim = self.stage.DefinePrim(f"/World/Looks/Shader_{index}", "Shader")
+            prim.CreateAttribute("inputs:diffuse_texture", Sdf.ValueTypeNames.Asset).Set(str(texture_path))
+            prim.CreateAttribute("inputs:normalmap_texture", Sdf.ValueTypeNames.Asset).Set(
+                str(self.temp_path / f"missing_{index}.png")
+            )
+
+    # After running each test
+    async def tearDown(self):
+        self.stage = None
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    async def test_stat_textures_async_should_cache_texture_stats(self):
+        # Arrange
+        prims = [prim for prim in self.stage.Traverse() if prim.GetTypeName() == "Shader"]
+
+        with StatCache(), patch.object(omni.client, "stat", wraps=omni.client.stat) as stat_mock:
+            # Act
+            await stat_textures_async(prims, ["inputs:diffuse_texture", "inputs:normalmap_texture", "inputs:missing"])
+            is_files = [OmniUrl(str(texture_path)).is_file for texture_path in self.texture_paths]
+
+        # Assert
+        self.assertListEqual([True] * len(self.texture_paths), is_files)
+        self.assertEqual(0, stat_mock.call_count)
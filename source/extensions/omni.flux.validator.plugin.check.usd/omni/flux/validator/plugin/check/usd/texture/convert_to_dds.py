@@ -15,8 +15,9 @@
 * limitations under the License.
 """
 
+import asyncio
+import functools
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -30,9 +31,15 @@ from omni.flux.asset_importer.core.data_models import (
 )
 from omni.flux.asset_importer.core.data_models import TEXTURE_TYPE_INPUT_MAP as _TEXTURE_TYPE_INPUT_MAP
 from omni.flux.asset_importer.core.data_models import TextureTypes as _TextureTypes
+from omni.flux.utils.common.conversion_cache import get_conversion_cache as _get_conversion_cache
+from omni.flux.utils.common.conversion_cache import run_cached_conversion as _run_cached_conversion
+from omni.flux.utils.common.conversion_scheduler import get_conversion_scheduler as _get_conversion_scheduler
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from omni.flux.utils.common.omni_url import StatCache as _StatCache
+from omni.flux.utils.common.path_utils import UdimIndex as _UdimIndex
 from omni.flux.utils.common.path_utils import get_new_hash as _get_new_hash
 from omni.flux.utils.common.path_utils import get_udim_sequence as _get_udim_sequence
+from omni.flux.utils.common.path_utils import hash_file as _hash_file
 from omni.flux.utils.common.path_utils import is_udim_texture as _is_udim_texture
 from omni.flux.utils.common.path_utils import texture_to_udim as _texture_to_udim
 from omni.flux.utils.common.path_utils import write_metadata as _write_metadata
@@ -42,6 +49,7 @@ from pxr import Sdf
 from pydantic import BaseModel, validator
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from .texture_utils import stat_textures_async as _stat_textures_async
 
 
 def _generate_out_path(in_path_str: str, suffix: str):
@@ -125,47 +133,51 @@ class ConvertToDDS(_CheckBaseUSD):
         stage_url = context.get_stage_url()
         message = f"Stage: {stage_url}\nCheck:\n"
         all_pass = True
-        for prim in selector_plugin_data:  # noqa
-            for attr_name in schema_data.conversion_args.keys():
-                texture_paths = []
-                attr = prim.GetAttribute(attr_name)
-                if attr and attr.Get():
-                    abs_path_str = attr.Get().resolvedPath
-                    if not abs_path_str:
-                        all_pass = False
-                        message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. Failed to resolve path.\n"
-                        continue
-
-                    abs_path_omni_url = _OmniUrl(abs_path_str)
-                    abs_path_str = str(abs_path_omni_url.path)
-                    is_udim = _is_udim_texture(abs_path_str)
-                    texture_paths = [abs_path_str]
-                    if is_udim:
-                        if schema_data.replace_udim_textures_by_empty:
-                            message += f"- REPLACE UDIM Texture: {attr.GetPath()} = `{attr.Get()}`.\n"
-                        texture_paths = _get_udim_sequence(abs_path_str)
-                        if not texture_paths:
+        with _StatCache(), _UdimIndex():
+            await _stat_textures_async(selector_plugin_data, schema_data.conversion_args.keys())
+            for prim in selector_plugin_data:  # noqa
+                for attr_name in schema_data.conversion_args.keys():
+                    texture_paths = []
+                    attr = prim.GetAttribute(attr_name)
+                    if attr and attr.Get():
+                        abs_path_str = attr.Get().resolvedPath
+                        if not abs_path_str:
                             all_pass = False
-                            message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. UDIM files don't exist.\n"
+                            message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. Failed to resolve path.\n"
                             continue
-                    elif not abs_path_omni_url.is_file:
-                        all_pass = False
-                        message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. File doesn't exist.\n"
-                        continue
-
-                    for texture_path in texture_paths[:]:
-                        suffix = self.__get_texture_type_suffix(attr_name)
-                        suffixes = f".{suffix}{schema_data.suffix}" if suffix else schema_data.suffix
-                        if not texture_path.endswith(suffixes):
+
+                        abs_path_omni_url = _OmniUrl(abs_path_str)
+                        abs_path_str = str(abs_path_omni_url.path)
+                        is_udim = _is_udim_texture(abs_path_str)
+                        texture_paths = [abs_path_str]
+                        if is_udim:
+                            if schema_data.replace_udim_textures_by_empty:
+                                message += f"- REPLACE UDIM Texture: {attr.GetPath()} = `{attr.Get()}`.\n"
+                            texture_paths = _get_udim_sequence(abs_path_str)
+                            if not texture_paths:
+                                all_pass = False
+                                message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. UDIM files don't exist.\n"
+                                continue
+                        elif not abs_path_omni_url.is_file:
                             all_pass = False
-                            message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. Incorrect suffix or extension.\n"
-                            texture_paths.remove(texture_path)
+                            message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. File doesn't exist.\n"
                             continue
 
-                if texture_paths:
-                    _validator_factory_utils.push_output_data(schema_data, texture_paths)
+                        for texture_path in texture_paths[:]:
+                            suffix = self.__get_texture_type_suffix(attr_name)
+                            suffixes = f".{suffix}{schema_data.suffix}" if suffix else schema_data.suffix
+                            if not texture_path.endswith(suffixes):
+                                all_pass = False
+                                message += (
+                                    f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. Incorrect suffix or extension.\n"
+                                )
+                                texture_paths.remove(texture_path)
+                                continue
+
+                    if texture_paths:
+                        _validator_factory_utils.push_output_data(schema_data, texture_paths)
 
-                message += f"- PASS: {prim.GetPath()}\n"
+                    message += f"- PASS: {prim.GetPath()}\n"
 
         return all_pass, message, None
 
@@ -189,49 +201,54 @@ class ConvertToDDS(_CheckBaseUSD):
         all_pass = True
         # collate all the files to generate
         files_needed = {}
-        for prim in selector_plugin_data:
-            for attr_name, settings in schema_data.conversion_args.items():
-                attr = prim.GetAttribute(attr_name)
-                if attr and attr.Get():
-                    abs_path_str = attr.Get().resolvedPath
-                    abs_path_omni_url = _OmniUrl(abs_path_str)
-                    abs_path_str = str(abs_path_omni_url.path)
-                    if not abs_path_str:
-                        all_pass = False
-                        message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. Failed to resolve path.\n"
-                        continue
-
-                    is_udim = _is_udim_texture(abs_path_str)
-                    texture_paths = [(abs_path_str, is_udim)]
-                    if is_udim:
-                        if schema_data.replace_udim_textures_by_empty:
-                            message += f"- REPLACE UDIM Texture: {attr.GetPath()} = `{attr.Get()}`.\n"
-                        texture_paths = [(texture_path, is_udim) for texture_path in _get_udim_sequence(abs_path_str)]
-                        if not texture_paths:
+        with _StatCache(), _UdimIndex():
+            await _stat_textures_async(selector_plugin_data, schema_data.conversion_args.keys())
+            for prim in selector_plugin_data:
+                for attr_name, settings in schema_data.conversion_args.items():
+                    attr = prim.GetAttribute(attr_name)
+                    if attr and attr.Get():
+                        abs_path_str = attr.Get().resolvedPath
+                        abs_path_omni_url = _OmniUrl(abs_path_str)
+                        abs_path_str = str(abs_path_omni_url.path)
+                        if not abs_path_str:
+                            all_pass = False
+                            message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. Failed to resolve path.\n"
+                            continue
+
+                        is_udim = _is_udim_texture(abs_path_str)
+                        texture_paths = [(abs_path_str, is_udim)]
+                        if is_udim:
+                            if schema_data.replace_udim_textures_by_empty:
+                                message += f"- REPLACE UDIM Texture: {attr.GetPath()} = `{attr.Get()}`.\n"
+                            texture_paths = [
+                                (texture_path, is_udim) for texture_path in _get_udim_sequence(abs_path_str)
+                            ]
+                            if not texture_paths:
+                                all_pass = False
+                                message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. UDIM files don't exist.\n"
+                                continue
+                        elif not abs_path_omni_url.is_file:
                             all_pass = False
-                            message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. UDIM files don't exist.\n"
+                            message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. File doesn't exist.\n"
                             continue
-                    elif not abs_path_omni_url.is_file:
-                        all_pass = False
-                        message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. File doesn't exist.\n"
-                        continue
-
-                    for texture_path, is_udim in texture_paths:
-                        out_path = texture_path
-                        suffix = self.__get_texture_type_suffix(attr_name)
-                        suffixes = f".{suffix}{schema_data.suffix}" if suffix else schema_data.suffix
-                        if not texture_path.endswith(suffixes):
-                            out_path = str(_generate_out_path(texture_path, suffixes))
-
-                        if out_path in files_needed:
-                            files_needed[out_path][-1].append(attr)
-                        else:
-                            files_needed[out_path] = (texture_path, is_udim, settings, [attr])
+
+                        for texture_path, is_udim in texture_paths:
+                            out_path = texture_path
+                            suffix = self.__get_texture_type_suffix(attr_name)
+                            suffixes = f".{suffix}{schema_data.suffix}" if suffix else schema_data.suffix
+                            if not texture_path.endswith(suffixes):
+                                out_path = str(_generate_out_path(texture_path, suffixes))
+
+                            if out_path in files_needed:
+                                files_needed[out_path][-1].append(attr)
+                            else:
+                                files_needed[out_path] = (texture_path, is_udim, settings, [attr])
 
         # generate all the files
         processed_files = []
-        futures = []
-        executor = ThreadPoolExecutor(max_workers=4)
+        conversions = {}
+        scheduler = _get_conversion_scheduler()
+        cache = _get_conversion_cache()
         nvtt_path = carb.tokens.get_tokens_interface().resolve(
             "${omni.flux.validator.plugin.check.usd}/../../deps/tools/nvtt/nvtt_export.exe"
         )
@@ -244,15 +261,17 @@ class ConvertToDDS(_CheckBaseUSD):
             if not out_path.exists() or src_hash is not None:
                 cmd = [nvtt_path, in_path_str, "--output", out_path_str] + settings.args
                 carb.log_info("Queuing DDS conversion: " + str(cmd))
-                future = executor.submit(
-                    subprocess.run, cmd, check=True, capture_output=True, text=True, stdin=subprocess.DEVNULL
+                cache_key = None
+                if cache is not None:
+                    source_hash = src_hash or _hash_file(in_path_str)
+                    if source_hash:
+                        cache_key = cache.get_key(source_hash, "nvtt_export", settings.args)
+                future = asyncio.ensure_future(
+                    _run_cached_conversion(
+                        cache, cache_key, out_path_str, functools.partial(scheduler.run_process, cmd)
+                    )
                 )
-                future.original_command = cmd
-                future.attrs = attrs
-                future.out_path = out_path
-                future.is_udim = is_udim
-                future.src_hash = src_hash
-                futures.append(future)
+                conversions[future] = (cmd, attrs, out_path, is_udim, src_hash)
                 processed_files.append(in_path_str)
             else:
                 # compressed texture exists and doesn't need to be updated
@@ -268,41 +287,52 @@ class ConvertToDDS(_CheckBaseUSD):
                 message += f"- PASS: reused existing compressed texture: {out_path_str}\n"
 
         # Update all the attributes as the files are generated.
-        if futures:
+        if conversions:
             progress = 0
             self.on_progress(progress, "Start", True)
-            to_add = 1 / len(futures)
-            for future in as_completed(futures):
-                progress += to_add
-                try:
-                    result = future.result()
-                    carb.log_info("DDS command result: " + str(result))
-                    out_path_str = str(future.out_path)
-                    _write_metadata(out_path_str, "src_hash", future.src_hash)
-                    with Sdf.ChangeBlock():
-                        for attr in future.attrs:
-                            value = out_path_str
-                            if future.is_udim:
-                                if schema_data.replace_udim_textures_by_empty:
-                                    value = ""
-                                else:
-                                    value = _texture_to_udim(out_path_str)
-                            attr.Set(value)
-
-                    _validator_factory_utils.push_output_data(schema_data, [out_path_str])
-
-                    message += f"- PASS: created compressed texture {future.out_path}\n"
-                    self.on_progress(progress, f"Compressed to {future.out_path}", True)
-                except subprocess.CalledProcessError as e:  # noqa
-                    carb.log_error(
-                        "Exception when converting texture to dds.\n"
-                        + f"cmd: {e.cmd}\noutput: {e.output}\nstdout: {e.stdout}\nstderr: {e.stderr}"
-                    )
-                    message += f"- FAIL: failure in dds compression command: {future.original_command}.\n"
-                    self.on_progress(progress, f"Error from {future.out_path}", True)
-                    all_pass = False
+            to_add = 1 / len(conversions)
+            pending = set(conversions)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        cmd, attrs, out_path, is_udim, src_hash = conversions[future]
+                        progress += to_add
+                        try:
+                            from_cache, result = future.result()
+                            carb.log_info("DDS command result: " + str(result))
+                            out_path_str = str(out_path)
+                            _write_metadata(out_path_str, "src_hash", src_hash)
+                            with Sdf.ChangeBlock():
+                                for attr in attrs:
+                                    value = out_path_str
+                                    if is_udim:
+                                        if schema_data.replace_udim_textures_by_empty:
+                                            value = ""
+                                        else:
+                                            value = _texture_to_udim(out_path_str)
+                                    attr.Set(value)
+
+                            _validator_factory_utils.push_output_data(schema_data, [out_path_str])
+
+                            if from_cache:
+                                message += f"- PASS: reused cached compressed texture {out_path}\n"
+                            else:
+                                message += f"- PASS: created compressed texture {out_path}\n"
+                            self.on_progress(progress, f"Compressed to {out_path}", True)
+                        except subprocess.CalledProcessError as e:  # noqa
+                            carb.log_error(
+                                "Exception when converting texture to dds.\n"
+                                + f"cmd: {e.cmd}\noutput: {e.output}\nstdout: {e.stdout}\nstderr: {e.stderr}"
+                            )
+                            message += f"- FAIL: failure in dds compression command: {cmd}.\n"
+                            self.on_progress(progress, f"Error from {out_path}", True)
+                            all_pass = False
+            finally:
+                # Don't leave conversions running if the validation is cancelled
+                for future in pending:
+                    future.cancel()
 
-        executor.shutdown(wait=True)
         await omni.kit.app.get_app().next_update_async()
 
         return all_pass, message, None
@@ -15,9 +15,9 @@
 * limitations under the License.
 """
 
+import asyncio
 import functools
 import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import IntEnum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -27,9 +27,15 @@ import carb.tokens
 import omni.client
 import omni.ui as ui
 import omni.usd
+from omni.flux.utils.common.conversion_cache import get_conversion_cache as _get_conversion_cache
+from omni.flux.utils.common.conversion_cache import run_cached_conversion as _run_cached_conversion
+from omni.flux.utils.common.conversion_scheduler import get_conversion_scheduler as _get_conversion_scheduler
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from omni.flux.utils.common.omni_url import StatCache as _StatCache
+from omni.flux.utils.common.path_utils import UdimIndex as _UdimIndex
 from omni.flux.utils.common.path_utils import get_new_hash as _get_new_hash
 from omni.flux.utils.common.path_utils import get_udim_sequence as _get_udim_sequence
+from omni.flux.utils.common.path_utils import hash_file as _hash_file
 from omni.flux.utils.common.path_utils import is_udim_texture as _is_udim_texture
 from omni.flux.utils.common.path_utils import texture_to_udim as _texture_to_udim
 from omni.flux.utils.common.path_utils import write_metadata as _write_metadata
@@ -40,6 +46,7 @@ from pxr import Sdf
 from pydantic import BaseModel, validator
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from .texture_utils import stat_textures_async as _stat_textures_async
 
 
 # This should match the `normalmap_encoding` in AperturePBR_normal.mdl
@@ -125,46 +132,48 @@ class ConvertToOctahedral(_CheckBaseUSD):
         stage_url = context.get_stage_url()
         message = f"Stage: {stage_url}\nCheck:\n"
         all_pass = True
-        for prim in selector_plugin_data:  # noqa
-            for attr_name, settings in schema_data.conversion_args.items():
-                attr = prim.GetAttribute(attr_name)
-                if not attr or not attr.HasValue():
-                    continue
-
-                abs_path_str = attr.Get().resolvedPath
-                if not abs_path_str:
-                    # no texture set!
-                    continue
-
-                abs_path_omni_url = _OmniUrl(abs_path_str)
-                abs_path_str = str(abs_path_omni_url.path)
-                is_udim = _is_udim_texture(abs_path_str)
-                texture_paths = [abs_path_str]
-                if is_udim:
-                    if schema_data.replace_udim_textures_by_empty:
-                        message += f"- REPLACE UDIM Texture: {attr.GetPath()} = `{attr.Get()}`.\n"
-                    texture_paths = _get_udim_sequence(abs_path_str)
-                    if not texture_paths:
-                        all_pass = False
-                        message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. UDIM files don't exist.\n"
+        with _StatCache(), _UdimIndex():
+            await _stat_textures_async(selector_plugin_data, schema_data.conversion_args.keys())
+            for prim in selector_plugin_data:  # noqa
+                for attr_name, settings in schema_data.conversion_args.items():
+                    attr = prim.GetAttribute(attr_name)
+                    if not attr or not attr.HasValue():
                         continue
-                elif not abs_path_omni_url.is_file:
-                    all_pass = False
-                    message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. File doesn't exist.\n"
-                    continue
-
-                encoding_attr = prim.GetAttribute(settings.encoding_attr)
-                if encoding_attr and encoding_attr.HasValue:
-                    encoding = encoding_attr.Get()
-                    if encoding != NormalMapEncodings.OCTAHEDRAL.value:
+
+                    abs_path_str = attr.Get().resolvedPath
+                    if not abs_path_str:
+                        # no texture set!
+                        continue
+
+                    abs_path_omni_url = _OmniUrl(abs_path_str)
+                    abs_path_str = str(abs_path_omni_url.path)
+                    is_udim = _is_udim_texture(abs_path_str)
+                    texture_paths = [abs_path_str]
+                    if is_udim:
+                        if schema_data.replace_udim_textures_by_empty:
+                            message += f"- REPLACE UDIM Texture: {attr.GetPath()} = `{attr.Get()}`.\n"
+                        texture_paths = _get_udim_sequence(abs_path_str)
+                        if not texture_paths:
+                            all_pass = False
+                            message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. UDIM files don't exist.\n"
+                            continue
+                    elif not abs_path_omni_url.is_file:
                         all_pass = False
-                        message += f"- Fail: {attr.GetPath()} is not octahedral encoded.\n"
+                        message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. File doesn't exist.\n"
                         continue
 
-                if texture_paths:
-                    _validator_factory_utils.push_output_data(schema_data, texture_paths)
+                    encoding_attr = prim.GetAttribute(settings.encoding_attr)
+                    if encoding_attr and encoding_attr.HasValue:
+                        encoding = encoding_attr.Get()
+                        if encoding != NormalMapEncodings.OCTAHEDRAL.value:
+                            all_pass = False
+                            message += f"- Fail: {attr.GetPath()} is not octahedral encoded.\n"
+                            continue
+
+                    if texture_paths:
+                        _validator_factory_utils.push_output_data(schema_data, texture_paths)
 
-            message += f"- PASS: {prim.GetPath()}\n"
+                message += f"- PASS: {prim.GetPath()}\n"
 
         return all_pass, message, None
 
@@ -188,56 +197,61 @@ class ConvertToOctahedral(_CheckBaseUSD):
         all_pass = True
         # collate all the files to generate
         files_needed = {}
-        for prim in selector_plugin_data:  # noqa
-            for attr_name, settings in schema_data.conversion_args.items():
-                attr = prim.GetAttribute(attr_name)
-                if not attr or not attr.HasValue():
-                    continue
-
-                abs_path_str = attr.Get().resolvedPath
-                if not abs_path_str:
-                    # no texture set!
-                    continue
-
-                abs_path_omni_url = _OmniUrl(abs_path_str)
-                abs_path_str = str(abs_path_omni_url.path)
-                is_udim = _is_udim_texture(abs_path_str)
-                texture_paths = [(abs_path_str, is_udim)]
-                if is_udim:
-                    if schema_data.replace_udim_textures_by_empty:
-                        message += f"- REPLACE UDIM Texture: {attr.GetPath()} = `{attr.Get()}`.\n"
-                    texture_paths = [(texture_path, is_udim) for texture_path in _get_udim_sequence(abs_path_str)]
-                    if not texture_paths:
+        with _StatCache(), _UdimIndex():
+            await _stat_textures_async(selector_plugin_data, schema_data.conversion_args.keys())
+            for prim in selector_plugin_data:  # noqa
+                for attr_name, settings in schema_data.conversion_args.items():
+                    attr = prim.GetAttribute(attr_name)
+                    if not attr or not attr.HasValue():
+                        continue
+
+                    abs_path_str = attr.Get().resolvedPath
+                    if not abs_path_str:
+                        # no texture set!
+                        continue
+
+                    abs_path_omni_url = _OmniUrl(abs_path_str)
+                    abs_path_str = str(abs_path_omni_url.path)
+                    is_udim = _is_udim_texture(abs_path_str)
+                    texture_paths = [(abs_path_str, is_udim)]
+                    if is_udim:
+                        if schema_data.replace_udim_textures_by_empty:
+                            message += f"- REPLACE UDIM Texture: {attr.GetPath()} = `{attr.Get()}`.\n"
+                        texture_paths = [(texture_path, is_udim) for texture_path in _get_udim_sequence(abs_path_str)]
+                        if not texture_paths:
+                            all_pass = False
+                            message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. UDIM files don't exist.\n"
+                            continue
+                    elif not abs_path_omni_url.is_file:
                         all_pass = False
-                        message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. UDIM files don't exist.\n"
+                        message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. File doesn't exist.\n"
                         continue
-                elif not abs_path_omni_url.is_file:
-                    all_pass = False
-                    message += f"- FAIL: {attr.GetPath()} = `{attr.Get()}`. File doesn't exist.\n"
-                    continue
-
-                encoding_attr = prim.GetAttribute(settings.encoding_attr)
-                if not encoding_attr or not encoding_attr.HasValue:
-                    # pick default (if none exists, then must be DX normals)
-                    encoding = NormalMapEncodings.TANGENT_SPACE_DX.value
-                else:
-                    encoding = encoding_attr.Get()
-
-                if encoding != NormalMapEncodings.OCTAHEDRAL.value:
-                    for texture_path, is_udim in texture_paths:
-                        if not texture_path.endswith(settings.suffix):
-                            # queue creation or conversion of texture
-                            out_path = str(_generate_out_path(texture_path, settings.suffix, settings.replace_suffix))
-
-                            if out_path in files_needed:
-                                files_needed[out_path][-1].append((attr, encoding_attr))
-                            else:
-                                files_needed[out_path] = (texture_path, is_udim, encoding, [(attr, encoding_attr)])
+
+                    encoding_attr = prim.GetAttribute(settings.encoding_attr)
+                    if not encoding_attr or not encoding_attr.HasValue:
+                        # pick default (if none exists, then must be DX normals)
+                        encoding = NormalMapEncodings.TANGENT_SPACE_DX.value
+                    else:
+                        encoding = encoding_attr.Get()
+
+                    if encoding != NormalMapEncodings.OCTAHEDRAL.value:
+                        for texture_path, is_udim in texture_paths:
+                            if not texture_path.endswith(settings.suffix):
+                                # queue creation or conversion of texture
+                                out_path = str(
+                                    _generate_out_path(texture_path, settings.suffix, settings.replace_suffix)
+                                )
+
+                                if out_path in files_needed:
+                                    files_needed[out_path][-1].append((attr, encoding_attr))
+                                else:
+                                    files_needed[out_path] = (texture_path, is_udim, encoding, [(attr, encoding_attr)])
 
         # generate all the files
         processed_files = []
-        futures = []
-        executor = ThreadPoolExecutor(max_workers=4)
+        conversions = {}
+        scheduler = _get_conversion_scheduler()
+        cache = _get_conversion_cache()
         for out_path_str, (in_path_str, is_udim, encoding, attrs) in files_needed.items():
             out_path = Path(out_path_str)
             src_hash = _get_new_hash(in_path_str, out_path_str)
@@ -245,21 +259,29 @@ class ConvertToOctahedral(_CheckBaseUSD):
             _validator_factory_utils.push_input_data(schema_data, [in_path_str])
 
             if not out_path.exists() or src_hash is not None:
-                future = None
+                convert_func = None
+                conversion = None
                 if encoding == NormalMapEncodings.TANGENT_SPACE_DX.value:
-                    future = executor.submit(
-                        functools.partial(OctahedralConverter.convert_dx_file_to_octahedral, in_path_str, out_path_str)
-                    )
+                    convert_func = OctahedralConverter.convert_dx_file_to_octahedral
+                    conversion = "octahedral_dx"
                 elif encoding == NormalMapEncodings.TANGENT_SPACE_OGL.value:
-                    future = executor.submit(
-                        functools.partial(OctahedralConverter.convert_ogl_file_to_octahedral, in_path_str, out_path_str)
+                    convert_func = OctahedralConverter.convert_ogl_file_to_octahedral
+                    conversion = "octahedral_ogl"
+                if convert_func:
+                    cache_key = None
+                    if cache is not None:
+                        source_hash = src_hash or _hash_file(in_path_str)
+                        if source_hash:
+                            cache_key = cache.get_key(source_hash, conversion)
+                    future = asyncio.ensure_future(
+                        _run_cached_conversion(
+                            cache,
+                            cache_key,
+                            out_path_str,
+                            functools.partial(scheduler.run, convert_func, in_path_str, out_path_str),
+                        )
                     )
-                if future:
-                    future.attrs = attrs
-                    future.is_udim = is_udim
-                    future.out_path = out_path
-                    future.src_hash = src_hash
-                    futures.append(future)
+                    conversions[future] = (attrs, out_path, is_udim, src_hash)
                     processed_files.append(in_path_str)
             else:
                 # octahedral texture exists and doesn't need to be updated
@@ -275,42 +297,53 @@ class ConvertToOctahedral(_CheckBaseUSD):
                         encoding_attr.Set(NormalMapEncodings.OCTAHEDRAL.value)
                 message += f"- PASS: reused existing octahedral map: {out_path}\n"
 
-        if futures:
+        if conversions:
             # Update all the attributes as the files are generated.
             progress = 0
             self.on_progress(progress, "Start", True)
-            to_add = 1 / len(futures)
-            for future in as_completed(futures):
-                progress += to_add
-                try:
-                    result = future.result()
-                    carb.log_info("Octahedral command result: " + str(result))
-                    out_path_str = str(future.out_path)
-                    _write_metadata(out_path_str, "src_hash", future.src_hash)
-                    with Sdf.ChangeBlock():
-                        for attr, encoding_attr in future.attrs:
-                            value = out_path_str
-                            if future.is_udim:
-                                if schema_data.replace_udim_textures_by_empty:
-                                    value = ""
-                                else:
-                                    value = _texture_to_udim(out_path_str)
-                            attr.Set(value)
-                            encoding_attr.Set(NormalMapEncodings.OCTAHEDRAL.value)
-
-                    _validator_factory_utils.push_output_data(schema_data, [out_path_str])
-
-                    message += f"- PASS: created octahedral map {future.out_path}\n"
-                    self.on_progress(progress, f"Compressed to {future.out_path}", True)
-                except Exception:  # noqa
-                    carb.log_error(
-                        f"Exception when creating octahedral map at {future.out_path}.\n" + traceback.format_exc()
-                    )
-                    message += f"- FAIL: exception during octahedral conversion: {future.out_path}.\n"
-                    self.on_progress(progress, f"Error from {future.out_path}", True)
-                    all_pass = False
+            to_add = 1 / len(conversions)
+            pending = set(conversions)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        attrs, out_path, is_udim, src_hash = conversions[future]
+                        progress += to_add
+                        try:
+                            from_cache, result = future.result()
+                            carb.log_info("Octahedral command result: " + str(result))
+                            out_path_str = str(out_path)
+                            _write_metadata(out_path_str, "src_hash", src_hash)
+                            with Sdf.ChangeBlock():
+                                for attr, encoding_attr in attrs:
+                                    value = out_path_str
+                                    if is_udim:
+                                        if schema_data.replace_udim_textures_by_empty:
+                                            value = ""
+                                        else:
+                                            value = _texture_to_udim(out_path_str)
+                                    attr.Set(value)
+                                    encoding_attr.Set(NormalMapEncodings.OCTAHEDRAL.value)
+
+                            _validator_factory_utils.push_output_data(schema_data, [out_path_str])
+
+                            if from_cache:
+                                message += f"- PASS: reused cached octahedral map {out_path}\n"
+                            else:
+                                message += f"- PASS: created octahedral map {out_path}\n"
+                            self.on_progress(progress, f"Compressed to {out_path}", True)
+                        except Exception:  # noqa
+                            carb.log_error(
+                                f"Exception when creating octahedral map at {out_path}.\n" + traceback.format_exc()
+                            )
+                            message += f"- FAIL: exception during octahedral conversion: {out_path}.\n"
+                            self.on_progress(progress, f"Error from {out_path}", True)
+                            all_pass = False
+            finally:
+                # Don't leave conversions running if the validation is cancelled
+                for future in pending:
+                    future.cancel()
 
-        executor.shutdown(wait=True)
         await omni.kit.app.get_app().next_update_async()
 
         return all_pass, message, None
@@ -18,7 +18,7 @@
 import asyncio
 import uuid
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import carb
 import carb.tokens
@@ -28,7 +28,7 @@ import omni.usd
 from omni.flux.lookdev.core import LookDevCore as _LookDevCore
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
 from omni.kit.viewport.utility import get_active_viewport
-from pxr import UsdGeom, UsdShade
+from pxr import Usd, UsdGeom, UsdShade
 from pydantic import Field
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
@@ -121,28 +121,17 @@ class MassTexturePreview(_CheckBaseUSD):
                 )
                 # get all material from the ingestion layer
                 default_material = lookdev_core.get_default_material_path()
-                text_material_prims = []
-                for prim in stage.TraverseAll():
-                    if not prim.IsA(UsdShade.Material):
-                        continue
-                    stack = prim.GetPrimStack()
-                    for prim_spec in stack:
-                        if str(_OmniUrl(prim_spec.layer.realPath)) == str(_OmniUrl(schema_data.temp_usd)):
-                            text_material_prims.append(prim)
-                            break
-                if text_material_prims:
-                    for prim in stage.TraverseAll():
-                        if prim.IsA(UsdGeom.Subset) or prim.IsA(UsdGeom.Mesh):
-                            material, _ = UsdShade.MaterialBindingAPI(prim).ComputeBoundMaterial()
-                            if material and str(material.GetPath()) == default_material:
-                                omni.kit.commands.execute(
-                                    "BindMaterialCommand",
-                                    prim_path=str(prim.GetPath()),
-                                    # for now we can only handle 1 set of texture
-                                    material_path=str(text_material_prims[0].GetPath()),
-                                    strength=UsdShade.Tokens.strongerThanDescendants,
-                                    stage=stage,
-                                )
+                text_material_prims, prims_by_material = self._get_preview_bindings(stage, schema_data.temp_usd)
+                prim_paths = prims_by_material.get(default_material)
+                if text_material_prims and prim_paths:
+                    omni.kit.commands.execute(
+                        "BindMaterialCommand",
+                        prim_path=prim_paths,
+                        # for now we can only handle 1 set of texture
+                        material_path=str(text_material_prims[0].GetPath()),
+                        strength=UsdShade.Tokens.strongerThanDescendants,
+                        stage=stage,
+                    )
                 callback("show_in_viewport")
 
         def __open_output_file():
@@ -166,6 +155,45 @@ class MassTexturePreview(_CheckBaseUSD):
                     ui.Spacer(width=ui.Pixel(2))
             ui.Spacer(height=ui.Pixel(2))
 
+    @staticmethod
+    def _get_preview_bindings(stage: Usd.Stage, layer_path: str) -> Tuple[List[Usd.Prim], Dict[str, List[str]]]:
+        """
+        Walk the stage once to find the materials defined in a layer and the materials bound to the geometry.
+
+        Args:
+            stage: the stage to look into
+            layer_path: the path of the layer the materials should be defined in
+
+        Returns:
+            The materials defined in the layer, and the paths of the meshes & subsets grouped by bound material path
+        """
+        layer_url = str(_OmniUrl(layer_path))
+        layer_matches = {}
+        material_prims = []
+        geometry_prims = []
+        for prim in stage.TraverseAll():
+            if prim.IsA(UsdGeom.Subset) or prim.IsA(UsdGeom.Mesh):
+                geometry_prims.append(prim)
+                continue
+            if not prim.IsA(UsdShade.Material):
+                continue
+            for prim_spec in prim.GetPrimStack():
+                layer = prim_spec.layer
+                if layer.identifier not in layer_matches:
+                    layer_matches[layer.identifier] = str(_OmniUrl(layer.realPath)) == layer_url
+                if layer_matches[layer.identifier]:
+                    material_prims.append(prim)
+                    break
+
+        prims_by_material = {}
+        if material_prims and geometry_prims:
+            # Resolve all the bindings at once so the binding & collection caches are shared by all the prims
+            materials, _ = UsdShade.MaterialBindingAPI.ComputeBoundMaterials(geometry_prims)
+            for prim, material in zip(geometry_prims, materials):
+                if material:
+                    prims_by_material.setdefault(str(material.GetPath()), []).append(str(prim.GetPath()))
+        return material_prims, prims_by_material
+
     @omni.usd.handle_exception
     async def _build_ui(self, schema_data: Data) -> Any:
         """
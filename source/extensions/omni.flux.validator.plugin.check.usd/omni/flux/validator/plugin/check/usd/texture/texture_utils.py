@@ -0,0 +1,47 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from typing import Iterable
+
+from omni.flux.utils.common.omni_url import stat_urls_async as _stat_urls_async
+from omni.flux.utils.common.path_utils import is_udim_texture as _is_udim_texture
+from pxr import Usd
+
+
+async def stat_textures_async(prims: Iterable[Usd.Prim], attr_names: Iterable[str]):
+    """
+    Stat the textures of the given prim attributes at once, listing the directories shared by many textures once.
+
+    The results are stored in the active `StatCache`, so the per-texture checks that follow don't stat them again. UDIM
+    textures are skipped since their tiles are found by the `UdimIndex`.
+
+    Args:
+        prims: the prims to get the textures from
+        attr_names: the names of the texture attributes
+    """
+    attr_names = list(attr_names)
+    texture_paths = set()
+    for prim in prims:
+        for attr_name in attr_names:
+            attr = prim.GetAttribute(attr_name)
+            if not attr or not attr.HasValue():
+                continue
+            value = attr.Get()
+            if value and value.resolvedPath and not _is_udim_texture(value.resolvedPath):
+                texture_paths.add(value.resolvedPath)
+    if texture_paths:
+        await _stat_urls_async(texture_paths)
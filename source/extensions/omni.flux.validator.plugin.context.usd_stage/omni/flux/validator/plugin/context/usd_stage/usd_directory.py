@@ -93,10 +93,9 @@ class USDDirectory(_ContextBaseUSD):
                 ignore_paths=schema_data.ignore_paths,
             )
             files_to_validate = 0
+            fixes_applied = _path_utils.read_metadata_batch(input_files, _FIXES_APPLIED)
             for input_file in input_files:
-                if not schema_data.file_validated_fixes.intersection(
-                    _path_utils.read_metadata(input_file, _FIXES_APPLIED) or []
-                ):
+                if not schema_data.file_validated_fixes.intersection(fixes_applied[input_file] or []):
                     files_to_validate += 1
             if files_to_validate < 1:
                 return False, "All the files within the directory were already validated."
@@ -136,9 +135,12 @@ class USDDirectory(_ContextBaseUSD):
         progress_delta = 1 / len(usd_file_paths)
 
         files_to_validate = 0
+        fixes_applied = (
+            _path_utils.read_metadata_batch(usd_file_paths, _FIXES_APPLIED) if schema_data.skip_validated_files else {}
+        )
         for i, file_path in enumerate(usd_file_paths):
             if schema_data.skip_validated_files and schema_data.file_validated_fixes.intersection(
-                _path_utils.read_metadata(file_path, _FIXES_APPLIED) or []
+                fixes_applied[file_path] or []
             ):
                 # File was already validated
                 continue
@@ -217,9 +219,14 @@ class USDDirectory(_ContextBaseUSD):
             ignore_paths=schema_data_template.ignore_paths,
         )
 
+        fixes_applied = (
+            _path_utils.read_metadata_batch(input_files, _FIXES_APPLIED)
+            if schema_data_template.skip_validated_files
+            else {}
+        )
         for input_file in input_files:
             if schema_data_template.skip_validated_files and schema_data_template.file_validated_fixes.intersection(
-                _path_utils.read_metadata(input_file, _FIXES_APPLIED) or []
+                fixes_applied[input_file] or []
             ):
                 continue
 
@@ -21,8 +21,8 @@ from typing import TYPE_CHECKING, Any, Tuple
 import omni.kit.app
 import omni.ui as ui
 import omni.usd
-from omni.flux.utils.common.path_utils import hash_file as _hash_file
-from omni.flux.utils.common.path_utils import write_metadata as _write_metadata
+from omni.flux.utils.common.path_utils import hash_files as _hash_files
+from omni.flux.utils.common.path_utils import write_metadata_batch as _write_metadata_batch
 from omni.flux.validator.factory import BASE_HASH_KEY as _BASE_HASH_KEY
 from omni.flux.validator.factory import CONTEXT_FIXES_APPLIED as _CONTEXT_FIXES_APPLIED
 from omni.flux.validator.factory import FIXES_APPLIED as _FIXES_APPLIED
@@ -66,18 +66,26 @@ class FileMetadataWritter(_ResultorBase):
         fixes_applied = schema.context_plugin.data.dict().get(_CONTEXT_FIXES_APPLIED, [])
 
         if all_data_flow:
-            for data_flow in all_data_flow:
-                if data_flow.name == "InOutData":
-                    for input_path in data_flow.input_data or []:
-                        src_hash = _hash_file(str(input_path))
-                        _write_metadata(str(input_path), _BASE_HASH_KEY, src_hash)
-                    for output_path in data_flow.output_data or []:
-                        src_hash = _hash_file(str(output_path))
-                        _write_metadata(str(output_path), _BASE_HASH_KEY, src_hash)
-                        _write_metadata(str(output_path), _VALIDATION_PASSED, schema.validation_passed)
-                        _write_metadata(str(output_path), _VALIDATION_EXTENSIONS, self.__current_validation_extensions)
-                        for fix in fixes_applied:
-                            _write_metadata(str(output_path), _FIXES_APPLIED, fix, append=True)
+            in_out_data_flows = [data_flow for data_flow in all_data_flow if data_flow.name == "InOutData"]
+            hashes = _hash_files(
+                str(path)
+                for data_flow in in_out_data_flows
+                for path in (data_flow.input_data or []) + (data_flow.output_data or [])
+            )
+            # Write all the metadata at once: every metadata file is only read & written once
+            values = []
+            appended_values = []
+            for data_flow in in_out_data_flows:
+                for input_path in data_flow.input_data or []:
+                    values.append((str(input_path), _BASE_HASH_KEY, hashes[str(input_path)]))
+                for output_path in data_flow.output_data or []:
+                    values.append((str(output_path), _BASE_HASH_KEY, hashes[str(output_path)]))
+                    values.append((str(output_path), _VALIDATION_PASSED, schema.validation_passed))
+                    values.append((str(output_path), _VALIDATION_EXTENSIONS, self.__current_validation_extensions))
+                    for fix in fixes_applied:
+                        appended_values.append((str(output_path), _FIXES_APPLIED, fix))
+            _write_metadata_batch(values)
+            _write_metadata_batch(appended_values, append=True)
 
         return True, "Metadata written"
 